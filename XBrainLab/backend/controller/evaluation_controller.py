@@ -1,17 +1,20 @@
 """Evaluation controller for model performance analysis.
 
-Provides methods for pooling evaluation results across training runs
-and generating model architecture summaries.
+Provides methods for pooling evaluation results across training runs,
+comparing plans and generating model architecture summaries.
 """
 
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from XBrainLab.backend.evaluation import Leaderboard, PairedComparison, compare_runs
 from XBrainLab.backend.training import TrainingPlanHolder
-from XBrainLab.backend.training.record import EvalRecord, TrainRecord
+from XBrainLab.backend.training.record import EvalRecord, RunSummary, TrainRecord
+from XBrainLab.backend.training.record.statistics import EvaluationStatistics
 from XBrainLab.backend.utils.logger import logger
 from XBrainLab.backend.utils.observer import Observable
 
@@ -31,6 +34,9 @@ class EvaluationController(Observable):
 
     Attributes:
         _study: Reference to the :class:`Study` backend instance.
+        _pooled: Pooled :class:`EvalRecord` of each plan with the
+            evaluation records it was pooled from, reused while those do
+            not change.
 
     """
 
@@ -43,6 +49,9 @@ class EvaluationController(Observable):
         """
         Observable.__init__(self)
         self._study = study
+        self._pooled: weakref.WeakKeyDictionary[
+            TrainingPlanHolder, tuple[list[EvalRecord], EvalRecord]
+        ] = weakref.WeakKeyDictionary()
 
     def get_loaded_data_list(self):
         """Return the loaded raw data list from the study.
@@ -82,7 +91,9 @@ class EvaluationController(Observable):
 
         Concatenates ground-truth labels and model outputs across
         every completed run in the given plan and computes per-class
-        metrics on the pooled data.
+        metrics on the pooled data. The pooled record is kept until the
+        finished runs or their evaluation records change, so repeated
+        calls reuse its arrays and memoized metrics.
 
         Args:
             plan: The :class:`TrainingPlanHolder` whose finished runs
@@ -99,33 +110,158 @@ class EvaluationController(Observable):
               dictionary if no data is available.
 
         """
-        records = [r for r in plan.get_plans() if r.is_finished()]
-        if not records:
+        pooled_record = self.get_pooled_eval_record(plan)
+        if pooled_record is None:
             return None, None, {}
+        metrics = pooled_record.get_per_class_metrics()
+        return pooled_record.label, pooled_record.output, metrics
 
-        all_labels = []
-        all_outputs = []
+    def get_pooled_eval_record(self, plan: TrainingPlanHolder) -> EvalRecord | None:
+        """Return an :class:`EvalRecord` pooling all finished runs of *plan*.
 
-        for r in records:
-            if r.eval_record:
-                all_labels.append(r.eval_record.label)
-                all_outputs.append(r.eval_record.output)
+        Args:
+            plan: The :class:`TrainingPlanHolder` whose finished runs
+                are to be pooled.
 
-        if not all_labels:
-            return None, None, {}
+        Returns:
+            The pooled record (without saliency maps), or ``None`` if no
+            finished run has an evaluation record.
 
-        # Concatenate for pooling
-        pooled_labels = np.concatenate(all_labels)
-        pooled_outputs = np.concatenate(all_outputs)
+        """
+        eval_records = [
+            r.eval_record for r in plan.get_plans() if r.is_finished() and r.eval_record
+        ]
+        if not eval_records:
+            return None
+
+        cached = self._pooled.get(plan)
+        if (
+            cached is not None
+            and len(cached[0]) == len(eval_records)
+            and all(a is b for a, b in zip(cached[0], eval_records, strict=True))
+        ):
+            return cached[1]
 
-        # Calculate metrics on pooled data
-        # We create a temporary EvalRecord to calculate metrics
         # Note: Gradients are passed as empty dicts as we don't need them for
         # metrics here
-        temp_record = EvalRecord(pooled_labels, pooled_outputs, {}, {}, {}, {}, {})
-        metrics = temp_record.get_per_class_metrics()
+        pooled_record = EvalRecord(
+            np.concatenate([r.label for r in eval_records]),
+            np.concatenate([r.output for r in eval_records]),
+            {},
+            {},
+            {},
+            {},
+            {},
+        )
+        self._pooled[plan] = (eval_records, pooled_record)
+        return pooled_record
+
+    def get_pooled_statistics(
+        self,
+        plan: TrainingPlanHolder,
+        n_bootstrap: int = 2000,
+        n_permutations: int = 2000,
+        confidence: float = 0.95,
+    ) -> EvaluationStatistics | None:
+        """Return confidence intervals and chance-level tests of a plan.
+
+        The statistics of the pooled finished runs are computed by
+        :meth:`EvalRecord.get_statistics` and memoized with the pooled
+        record.
+
+        Args:
+            plan: The :class:`TrainingPlanHolder` whose finished runs
+                are pooled.
+            n_bootstrap: Number of bootstrap resamples.
+            n_permutations: Number of label permutations.
+            confidence: Confidence level of the intervals.
+
+        Returns:
+            The statistics, or ``None`` if no finished run has an
+            evaluation record.
+
+        """
+        pooled_record = self.get_pooled_eval_record(plan)
+        if pooled_record is None:
+            return None
+        return pooled_record.get_statistics(n_bootstrap, n_permutations, confidence)
+
+    def export_pooled_statistics(
+        self,
+        plan: TrainingPlanHolder,
+        filepath: str,
+        n_bootstrap: int = 2000,
+        n_permutations: int = 2000,
+        confidence: float = 0.95,
+    ) -> None:
+        """Write the pooled statistics of *plan* to the CSV file *filepath*.
+
+        Raises:
+            ValueError: If no finished run has an evaluation record.
+
+        """
+        statistics = self.get_pooled_statistics(
+            plan, n_bootstrap, n_permutations, confidence
+        )
+        if statistics is None:
+            raise ValueError("No evaluation record for this training plan")
+        statistics.export_csv(filepath)
+
+    def get_run_summaries(self, plan: TrainingPlanHolder) -> list[RunSummary]:
+        """Return the cached summaries of the finished runs of *plan*.
+
+        Args:
+            plan: The :class:`TrainingPlanHolder` to summarize.
+
+        Returns:
+            One :class:`RunSummary` per finished run (see
+            :meth:`TrainRecord.get_summary`).
 
-        return pooled_labels, pooled_outputs, metrics
+        """
+        summaries = []
+        for record in plan.get_plans():
+            if record.is_finished():
+                summary = record.get_summary()
+                if summary is not None:
+                    summaries.append(summary)
+        return summaries
+
+    def get_leaderboard(self) -> Leaderboard:
+        """Return a leaderboard of the finished runs of every plan.
+
+        Built from the cached run summaries only, so no evaluation output
+        or saliency map is loaded.
+
+        Returns:
+            A :class:`Leaderboard` with one entry per finished run.
+
+        """
+        leaderboard = Leaderboard()
+        for i, plan in enumerate(self.get_plans()):
+            for summary in self.get_run_summaries(plan):
+                leaderboard.add(i, plan.get_name(), summary)
+        return leaderboard
+
+    def compare_plans(
+        self, plan_a: TrainingPlanHolder, plan_b: TrainingPlanHolder
+    ) -> PairedComparison:
+        """Test whether two plans differ in accuracy, repeat by repeat.
+
+        Args:
+            plan_a: The first :class:`TrainingPlanHolder`.
+            plan_b: The second :class:`TrainingPlanHolder`.
+
+        Returns:
+            Paired t-test and McNemar test results (see
+            :func:`~XBrainLab.backend.evaluation.compare_runs`).
+
+        Raises:
+            ValueError: If the plans share no finished repeat.
+
+        """
+        return compare_runs(
+            self.get_run_summaries(plan_a), self.get_run_summaries(plan_b)
+        )
 
     def get_model_summary_str(
         self,
@@ -1,21 +1,24 @@
 """Visualization controller for EEG data and model result rendering.
 
 Provides methods for montage configuration, saliency parameter
-management, and computation of averaged evaluation records across
-training runs.
+management, and computation of averaged and variability evaluation
+records across training runs.
 """
 
 from __future__ import annotations
 
+import weakref
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from XBrainLab.backend.training import TrainingPlanHolder
 from XBrainLab.backend.training.record.eval import EvalRecord
+from XBrainLab.backend.training.saliency_stats import SaliencyAggregator
 from XBrainLab.backend.utils.observer import Observable
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from XBrainLab.backend.study import Study
 
 
@@ -33,6 +36,7 @@ class VisualizationController(Observable):
 
     Attributes:
         _study: Reference to the :class:`Study` backend instance.
+        _aggregators: :class:`SaliencyAggregator` of each plan holder.
 
     """
 
@@ -45,6 +49,9 @@ class VisualizationController(Observable):
         """
         Observable.__init__(self)
         self._study = study
+        self._aggregators: weakref.WeakKeyDictionary[
+            TrainingPlanHolder, SaliencyAggregator
+        ] = weakref.WeakKeyDictionary()
 
     def get_loaded_data_list(self):
         """Return the loaded raw data list from the study.
@@ -131,8 +138,30 @@ class VisualizationController(Observable):
 
         """
         self._study.set_saliency_params(params)
+        for aggregator in self._aggregators.values():
+            aggregator.reset()
         self.notify("saliency_changed")
 
+    def get_saliency_aggregator(
+        self,
+        trainer_holder: TrainingPlanHolder,
+    ) -> SaliencyAggregator:
+        """Return the cached :class:`SaliencyAggregator` of a plan holder.
+
+        Args:
+            trainer_holder: The :class:`TrainingPlanHolder` whose repeats
+                are aggregated.
+
+        Returns:
+            The aggregator, created on first use.
+
+        """
+        aggregator = self._aggregators.get(trainer_holder)
+        if aggregator is None:
+            aggregator = SaliencyAggregator(trainer_holder)
+            self._aggregators[trainer_holder] = aggregator
+        return aggregator
+
     def get_averaged_record(
         self,
         trainer_holder: TrainingPlanHolder,
@@ -141,7 +170,10 @@ class VisualizationController(Observable):
 
         Gradient-based attributes (gradient, gradient*input,
         SmoothGrad, SmoothGrad², VarGrad) are averaged element-wise
-        across all completed runs in the plan holder.
+        across all completed runs in the plan holder. The average of a
+        method and class is only computed when a visualizer requests it,
+        and is kept by the plan's :class:`SaliencyAggregator`, which adds
+        runs finishing later without recomputing the others.
 
         Args:
             trainer_holder: The :class:`TrainingPlanHolder` whose
@@ -152,48 +184,52 @@ class VisualizationController(Observable):
             ``None`` if no finished runs contain evaluation records.
 
         """
-        plans = trainer_holder.get_plans()
-        # Filter for plans with valid eval records
-        records: list[EvalRecord] = []
-        for p in plans:
-            r = p.get_eval_record()
-            if r is not None:
-                records.append(r)
+        aggregator = self.get_saliency_aggregator(trainer_holder)
+        return self._get_aggregated_record(aggregator, aggregator.get_mean)
+
+    def get_variability_record(
+        self,
+        trainer_holder: TrainingPlanHolder,
+    ) -> EvalRecord | None:
+        """Return an :class:`EvalRecord` of across-run variability maps.
+
+        Like :meth:`get_averaged_record`, with the element-wise standard
+        deviation of the saliency maps across finished runs instead of
+        their mean.
+
+        Args:
+            trainer_holder: The :class:`TrainingPlanHolder` whose
+                finished runs are compared.
+
+        Returns:
+            An :class:`EvalRecord` with standard deviation maps, or
+            ``None`` if no finished runs contain evaluation records.
+
+        """
+        aggregator = self.get_saliency_aggregator(trainer_holder)
+        return self._get_aggregated_record(aggregator, aggregator.get_std)
 
+    @staticmethod
+    def _get_aggregated_record(
+        aggregator: SaliencyAggregator,
+        source: Callable[[str, int], np.ndarray],
+    ) -> EvalRecord | None:
+        records = aggregator.get_eval_records()
         if not records:
             return None
 
         base = records[0]
-
-        def avg_dict(attr_name):
-            result = {}
-            # attributes like 'gradient', 'smoothgrad' are dictionaries
-            base_attr = getattr(base, attr_name)
-            if not base_attr:
-                return {}
-
-            keys = base_attr.keys()
-            for k in keys:
-                # Stack arrays from all records and compute mean
-                arrays = [getattr(r, attr_name)[k] for r in records]
-                result[k] = np.mean(np.stack(arrays), axis=0)
-            return result
-
-        avg_gradient = avg_dict("gradient")
-        avg_gradient_input = avg_dict("gradient_input")
-        avg_smoothgrad = avg_dict("smoothgrad")
-        avg_smoothgrad_sq = avg_dict("smoothgrad_sq")
-        avg_vargrad = avg_dict("vargrad")
-
-        return EvalRecord(
+        aggregated = EvalRecord(
             label=base.label.copy() if hasattr(base.label, "copy") else base.label,
             # Copy output to avoid shared mutable reference
             output={k: v.copy() for k, v in base.output.items()}
             if isinstance(base.output, dict)
             else base.output,
-            gradient=avg_gradient,
-            gradient_input=avg_gradient_input,
-            smoothgrad=avg_smoothgrad,
-            smoothgrad_sq=avg_smoothgrad_sq,
-            vargrad=avg_vargrad,
+            gradient={},
+            gradient_input={},
+            smoothgrad={},
+            smoothgrad_sq={},
+            vargrad={},
         )
+        aggregated.saliency_source = source
+        return aggregated
@@ -59,6 +59,8 @@ class Epochs:
         label: Array of label index for each epoch.
         idx: Array of within-file epoch index for each epoch.
         data: 3D array of shape ``(n_epochs, n_channels, n_samples)``.
+        preprocess_steps: Preprocessing steps that produced the data (see
+            :class:`~XBrainLab.backend.preprocessor.PreprocessStep`).
 
     Raises:
         ValueError: If any item in preprocessed_data_list is unsegmented raw.
@@ -95,6 +97,12 @@ class Epochs:
         self.idx: np.ndarray = np.array([])
 
         self.data: np.ndarray = np.array([])
+        # all files go through the same preprocessing
+        self.preprocess_steps = (
+            list(preprocessed_data_list[0].get_preprocess_steps())
+            if preprocessed_data_list
+            else []
+        )
 
         # event_id
         for preprocessed_data in preprocessed_data_list:
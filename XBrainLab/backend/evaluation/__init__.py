@@ -1,5 +1,6 @@
-"""Evaluation package for model performance metrics."""
+"""Evaluation package for model performance metrics and model comparison."""
 
+from .comparison import Leaderboard, PairedComparison, compare_runs
 from .metric import Metric
 
-__all__ = ["Metric"]
+__all__ = ["Leaderboard", "Metric", "PairedComparison", "compare_runs"]
@@ -0,0 +1,218 @@
+"""Leaderboards and paired significance tests across training plans.
+
+Both work on :class:`~XBrainLab.backend.training.record.summary.RunSummary`
+objects, the compact per-repeat summaries cached by
+:meth:`TrainRecord.get_summary`, so comparing hundreds of repeats never
+loads their outputs or saliency maps.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+from scipy import stats
+
+from XBrainLab.backend.training.record.summary import RunSummary
+
+# Columns of a leaderboard row, in display order
+LEADERBOARD_COLUMNS = [
+    "plan_index",
+    "plan",
+    "name",
+    "model_name",
+    "repeat",
+    "accuracy",
+    "auc",
+    "kappa",
+    "macro_f1",
+    "epochs",
+    "training_time",
+    "throughput",
+    "n_samples",
+]
+
+
+@dataclass
+class LeaderboardEntry:
+    """One repeat on a leaderboard.
+
+    Attributes:
+        plan_index: Index of the training plan.
+        plan: Name of the training plan.
+        summary: Summary of the repeat.
+
+    """
+
+    plan_index: int
+    plan: str
+    summary: RunSummary
+
+    def get_row(self) -> dict[str, Any]:
+        """Return the plan and the scalar fields of the summary."""
+        return {
+            "plan_index": self.plan_index,
+            "plan": self.plan,
+            **self.summary.get_row(),
+        }
+
+
+@dataclass
+class Leaderboard:
+    """Sortable table of finished repeats across training plans.
+
+    Attributes:
+        entries: The repeats, in the order they were added.
+
+    """
+
+    entries: list[LeaderboardEntry] = field(default_factory=list)
+
+    def add(self, plan_index: int, plan: str, summary: RunSummary) -> None:
+        """Add the summary of a repeat of the plan *plan*."""
+        self.entries.append(LeaderboardEntry(plan_index, plan, summary))
+
+    def get_rows(
+        self, sort_by: str | None = "accuracy", descending: bool = True
+    ) -> list[dict[str, Any]]:
+        """Return one row per repeat, sorted by a column.
+
+        Args:
+            sort_by: Column to sort by, e.g. ``"accuracy"``,
+                ``"training_time"`` or ``"best_val_loss"``; ``None`` keeps
+                the order of :attr:`entries`.
+            descending: Sort from the largest value.
+
+        Returns:
+            Rows of :meth:`LeaderboardEntry.get_row`. Rows without a value
+            for *sort_by* (or ``nan``) come last.
+
+        """
+        rows = [entry.get_row() for entry in self.entries]
+        if sort_by is None:
+            return rows
+
+        def is_missing(row: dict[str, Any]) -> bool:
+            value = row.get(sort_by)
+            return value is None or (isinstance(value, float) and math.isnan(value))
+
+        present = [row for row in rows if not is_missing(row)]
+        missing = [row for row in rows if is_missing(row)]
+        present.sort(key=lambda row: row[sort_by], reverse=descending)
+        return present + missing
+
+    def export_csv(
+        self, path: str, sort_by: str | None = "accuracy", descending: bool = True
+    ) -> None:
+        """Write the sorted rows of :meth:`get_rows` to the CSV file *path*."""
+        rows = self.get_rows(sort_by, descending)
+        fieldnames = list(LEADERBOARD_COLUMNS)
+        for row in rows:
+            fieldnames += [key for key in row if key not in fieldnames]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+@dataclass
+class PairedComparison:
+    """Paired significance tests between the repeats of two models.
+
+    Repeats are paired by repeat index, so both models were trained and
+    evaluated on the same split.
+
+    Attributes:
+        n_pairs: Number of paired repeats.
+        accuracy_a: Mean accuracy of the first model over the pairs.
+        accuracy_b: Mean accuracy of the second model over the pairs.
+        mean_difference: Mean of the per-repeat accuracy differences
+            (first minus second).
+        t_statistic: Paired t statistic of the repeat accuracies.
+        t_p_value: Two-sided p-value of the paired t-test, ``nan`` with
+            fewer than two pairs.
+        n_samples: Number of epochs in the McNemar test.
+        only_a_correct: Epochs only the first model classifies correctly.
+        only_b_correct: Epochs only the second model classifies correctly.
+        mcnemar_p_value: Two-sided p-value of the exact McNemar test over
+            the pooled epochs, ``nan`` if paired repeats were evaluated on
+            different epochs.
+
+    """
+
+    n_pairs: int
+    accuracy_a: float
+    accuracy_b: float
+    mean_difference: float
+    t_statistic: float
+    t_p_value: float
+    n_samples: int
+    only_a_correct: int
+    only_b_correct: int
+    mcnemar_p_value: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the results as plain (JSON serializable) types."""
+        return asdict(self)
+
+
+def compare_runs(
+    summaries_a: Sequence[RunSummary], summaries_b: Sequence[RunSummary]
+) -> PairedComparison:
+    """Test whether two models differ in accuracy on the same splits.
+
+    Args:
+        summaries_a: Summaries of the repeats of the first model.
+        summaries_b: Summaries of the repeats of the second model.
+
+    Returns:
+        A paired t-test of the accuracies of the repeats and an exact
+        McNemar test of the per-epoch correctness of the pooled repeats.
+
+    Raises:
+        ValueError: If no repeat index is shared by both models.
+
+    """
+    by_repeat = {summary.repeat: summary for summary in summaries_b}
+    pairs = [(a, by_repeat[a.repeat]) for a in summaries_a if a.repeat in by_repeat]
+    if not pairs:
+        raise ValueError("No paired repeats to compare")
+
+    accuracy_a = np.array([a.metrics["accuracy"] for a, _ in pairs])
+    accuracy_b = np.array([b.metrics["accuracy"] for _, b in pairs])
+    t_statistic = t_p_value = math.nan
+    if len(pairs) > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = stats.ttest_rel(accuracy_a, accuracy_b)
+        t_statistic, t_p_value = float(result.statistic), float(result.pvalue)
+
+    n_samples = only_a = only_b = 0
+    mcnemar_p_value = math.nan
+    if all(a.label == b.label for a, b in pairs):
+        correct_a = np.concatenate([a.get_correct() for a, _ in pairs])
+        correct_b = np.concatenate([b.get_correct() for _, b in pairs])
+        n_samples = len(correct_a)
+        only_a = int(np.count_nonzero(correct_a & ~correct_b))
+        only_b = int(np.count_nonzero(correct_b & ~correct_a))
+        mcnemar_p_value = 1.0
+        if only_a + only_b > 0:
+            mcnemar_p_value = float(
+                stats.binomtest(min(only_a, only_b), only_a + only_b).pvalue
+            )
+
+    return PairedComparison(
+        n_pairs=len(pairs),
+        accuracy_a=float(accuracy_a.mean()),
+        accuracy_b=float(accuracy_b.mean()),
+        mean_difference=float((accuracy_a - accuracy_b).mean()),
+        t_statistic=t_statistic,
+        t_p_value=t_p_value,
+        n_samples=n_samples,
+        only_a_correct=only_a,
+        only_b_correct=only_b,
+        mcnemar_p_value=mcnemar_p_value,
+    )
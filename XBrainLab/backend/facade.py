@@ -14,6 +14,7 @@ from XBrainLab.backend.dataset import (
     TrainingType,
     ValSplitByType,
 )
+from XBrainLab.backend.inference import ModelBundle, ModelExporter, QuantizationMode
 from XBrainLab.backend.load_data.label_loader import load_label_file
 from XBrainLab.backend.model_base.EEGNet import EEGNet
 from XBrainLab.backend.model_base.SCCNet import SCCNet
@@ -453,6 +454,150 @@ class BackendFacade:
         return self.training.is_training()
 
     # --- Evaluation ---
+    def export_model(self, filepath: str, plan_index: int = 0, repeat: int = 0):
+        """Export a trained model for headless inference on new recordings.
+
+        The file bundles the weights with the preprocessing of the training
+        data (see :class:`~XBrainLab.backend.inference.ModelBundle`).
+
+        Args:
+            filepath: Destination file.
+            plan_index: Index of the training plan.
+            repeat: Index of the repetition within the plan.
+
+        Raises:
+            ValueError: If there is no such trained plan.
+
+        """
+        plans = self.evaluation.get_plans()
+        if not 0 <= plan_index < len(plans):
+            raise ValueError(f"No training plan at index {plan_index}")
+        ModelBundle.from_plan(plans[plan_index], repeat).save(filepath)
+
+    def export_quantized_model(
+        self,
+        output_dir: str,
+        plan_index: int = 0,
+        repeat: int = 0,
+        mode: str = "static",
+    ) -> list[dict]:
+        """Export a trained model as int8 and ONNX models for CPU inference.
+
+        See :class:`~XBrainLab.backend.inference.ModelExporter`.
+
+        Args:
+            output_dir: Destination directory.
+            plan_index: Index of the training plan.
+            repeat: Index of the repetition within the plan.
+            mode: ``"static"`` or ``"dynamic"`` quantization.
+
+        Returns:
+            Accuracy, size and latency of each exported runtime compared
+            with the float model.
+
+        Raises:
+            ValueError: If there is no such trained plan.
+
+        """
+        plans = self.evaluation.get_plans()
+        if not 0 <= plan_index < len(plans):
+            raise ValueError(f"No training plan at index {plan_index}")
+        exporter = ModelExporter.from_plan(
+            plans[plan_index], repeat, QuantizationMode(mode)
+        )
+        return [vars(result) for result in exporter.export(output_dir)]
+
+    def get_evaluation_statistics(
+        self,
+        plan_index: int = 0,
+        n_bootstrap: int = 2000,
+        n_permutations: int = 2000,
+        confidence: float = 0.95,
+        filepath: str | None = None,
+    ) -> dict:
+        """Get confidence intervals and chance-level p-values of a plan.
+
+        The finished repetitions of the plan are pooled, as in the
+        evaluation panel's average view.
+
+        Args:
+            plan_index: Index of the training plan.
+            n_bootstrap: Number of bootstrap resamples.
+            n_permutations: Number of label permutations.
+            confidence: Confidence level of the intervals.
+            filepath: Optional CSV file the statistics are also written to.
+
+        Returns:
+            Estimate, interval and p-value of accuracy, AUC, kappa and
+            per-class F1, with the resampling settings.
+
+        Raises:
+            ValueError: If there is no such plan or it has no finished run.
+
+        """
+        plans = self.evaluation.get_plans()
+        if not 0 <= plan_index < len(plans):
+            raise ValueError(f"No training plan at index {plan_index}")
+        statistics = self.evaluation.get_pooled_statistics(
+            plans[plan_index], n_bootstrap, n_permutations, confidence
+        )
+        if statistics is None:
+            raise ValueError("No evaluation record for this training plan")
+        if filepath:
+            statistics.export_csv(filepath)
+        return statistics.to_dict()
+
+    def get_leaderboard(
+        self,
+        sort_by: str | None = "accuracy",
+        descending: bool = True,
+        filepath: str | None = None,
+    ) -> list[dict]:
+        """Get one row per finished run of every plan, sorted by a column.
+
+        Rows come from the cached run summaries, without loading any
+        evaluation output or saliency map.
+
+        Args:
+            sort_by: Column to sort by, e.g. ``"accuracy"``, ``"kappa"`` or
+                ``"training_time"``; ``None`` keeps the plan order.
+            descending: Sort from the largest value.
+            filepath: Optional CSV file the rows are also written to.
+
+        Returns:
+            Plan, run, final metrics, training time and throughput of each
+            finished run.
+
+        """
+        leaderboard = self.evaluation.get_leaderboard()
+        if filepath:
+            leaderboard.export_csv(filepath, sort_by, descending)
+        return leaderboard.get_rows(sort_by, descending)
+
+    def compare_plans(self, plan_a: int = 0, plan_b: int = 1) -> dict:
+        """Test whether two training plans differ in accuracy.
+
+        Runs are paired by repetition index (see
+        :meth:`EvaluationController.compare_plans`).
+
+        Args:
+            plan_a: Index of the first training plan.
+            plan_b: Index of the second training plan.
+
+        Returns:
+            Mean accuracies, paired t-test and exact McNemar test results.
+
+        Raises:
+            ValueError: If there is no such plan or the plans share no
+                finished repetition.
+
+        """
+        plans = self.evaluation.get_plans()
+        for index in (plan_a, plan_b):
+            if not 0 <= index < len(plans):
+                raise ValueError(f"No training plan at index {index}")
+        return self.evaluation.compare_plans(plans[plan_a], plans[plan_b]).to_dict()
+
     def get_latest_results(self) -> dict:
         """Get results from the latest training run.
 
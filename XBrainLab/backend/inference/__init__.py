@@ -0,0 +1,37 @@
+"""Headless batch and streaming inference of trained models."""
+
+from .bundle import ModelBundle, register_model
+from .predictor import BatchPredictor, FilePrediction
+from .quantization import (
+    CpuRuntime,
+    ModelExporter,
+    QuantizationMode,
+    RuntimeBenchmark,
+    benchmark_runtimes,
+    load_cpu_runtime,
+    quantize_model,
+)
+from .streaming import (
+    FileReplaySource,
+    RingBuffer,
+    StreamingClassifier,
+    WindowPrediction,
+)
+
+__all__ = [
+    "BatchPredictor",
+    "CpuRuntime",
+    "FilePrediction",
+    "FileReplaySource",
+    "ModelBundle",
+    "ModelExporter",
+    "QuantizationMode",
+    "RingBuffer",
+    "RuntimeBenchmark",
+    "StreamingClassifier",
+    "WindowPrediction",
+    "benchmark_runtimes",
+    "load_cpu_runtime",
+    "quantize_model",
+    "register_model",
+]
@@ -0,0 +1,7 @@
+"""Entry point of ``python -m XBrainLab.backend.inference``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,200 @@
+"""Self-contained trained model for inference on new recordings."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import torch
+
+from .. import model_base
+from ..preprocessor import PreprocessStep
+
+if TYPE_CHECKING:
+    from ..training import TrainingPlanHolder
+
+FORMAT_VERSION = 1
+
+
+def get_model_path(model_class: type) -> str:
+    """Return the ``"module:qualname"`` path that names *model_class*."""
+    return f"{model_class.__module__}:{model_class.__qualname__}"
+
+
+# Model classes bundles may name, by import path. Bundles are untrusted
+# files, so the class is never imported from the path they contain.
+_MODEL_REGISTRY: dict[str, type[torch.nn.Module]] = {
+    get_model_path(getattr(model_base, name)): getattr(model_base, name)
+    for name in model_base.__all__
+}
+
+
+def register_model(model_class: type[torch.nn.Module]) -> None:
+    """Allow bundles to build *model_class*.
+
+    The models of :mod:`XBrainLab.backend.model_base` are registered;
+    custom models must be registered before a bundle naming them is
+    applied. :meth:`ModelBundle.from_plan` registers the model of the plan.
+
+    Raises:
+        ValueError: If *model_class* is not a :class:`torch.nn.Module`.
+
+    """
+    if not (isinstance(model_class, type) and issubclass(model_class, torch.nn.Module)):
+        raise ValueError(f"{model_class!r} is not a torch.nn.Module subclass")
+    _MODEL_REGISTRY[get_model_path(model_class)] = model_class
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert numpy values left in preprocessing arguments for JSON."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class ModelBundle:
+    """A trained model together with everything needed to apply it.
+
+    Holds the model class, its arguments and weights, the preprocessing
+    steps that produced the training data and the class names, so a new
+    recording can be preprocessed, epoched and scored without the
+    :class:`~XBrainLab.backend.study.Study` that trained the model.
+
+    Attributes:
+        model_class: Import path of the model class, ``"module:qualname"``;
+            only classes of :func:`register_model` are built.
+        model_params: Model parameters of the
+            :class:`~XBrainLab.backend.training.ModelHolder`.
+        model_args: Input shape arguments (``n_classes``, ``channels``,
+            ``samples``, ``sfreq``).
+        state_dict: Trained weights.
+        preprocess_steps: Preprocessing steps of the training data.
+        label_map: Mapping from class index to class name.
+        ch_names: Channel names of the training data.
+
+    """
+
+    def __init__(
+        self,
+        model_class: str,
+        model_params: dict,
+        model_args: dict,
+        state_dict: dict[str, torch.Tensor],
+        preprocess_steps: list[PreprocessStep],
+        label_map: dict[int, str],
+        ch_names: list[str],
+    ):
+        self.model_class = model_class
+        self.model_params = model_params
+        self.model_args = model_args
+        self.state_dict = state_dict
+        self.preprocess_steps = preprocess_steps
+        self.label_map = label_map
+        self.ch_names = ch_names
+
+    @classmethod
+    def from_plan(cls, plan: TrainingPlanHolder, repeat: int = 0) -> ModelBundle:
+        """Create a bundle from one repetition of a training plan.
+
+        The weights are the ones the plan evaluates (see
+        :meth:`TrainingPlanHolder.get_eval_state`).
+
+        Args:
+            plan: Trained plan.
+            repeat: Index of the repetition.
+
+        Returns:
+            The bundle.
+
+        Raises:
+            ValueError: If the repetition has no trained weights.
+
+        """
+        train_record = plan.get_plans()[repeat]
+        state = plan.get_eval_state(train_record)
+        if not state:
+            raise ValueError(f"Repeat {repeat} of {plan.get_name()} has no weights")
+        target = plan.model_holder.target_model
+        register_model(target)
+        epoch_data = plan.get_dataset().get_epoch_data()
+        return cls(
+            model_class=get_model_path(target),
+            model_params=dict(plan.model_holder.model_params_map),
+            model_args=epoch_data.get_model_args(),
+            state_dict={k: v.detach().cpu().clone() for k, v in state.items()},
+            preprocess_steps=list(getattr(epoch_data, "preprocess_steps", [])),
+            label_map=dict(epoch_data.label_map),
+            ch_names=list(epoch_data.get_channel_names()),
+        )
+
+    def save(self, filepath: str) -> None:
+        """Save the bundle to *filepath* (see :meth:`load`)."""
+        metadata = {
+            "format_version": FORMAT_VERSION,
+            "model_class": self.model_class,
+            "model_params": self.model_params,
+            "model_args": self.model_args,
+            "preprocess_steps": [step.to_dict() for step in self.preprocess_steps],
+            "label_map": self.label_map,
+            "ch_names": self.ch_names,
+        }
+        torch.save(
+            {
+                "metadata": json.dumps(metadata, default=_to_builtin),
+                "state_dict": self.state_dict,
+            },
+            filepath,
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> ModelBundle:
+        """Load a bundle written by :meth:`save`.
+
+        Only weights and JSON metadata are read, so loading does not execute
+        code from the file, and :meth:`get_model` only builds registered
+        model classes.
+
+        Raises:
+            ValueError: If the file was written by a newer version.
+
+        """
+        content = torch.load(filepath, map_location="cpu", weights_only=True)
+        metadata = json.loads(content["metadata"])
+        if metadata["format_version"] > FORMAT_VERSION:
+            raise ValueError(f"Unsupported model bundle version in {filepath}")
+        return cls(
+            model_class=metadata["model_class"],
+            model_params=metadata["model_params"],
+            model_args=metadata["model_args"],
+            state_dict=content["state_dict"],
+            preprocess_steps=[
+                PreprocessStep.from_dict(step) for step in metadata["preprocess_steps"]
+            ],
+            label_map={int(k): v for k, v in metadata["label_map"].items()},
+            ch_names=metadata["ch_names"],
+        )
+
+    def get_model(self, device: str = "cpu") -> torch.nn.Module:
+        """Create the trained model in evaluation mode on *device*.
+
+        Raises:
+            ValueError: If the model class is not registered with
+                :func:`register_model`.
+
+        """
+        target = _MODEL_REGISTRY.get(self.model_class)
+        if target is None:
+            raise ValueError(
+                f"Unknown model {self.model_class}; only registered models "
+                "can be loaded from a bundle"
+            )
+        model = target(**self.model_params, **self.model_args)
+        model.load_state_dict(self.state_dict)
+        return model.to(device).eval()
+
+    def get_class_names(self) -> list[str]:
+        """Return the class names in output order."""
+        return [self.label_map[i] for i in sorted(self.label_map)]
@@ -0,0 +1,124 @@
+"""Command line interface of the batch inference API.
+
+Example::
+
+    python -m XBrainLab.backend.inference model.pt night/ -o predictions/
+
+scores every supported recording in ``night/`` with a model exported by
+:meth:`ModelBundle.save` and writes one CSV file of class probabilities per
+recording to ``predictions/``. *model* may also be a directory written by
+:class:`~.quantization.ModelExporter`, which is scored with the fastest
+CPU runtime it contains (or the one chosen with ``--runtime``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections.abc import Sequence
+
+from ..load_data.factory import RawDataLoaderFactory
+from .bundle import ModelBundle
+from .predictor import BatchPredictor, FilePrediction
+from .quantization import (
+    MODEL_FILE,
+    RUNTIME_FILES,
+    CpuRuntime,
+    load_cpu_runtime,
+    load_runtime,
+)
+
+
+def collect_files(inputs: Sequence[str]) -> list[str]:
+    """Expand directories in *inputs* to the supported recordings they contain."""
+    extensions = tuple(RawDataLoaderFactory.get_supported_extensions())
+    filepaths = []
+    for path in inputs:
+        if not os.path.isdir(path):
+            filepaths.append(path)
+            continue
+        for root, _, names in sorted(os.walk(path)):
+            filepaths.extend(
+                os.path.join(root, name)
+                for name in sorted(names)
+                if name.lower().endswith(extensions)
+            )
+    return filepaths
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the CLI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m XBrainLab.backend.inference",
+        description="Score EEG recordings with a trained XBrainLab model.",
+    )
+    parser.add_argument(
+        "model",
+        help="model bundle or export directory exported from XBrainLab",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="recordings, or directories searched for recordings",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        required=True,
+        help="directory of the probability CSV files",
+    )
+    parser.add_argument("--device", default="cpu", help="e.g. cpu or cuda:0")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="recordings loaded and preprocessed in parallel",
+    )
+    parser.add_argument(
+        "--runtime",
+        choices=list(RUNTIME_FILES),
+        help="runtime of an export directory (default: fastest available)",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the CLI.
+
+    Returns:
+        ``0`` if every recording was scored, ``1`` otherwise.
+
+    """
+    args = build_parser().parse_args(argv)
+    filepaths = collect_files(args.inputs)
+    if not filepaths:
+        print("No recordings found", file=sys.stderr)
+        return 1
+    runtime: CpuRuntime | None = None
+    model_path = args.model
+    if os.path.isdir(args.model):
+        if args.runtime is None:
+            runtime = load_cpu_runtime(args.model)
+        else:
+            runtime = load_runtime(args.model, args.runtime)
+        model_path = os.path.join(args.model, MODEL_FILE)
+    predictor = BatchPredictor(
+        ModelBundle.load(model_path),
+        device=args.device,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        runtime=runtime,
+    )
+
+    def report(result: FilePrediction) -> None:
+        if result.error is None:
+            print(
+                f"{result.filepath}: {result.n_epochs} epochs -> {result.output_path}"
+            )
+        else:
+            print(f"{result.filepath}: failed ({result.error})", file=sys.stderr)
+
+    results = predictor.predict_files(filepaths, args.output_dir, report)
+    return 0 if all(result.error is None for result in results) else 1
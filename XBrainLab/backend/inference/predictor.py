@@ -0,0 +1,278 @@
+"""Batch prediction of new recordings with a :class:`ModelBundle`."""
+
+from __future__ import annotations
+
+import csv
+import os
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import torch
+
+from ..load_data import Raw
+from ..load_data.raw_data_loader import load_raw_data
+from ..preprocessor import EditEventId, EditEventName, WindowEpoch
+from ..utils.logger import logger
+from .bundle import ModelBundle
+from .quantization import CpuRuntime
+
+# Steps that only rename labels, which new recordings do not need
+_LABEL_STEPS = (EditEventName.__name__, EditEventId.__name__)
+
+
+@dataclass
+class FilePrediction:
+    """Outcome of scoring one recording.
+
+    Attributes:
+        filepath: The recording.
+        output_path: CSV file of the class probabilities, ``None`` if the
+            recording failed.
+        n_epochs: Number of scored epochs.
+        error: Error message if the recording failed.
+
+    """
+
+    filepath: str
+    output_path: str | None = None
+    n_epochs: int = 0
+    error: str | None = None
+
+
+class BatchPredictor:
+    """Scores new recordings with a trained model.
+
+    Each recording is loaded, preprocessed and epoched with the steps
+    stored in the bundle, then its epochs are predicted in batches under
+    :func:`torch.inference_mode`. The class probabilities of every epoch
+    are written to one CSV file per recording.
+
+    Recordings are prepared by a pool of *workers* threads while the model
+    scores the previous ones. At most *workers* prepared recordings wait
+    for the model at any time, so memory stays bounded however many files
+    are scored.
+
+    Attributes:
+        bundle: The trained model.
+        device: Device the model runs on.
+        batch_size: Number of epochs per forward pass.
+        workers: Number of recordings prepared in parallel.
+        runtime: CPU runtime replacing the PyTorch model, or ``None``.
+
+    """
+
+    def __init__(
+        self,
+        bundle: ModelBundle,
+        device: str = "cpu",
+        batch_size: int = 256,
+        workers: int = 1,
+        runtime: CpuRuntime | None = None,
+    ):
+        """Create the predictor and its model.
+
+        Args:
+            bundle: The trained model.
+            device: Device the model runs on.
+            batch_size: Number of epochs per forward pass.
+            workers: Number of recordings prepared in parallel.
+            runtime: Exported CPU runtime (see
+                :func:`~.quantization.load_cpu_runtime`) used instead of
+                the PyTorch model of *bundle*.
+
+        Raises:
+            ValueError: If *batch_size* or *workers* is not positive.
+
+        """
+        if batch_size <= 0:
+            raise ValueError("Invalid batch size (must be positive)")
+        if workers <= 0:
+            raise ValueError("Invalid number of workers (must be positive)")
+        self.bundle = bundle
+        self.device = device
+        self.batch_size = batch_size
+        self.workers = workers
+        self.runtime = runtime
+        self.model = bundle.get_model(device) if runtime is None else None
+
+    def prepare(self, filepath: str) -> Raw:
+        """Load *filepath* and apply the preprocessing of the bundle.
+
+        Event renaming steps are skipped. Sliding-window epoching does not
+        need events in the new recording.
+
+        Returns:
+            The epoched recording.
+
+        Raises:
+            ValueError: If the preprocessing does not produce epochs.
+
+        """
+        raw = load_raw_data(filepath)
+        for step in self.bundle.preprocess_steps:
+            if step.name in _LABEL_STEPS:
+                continue
+            if step.name == WindowEpoch.__name__:
+                # the windows are labelled by a single placeholder event
+                raw.set_event(np.zeros((1, 3), dtype=int), {"window": 0})
+            step.apply([raw])
+        if raw.is_raw():
+            raise ValueError(f"{raw.get_filename()} is not epoched by preprocessing")
+        return raw
+
+    def get_epoch_data(self, raw: Raw) -> np.ndarray:
+        """Return the epochs of *raw* in the channel order of the model.
+
+        Raises:
+            ValueError: If the epochs do not match the model input.
+
+        """
+        epochs = raw.get_mne()
+        data = epochs.get_data()
+        ch_names = epochs.info.ch_names
+        if set(self.bundle.ch_names) <= set(ch_names):
+            data = data[:, [ch_names.index(ch) for ch in self.bundle.ch_names]]
+        expected = (
+            self.bundle.model_args["channels"],
+            self.bundle.model_args["samples"],
+        )
+        if data.shape[1:] != expected:
+            raise ValueError(
+                f"{raw.get_filename()}: epochs of shape {data.shape[1:]} "
+                f"do not match the model input {expected}",
+            )
+        return data
+
+    def predict(self, data: np.ndarray) -> np.ndarray:
+        """Return the class probabilities of *data*.
+
+        Args:
+            data: Epochs of shape ``(n_epochs, channels, samples)``.
+
+        Returns:
+            Array of shape ``(n_epochs, n_classes)``.
+
+        """
+        if self.runtime is not None:
+            return self.runtime.predict(data, self.batch_size)
+        model = self.model
+        if model is None:
+            raise RuntimeError("Predictor has neither a runtime nor a model")
+        outputs = []
+        with torch.inference_mode():
+            for start in range(0, len(data), self.batch_size):
+                batch = torch.as_tensor(
+                    data[start : start + self.batch_size], dtype=torch.float32
+                ).to(self.device)
+                outputs.append(torch.softmax(model(batch), dim=-1).cpu())
+        if not outputs:
+            return np.empty((0, len(self.bundle.label_map)), dtype=np.float32)
+        return torch.cat(outputs).numpy()
+
+    def predict_file(self, filepath: str, output_dir: str) -> FilePrediction:
+        """Score one recording and write its probabilities to *output_dir*."""
+        try:
+            raw = self.prepare(filepath)
+        except Exception as e:
+            return self._failed(filepath, e)
+        return self._predict_prepared(filepath, raw, output_dir)
+
+    def predict_files(
+        self,
+        filepaths: Iterable[str],
+        output_dir: str,
+        on_result: Callable[[FilePrediction], None] | None = None,
+    ) -> list[FilePrediction]:
+        """Score recordings, preparing up to :attr:`workers` in parallel.
+
+        A recording that fails is reported in its :class:`FilePrediction`
+        without stopping the others.
+
+        Args:
+            filepaths: Recordings to score.
+            output_dir: Directory of the CSV files.
+            on_result: Called with the result of each recording, in the
+                order of *filepaths*.
+
+        Returns:
+            The results in the order of *filepaths*.
+
+        """
+        results = []
+        remaining = iter(filepaths)
+        pending: deque[tuple[str, Future[Raw]]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="inference",
+        ) as executor:
+
+            def submit_next() -> None:
+                filepath = next(remaining, None)
+                if filepath is not None:
+                    pending.append((filepath, executor.submit(self.prepare, filepath)))
+
+            for _ in range(self.workers):
+                submit_next()
+            while pending:
+                filepath, future = pending.popleft()
+                submit_next()
+                try:
+                    raw = future.result()
+                except Exception as e:
+                    result = self._failed(filepath, e)
+                else:
+                    result = self._predict_prepared(filepath, raw, output_dir)
+                    del raw
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        return results
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _predict_prepared(
+        self,
+        filepath: str,
+        raw: Raw,
+        output_dir: str,
+    ) -> FilePrediction:
+        try:
+            probabilities = self.predict(self.get_epoch_data(raw))
+            output_path = self._get_output_path(filepath, output_dir)
+            self._write_csv(output_path, raw.get_mne().events[:, 0], probabilities)
+        except Exception as e:
+            return self._failed(filepath, e)
+        logger.info("Scored %d epochs of %s", len(probabilities), filepath)
+        return FilePrediction(filepath, output_path, len(probabilities))
+
+    @staticmethod
+    def _failed(filepath: str, error: Exception) -> FilePrediction:
+        logger.error("Failed to score %s: %s", filepath, error, exc_info=True)
+        return FilePrediction(filepath, error=str(error))
+
+    @staticmethod
+    def _get_output_path(filepath: str, output_dir: str) -> str:
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        return os.path.join(output_dir, f"{stem}.csv")
+
+    def _write_csv(
+        self,
+        output_path: str,
+        samples: np.ndarray,
+        probabilities: np.ndarray,
+    ) -> None:
+        """Write one row per epoch: index, onset sample, probabilities, class."""
+        class_names = self.bundle.get_class_names()
+        with open(output_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["epoch", "sample", *class_names, "predict"])
+            for i, (sample, row) in enumerate(zip(samples, probabilities, strict=True)):
+                writer.writerow(
+                    [i, int(sample), *row.tolist(), class_names[int(row.argmax())]],
+                )
@@ -0,0 +1,517 @@
+"""Int8 quantization, ONNX export and CPU runtimes of a :class:`ModelBundle`.
+
+:class:`ModelExporter` writes an export directory next to the float bundle:
+
+* ``model_int8.pt``: the model quantized to int8 with PyTorch, saved as a
+  TorchScript module;
+* ``model.onnx``: the float model as an ONNX graph;
+* ``model_int8.onnx``: the ONNX graph quantized to int8 by ONNX Runtime,
+  when ``onnxruntime`` is installed.
+
+Static quantization is calibrated on windows of the training split. PyTorch
+static quantization traces the model symbolically, which fails for models
+whose forward pass branches on the input shape; those fall back to dynamic
+quantization of the linear layers, while ONNX Runtime quantizes the traced
+graph statically. :func:`load_cpu_runtime` picks the fastest runtime
+available in a directory and :func:`benchmark_runtimes` compares accuracy,
+agreement and per-window latency against the float model.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import numpy as np
+import torch
+from scipy.special import softmax
+from torch.ao.quantization import get_default_qconfig_mapping
+from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+
+from ..utils.logger import logger
+from .bundle import ModelBundle
+
+if TYPE_CHECKING:
+    from ..training import TrainingPlanHolder
+
+try:
+    import onnxruntime
+    from onnxruntime import quantization as ort_quantization
+except ImportError:
+    # Optional dependency — ONNX runtimes are skipped without it
+    onnxruntime = None
+    ort_quantization = None
+
+MODEL_FILE = "model.pt"
+INT8_FILE = "model_int8.pt"
+ONNX_FILE = "model.onnx"
+ONNX_INT8_FILE = "model_int8.onnx"
+BENCHMARK_FILE = "benchmark.json"
+
+_ONNX_INPUT = "input"
+_ONNX_OUTPUT = "logits"
+_ONNX_OPSET = 17
+_LATENCY_WARMUP = 5
+
+
+class QuantizationMode(Enum):
+    """How the weights and activations of a model are quantized to int8.
+
+    Attributes:
+        DYNAMIC: Int8 weights; activations are quantized on the fly.
+        STATIC: Int8 weights and activations, with activation ranges
+            calibrated on training data.
+
+    """
+
+    DYNAMIC = "dynamic"
+    STATIC = "static"
+
+
+class CpuRuntime:
+    """A model that predicts class probabilities on the CPU.
+
+    Attributes:
+        name: Name of the runtime, e.g. ``"onnx-int8"``.
+        filepath: File the runtime was loaded from.
+
+    """
+
+    def __init__(self, name: str, filepath: str):
+        self.name = name
+        self.filepath = filepath
+
+    def predict(self, data: np.ndarray, batch_size: int = 256) -> np.ndarray:
+        """Return the class probabilities of epochs *data*.
+
+        Args:
+            data: Epochs of shape ``(n_epochs, channels, samples)``.
+            batch_size: Number of epochs per forward pass.
+
+        Returns:
+            Array of shape ``(n_epochs, n_classes)``.
+
+        """
+        outputs = [
+            self._forward(np.ascontiguousarray(data[start : start + batch_size]))
+            for start in range(0, len(data), batch_size)
+        ]
+        return softmax(np.concatenate(outputs), axis=-1).astype(np.float32)
+
+    def get_size(self) -> int:
+        """Return the size of the model file in bytes."""
+        return os.path.getsize(self.filepath)
+
+    def _forward(self, batch: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+
+class TorchRuntime(CpuRuntime):
+    """Runs a PyTorch or TorchScript model under :func:`torch.inference_mode`."""
+
+    def __init__(self, name: str, filepath: str, model: torch.nn.Module):
+        super().__init__(name, filepath)
+        self.model = model.eval()
+
+    def _forward(self, batch: np.ndarray) -> np.ndarray:
+        with torch.inference_mode():
+            return self.model(torch.as_tensor(batch, dtype=torch.float32)).numpy()
+
+
+class OnnxRuntime(CpuRuntime):
+    """Runs an ONNX graph with the ONNX Runtime CPU execution provider."""
+
+    def __init__(self, name: str, filepath: str):
+        super().__init__(name, filepath)
+        if onnxruntime is None:
+            raise RuntimeError("onnxruntime is not installed")
+        self.session = onnxruntime.InferenceSession(
+            filepath, providers=["CPUExecutionProvider"]
+        )
+
+    def _forward(self, batch: np.ndarray) -> np.ndarray:
+        return self.session.run(None, {_ONNX_INPUT: batch.astype(np.float32)})[0]
+
+
+def _select_engine() -> str:
+    """Select the int8 CPU kernels of this machine."""
+    engines = torch.backends.quantized.supported_engines
+    for engine in ("x86", "fbgemm", "qnnpack"):
+        if engine in engines:
+            torch.backends.quantized.engine = engine
+            return engine
+    raise RuntimeError("No int8 CPU kernels are available in this PyTorch build")
+
+
+def quantize_model(
+    model: torch.nn.Module,
+    mode: QuantizationMode,
+    calibration_data: np.ndarray | None = None,
+    batch_size: int = 64,
+) -> tuple[torch.nn.Module, QuantizationMode]:
+    """Return an int8 copy of *model* for CPU inference.
+
+    Static quantization uses FX graph mode. Models that cannot be traced
+    symbolically are quantized dynamically instead.
+
+    Args:
+        model: Float model.
+        mode: Requested quantization mode.
+        calibration_data: Training epochs used to calibrate static
+            quantization.
+        batch_size: Number of epochs per calibration pass.
+
+    Returns:
+        The quantized model and the mode actually applied.
+
+    Raises:
+        ValueError: If static quantization has no calibration data.
+
+    """
+    engine = _select_engine()
+    model = copy.deepcopy(model).cpu().eval()
+    if mode == QuantizationMode.STATIC:
+        if calibration_data is None or len(calibration_data) == 0:
+            raise ValueError("Static quantization needs calibration data")
+        example = torch.as_tensor(calibration_data[:1], dtype=torch.float32)
+        try:
+            prepared = prepare_fx(
+                model, get_default_qconfig_mapping(engine), (example,)
+            )
+        except Exception as e:
+            logger.warning(
+                "%s cannot be traced for static quantization (%s), "
+                "quantizing dynamically",
+                type(model).__name__,
+                e,
+            )
+        else:
+            with torch.inference_mode():
+                for start in range(0, len(calibration_data), batch_size):
+                    prepared(
+                        torch.as_tensor(
+                            calibration_data[start : start + batch_size],
+                            dtype=torch.float32,
+                        )
+                    )
+            return convert_fx(prepared), QuantizationMode.STATIC
+    quantized = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    return quantized, QuantizationMode.DYNAMIC
+
+
+def export_onnx(
+    model: torch.nn.Module,
+    filepath: str,
+    channels: int,
+    samples: int,
+) -> None:
+    """Export float *model* as an ONNX graph with a dynamic batch axis."""
+    example = torch.zeros(1, channels, samples)
+    torch.onnx.export(
+        copy.deepcopy(model).cpu().eval(),
+        (example,),
+        filepath,
+        input_names=[_ONNX_INPUT],
+        output_names=[_ONNX_OUTPUT],
+        dynamic_axes={_ONNX_INPUT: {0: "batch"}, _ONNX_OUTPUT: {0: "batch"}},
+        opset_version=_ONNX_OPSET,
+    )
+
+
+def quantize_onnx(
+    source: str,
+    target: str,
+    mode: QuantizationMode,
+    calibration_data: np.ndarray | None = None,
+) -> None:
+    """Quantize the ONNX graph *source* to int8 with ONNX Runtime.
+
+    Raises:
+        RuntimeError: If onnxruntime is not installed.
+        ValueError: If static quantization has no calibration data.
+
+    """
+    if ort_quantization is None:
+        raise RuntimeError("onnxruntime is not installed")
+    if mode == QuantizationMode.DYNAMIC:
+        ort_quantization.quantize_dynamic(
+            source, target, weight_type=ort_quantization.QuantType.QInt8
+        )
+        return
+    if calibration_data is None or len(calibration_data) == 0:
+        raise ValueError("Static quantization needs calibration data")
+    windows = calibration_data.astype(np.float32)
+
+    class _Reader(ort_quantization.CalibrationDataReader):
+        def __init__(self) -> None:
+            self.windows = iter(windows)
+
+        def get_next(self) -> dict | None:
+            window = next(self.windows, None)
+            return None if window is None else {_ONNX_INPUT: window[None]}
+
+    ort_quantization.quantize_static(
+        source,
+        target,
+        _Reader(),
+        activation_type=ort_quantization.QuantType.QInt8,
+        weight_type=ort_quantization.QuantType.QInt8,
+    )
+
+
+# Runtime names, fastest first
+RUNTIME_FILES = {
+    "onnx-int8": ONNX_INT8_FILE,
+    "torch-int8": INT8_FILE,
+    "onnx": ONNX_FILE,
+    "torch": MODEL_FILE,
+}
+
+
+def load_runtime(directory: str, name: str) -> CpuRuntime:
+    """Load runtime *name* (a key of :data:`RUNTIME_FILES`) from *directory*.
+
+    Raises:
+        ValueError: If the runtime is unknown or was not exported.
+        RuntimeError: If the runtime needs onnxruntime, which is missing.
+
+    """
+    if name not in RUNTIME_FILES:
+        raise ValueError(f"Unknown runtime {name}")
+    filepath = os.path.join(directory, RUNTIME_FILES[name])
+    if not os.path.exists(filepath):
+        raise ValueError(f"{directory} has no {name} model")
+    if name.startswith("onnx"):
+        return OnnxRuntime(name, filepath)
+    if name == "torch-int8":
+        _select_engine()
+        return TorchRuntime(name, filepath, torch.jit.load(filepath, "cpu"))
+    return TorchRuntime(name, filepath, ModelBundle.load(filepath).get_model("cpu"))
+
+
+def get_available_runtimes(directory: str) -> list[str]:
+    """Return the runtimes of *directory* usable here, fastest first."""
+    return [
+        name
+        for name, filename in RUNTIME_FILES.items()
+        if os.path.exists(os.path.join(directory, filename))
+        and (onnxruntime is not None or not name.startswith("onnx"))
+    ]
+
+
+def load_cpu_runtime(directory: str) -> CpuRuntime:
+    """Load the fastest runtime available in the export *directory*.
+
+    Raises:
+        ValueError: If the directory contains no usable model.
+
+    """
+    available = get_available_runtimes(directory)
+    if not available:
+        raise ValueError(f"{directory} contains no exported model")
+    return load_runtime(directory, available[0])
+
+
+@dataclass
+class RuntimeBenchmark:
+    """Accuracy and speed of one runtime on held-out epochs.
+
+    Attributes:
+        name: Name of the runtime.
+        size_bytes: Size of the model file.
+        accuracy: Accuracy in percent, ``None`` without labels.
+        agreement: Percentage of epochs predicted like the float model.
+        max_prob_error: Largest absolute probability difference to the
+            float model.
+        latency_ms: Median latency of one window in milliseconds.
+        latency_p95_ms: 95th percentile latency of one window.
+
+    """
+
+    name: str
+    size_bytes: int
+    accuracy: float | None
+    agreement: float
+    max_prob_error: float
+    latency_ms: float
+    latency_p95_ms: float
+
+
+def benchmark_runtimes(
+    runtimes: list[CpuRuntime],
+    data: np.ndarray,
+    labels: np.ndarray | None = None,
+    n_latency: int = 100,
+) -> list[RuntimeBenchmark]:
+    """Compare *runtimes* against the first one, the float reference.
+
+    Args:
+        runtimes: Runtimes to compare; the first is the reference.
+        data: Held-out epochs.
+        labels: Labels of *data*, or ``None``.
+        n_latency: Number of single windows timed per runtime.
+
+    Returns:
+        One benchmark per runtime, in order.
+
+    """
+    reference = None
+    results = []
+    windows = data[: max(n_latency, 1)]
+    for runtime in runtimes:
+        probabilities = runtime.predict(data)
+        if reference is None:
+            reference = probabilities
+        predictions = probabilities.argmax(axis=-1)
+        for window in windows[:_LATENCY_WARMUP]:
+            runtime.predict(window[None])
+        latencies = []
+        for window in windows:
+            start = time.perf_counter()
+            runtime.predict(window[None])
+            latencies.append((time.perf_counter() - start) * 1000)
+        results.append(
+            RuntimeBenchmark(
+                name=runtime.name,
+                size_bytes=runtime.get_size(),
+                accuracy=(
+                    None
+                    if labels is None
+                    else float((predictions == labels).mean() * 100)
+                ),
+                agreement=float(
+                    (predictions == reference.argmax(axis=-1)).mean() * 100
+                ),
+                max_prob_error=float(np.abs(probabilities - reference).max()),
+                latency_ms=float(np.median(latencies)),
+                latency_p95_ms=float(np.percentile(latencies, 95)),
+            )
+        )
+    return results
+
+
+class ModelExporter:
+    """Exports a bundle as int8 and ONNX models for CPU inference nodes.
+
+    Attributes:
+        bundle: The trained float model.
+        mode: Requested quantization mode.
+        calibration_data: Training epochs calibrating static quantization.
+        eval_data: Held-out epochs of the benchmark, or ``None``.
+        eval_labels: Labels of :attr:`eval_data`, or ``None``.
+
+    """
+
+    def __init__(
+        self,
+        bundle: ModelBundle,
+        mode: QuantizationMode = QuantizationMode.STATIC,
+        calibration_data: np.ndarray | None = None,
+        eval_data: np.ndarray | None = None,
+        eval_labels: np.ndarray | None = None,
+    ):
+        self.bundle = bundle
+        self.mode = mode
+        self.calibration_data = calibration_data
+        self.eval_data = eval_data
+        self.eval_labels = eval_labels
+
+    @classmethod
+    def from_plan(
+        cls,
+        plan: TrainingPlanHolder,
+        repeat: int = 0,
+        mode: QuantizationMode = QuantizationMode.STATIC,
+        calibration_size: int = 256,
+    ) -> ModelExporter:
+        """Create an exporter for one repetition of a trained plan.
+
+        Up to *calibration_size* random training epochs calibrate the
+        quantization. The test split (or the validation split without one)
+        is used for the benchmark.
+
+        """
+        dataset = plan.get_dataset()
+        data = dataset.get_epoch_data().get_data()
+        labels = dataset.get_epoch_data().get_label_list()
+        train_indices = dataset.get_training_indices()
+        if len(train_indices) > calibration_size:
+            rng = np.random.default_rng(0)
+            train_indices = np.sort(
+                rng.choice(train_indices, calibration_size, replace=False)
+            )
+        eval_indices = dataset.get_test_indices()
+        if len(eval_indices) == 0:
+            eval_indices = dataset.get_val_indices()
+        eval_data = eval_labels = None
+        if len(eval_indices) > 0:
+            eval_data = data[eval_indices].astype(np.float32)
+            eval_labels = labels[eval_indices]
+        return cls(
+            ModelBundle.from_plan(plan, repeat),
+            mode,
+            data[train_indices].astype(np.float32),
+            eval_data,
+            eval_labels,
+        )
+
+    def export(self, output_dir: str) -> list[RuntimeBenchmark]:
+        """Write the float, int8 and ONNX models to *output_dir*.
+
+        A runtime that cannot be exported is logged and left out. When
+        held-out data is available, all exported runtimes are benchmarked
+        and the results are written to ``benchmark.json``.
+
+        Returns:
+            The benchmarks, float model first; empty without held-out data.
+
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self.bundle.save(os.path.join(output_dir, MODEL_FILE))
+        model = self.bundle.get_model("cpu")
+        channels = self.bundle.model_args["channels"]
+        samples = self.bundle.model_args["samples"]
+        try:
+            quantized, mode = quantize_model(model, self.mode, self.calibration_data)
+            example = torch.zeros(1, channels, samples)
+            with torch.inference_mode():
+                traced = torch.jit.trace(quantized, example)
+            torch.jit.save(traced, os.path.join(output_dir, INT8_FILE))
+            logger.info("Exported %s int8 model to %s", mode.value, output_dir)
+        except Exception as e:
+            logger.warning("PyTorch int8 export failed: %s", e, exc_info=True)
+        onnx_path = os.path.join(output_dir, ONNX_FILE)
+        try:
+            export_onnx(model, onnx_path, channels, samples)
+        except Exception as e:
+            logger.warning("ONNX export failed: %s", e, exc_info=True)
+        if os.path.exists(onnx_path) and onnxruntime is not None:
+            try:
+                quantize_onnx(
+                    onnx_path,
+                    os.path.join(output_dir, ONNX_INT8_FILE),
+                    self.mode,
+                    self.calibration_data,
+                )
+            except Exception as e:
+                logger.warning("ONNX int8 export failed: %s", e, exc_info=True)
+        if self.eval_data is None:
+            return []
+        names = ["torch"] + [
+            name for name in get_available_runtimes(output_dir) if name != "torch"
+        ]
+        results = benchmark_runtimes(
+            [load_runtime(output_dir, name) for name in names],
+            self.eval_data,
+            self.eval_labels,
+        )
+        with open(os.path.join(output_dir, BENCHMARK_FILE), "w") as f:
+            json.dump([asdict(result) for result in results], f, indent=2)
+        return results
@@ -0,0 +1,512 @@
+"""Online sliding-window classification of a live EEG stream.
+
+:class:`StreamingClassifier` accepts sample chunks as they arrive from an
+amplifier, applies causal versions of the preprocessing stored in a
+:class:`~.bundle.ModelBundle` chunk by chunk, keeps the preprocessed signal
+in a :class:`RingBuffer` and classifies the latest window every *hop*
+seconds. :class:`FileReplaySource` replays a recording at real-time speed
+in place of an amplifier.
+
+The offline preprocessing is approximated causally:
+
+* filters become Butterworth (order 4) and notch IIR filters whose state
+  is carried across chunks, so their phase response differs from the
+  zero-phase filters used in training;
+* resampling interpolates linearly after a causal anti-aliasing filter;
+* normalization before epoching uses the statistics of all samples seen
+  so far, normalization after epoching is applied to each window;
+* epoching becomes the sliding window, whatever epoching produced the
+  training data.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+import torch
+from scipy import signal
+
+from ..load_data.raw_data_loader import load_raw_data
+from ..preprocessor import (
+    ChannelSelection,
+    EditEventId,
+    EditEventName,
+    Filtering,
+    Normalize,
+    PreprocessStep,
+    Rereference,
+    Resample,
+    TimeEpoch,
+    WindowEpoch,
+)
+from .bundle import ModelBundle
+
+_EPOCH_STEPS = (TimeEpoch.__name__, WindowEpoch.__name__)
+_LABEL_STEPS = (EditEventName.__name__, EditEventId.__name__)
+_EPS = 1e-12
+
+
+@dataclass(frozen=True)
+class WindowPrediction:
+    """Prediction of one window of the stream.
+
+    Attributes:
+        index: 0-based index of the window.
+        end_sample: Number of preprocessed samples up to the end of the
+            window, at the sampling rate of the model.
+        probabilities: Class probabilities.
+        label: Name of the predicted class.
+        latency: Seconds from the arrival of the chunk completing the window
+            to the prediction.
+
+    """
+
+    index: int
+    end_sample: int
+    probabilities: np.ndarray
+    label: str
+    latency: float
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of the latest samples of a multichannel signal.
+
+    Attributes:
+        capacity: Number of samples kept.
+        n_total: Number of samples appended since creation.
+
+    """
+
+    def __init__(self, n_channels: int, capacity: int):
+        self.capacity = capacity
+        self.n_total = 0
+        self._data = np.zeros((n_channels, capacity), dtype=np.float32)
+
+    def append(self, chunk: np.ndarray) -> None:
+        """Append *chunk* of shape ``(channels, samples)``."""
+        n = chunk.shape[1]
+        if n > self.capacity:
+            self.n_total += n - self.capacity
+            chunk = chunk[:, -self.capacity :]
+            n = self.capacity
+        start = self.n_total % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[:, start : start + first] = chunk[:, :first]
+        self._data[:, : n - first] = chunk[:, first:]
+        self.n_total += n
+
+    def latest(self, n: int) -> np.ndarray:
+        """Return a copy of the latest *n* samples.
+
+        Raises:
+            ValueError: If fewer than *n* samples are available.
+
+        """
+        if n > min(self.n_total, self.capacity):
+            raise ValueError(f"Only {min(self.n_total, self.capacity)} samples kept")
+        end = self.n_total % self.capacity
+        index = np.arange(end - n, end) % self.capacity
+        return self._data[:, index]
+
+
+class _CausalFilter:
+    """IIR filter whose state is carried from chunk to chunk."""
+
+    def __init__(self, sos: np.ndarray):
+        self._sos = sos
+        self._zi: np.ndarray | None = None
+
+    @classmethod
+    def from_bands(
+        cls,
+        sfreq: float,
+        l_freq: float | None,
+        h_freq: float | None,
+        notch_freqs=None,
+    ) -> _CausalFilter:
+        nyquist = sfreq / 2
+        h_freq = h_freq if h_freq is not None and h_freq < nyquist else None
+        sections = []
+        if l_freq and h_freq is not None:
+            sections.append(
+                signal.butter(4, [l_freq, h_freq], "bandpass", fs=sfreq, output="sos")
+            )
+        elif l_freq:
+            sections.append(
+                signal.butter(4, l_freq, "highpass", fs=sfreq, output="sos")
+            )
+        elif h_freq is not None:
+            sections.append(signal.butter(4, h_freq, "lowpass", fs=sfreq, output="sos"))
+        for freq in np.atleast_1d(notch_freqs) if notch_freqs is not None else []:
+            if freq < nyquist:
+                b, a = signal.iirnotch(float(freq), 30.0, fs=sfreq)
+                sections.append(signal.tf2sos(b, a))
+        if not sections:
+            return cls(np.empty((0, 6)))
+        return cls(np.concatenate(sections))
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        if len(self._sos) == 0 or chunk.shape[1] == 0:
+            return chunk
+        if self._zi is None:
+            # start in the steady state of the first sample to avoid a
+            # transient from the signal offset
+            zi = signal.sosfilt_zi(self._sos)
+            self._zi = zi[:, None, :] * chunk[None, :, :1]
+        filtered, self._zi = signal.sosfilt(self._sos, chunk, axis=-1, zi=self._zi)
+        return filtered
+
+
+class _Resampler:
+    """Causal linear-interpolation resampler."""
+
+    def __init__(self, sfreq: float, new_sfreq: float):
+        self._step = sfreq / new_sfreq
+        self._anti_alias = (
+            _CausalFilter.from_bands(sfreq, None, 0.45 * new_sfreq)
+            if new_sfreq < sfreq
+            else None
+        )
+        # position of the next output sample relative to the next chunk
+        self._next = 0.0
+        self._last: np.ndarray | None = None
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        if self._anti_alias is not None:
+            chunk = self._anti_alias.process(chunk)
+        n = chunk.shape[1]
+        if n == 0:
+            return chunk
+        if self._last is not None:
+            chunk = np.concatenate([self._last, chunk], axis=1)
+            offset = 1
+        else:
+            offset = 0
+        times = np.arange(self._next, n - 1 + _EPS, self._step)
+        self._next = (times[-1] + self._step - n) if len(times) else self._next - n
+        self._last = chunk[:, -1:]
+        position = times + offset
+        left = np.floor(position).astype(int)
+        right = np.minimum(left + 1, chunk.shape[1] - 1)
+        weight = position - left
+        return chunk[:, left] * (1 - weight) + chunk[:, right] * weight
+
+
+class _RunningNormalize:
+    """Normalization by the statistics of all samples seen so far."""
+
+    def __init__(self, method: str):
+        self._method = method
+        self._count = 0
+        self._sum: np.ndarray | float = 0.0
+        self._sum_sq: np.ndarray | float = 0.0
+        self._min: np.ndarray | None = None
+        self._max: np.ndarray | None = None
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        if chunk.shape[1] == 0:
+            return chunk
+        if self._method == "z score":
+            self._count += chunk.shape[1]
+            self._sum = self._sum + chunk.sum(axis=1, keepdims=True)
+            self._sum_sq = self._sum_sq + np.square(chunk).sum(axis=1, keepdims=True)
+            mean = self._sum / self._count
+            std = np.sqrt(np.maximum(self._sum_sq / self._count - mean**2, 0))
+            return (chunk - mean) / (std + _EPS)
+        low = chunk.min(axis=1, keepdims=True)
+        high = chunk.max(axis=1, keepdims=True)
+        self._min = low if self._min is None else np.minimum(self._min, low)
+        self._max = high if self._max is None else np.maximum(self._max, high)
+        return (chunk - self._min) / (self._max - self._min + _EPS)
+
+
+def _pick_channels(chunk: np.ndarray, picks: list[int]) -> np.ndarray:
+    return chunk[picks]
+
+
+def _rereference(chunk: np.ndarray, refs: list[int]) -> np.ndarray:
+    return chunk - chunk[refs].mean(axis=0)
+
+
+def _normalize_windows(windows: np.ndarray, method: str) -> np.ndarray:
+    """Normalize each window of ``(windows, channels, samples)`` on its own."""
+    if method == "z score":
+        mean = windows.mean(axis=-1, keepdims=True)
+        return (windows - mean) / (windows.std(axis=-1, keepdims=True) + _EPS)
+    low = windows.min(axis=-1, keepdims=True)
+    high = windows.max(axis=-1, keepdims=True)
+    return (windows - low) / (high - low + _EPS)
+
+
+def _get_norm_method(norm: str) -> str:
+    method = norm.lower().replace("-", " ").replace("_", " ").strip()
+    if method not in ("z score", "minmax"):
+        raise ValueError(f"Unknown normalization method: '{norm}'")
+    return method
+
+
+class StreamPipeline:
+    """Causal version of the preprocessing steps of a bundle.
+
+    Attributes:
+        ch_names: Channel names of the preprocessed signal.
+        sfreq: Sampling frequency of the preprocessed signal.
+
+    """
+
+    def __init__(self, steps: list[PreprocessStep], ch_names: list[str], sfreq: float):
+        """Build the causal stages of *steps*.
+
+        Args:
+            steps: Preprocessing steps of the training data.
+            ch_names: Channel names of the incoming stream.
+            sfreq: Sampling frequency of the incoming stream.
+
+        Raises:
+            ValueError: If a step cannot be applied to a stream.
+
+        """
+        self.ch_names = list(ch_names)
+        self.sfreq = float(sfreq)
+        self._stages: list[Callable[[np.ndarray], np.ndarray]] = []
+        self._window_norms: list[str] = []
+        epoched = False
+        for step in steps:
+            if step.name in _LABEL_STEPS:
+                continue
+            if step.name in _EPOCH_STEPS:
+                epoched = True
+                continue
+            args = step.get_arguments()
+            if step.name == Normalize.__name__:
+                method = _get_norm_method(args["norm"])
+                if epoched:
+                    self._window_norms.append(method)
+                else:
+                    self._stages.append(_RunningNormalize(method).process)
+            else:
+                self._add_stage(step.name, args)
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Preprocess a chunk of shape ``(channels, samples)`` of the stream."""
+        for stage in self._stages:
+            chunk = stage(chunk)
+        return chunk
+
+    def process_windows(self, windows: np.ndarray) -> np.ndarray:
+        """Apply the steps following epoching to a batch of windows."""
+        for method in self._window_norms:
+            windows = _normalize_windows(windows, method)
+        return windows
+
+    def _add_stage(self, name: str, args: dict) -> None:
+        if name == ChannelSelection.__name__:
+            picks = [self._index(ch) for ch in args["selected_channels"]]
+            self.ch_names = [self.ch_names[i] for i in picks]
+            self._stages.append(functools.partial(_pick_channels, picks=picks))
+        elif name == Rereference.__name__:
+            ref = args["ref_channels"]
+            if isinstance(ref, str):
+                refs = list(range(len(self.ch_names)))
+            else:
+                refs = [self._index(ch) for ch in ref]
+            self._stages.append(functools.partial(_rereference, refs=refs))
+        elif name == Filtering.__name__:
+            causal_filter = _CausalFilter.from_bands(
+                self.sfreq, args["l_freq"], args["h_freq"], args["notch_freqs"]
+            )
+            self._stages.append(causal_filter.process)
+        elif name == Resample.__name__:
+            self._stages.append(_Resampler(self.sfreq, float(args["sfreq"])).process)
+            self.sfreq = float(args["sfreq"])
+        else:
+            raise ValueError(f"{name} cannot be applied to a stream")
+
+    def _index(self, ch_name: str) -> int:
+        if ch_name not in self.ch_names:
+            raise ValueError(f"Channel {ch_name} is not in the stream")
+        return self.ch_names.index(ch_name)
+
+
+class StreamingClassifier:
+    """Classifies the latest window of a live stream at a fixed hop.
+
+    Call :meth:`push` with every chunk received from the amplifier; it
+    returns the predictions of the windows the chunk completes. The first
+    window ends once a window of preprocessed samples has arrived, the
+    following ones every *hop* seconds. Windows completed by the same chunk
+    are predicted in one batch.
+
+    Attributes:
+        bundle: The trained model.
+        pipeline: Causal preprocessing of the stream.
+        window: Window length in samples of the model.
+        hop: Hop between windows in samples of the model.
+        latencies: Latency of every window so far, in seconds.
+
+    """
+
+    def __init__(
+        self,
+        bundle: ModelBundle,
+        ch_names: list[str],
+        sfreq: float,
+        hop: float,
+        device: str = "cpu",
+    ):
+        """Create the classifier.
+
+        Args:
+            bundle: The trained model.
+            ch_names: Channel names of the stream.
+            sfreq: Sampling frequency of the stream in Hz.
+            hop: Time between the ends of consecutive windows in seconds.
+            device: Device the model runs on.
+
+        Raises:
+            ValueError: If the stream does not provide the input of the model.
+
+        """
+        self.bundle = bundle
+        self.device = device
+        self.pipeline = StreamPipeline(bundle.preprocess_steps, ch_names, sfreq)
+        model_sfreq = bundle.model_args["sfreq"]
+        if model_sfreq and not np.isclose(self.pipeline.sfreq, model_sfreq):
+            raise ValueError(
+                f"The stream is preprocessed to {self.pipeline.sfreq} Hz, "
+                f"the model expects {model_sfreq} Hz",
+            )
+        if not set(bundle.ch_names) <= set(self.pipeline.ch_names):
+            raise ValueError("The stream lacks channels of the model")
+        self._channels = [self.pipeline.ch_names.index(ch) for ch in bundle.ch_names]
+        self.window = int(bundle.model_args["samples"])
+        self.hop = round(hop * self.pipeline.sfreq)
+        if self.hop <= 0:
+            raise ValueError("Invalid hop (must be positive)")
+        self.buffer = RingBuffer(len(self.pipeline.ch_names), self.window + self.hop)
+        self.model = bundle.get_model(device)
+        self.class_names = bundle.get_class_names()
+        self.latencies: list[float] = []
+        self._next_end = self.window
+
+    def push(self, chunk: np.ndarray) -> list[WindowPrediction]:
+        """Add a chunk of shape ``(channels, samples)`` to the stream.
+
+        Returns:
+            Predictions of the windows completed by *chunk*.
+
+        """
+        arrival = time.perf_counter()
+        samples = self.pipeline.process(np.asarray(chunk, dtype=np.float64))
+        windows, ends = [], []
+        position = 0
+        while position < samples.shape[1]:
+            n = min(self._next_end - self.buffer.n_total, samples.shape[1] - position)
+            self.buffer.append(samples[:, position : position + n])
+            position += n
+            if self.buffer.n_total == self._next_end:
+                windows.append(self.buffer.latest(self.window)[self._channels])
+                ends.append(self._next_end)
+                self._next_end += self.hop
+        if not windows:
+            return []
+        batch = self.pipeline.process_windows(np.stack(windows))
+        with torch.inference_mode():
+            outputs = self.model(
+                torch.as_tensor(batch, dtype=torch.float32).to(self.device)
+            )
+            probabilities = torch.softmax(outputs, dim=-1).cpu().numpy()
+        latency = time.perf_counter() - arrival
+        predictions = []
+        for end, row in zip(ends, probabilities, strict=True):
+            predictions.append(
+                WindowPrediction(
+                    index=len(self.latencies),
+                    end_sample=end,
+                    probabilities=row,
+                    label=self.class_names[int(row.argmax())],
+                    latency=latency,
+                ),
+            )
+            self.latencies.append(latency)
+        return predictions
+
+    def stream(self, source: Iterable[np.ndarray]) -> Iterator[WindowPrediction]:
+        """Push every chunk of *source* and yield the predictions."""
+        for chunk in source:
+            yield from self.push(chunk)
+
+    def get_latency_summary(self) -> dict[str, float]:
+        """Return the mean, median, 95th percentile and maximum latency (s)."""
+        if not self.latencies:
+            return {"windows": 0}
+        latencies = np.asarray(self.latencies)
+        return {
+            "windows": len(latencies),
+            "mean": float(latencies.mean()),
+            "median": float(np.median(latencies)),
+            "p95": float(np.percentile(latencies, 95)),
+            "max": float(latencies.max()),
+        }
+
+
+class FileReplaySource:
+    """Replays a recording chunk by chunk like a live amplifier.
+
+    Iterating yields ``(channels, samples)`` chunks read lazily from the
+    file. Each chunk is released when its last sample would have been
+    recorded, so a replay at ``speed=1`` takes as long as the recording.
+
+    Attributes:
+        ch_names: Channel names of the recording.
+        sfreq: Sampling frequency of the recording.
+        chunk_size: Samples per chunk.
+        speed: Replay speed relative to real time; ``None`` replays as
+            fast as possible.
+
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        chunk_duration: float = 0.04,
+        speed: float | None = 1.0,
+    ):
+        """Open the recording.
+
+        Args:
+            filepath: Continuous recording readable by XBrainLab.
+            chunk_duration: Duration of each chunk in seconds.
+            speed: Replay speed relative to real time, ``None`` for no
+                pacing.
+
+        Raises:
+            ValueError: If the recording is epoched or the chunk is empty.
+
+        """
+        self._raw = load_raw_data(filepath)
+        if not self._raw.is_raw():
+            raise ValueError("Only continuous recordings can be replayed")
+        self.ch_names = list(self._raw.get_mne().info.ch_names)
+        self.sfreq = self._raw.get_sfreq()
+        self.chunk_size = round(chunk_duration * self.sfreq)
+        if self.chunk_size <= 0:
+            raise ValueError("Invalid chunk duration (must cover a sample)")
+        self.speed = speed
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        mne_data = self._raw.get_mne()
+        n_times = mne_data.n_times
+        start_time = time.perf_counter()
+        for start in range(0, n_times, self.chunk_size):
+            stop = min(start + self.chunk_size, n_times)
+            if self.speed:
+                due = start_time + stop / self.sfreq / self.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            yield mne_data.get_data(start=start, stop=stop)
@@ -61,6 +61,11 @@ class RawDataLoaderFactory:
 
         return cls._loaders[ext]
 
+    @classmethod
+    def get_supported_extensions(cls) -> list[str]:
+        """Return the registered file extensions (including the dot)."""
+        return sorted(cls._loaders)
+
     @classmethod
     def load(cls, filepath: str) -> Raw | None:
         """Load raw data from file using the appropriate loader.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
 import mne
 import numpy as np
@@ -11,6 +12,9 @@ from ..utils import validate_type
 from ..utils.filename_parser import FilenameParser
 from ..utils.logger import logger
 
+if TYPE_CHECKING:
+    from ..preprocessor.base import PreprocessStep
+
 
 class Raw:
     """Wrapper around MNE data objects with metadata and event tracking.
@@ -22,6 +26,7 @@ class Raw:
         filepath: Absolute path to the source data file.
         mne_data: Underlying MNE data object (raw or epochs).
         preprocess_history: Ordered list of preprocessing step descriptions.
+        preprocess_steps: Ordered list of the replayable preprocessing steps.
         raw_events: Imported event array in MNE format, or None.
         raw_event_id: Imported event ID mapping, or None.
         subject: Subject identifier string.
@@ -43,6 +48,7 @@ class Raw:
         self.filepath = filepath
         self.mne_data = mne_data
         self.preprocess_history: list[str] = []
+        self.preprocess_steps: list[PreprocessStep] = []
         self.raw_events: np.ndarray | None = None
         self.raw_event_id: dict[str, int] | None = None
         self.subject = "0"
@@ -69,14 +75,22 @@ class Raw:
         """Return the preprocess history of the raw data."""
         return self.preprocess_history
 
-    def add_preprocess(self, desc: str) -> None:
+    def get_preprocess_steps(self) -> list[PreprocessStep]:
+        """Return the replayable preprocessing steps of the raw data."""
+        return self.preprocess_steps
+
+    def add_preprocess(self, desc: str, step: PreprocessStep | None = None) -> None:
         """Append a preprocessing description to the history.
 
         Args:
             desc: Human-readable description of the preprocessing step.
+            step: The step itself, recorded so it can be applied to new
+                recordings.
 
         """
         self.preprocess_history.append(desc)
+        if step is not None:
+            self.preprocess_steps.append(step)
 
     def parse_filename(self, regex: str) -> None:
         """Extract and set data related information from the filename.
@@ -313,6 +327,7 @@ class Raw:
 
         # Copy properties
         new_obj.preprocess_history = self.preprocess_history.copy()
+        new_obj.preprocess_steps = self.preprocess_steps.copy()
         new_obj.subject = self.subject
         new_obj.session = self.session
         new_obj.labels_imported = self.labels_imported
@@ -1,6 +1,6 @@
 """EEG data preprocessing modules."""
 
-from .base import PreprocessBase
+from .base import PreprocessBase, PreprocessStep
 from .channel_selection import ChannelSelection
 from .edit_event import EditEventId, EditEventName
 from .export import Export
@@ -19,6 +19,7 @@ __all__ = [
     "Filtering",
     "Normalize",
     "PreprocessBase",
+    "PreprocessStep",
     "Rereference",
     "Resample",
     "TimeEpoch",
@@ -1,11 +1,80 @@
 """Base class for all EEG preprocessors."""
 
+from __future__ import annotations
+
+import inspect
 from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
 from ..load_data import Raw
 from ..utils import validate_list_type
 
 
+@dataclass(frozen=True)
+class PreprocessStep:
+    """A recorded preprocessing step that can be applied to new data.
+
+    Every :meth:`PreprocessBase.data_preprocess` call stores one step in
+    the preprocessing history of the processed data (see
+    :meth:`Raw.get_preprocess_steps`), so the pipeline that produced a
+    training set can be replayed on new recordings.
+
+    Attributes:
+        name: Class name of the preprocessor.
+        args: Positional arguments of ``data_preprocess``.
+        kwargs: Keyword arguments of ``data_preprocess``.
+
+    """
+
+    name: str
+    args: tuple = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def apply(self, preprocessed_data_list: list[Raw]) -> list[Raw]:
+        """Apply the step in place to *preprocessed_data_list*.
+
+        Args:
+            preprocessed_data_list: Data to preprocess.
+
+        Returns:
+            The preprocessed data.
+
+        Raises:
+            ValueError: If the preprocessor is unknown or rejects the data.
+
+        """
+        preprocessor = PreprocessBase.get_preprocessor(self.name)
+        return preprocessor(preprocessed_data_list, copy=False).data_preprocess(
+            *self.args, **self.kwargs
+        )
+
+    def get_arguments(self) -> dict[str, Any]:
+        """Return the arguments of the step by parameter name.
+
+        Parameters left out of the recorded call take their defaults.
+
+        Raises:
+            ValueError: If the preprocessor is unknown.
+            TypeError: If the arguments do not match the preprocessor.
+
+        """
+        preprocessor = PreprocessBase.get_preprocessor(self.name)
+        signature = inspect.signature(preprocessor._data_preprocess)
+        bound = signature.bind(None, None, *self.args, **self.kwargs)
+        bound.apply_defaults()
+        return dict(list(bound.arguments.items())[2:])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the step as a JSON-serializable dict."""
+        return {"name": self.name, "args": list(self.args), "kwargs": self.kwargs}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PreprocessStep:
+        """Create a step from the output of :meth:`to_dict`."""
+        return cls(data["name"], tuple(data["args"]), dict(data["kwargs"]))
+
+
 class PreprocessBase:
     """Base class for preprocessors.
 
@@ -18,22 +87,44 @@ class PreprocessBase:
 
     """
 
-    def __init__(self, preprocessed_data_list: list[Raw]):
+    _registry: ClassVar[dict[str, type[PreprocessBase]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        PreprocessBase._registry[cls.__name__] = cls
+
+    def __init__(self, preprocessed_data_list: list[Raw], copy: bool = True):
         """Initializes the preprocessor with a deep copy of the data.
 
         Args:
             preprocessed_data_list: List of
                 :class:`~XBrainLab.backend.load_data.Raw` instances to
                 preprocess.
+            copy: Preprocess a deep copy of the data. Pass ``False`` to
+                modify the given instances in place.
 
         Raises:
             TypeError: If the list contains invalid types.
             ValueError: If the list is empty.
 
         """
-        self.preprocessed_data_list = deepcopy(preprocessed_data_list)
+        if copy:
+            preprocessed_data_list = deepcopy(preprocessed_data_list)
+        self.preprocessed_data_list = preprocessed_data_list
         self.check_data()
 
+    @staticmethod
+    def get_preprocessor(name: str) -> type[PreprocessBase]:
+        """Return the preprocessor class named *name*.
+
+        Raises:
+            ValueError: If no preprocessor of that name is defined.
+
+        """
+        if name not in PreprocessBase._registry:
+            raise ValueError(f"Unknown preprocessor: {name}")
+        return PreprocessBase._registry[name]
+
     def check_data(self) -> None:
         """Check if the data is valid.
 
@@ -72,7 +163,8 @@ class PreprocessBase:
 
         Iterates over each item in ``preprocessed_data_list``, calls
         :meth:`_data_preprocess`, and records the operation description
-        in each item's preprocessing history.
+        and a replayable :class:`PreprocessStep` in each item's
+        preprocessing history.
 
         Args:
             *args: Preprocessing-specific positional arguments forwarded to
@@ -85,9 +177,12 @@ class PreprocessBase:
             :class:`~XBrainLab.backend.load_data.Raw` instances.
 
         """
+        step = PreprocessStep(type(self).__name__, args, kwargs)
         for preprocessed_data in self.preprocessed_data_list:
             self._data_preprocess(preprocessed_data, *args, **kwargs)
-            preprocessed_data.add_preprocess(self.get_preprocess_desc(*args, **kwargs))
+            preprocessed_data.add_preprocess(
+                self.get_preprocess_desc(*args, **kwargs), step
+            )
         return self.preprocessed_data_list
 
     def _data_preprocess(self, preprocessed_data: Raw, *args, **kwargs) -> None:
@@ -1,23 +1,50 @@
 """Training module providing model training, evaluation, and plan management."""
 
-from .model_holder import ModelHolder
+from .model_holder import ModelCompileMode, ModelHolder
 from .option import (
     TestOnlyOption,
+    TrainingAugmentation,
+    TrainingEarlyStopping,
     TrainingEvaluation,
     TrainingOption,
+    TrainingPrecision,
+    TrainingScheduler,
     parse_device_name,
     parse_optim_name,
 )
+from .sweep import (
+    LogUniform,
+    SearchSpace,
+    Sweep,
+    SweepObjective,
+    SweepStrategy,
+    SweepTrial,
+    TrialStatus,
+    Uniform,
+)
 from .trainer import Trainer
 from .training_plan import TrainingPlanHolder
 
 __all__ = [
+    "LogUniform",
+    "ModelCompileMode",
     "ModelHolder",
+    "SearchSpace",
+    "Sweep",
+    "SweepObjective",
+    "SweepStrategy",
+    "SweepTrial",
     "TestOnlyOption",
     "Trainer",
+    "TrainingAugmentation",
+    "TrainingEarlyStopping",
     "TrainingEvaluation",
     "TrainingOption",
     "TrainingPlanHolder",
+    "TrainingPrecision",
+    "TrainingScheduler",
+    "TrialStatus",
+    "Uniform",
     "parse_device_name",
     "parse_optim_name",
 ]
@@ -0,0 +1,240 @@
+"""Batched data augmentation of EEG training batches.
+
+:class:`BatchAugmenter` applies the augmentations configured in
+:attr:`TrainingOption.augmentation` to whole ``(B, ..., channels, time)``
+batches with tensor operations on the training device, between the
+training loader and the model. Every operation returns a new tensor, so
+batches served from the device-resident
+:class:`~.tensor_cache.TensorCache` are never modified.
+
+Random draws come from a generator seeded by the seed of the
+:class:`~.record.TrainRecord` and the epoch, so a repeat sees the same
+augmented batches when it is trained again or resumed from a checkpoint,
+independently of the global random stream.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import torch
+
+from .option import TrainingAugmentation
+
+
+@dataclass(frozen=True)
+class MixedTargets:
+    """Second targets of a mixup batch.
+
+    Attributes:
+        labels: Labels of the samples mixed into the batch.
+        weight: Weight of the original samples, at least ``0.5``.
+
+    """
+
+    labels: torch.Tensor
+    weight: float
+
+
+def mixed_loss(
+    criterion: torch.nn.Module,
+    outputs: torch.Tensor,
+    labels: torch.Tensor,
+    mixed: MixedTargets | None,
+) -> torch.Tensor:
+    """Return the loss of *outputs*, weighting mixup targets if present.
+
+    Args:
+        criterion: Loss function.
+        outputs: Model outputs.
+        labels: Labels of the (original) samples.
+        mixed: Second targets returned by :meth:`BatchAugmenter.augment`.
+
+    Returns:
+        ``criterion(outputs, labels)`` or, for a mixup batch, the mixture
+        of the losses of both targets.
+
+    """
+    loss = criterion(outputs, labels)
+    if mixed is None:
+        return loss
+    return mixed.weight * loss + (1 - mixed.weight) * criterion(outputs, mixed.labels)
+
+
+class BatchAugmenter:
+    """Applies the configured augmentations to training batches.
+
+    The augmentations are applied in the order time shift, frequency
+    shift, amplitude scaling, channel dropout, Gaussian noise and mixup.
+    Each is applied to a sample with probability *prob*; mixup is applied
+    to the whole batch with that probability.
+
+    Attributes:
+        augmentation: Magnitude of each enabled augmentation.
+        prob: Probability of applying each augmentation.
+        sfreq: Sampling frequency of the data in Hz.
+        device: Device the batches live on.
+
+    """
+
+    def __init__(
+        self,
+        augmentation: dict[TrainingAugmentation, float],
+        prob: float,
+        sfreq: float | None,
+        device: str,
+    ):
+        """Create an augmenter.
+
+        Args:
+            augmentation: Magnitude of each enabled augmentation (see
+                :class:`TrainingAugmentation`).
+            prob: Probability of applying each augmentation.
+            sfreq: Sampling frequency in Hz, required by the frequency
+                shift.
+            device: Device of the training batches.
+
+        Raises:
+            ValueError: If a frequency shift is requested without a
+                sampling frequency.
+
+        """
+        if TrainingAugmentation.FREQUENCY_SHIFT in augmentation and not sfreq:
+            raise ValueError("Frequency shift requires the sampling frequency")
+        self.augmentation = augmentation
+        self.prob = prob
+        self.sfreq = sfreq
+        self._sample_period = 1 / sfreq if sfreq else 0.0
+        self.device = torch.device(device)
+        self._generator = torch.Generator(device=self.device)
+        self._rng = np.random.default_rng()
+
+    def set_epoch(self, seed: int, epoch: int) -> None:
+        """Seed the random draws of an epoch.
+
+        Args:
+            seed: Seed of the training record.
+            epoch: 0-based epoch about to be trained.
+
+        """
+        sequence = np.random.SeedSequence([seed, epoch])
+        self._generator.manual_seed(int(sequence.generate_state(1, np.uint64)[0]))
+        self._rng = np.random.default_rng(sequence)
+
+    @torch.no_grad()
+    def augment(
+        self,
+        inputs: torch.Tensor,
+        labels: torch.Tensor,
+    ) -> tuple[torch.Tensor, MixedTargets | None]:
+        """Return an augmented copy of a training batch.
+
+        Args:
+            inputs: Batch of shape ``(B, ..., channels, time)``.
+            labels: Labels of shape ``(B,)``.
+
+        Returns:
+            The augmented inputs and, for a mixup batch, the second
+            targets to pass to :func:`mixed_loss`.
+
+        """
+        x = inputs
+        config = self.augmentation
+        if TrainingAugmentation.TIME_SHIFT in config:
+            x = self._time_shift(x, config[TrainingAugmentation.TIME_SHIFT])
+        if TrainingAugmentation.FREQUENCY_SHIFT in config:
+            x = self._frequency_shift(x, config[TrainingAugmentation.FREQUENCY_SHIFT])
+        if TrainingAugmentation.AMPLITUDE_SCALE in config:
+            magnitude = config[TrainingAugmentation.AMPLITUDE_SCALE]
+            factor = 1 + magnitude * (2 * self._uniform(len(x)) - 1)
+            x = x * self._where_applied(factor, 1.0).view(self._sample_shape(x))
+        if TrainingAugmentation.CHANNEL_DROPOUT in config:
+            x = self._channel_dropout(x, config[TrainingAugmentation.CHANNEL_DROPOUT])
+        if TrainingAugmentation.GAUSSIAN_NOISE in config:
+            magnitude = config[TrainingAugmentation.GAUSSIAN_NOISE]
+            scale = x.std(dim=-1, keepdim=True) * magnitude
+            scale = scale * self._applied(len(x)).view(self._sample_shape(x))
+            noise = torch.randn(
+                x.shape, generator=self._generator, device=x.device, dtype=x.dtype
+            )
+            x = x + noise * scale
+        mixed = None
+        if TrainingAugmentation.MIXUP in config and self._rng.random() < self.prob:
+            x, mixed = self._mixup(x, labels, config[TrainingAugmentation.MIXUP])
+        return x, mixed
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _sample_shape(x: torch.Tensor) -> tuple[int, ...]:
+        """Return the shape broadcasting one value per sample over *x*."""
+        return (len(x),) + (1,) * (x.dim() - 1)
+
+    def _uniform(self, n: int) -> torch.Tensor:
+        return torch.rand(n, generator=self._generator, device=self.device)
+
+    def _applied(self, n: int) -> torch.Tensor:
+        """Return a float mask of the samples an augmentation applies to."""
+        return (self._uniform(n) < self.prob).float()
+
+    def _where_applied(self, values: torch.Tensor, default: float) -> torch.Tensor:
+        return torch.where(self._applied(len(values)).bool(), values, default)
+
+    def _time_shift(self, x: torch.Tensor, magnitude: float) -> torch.Tensor:
+        n_times = x.shape[-1]
+        max_shift = round(magnitude * n_times)
+        if max_shift == 0:
+            return x
+        shifts = torch.randint(
+            -max_shift,
+            max_shift + 1,
+            (len(x),),
+            generator=self._generator,
+            device=self.device,
+        )
+        shifts = shifts * self._applied(len(x)).long()
+        index = torch.arange(n_times, device=self.device) - shifts[:, None]
+        index = index.remainder(n_times).view(len(x), *(1,) * (x.dim() - 2), n_times)
+        return x.gather(-1, index.expand_as(x))
+
+    def _frequency_shift(self, x: torch.Tensor, magnitude: float) -> torch.Tensor:
+        """Shift the spectrum of each channel using its analytic signal."""
+        n_times = x.shape[-1]
+        shifts = magnitude * (2 * self._uniform(len(x)) - 1)
+        shifts = self._where_applied(shifts, 0.0)
+        spectrum = torch.fft.fft(x.float(), dim=-1)
+        # Hilbert transform: keep DC (and Nyquist), double positive bins
+        hilbert = torch.zeros(n_times, device=self.device)
+        hilbert[0] = 1
+        hilbert[1 : (n_times + 1) // 2] = 2
+        if n_times % 2 == 0:
+            hilbert[n_times // 2] = 1
+        analytic = torch.fft.ifft(spectrum * hilbert, dim=-1)
+        times = torch.arange(n_times, device=self.device) * self._sample_period
+        phase = 2 * math.pi * shifts[:, None] * times
+        rotation = torch.polar(torch.ones_like(phase), phase)
+        rotation = rotation.view(len(x), *(1,) * (x.dim() - 2), n_times)
+        return (analytic * rotation).real.to(x.dtype)
+
+    def _channel_dropout(self, x: torch.Tensor, magnitude: float) -> torch.Tensor:
+        mask_shape = (*x.shape[:-1], 1)
+        keep = torch.rand(mask_shape, generator=self._generator, device=self.device)
+        keep = (keep >= magnitude).float()
+        applied = self._applied(len(x)).view(self._sample_shape(x))
+        return x * (keep * applied + (1 - applied))
+
+    def _mixup(
+        self,
+        x: torch.Tensor,
+        labels: torch.Tensor,
+        alpha: float,
+    ) -> tuple[torch.Tensor, MixedTargets]:
+        weight = float(self._rng.beta(alpha, alpha))
+        weight = max(weight, 1 - weight)
+        order = torch.randperm(len(x), generator=self._generator, device=self.device)
+        mixed = weight * x + (1 - weight) * x[order]
+        return mixed, MixedTargets(labels[order], weight)
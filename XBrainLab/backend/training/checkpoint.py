@@ -0,0 +1,167 @@
+"""Background writer for training checkpoints.
+
+:meth:`TrainRecord.export_checkpoint` snapshots the state to save in memory
+and hands it to the process-wide :class:`CheckpointWriter`, so the training
+loop does not wait for the disk. Files are written to a temporary name and
+renamed into place, so a checkpoint on disk is always complete, and jobs run
+in submission order, so a later checkpoint never gets overwritten by an
+earlier one. :func:`flush_checkpoints` blocks until everything submitted
+has been written; it is called when a record is paused and at interpreter
+exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import re
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import torch
+
+from ..utils.logger import logger
+
+_EPOCH_FILE = re.compile(r"^Epoch-(\d+)-model$")
+
+
+def epoch_checkpoint_name(epoch: int) -> str:
+    """Return the file name of the model checkpoint of *epoch*."""
+    return f"Epoch-{epoch}-model"
+
+
+def cpu_copy(obj: Any) -> Any:
+    """Return a copy of *obj* with every tensor detached and copied to the CPU.
+
+    Args:
+        obj: Tensor, or (nested) dict, list or tuple such as a model or
+            optimizer state dict.
+
+    Returns:
+        The copy; non-tensor leaves are shared with *obj*.
+
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().to("cpu", copy=True)
+    if isinstance(obj, dict):
+        return {k: cpu_copy(v) for k, v in obj.items()}
+    if isinstance(obj, list | tuple):
+        return type(obj)(cpu_copy(v) for v in obj)
+    return obj
+
+
+def save_atomic(obj: Any, path: str) -> None:
+    """Save *obj* with :func:`torch.save` and atomically rename it to *path*.
+
+    Args:
+        obj: Object to save.
+        path: Final file path.
+
+    """
+    tmp_path = path + ".tmp"
+    torch.save(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def prune_epoch_checkpoints(
+    target_path: str,
+    keep_last: int,
+    keep: Iterable[int] = (),
+) -> list[str]:
+    """Delete all but the newest epoch checkpoints in *target_path*.
+
+    Args:
+        target_path: Directory holding ``Epoch-N-model`` files.
+        keep_last: Number of most recent epochs to keep; ``0`` keeps all.
+        keep: Additional epochs to keep (e.g. the best epoch).
+
+    Returns:
+        The names of the deleted files.
+
+    """
+    if keep_last <= 0 or not os.path.isdir(target_path):
+        return []
+    epochs = sorted(
+        int(match.group(1))
+        for match in map(_EPOCH_FILE.match, os.listdir(target_path))
+        if match
+    )
+    retained = set(epochs[-keep_last:]) | set(keep)
+    deleted = []
+    for epoch in epochs:
+        if epoch in retained:
+            continue
+        name = epoch_checkpoint_name(epoch)
+        try:
+            os.remove(os.path.join(target_path, name))
+        except FileNotFoundError:
+            continue
+        deleted.append(name)
+    return deleted
+
+
+class CheckpointWriter:
+    """Single background thread executing checkpoint write jobs in order.
+
+    The thread is started on the first submission. A failing job is logged
+    and does not stop later jobs.
+    """
+
+    def __init__(self):
+        """Create an idle writer."""
+        self._queue: queue.Queue[Callable[[], None]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """Queue *job* for execution on the writer thread.
+
+        Args:
+            job: Callable performing the writes.
+
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="CheckpointWriter",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._queue.put(job)
+
+    def flush(self) -> None:
+        """Block until every submitted job has finished."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                job()
+            except Exception as e:
+                logger.error("Failed to write checkpoint: %s", e, exc_info=True)
+            finally:
+                self._queue.task_done()
+
+
+_writer: CheckpointWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_checkpoint_writer() -> CheckpointWriter:
+    """Return the process-wide checkpoint writer, creating it on first use."""
+    global _writer  # noqa: PLW0603
+    with _writer_lock:
+        if _writer is None:
+            _writer = CheckpointWriter()
+            atexit.register(_writer.flush)
+        return _writer
+
+
+def flush_checkpoints() -> None:
+    """Wait until all pending checkpoints of this process are on disk."""
+    if _writer is not None:
+        _writer.flush()
@@ -0,0 +1,239 @@
+"""Compiled forward passes shared by the models of a training plan.
+
+Every repeat (and every plan of a cross-validation run) creates a new model
+of the same class with the same arguments. :class:`CompiledModel` runs such
+a model through a compiled artifact, either a :func:`torch.compile` graph or
+a :func:`torch.jit.trace` module, cached per model class, model arguments,
+input shape and training mode. Later models bind their own parameters and
+buffers to the cached artifact instead of compiling again.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import torch
+from torch.func import functional_call
+
+from .model_holder import ModelCompileMode
+
+_COMPILE_BACKEND = "inductor"
+_BENCHMARK_ITERS = 3
+
+
+@dataclass
+class _CompiledEntry:
+    """A cached artifact and the timings measured when it was built."""
+
+    artifact: Any
+    compile_time: float
+    eager_time: float
+    compiled_time: float
+
+
+_CACHE: dict[tuple, _CompiledEntry] = {}
+
+
+def clear_compile_cache() -> None:
+    """Drop all cached compiled artifacts."""
+    _CACHE.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable representation of model arguments."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _synchronize(device: torch.device) -> None:
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def _time_calls(forward: Callable, inputs: torch.Tensor) -> float:
+    """Return the fastest of a few forward calls, in seconds."""
+    best = float("inf")
+    for _ in range(_BENCHMARK_ITERS):
+        start = time.perf_counter()
+        forward(inputs)
+        _synchronize(inputs.device)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextlib.contextmanager
+def _preserved_state(model: torch.nn.Module, device: torch.device) -> Iterator[None]:
+    """Undo buffer updates and random draws of benchmark forward passes."""
+    buffers = {name: b.clone() for name, b in model.named_buffers()}
+    devices = [device.index or 0] if device.type == "cuda" else []
+    with torch.random.fork_rng(devices=devices):
+        yield
+    with torch.no_grad():
+        for name, b in model.named_buffers():
+            b.copy_(buffers[name])
+
+
+def _set_tensor(module: torch.nn.Module, name: str, tensor: torch.Tensor) -> None:
+    """Replace the parameter or buffer *name* (a dotted path) of *module*."""
+    *path, leaf = name.split(".")
+    for part in path:
+        module = getattr(module, part)
+    setattr(module, leaf, tensor)
+
+
+class CompiledModel(torch.nn.Module):
+    """Wrapper that runs a model's forward pass through a cached artifact.
+
+    The wrapped model keeps ownership of its parameters, so optimizers,
+    state dicts and checkpoints refer to :attr:`model` as usual. The first
+    call for a new input shape or training mode looks the artifact up in a
+    process-wide cache and, on a miss, compiles it and times it against the
+    eager model.
+
+    Attributes:
+        model: The eager model whose parameters are trained.
+        mode: :attr:`ModelCompileMode.COMPILE` or :attr:`ModelCompileMode.TRACE`.
+        compile_time: Seconds spent compiling for this model (``0`` when
+            every artifact came from the cache).
+
+    """
+
+    def __init__(
+        self,
+        model: torch.nn.Module,
+        mode: ModelCompileMode | str,
+        model_args: dict,
+    ):
+        """Wrap *model* without compiling anything yet.
+
+        Args:
+            model: Model to execute, already on the training device.
+            mode: Compilation mode other than ``NONE``.
+            model_args: Constructor arguments of *model*, part of the cache
+                key.
+
+        Raises:
+            ValueError: If *mode* is :attr:`ModelCompileMode.NONE`.
+
+        """
+        super().__init__()
+        self.model = model
+        self.mode = ModelCompileMode(mode)
+        if self.mode == ModelCompileMode.NONE:
+            raise ValueError("CompiledModel requires a compile mode")
+        self.compile_time = 0.0
+        self._key = (self.mode, type(model), _freeze(model_args))
+        self._forwards: dict[tuple, Callable] = {}
+        self._entries: list[tuple[bool, _CompiledEntry, bool]] = []
+
+    def forward(self, inputs: torch.Tensor) -> torch.Tensor:
+        """Run the compiled forward pass of :attr:`model` on *inputs*."""
+        key = (
+            *self._key,
+            tuple(inputs.shape[1:]),
+            inputs.dtype,
+            inputs.device.type,
+            self.model.training,
+        )
+        forward = self._forwards.get(key)
+        if forward is None:
+            entry = _CACHE.get(key)
+            reused = entry is not None
+            if entry is None:
+                entry = self._build(inputs)
+                _CACHE[key] = entry
+                self.compile_time += entry.compile_time
+            forward = self._bind(entry.artifact)
+            self._forwards[key] = forward
+            self._entries.append((self.model.training, entry, reused))
+        return forward(inputs)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the compile cost and the forward-pass speedup.
+
+        Timings come from the first artifact used in training mode (or the
+        first artifact at all if the model was only evaluated).
+
+        Returns:
+            Dictionary with ``mode``, ``compile_time`` (s), ``reused``
+            (whether every artifact came from the cache), ``eager_time`` and
+            ``compiled_time`` (s per forward pass on the first batch) and
+            ``speedup``. Empty before the first forward pass.
+
+        """
+        if not self._entries:
+            return {}
+        training = [entry for is_train, entry, _ in self._entries if is_train]
+        entry = training[0] if training else self._entries[0][1]
+        return {
+            "mode": self.mode.value,
+            "compile_time": self.compile_time,
+            "reused": all(reused for _, _, reused in self._entries),
+            "eager_time": entry.eager_time,
+            "compiled_time": entry.compiled_time,
+            "speedup": entry.eager_time / max(entry.compiled_time, 1e-12),
+        }
+
+    def _build(self, inputs: torch.Tensor) -> _CompiledEntry:
+        """Compile an artifact for *inputs* and time it against eager mode."""
+        with _preserved_state(self.model, inputs.device):
+            start = time.perf_counter()
+            artifact = self._compile(inputs)
+            forward = self._bind(artifact)
+            forward(inputs)
+            _synchronize(inputs.device)
+            first_call = time.perf_counter() - start
+            eager_time = _time_calls(self.model, inputs)
+            compiled_time = _time_calls(forward, inputs)
+        return _CompiledEntry(
+            artifact,
+            max(first_call - compiled_time, 0.0),
+            eager_time,
+            compiled_time,
+        )
+
+    def _compile(self, inputs: torch.Tensor) -> Any:
+        if self.mode == ModelCompileMode.TRACE:
+            # Trace a copy so tracing does not update the model's buffers
+            return torch.jit.trace(copy.deepcopy(self.model), inputs, check_trace=False)
+
+        base = copy.deepcopy(self.model).to("meta")
+        param_names = [name for name, _ in self.model.named_parameters()]
+        buffer_names = [name for name, _ in self.model.named_buffers()]
+        n_params = len(param_names)
+
+        def functional_forward(*tensors: torch.Tensor) -> torch.Tensor:
+            params = dict(zip(param_names, tensors[:n_params], strict=True))
+            buffers = dict(zip(buffer_names, tensors[n_params:-1], strict=True))
+            return functional_call(base, (params, buffers), (tensors[-1],))
+
+        return torch.compile(functional_forward, backend=_COMPILE_BACKEND)
+
+    def _bind(self, artifact: Any) -> Callable:
+        """Return a forward function running *artifact* on this model's tensors."""
+        if self.mode == ModelCompileMode.TRACE:
+            script = copy.deepcopy(artifact)
+            for name, param in self.model.named_parameters():
+                _set_tensor(script, name, param)
+            for name, buffer in self.model.named_buffers():
+                _set_tensor(script, name, buffer)
+            return script
+
+        model = self.model
+
+        def forward(inputs: torch.Tensor) -> torch.Tensor:
+            return artifact(*model.parameters(), *model.buffers(), inputs)
+
+        return forward
@@ -10,38 +10,63 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Callable
 
 import torch
-import torch.utils.data as torch_data
 
+from .augmentation import BatchAugmenter, mixed_loss
 from .evaluator import Evaluator
+from .metrics import MetricAccumulator
+from .option import TrainingEarlyStopping, TrainingOption
+from .precision import MixedPrecision
+from .profiler import EpochProfiler
 from .record import RecordKey, TrainRecordKey
 from .record.train import TrainRecord
+from .tensor_cache import BatchLoader
 
 
 class EpochRunner:
     """Runs a single training epoch end-to-end.
 
     Isolates:
-    1. Batch loop (forward + backward)
-    2. Metric computation (AUC)
+    1. Batch loop (augmentation + forward + backward, see
+       :class:`~.augmentation.BatchAugmenter`)
+    2. Metric computation (on-device accumulation, see
+       :class:`~.metrics.MetricAccumulator`)
     3. Record update (loss / acc / auc / lr / time)
-    4. Validation & test evaluation
-    5. Checkpoint export
+    4. Validation & test evaluation (every
+       :attr:`TrainingOption.eval_every` epochs)
+    5. Early stopping, learning-rate scheduling and checkpoint export
+    6. Optional phase timing (:attr:`TrainingOption.profile`, see
+       :class:`~.profiler.EpochProfiler`)
 
     Args:
         interrupt: A :class:`threading.Event` checked between batches.
         checkpoint_epoch: Export a checkpoint every *N* epochs
             (``0`` / ``None`` to disable).
+        on_epoch_end: Optional callback invoked with the record after each
+            completed epoch (used to stream progress out of worker
+            processes).
+        precision: Optional :class:`MixedPrecision` applied to the
+            forward/backward passes and evaluation (``fp32`` if omitted).
+        option: Optional :class:`TrainingOption` providing the evaluation
+            cadence and the early-stopping criterion. Without it every epoch
+            is evaluated and training never stops early.
     """
 
     def __init__(
         self,
         interrupt: threading.Event,
         checkpoint_epoch: int | None = None,
+        on_epoch_end: Callable[[TrainRecord], None] | None = None,
+        precision: MixedPrecision | None = None,
+        option: TrainingOption | None = None,
     ) -> None:
         self._interrupt = interrupt
         self._checkpoint_epoch = checkpoint_epoch or 0
+        self._on_epoch_end = on_epoch_end
+        self._precision = precision or MixedPrecision()
+        self._option = option
 
     # ------------------------------------------------------------------
     # Public API
@@ -50,9 +75,9 @@ class EpochRunner:
     def run(
         self,
         model: torch.nn.Module,
-        train_loader: torch_data.DataLoader,
-        val_loader: torch_data.DataLoader | None,
-        test_loader: torch_data.DataLoader | None,
+        train_loader: BatchLoader,
+        val_loader: BatchLoader | None,
+        test_loader: BatchLoader | None,
         optimizer: torch.optim.Optimizer,
         criterion: torch.nn.Module,
         train_record: TrainRecord,
@@ -70,52 +95,61 @@ class EpochRunner:
         """
         start_time = time.time()
         model.train()
+        profiler = self._make_profiler(train_record)
 
         # 1. Batch loop
-        running_loss, correct, total_count, y_true, y_pred = self._train_batches(
+        metrics = self._train_batches(
             model,
             train_loader,
             optimizer,
             criterion,
+            profiler,
+            self._make_augmenter(train_record),
         )
         if self._interrupt.is_set():
             return
 
-        if total_count == 0:
+        if metrics.n_samples == 0:
             return
 
-        # 2. Metrics
-        train_auc = Evaluator.compute_auc(y_true, y_pred)
-        running_loss /= len(train_loader)
-        train_acc = correct / total_count * 100
+        # 2. Metrics (one host transfer per epoch)
+        result = metrics.compute()
 
         # 3. Record update
         self._update_records(
             train_record,
-            running_loss,
-            train_acc,
-            train_auc,
+            result[RecordKey.LOSS],
+            result[RecordKey.ACC],
+            result[RecordKey.AUC],
             optimizer.param_groups[0]["lr"],
             time.time() - start_time,
         )
 
         # 4. Validation & test
-        if val_loader:
-            result = Evaluator.test_model(model, val_loader, criterion)
-            train_record.update_eval(result)
+        evaluate = self._is_eval_epoch(train_record)
+        val_result = None
+        if val_loader and evaluate:
+            with profiler.phase("val"):
+                val_result = Evaluator.test_model(
+                    model, val_loader, criterion, self._precision
+                )
+            train_record.update_eval(val_result)
+        stop = val_result is not None and self._should_stop(train_record)
 
-        if test_loader:
-            result = Evaluator.test_model(model, test_loader, criterion)
+        if test_loader and self._is_test_epoch(train_record, evaluate, stop):
+            with profiler.phase("test"):
+                result = Evaluator.test_model(
+                    model, test_loader, criterion, self._precision
+                )
             train_record.update_test(result)
 
-        train_record.step()
-
-        # 5. Checkpoint
-        if (
-            self._checkpoint_epoch
-            and train_record.get_epoch() % self._checkpoint_epoch == 0
-        ):
-            train_record.export_checkpoint()
+        # 5. Scheduler & checkpoint
+        self._step_scheduler(
+            train_record,
+            val_result,
+            has_val=val_loader is not None,
+        )
+        self._finish_epoch(train_record, stop, profiler)
 
         # Free VRAM to prevent linear growth
         torch.cuda.empty_cache()
@@ -127,35 +161,166 @@ class EpochRunner:
     def _train_batches(
         self,
         model: torch.nn.Module,
-        train_loader: torch_data.DataLoader,
+        train_loader: BatchLoader,
         optimizer: torch.optim.Optimizer,
         criterion: torch.nn.Module,
-    ) -> tuple[float, float, int, torch.Tensor | None, torch.Tensor | None]:
-        """Run the forward/backward pass over every batch in the loader."""
-        running_loss = 0.0
-        correct = 0.0
-        total_count = 0
-        y_true_parts: list[torch.Tensor] = []
-        y_pred_parts: list[torch.Tensor] = []
-
-        for inputs, labels in train_loader:
+        profiler: EpochProfiler | None = None,
+        augmenter: BatchAugmenter | None = None,
+    ) -> MetricAccumulator:
+        """Run the forward/backward pass over every batch in the loader.
+
+        Metrics are accumulated on the device, so no batch waits for a
+        host read-back. Augmented batches are scored against their original
+        labels.
+        """
+        profiler = profiler or EpochProfiler("cpu", 0, enabled=False)
+        metrics = MetricAccumulator()
+        for batch_inputs, labels in profiler.iterate(train_loader):
             if self._interrupt.is_set():
                 break
+            inputs, mixed = batch_inputs, None
+            if augmenter is not None:
+                with profiler.phase("data"):
+                    inputs, mixed = augmenter.augment(batch_inputs, labels)
             optimizer.zero_grad()
-            outputs = model(inputs)
-            loss = criterion(outputs, labels)
-            loss.backward()
-            optimizer.step()
-
-            correct += (outputs.argmax(axis=1) == labels).float().sum().item()
-            y_true_parts.append(labels.detach().cpu())
-            y_pred_parts.append(outputs.detach().cpu())
-            total_count += len(labels)
-            running_loss += loss.item()
-
-        y_true = torch.cat(y_true_parts) if y_true_parts else None
-        y_pred = torch.cat(y_pred_parts) if y_pred_parts else None
-        return running_loss, correct, total_count, y_true, y_pred
+            with profiler.phase("forward"), self._precision.autocast():
+                outputs = model(inputs)
+                loss = mixed_loss(criterion, outputs, labels, mixed)
+            with profiler.phase("backward"):
+                self._precision.backward(loss)
+            with profiler.phase("optimizer"):
+                self._precision.step(optimizer)
+                self._precision.update()
+            metrics.update(outputs, labels, loss)
+        profiler.end_training(metrics.n_samples)
+        return metrics
+
+    def _make_profiler(self, train_record: TrainRecord) -> EpochProfiler:
+        """Return the profiler of the running epoch of *train_record*.
+
+        It is disabled unless :attr:`TrainingOption.profile` is set.
+        """
+        if self._option is None or not self._option.profile:
+            return EpochProfiler("cpu", 0, enabled=False)
+        return EpochProfiler(
+            self._option.get_device(),
+            train_record.get_epoch() + 1,
+        )
+
+    def _make_augmenter(self, train_record: TrainRecord) -> BatchAugmenter | None:
+        """Return the augmenter of the running epoch of *train_record*.
+
+        Its random draws are seeded by the record's seed and epoch. Returns
+        ``None`` unless :attr:`TrainingOption.augmentation` is configured.
+        """
+        if self._option is None or not self._option.augmentation:
+            return None
+        augmenter = BatchAugmenter(
+            self._option.augmentation,
+            self._option.augment_prob,
+            train_record.dataset.get_epoch_data().sfreq,
+            self._option.get_device(),
+        )
+        augmenter.set_epoch(train_record.seed, train_record.get_epoch())
+        return augmenter
+
+    def _is_eval_epoch(self, train_record: TrainRecord) -> bool:
+        """Return whether the running epoch of *train_record* is evaluated."""
+        if self._option is None:
+            return True
+        return self._option.is_eval_epoch(train_record.get_epoch() + 1)
+
+    def _is_test_epoch(
+        self,
+        train_record: TrainRecord,
+        evaluate: bool,
+        stop: bool,
+    ) -> bool:
+        """Return whether the test split is evaluated after this epoch.
+
+        Without per-epoch testing, only the last epoch (including one that
+        stops early) is tested.
+        """
+        if self._option is None or (evaluate and self._option.per_epoch_test):
+            return True
+        return stop or train_record.get_epoch() + 1 >= self._option.epoch
+
+    def _should_stop(self, train_record: TrainRecord) -> bool:
+        """Check the early-stopping criterion after a validation update.
+
+        Training stops once the monitored validation metric has not
+        improved for :attr:`TrainingOption.patience` epochs.
+        """
+        if self._option is None:
+            return False
+        criterion = self._option.early_stopping
+        if criterion == TrainingEarlyStopping.NONE:
+            return False
+        if criterion == TrainingEarlyStopping.VAL_LOSS:
+            key = RecordKey.LOSS
+        else:
+            key = RecordKey.AUC
+        best_epoch = train_record.best_record[f"best_val_{key}_epoch"]
+        if best_epoch is None:
+            return False
+        return train_record.get_epoch() - best_epoch >= self._option.patience
+
+    @staticmethod
+    def _step_scheduler(
+        train_record: TrainRecord,
+        val_result: dict[str, float] | None,
+        has_val: bool,
+    ) -> None:
+        """Step the learning-rate scheduler of *train_record*, if any.
+
+        A plateau scheduler monitors the validation loss on evaluated
+        epochs, or the training loss when there is no validation data;
+        other schedulers step every epoch.
+        """
+        scheduler = train_record.scheduler
+        if scheduler is None:
+            return
+        if not isinstance(scheduler, torch.optim.lr_scheduler.ReduceLROnPlateau):
+            scheduler.step()
+        elif val_result is not None:
+            scheduler.step(val_result[RecordKey.LOSS])
+        elif not has_val:
+            scheduler.step(train_record.train[RecordKey.LOSS][-1])
+
+    def _finish_epoch(
+        self,
+        train_record: TrainRecord,
+        stop: bool = False,
+        profiler: EpochProfiler | None = None,
+    ) -> None:
+        """Advance the epoch, checkpoint if due and notify.
+
+        A checkpoint also saves a resume point; with
+        :attr:`TrainingOption.epoch_snapshots` one is saved every epoch.
+
+        Args:
+            train_record: Record of the finished epoch.
+            stop: Mark the record as stopped early.
+            profiler: Profiler of the epoch, whose statistics are stored in
+                *train_record* after the checkpoint export.
+
+        """
+        profiler = profiler or EpochProfiler("cpu", 0, enabled=False)
+        train_record.step()
+        if stop:
+            train_record.stop_early()
+        if (
+            self._checkpoint_epoch
+            and train_record.get_epoch() % self._checkpoint_epoch == 0
+        ):
+            with profiler.phase("checkpoint"):
+                train_record.export_checkpoint()
+        if train_record.takes_epoch_snapshots() and not train_record.has_resume_point():
+            train_record.save_resume_point()
+        profiler.finish(train_record)
+
+        if self._on_epoch_end is not None:
+            self._on_epoch_end(train_record)
 
     @staticmethod
     def _update_records(
@@ -6,11 +6,19 @@ import logging
 
 import numpy as np
 import torch
-import torch.utils.data as torch_data
-from captum.attr import NoiseTunnel, Saliency
 from sklearn.metrics import roc_auc_score
 
-from .record import EvalRecord, RecordKey
+from .metrics import MetricAccumulator
+from .precision import MixedPrecision
+from .record import EvalRecord
+from .record.eval import SALIENCY_ATTRIBUTES
+from .saliency import (
+    NOISE_TUNNEL_TYPES,
+    compute_noise_tunnel,
+    compute_saliency,
+    get_shared_methods,
+)
+from .tensor_cache import BatchLoader
 
 
 class Evaluator:
@@ -87,15 +95,22 @@ class Evaluator:
     @staticmethod
     def test_model(
         model: torch.nn.Module,
-        data_loader: torch_data.DataLoader,
+        data_loader: BatchLoader,
         criterion: torch.nn.Module,
+        precision: MixedPrecision | None = None,
     ) -> dict[str, float]:
         """Test a model on the given data loader and compute metrics.
 
+        Metrics are accumulated on the device by a
+        :class:`~.metrics.MetricAccumulator` and read back once at the end;
+        the AUC is its histogram estimate.
+
         Args:
             model: The PyTorch model to evaluate.
             data_loader: DataLoader providing input-label pairs.
             criterion: Loss function used to compute evaluation loss.
+            precision: Autocast settings for the forward pass. Defaults to
+                ``fp32``.
 
         Returns:
             A dictionary containing accuracy (``RecordKey.ACC``),
@@ -103,49 +118,73 @@ class Evaluator:
 
         """
         model.eval()
+        precision = precision or MixedPrecision()
 
-        running_loss = 0.0
-        total_count = 0
-        correct = 0.0
-        y_true_parts: list[torch.Tensor] = []
-        y_pred_parts: list[torch.Tensor] = []
-
+        metrics = MetricAccumulator()
         with torch.no_grad():
             for inputs, labels in data_loader:
-                outputs = model(inputs)
-                loss = criterion(outputs, labels)
-                running_loss += loss.item()
-
-                correct += (outputs.argmax(axis=1) == labels).float().sum().item()
-                total_count += len(labels)
+                with precision.autocast():
+                    outputs = model(inputs)
+                    loss = criterion(outputs, labels)
+                metrics.update(outputs, labels, loss)
+        return metrics.compute()
 
-                y_true_parts.append(labels.detach().cpu())
-                y_pred_parts.append(outputs.detach().cpu())
+    @staticmethod
+    def evaluate(
+        model: torch.nn.Module,
+        data_loader: BatchLoader,
+        precision: MixedPrecision | None = None,
+    ) -> EvalRecord:
+        """Evaluate model and store its labels and outputs.
 
-        y_true = torch.cat(y_true_parts) if y_true_parts else None
-        y_pred = torch.cat(y_pred_parts) if y_pred_parts else None
+        Saliency maps are not computed; attach a
+        :class:`~.saliency.SaliencySource` to the record to compute them
+        on demand.
 
-        if total_count == 0:
-            return {RecordKey.ACC: 0, RecordKey.AUC: 0, RecordKey.LOSS: 0}
+        Args:
+            model: The PyTorch model to evaluate.
+            data_loader: DataLoader providing input-label pairs.
+            precision: Autocast settings for the forward pass. Defaults to
+                ``fp32``.
 
-        running_loss /= len(data_loader)
-        acc = correct / total_count * 100
+        Returns:
+            An :class:`EvalRecord` with labels, outputs and empty saliency
+            dictionaries.
 
-        # Calculate AUC using shared helper
-        auc = Evaluator.compute_auc(y_true, y_pred)
+        """
+        model.eval()
+        precision = precision or MixedPrecision()
 
-        return {RecordKey.ACC: acc, RecordKey.AUC: auc, RecordKey.LOSS: running_loss}
+        output_list = []
+        label_list = []
+        with torch.no_grad():
+            for inputs, labels in data_loader:
+                with precision.autocast():
+                    output_list.append(model(inputs).float().cpu().numpy())
+                label_list.append(labels.cpu().numpy())
+        return EvalRecord(
+            np.concatenate(label_list),
+            np.concatenate(output_list),
+            {},
+            {},
+            {},
+            {},
+            {},
+        )
 
     @staticmethod
     def evaluate_with_saliency(
         model: torch.nn.Module,
-        data_loader: torch_data.DataLoader,
+        data_loader: BatchLoader,
         saliency_params: dict,
+        precision: MixedPrecision | None = None,
     ) -> EvalRecord:
         """Evaluate model and compute saliency maps using multiple attribution methods.
 
         Computes Gradient, Gradient*Input, SmoothGrad, SmoothGrad Squared,
-        and VarGrad saliency maps for each batch in the data loader.
+        and VarGrad saliency maps for each batch in the data loader. The
+        smoothed methods with identical parameters are computed in one pass
+        of :func:`~.saliency.compute_noise_tunnel`.
 
         Args:
             model: The PyTorch model to evaluate (should be in eval mode).
@@ -153,6 +192,8 @@ class Evaluator:
             saliency_params: Dictionary of parameters for each saliency method,
                 keyed by method name (e.g., ``'SmoothGrad'``,
                 ``'SmoothGrad_Squared'``, ``'VarGrad'``).
+            precision: Autocast settings for the forward passes of the
+                model and the attribution methods. Defaults to ``fp32``.
 
         Returns:
             An :class:`EvalRecord` containing labels, outputs, and per-class
@@ -160,84 +201,45 @@ class Evaluator:
 
         """
         model.eval()
+        precision = precision or MixedPrecision()
 
         output_list = []
         label_list = []
-
-        gradient_list = []
-        gradient_input_list = []
-        smoothgrad_list = []
-        smoothgrad_sq_list = []
-        vargrad_list = []
-
-        saliency_inst = Saliency(model)
-        noise_tunnel_inst = NoiseTunnel(saliency_inst)
+        saliency_lists: dict[str, list[np.ndarray]] = {
+            method: [] for method in SALIENCY_ATTRIBUTES
+        }
 
         for inputs, labels in data_loader:
-            outputs = model(inputs)
+            with precision.autocast():
+                outputs = model(inputs).float()
 
-            output_list.append(outputs.detach().cpu().numpy())
-            label_list.append(labels.detach().cpu().numpy())
+                output_list.append(outputs.detach().cpu().numpy())
+                label_list.append(labels.detach().cpu().numpy())
+                target = label_list[-1].tolist()
 
-            inputs.requires_grad = True
-            batch_gradient = (
-                saliency_inst.attribute(
-                    inputs,
-                    target=label_list[-1].tolist(),
-                    abs=False,
-                )
-                .detach()
-                .cpu()
-                .numpy()
-            )
-
-            gradient_list.append(batch_gradient)
-            gradient_input_list.append(
-                np.multiply(inputs.detach().cpu().numpy(), batch_gradient),
-            )
-            smoothgrad_list.append(
-                noise_tunnel_inst.attribute(
-                    inputs,
-                    target=label_list[-1].tolist(),
-                    nt_type="smoothgrad",
-                    **saliency_params["SmoothGrad"],
+                batch_gradient = compute_saliency(
+                    model, inputs, target, "Gradient", saliency_params
                 )
-                .detach()
-                .cpu()
-                .numpy(),
-            )
-            smoothgrad_sq_list.append(
-                noise_tunnel_inst.attribute(
-                    inputs,
-                    target=label_list[-1].tolist(),
-                    nt_type="smoothgrad_sq",
-                    **saliency_params["SmoothGrad_Squared"],
+                saliency_lists["Gradient"].append(batch_gradient.detach().cpu().numpy())
+                saliency_lists["Gradient * Input"].append(
+                    (batch_gradient * inputs).detach().cpu().numpy()
                 )
-                .detach()
-                .cpu()
-                .numpy(),
-            )
-            vargrad_list.append(
-                noise_tunnel_inst.attribute(
-                    inputs,
-                    target=label_list[-1].tolist(),
-                    nt_type="vargrad",
-                    **saliency_params["VarGrad"],
-                )
-                .detach()
-                .cpu()
-                .numpy(),
-            )
+                # Methods sharing their parameters reuse the same noisy copies
+                remaining = list(NOISE_TUNNEL_TYPES)
+                while remaining:
+                    shared = get_shared_methods(remaining[0], saliency_params)
+                    maps = compute_noise_tunnel(
+                        model, inputs, target, **saliency_params[remaining[0]]
+                    )
+                    for method in shared:
+                        saliency_lists[method].append(
+                            maps[method].detach().cpu().numpy()
+                        )
+                        remaining.remove(method)
 
         label_list = np.concatenate(label_list)
         output_list = np.concatenate(output_list)
 
-        gradient_list = np.concatenate(gradient_list)
-        gradient_input_list = np.concatenate(gradient_input_list)
-        smoothgrad_list = np.concatenate(smoothgrad_list)
-        smoothgrad_sq_list = np.concatenate(smoothgrad_sq_list)
-        vargrad_list = np.concatenate(vargrad_list)
-
         num_classes = output_list.shape[-1]
 
         # Helper to organize by class
@@ -247,9 +249,8 @@ class Evaluator:
         return EvalRecord(
             label_list,
             output_list,
-            _by_class(gradient_list, label_list, num_classes),
-            _by_class(gradient_input_list, label_list, num_classes),
-            _by_class(smoothgrad_list, label_list, num_classes),
-            _by_class(smoothgrad_sq_list, label_list, num_classes),
-            _by_class(vargrad_list, label_list, num_classes),
+            *(
+                _by_class(np.concatenate(maps), label_list, num_classes)
+                for maps in saliency_lists.values()
+            ),
         )
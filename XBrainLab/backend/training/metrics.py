@@ -0,0 +1,160 @@
+"""Streaming classification metrics accumulated on the training device.
+
+:class:`MetricAccumulator` keeps the running loss, a confusion matrix and
+per-class score histograms as device tensors. Updating it never reads a
+value back to the host, so the batch loop runs without device
+synchronization, and its memory does not grow with the number of samples.
+All statistics are copied to the host in one transfer by
+:meth:`MetricAccumulator.compute`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+
+from .record import RecordKey
+
+AUC_BINS = 1000
+"""Number of probability bins of the histogram AUC estimate."""
+
+
+class MetricAccumulator:
+    """Running loss, accuracy and AUC of a classifier over one pass.
+
+    The AUC is the one-vs-rest ROC AUC of the softmax scores (macro
+    averaged over classes; the score of class ``1`` for binary problems),
+    estimated from :data:`AUC_BINS`-bin histograms of the scores of
+    positive and negative samples. Scores falling into the same bin count
+    as ties. As with :meth:`Evaluator.compute_auc`, the AUC is ``0`` when a
+    class has no positive or no negative samples.
+
+    Attributes:
+        n_bins: Number of histogram bins.
+        n_batches: Number of batches accumulated.
+        n_samples: Number of samples accumulated.
+        confusion: Confusion matrix (rows are labels, columns predictions)
+            as a host array, available after :meth:`compute`.
+
+    """
+
+    def __init__(self, n_bins: int = AUC_BINS):
+        """Create an empty accumulator.
+
+        Args:
+            n_bins: Number of probability bins of the histogram AUC.
+
+        """
+        self.n_bins = n_bins
+        self.n_batches = 0
+        self.n_samples = 0
+        self.confusion: np.ndarray | None = None
+        self._n_classes = 0
+        # Allocated on the device of the first batch
+        self._loss = torch.zeros(())
+        self._confusion = torch.zeros(0)
+        self._positive = torch.zeros(0)
+        self._negative = torch.zeros(0)
+
+    def update(
+        self,
+        outputs: torch.Tensor,
+        labels: torch.Tensor,
+        loss: torch.Tensor,
+    ) -> None:
+        """Add one batch without synchronizing with the device.
+
+        Args:
+            outputs: Logits of shape ``(B, C)``.
+            labels: Integer labels of shape ``(B,)``.
+            loss: Mean loss of the batch (scalar tensor).
+
+        """
+        outputs = outputs.detach().float()
+        labels = labels.detach().long()
+        n_classes = outputs.shape[-1]
+        if self.n_batches == 0:
+            device = outputs.device
+            self._n_classes = n_classes
+            self._loss = torch.zeros((), device=device)
+            self._confusion = torch.zeros(n_classes * n_classes, device=device)
+            self._positive = torch.zeros(n_classes * self.n_bins, device=device)
+            self._negative = torch.zeros(n_classes * self.n_bins, device=device)
+
+        self._loss += loss.detach().float()
+        predictions = outputs.argmax(dim=1)
+        self._confusion.index_add_(
+            0,
+            labels * n_classes + predictions,
+            torch.ones_like(labels, dtype=torch.float32),
+        )
+
+        probs = torch.softmax(outputs, dim=1)
+        bins = (probs * self.n_bins).long().clamp_(max=self.n_bins - 1)
+        classes = torch.arange(n_classes, device=outputs.device)
+        index = (classes * self.n_bins + bins).flatten()
+        is_positive = (labels[:, None] == classes).flatten().float()
+        self._positive.index_add_(0, index, is_positive)
+        self._negative.index_add_(0, index, 1 - is_positive)
+
+        self.n_batches += 1
+        self.n_samples += len(labels)
+
+    def compute(self) -> dict[str, float]:
+        """Copy the statistics to the host and return the epoch metrics.
+
+        Returns:
+            A dictionary with accuracy in percent (``RecordKey.ACC``), AUC
+            (``RecordKey.AUC``) and the mean batch loss (``RecordKey.LOSS``);
+            all ``0`` if no batch was accumulated.
+
+        """
+        if self.n_samples == 0:
+            return {RecordKey.ACC: 0, RecordKey.AUC: 0, RecordKey.LOSS: 0}
+
+        packed = torch.cat(
+            [self._loss[None], self._confusion, self._positive, self._negative]
+        )
+        host = packed.cpu().double().numpy()
+        n_classes = self._n_classes
+        n_confusion = n_classes * n_classes
+        loss = host[0]
+        confusion = host[1 : 1 + n_confusion].reshape(n_classes, n_classes)
+        histograms = host[1 + n_confusion :].reshape(2, n_classes, self.n_bins)
+        self.confusion = confusion.astype(np.int64)
+
+        return {
+            RecordKey.ACC: float(np.trace(confusion) / self.n_samples * 100),
+            RecordKey.AUC: histogram_auc(histograms[0], histograms[1]),
+            RecordKey.LOSS: float(loss / self.n_batches),
+        }
+
+
+def histogram_auc(positive: np.ndarray, negative: np.ndarray) -> float:
+    """Compute the one-vs-rest ROC AUC from per-class score histograms.
+
+    Args:
+        positive: Array of shape ``(C, bins)`` counting, per class, the
+            scores of samples of that class.
+        negative: Array of shape ``(C, bins)`` counting the scores of all
+            other samples.
+
+    Returns:
+        Macro-averaged AUC over classes (class ``1`` only when ``C == 2``),
+        or ``0.0`` if it is undefined.
+
+    """
+    n_classes = positive.shape[0]
+    if n_classes < 2:
+        return 0.0
+    n_positive = positive.sum(axis=1)
+    n_negative = negative.sum(axis=1)
+    if (n_positive == 0).any() or (n_negative == 0).any():
+        return 0.0
+    # Negatives scored strictly lower, plus half of the ties in the same bin
+    below = np.cumsum(negative, axis=1) - negative
+    wins = (positive * (below + 0.5 * negative)).sum(axis=1)
+    auc = wins / (n_positive * n_negative)
+    if n_classes == 2:
+        return float(auc[1])
+    return float(auc.mean())
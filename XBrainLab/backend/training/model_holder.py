@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
+from enum import Enum
+
 import torch
 
 
+class ModelCompileMode(Enum):
+    """How the training loop executes a model's forward pass.
+
+    Attributes:
+        NONE: Eager execution.
+        COMPILE: Graph compiled with :func:`torch.compile`.
+        TRACE: TorchScript module recorded with :func:`torch.jit.trace`.
+
+    """
+
+    NONE = "none"
+    COMPILE = "compile"
+    TRACE = "trace"
+
+
 class ModelHolder:
     """Class for storing model information
 
@@ -14,6 +31,7 @@ class ModelHolder:
         target_model (type): Model class, inherited from `torch.nn.Module`
         model_params_map (dict): Model parameters
         pretrained_weight_path (str): Path to pretrained weight
+        compile_mode (ModelCompileMode): Execution mode used for training
 
     """
 
@@ -22,10 +40,12 @@ class ModelHolder:
         target_model: type,
         model_params_map: dict,
         pretrained_weight_path: str | None = None,
+        compile_mode: ModelCompileMode | str = ModelCompileMode.NONE,
     ):
         self.target_model = target_model
         self.model_params_map = model_params_map
         self.pretrained_weight_path = pretrained_weight_path
+        self.compile_mode = ModelCompileMode(compile_mode)
 
     def get_model_desc_str(self) -> str:
         """Get a human-readable model description string.
@@ -62,3 +82,29 @@ class ModelHolder:
                 torch.load(self.pretrained_weight_path, weights_only=True),
             )
         return model
+
+    def get_compiled_model(self, model: torch.nn.Module, args) -> torch.nn.Module:
+        """Wrap a model created by :meth:`get_model` for :attr:`compile_mode`.
+
+        Compiled artifacts are cached per model class, model arguments,
+        input shape and training mode, so the models of later repeats reuse
+        them (see :class:`~.compiled.CompiledModel`).
+
+        Args:
+            model: Model returned by :meth:`get_model`, already on its device.
+            args: The keyword arguments passed to :meth:`get_model`.
+
+        Returns:
+            *model* itself for :attr:`ModelCompileMode.NONE`, otherwise a
+            :class:`~.compiled.CompiledModel` sharing its parameters.
+
+        """
+        if self.compile_mode == ModelCompileMode.NONE:
+            return model
+        from .compiled import CompiledModel  # noqa: PLC0415 — circular import
+
+        return CompiledModel(
+            model,
+            self.compile_mode,
+            {**self.model_params_map, **args},
+        )
@@ -1,5 +1,6 @@
 """Training option and configuration classes for model training."""
 
+import os
 from enum import Enum
 
 import torch
@@ -23,6 +24,80 @@ class TrainingEvaluation(Enum):
     LAST_EPOCH = "Last Epoch"
 
 
+class TrainingPrecision(Enum):
+    """Enumeration of numeric precisions for training and evaluation.
+
+    Attributes:
+        FP32: Full single precision.
+        BF16: ``bfloat16`` autocast (CPU or CUDA).
+        FP16: ``float16`` autocast with gradient scaling (CUDA only).
+
+    """
+
+    FP32 = "fp32"
+    BF16 = "bf16"
+    FP16 = "fp16"
+
+
+class TrainingEarlyStopping(Enum):
+    """Enumeration of early-stopping criteria.
+
+    Attributes:
+        NONE: Always train for the configured number of epochs.
+        VAL_LOSS: Stop when the validation loss stops decreasing.
+        VAL_AUC: Stop when the validation AUC stops increasing.
+
+    """
+
+    NONE = "None"
+    VAL_LOSS = "Validation loss"
+    VAL_AUC = "Validation AUC"
+
+
+class TrainingScheduler(Enum):
+    """Enumeration of learning-rate schedulers.
+
+    Attributes:
+        NONE: Constant learning rate.
+        PLATEAU: Reduce the learning rate when the validation loss (or the
+            training loss without validation data) stops improving.
+        COSINE: Cosine annealing to zero over the configured epochs.
+
+    """
+
+    NONE = "None"
+    PLATEAU = "Reduce on plateau"
+    COSINE = "Cosine annealing"
+
+
+class TrainingAugmentation(Enum):
+    """Enumeration of training-batch augmentations.
+
+    Each augmentation is configured by a magnitude in
+    :attr:`TrainingOption.augmentation`:
+
+    Attributes:
+        TIME_SHIFT: Circular shift in time by up to the magnitude times the
+            epoch length.
+        AMPLITUDE_SCALE: Scaling by a factor in ``[1 - m, 1 + m]``.
+        GAUSSIAN_NOISE: Additive noise with a standard deviation of the
+            magnitude times that of each channel.
+        CHANNEL_DROPOUT: Zeroing each channel with the magnitude as
+            probability.
+        FREQUENCY_SHIFT: Shift of the spectrum by up to the magnitude in Hz.
+        MIXUP: Mixup of the batch with a shuffled copy, with the magnitude
+            as the ``alpha`` of the Beta distribution of the mixing weight.
+
+    """
+
+    TIME_SHIFT = "Time shift"
+    AMPLITUDE_SCALE = "Amplitude scaling"
+    GAUSSIAN_NOISE = "Gaussian noise"
+    CHANNEL_DROPOUT = "Channel dropout"
+    FREQUENCY_SHIFT = "Frequency shift"
+    MIXUP = "Mixup"
+
+
 def parse_device_name(use_cpu: bool, gpu_idx: int | None) -> str:
     """Return a human-readable device description string.
 
@@ -77,6 +152,47 @@ class TrainingOption:
         evaluation_option: Model selection option
         repeat_num: Number of repeats
         criterion: Loss function
+        cache_data: Whether to keep the dataset splits as tensors on the
+            training device for the lifetime of a training plan
+        cache_budget_mb: Memory budget (MB) for the tensor cache; larger
+            datasets fall back to the streaming loader
+        num_workers: Number of data-loading worker processes
+        prefetch_factor: Batches prefetched by each worker
+        pin_memory: Whether to load batches into pinned host memory
+        persistent_workers: Whether workers survive between epochs
+        parallel_jobs: Number of repeats trained concurrently in worker
+            processes (CPU only)
+        threads_per_job: Intra-op thread budget of each parallel job
+            (``0`` divides the available cores evenly)
+        vectorize_repeats: Whether all repeats of a plan are trained
+            together in one vectorized forward/backward pass
+        precision: :class:`TrainingPrecision` of forward/backward passes
+        eval_every: Evaluate on the validation split every N epochs
+        per_epoch_test: Whether the test split is evaluated together with
+            the validation split, or only after the last epoch
+        early_stopping: :class:`TrainingEarlyStopping` criterion
+        patience: Epochs without improvement before early stopping
+        lr_scheduler: :class:`TrainingScheduler` of the learning rate
+        scheduler_patience: Epochs without improvement before the plateau
+            scheduler reduces the learning rate
+        scheduler_factor: Learning-rate reduction factor of the plateau
+            scheduler
+        schedule_epoch: Epochs the cosine scheduler anneals over, ``None``
+            for :attr:`epoch`
+        checkpoint_keep_last: Number of most recent epoch checkpoints kept
+            on disk (``0`` keeps all)
+        checkpoint_keep_best: Whether the epoch checkpoint of the model
+            selected by :attr:`evaluation_option` is always kept
+        epoch_snapshots: Whether the training state is copied after every
+            epoch, so an interrupted epoch is undone exactly
+        profile: Whether the phases of every epoch are timed (see
+            :mod:`~.profiler`)
+        augmentation: Magnitude of each :class:`TrainingAugmentation`
+            applied to training batches (see :mod:`~.augmentation`)
+        augment_prob: Probability of applying each augmentation to a
+            sample (to a batch for mixup)
+        precompute_saliency: Whether final evaluation computes every
+            saliency map, or leaves them to be computed on demand
 
     """
 
@@ -93,6 +209,31 @@ class TrainingOption:
         checkpoint_epoch: int,
         evaluation_option: TrainingEvaluation,
         repeat_num: int,
+        cache_data: bool = False,
+        cache_budget_mb: float = 1024.0,
+        num_workers: int = 0,
+        prefetch_factor: int = 2,
+        pin_memory: bool = False,
+        persistent_workers: bool = False,
+        parallel_jobs: int = 1,
+        threads_per_job: int = 0,
+        vectorize_repeats: bool = False,
+        precision: TrainingPrecision | str = TrainingPrecision.FP32,
+        eval_every: int = 1,
+        per_epoch_test: bool = True,
+        early_stopping: TrainingEarlyStopping | str = TrainingEarlyStopping.NONE,
+        patience: int = 10,
+        lr_scheduler: TrainingScheduler | str = TrainingScheduler.NONE,
+        scheduler_patience: int = 5,
+        scheduler_factor: float = 0.1,
+        schedule_epoch: int | None = None,
+        checkpoint_keep_last: int = 0,
+        checkpoint_keep_best: bool = True,
+        epoch_snapshots: bool = False,
+        profile: bool = False,
+        augmentation: dict | None = None,
+        augment_prob: float = 0.5,
+        precompute_saliency: bool = False,
     ):
         """Initialize training options and validate them.
 
@@ -109,6 +250,85 @@ class TrainingOption:
             checkpoint_epoch: Save checkpoint every N epochs.
             evaluation_option: Model selection strategy.
             repeat_num: Number of training repetitions.
+            cache_data: Convert the train/val/test splits to tensors on the
+                training device once per plan and reuse them across epochs
+                and repeats. Defaults to ``False``.
+            cache_budget_mb: Estimated cache size (MB) above which the
+                streaming loader is used instead. Defaults to ``1024``.
+            num_workers: Worker processes for the streaming loader. Workers
+                read a memory-mapped copy of the epoch array. Defaults to
+                ``0`` (load in the training thread).
+            prefetch_factor: Batches loaded in advance by each worker.
+                Defaults to ``2``.
+            pin_memory: Load batches into pinned host memory before the
+                device transfer (CUDA only). Defaults to ``False``.
+            persistent_workers: Keep workers alive between epochs.
+                Defaults to ``False``.
+            parallel_jobs: Train up to this many repeats (and plans) at
+                the same time in separate processes. Only used on CPU.
+                Defaults to ``1`` (sequential).
+            threads_per_job: ``torch.set_num_threads`` budget of each
+                parallel job. Defaults to ``0`` (CPU count divided by
+                ``parallel_jobs``).
+            vectorize_repeats: Stack the parameters of all repeats and
+                train them with one ``torch.func.vmap`` call per shared
+                batch. Repeats keep their own records and optimizers but
+                see batches in the same order. Defaults to ``False``.
+            precision: Autocast precision for training, evaluation and
+                saliency (a :class:`TrainingPrecision` or its value).
+                ``fp16`` requires a GPU. Defaults to ``fp32``.
+            eval_every: Run validation (and per-epoch test) evaluation after
+                every N-th epoch and after the last one. Best-model tracking
+                only considers evaluated epochs. Defaults to ``1``.
+            per_epoch_test: Evaluate the test split at every evaluation.
+                If ``False`` it is only evaluated after the last epoch,
+                which cannot be combined with selecting the model by test
+                performance. Defaults to ``True``.
+            early_stopping: Stop a repeat once the chosen validation metric
+                has not improved for *patience* epochs. Defaults to
+                ``NONE``.
+            patience: Early-stopping patience in epochs. Defaults to ``10``.
+            lr_scheduler: Learning-rate schedule stepped after every epoch.
+                Defaults to ``NONE``.
+            scheduler_patience: Patience of the plateau scheduler in
+                evaluations. Defaults to ``5``.
+            scheduler_factor: Factor applied to the learning rate by the
+                plateau scheduler. Defaults to ``0.1``.
+            schedule_epoch: Length in epochs of the cosine schedule, when
+                a plan is trained in stages whose :attr:`epoch` grows up to
+                this budget (see :class:`~.sweep.Sweep`).
+                Defaults to ``None`` (anneal over :attr:`epoch`).
+            checkpoint_keep_last: Keep only the last K ``Epoch-N-model``
+                checkpoints of a repeat and delete older ones. ``0`` keeps
+                every checkpoint. Defaults to ``0``.
+            checkpoint_keep_best: Never delete the epoch checkpoint of the
+                best epoch under :attr:`evaluation_option`. Defaults to
+                ``True``.
+            epoch_snapshots: Copy the model, optimizer and scheduler state
+                to the CPU after every epoch, so an epoch cut short by an
+                interrupt is rolled back and training continues exactly.
+                Otherwise the state is only copied with checkpoints, and an
+                interrupted epoch is rolled back only if it follows one.
+                Defaults to ``False``.
+            profile: Time the data fetch, forward, backward and optimizer
+                step of every batch and the validation, test and checkpoint
+                phases, and record them with the throughput and peak memory
+                as training statistics. Synchronizes the GPU around every
+                phase. Defaults to ``False``.
+            augmentation: Mapping of :class:`TrainingAugmentation` (or its
+                value) to its magnitude. The augmentations are applied to
+                whole training batches on the training device; validation
+                and test data are never augmented. A magnitude of ``0``
+                disables an augmentation. Defaults to ``None`` (no
+                augmentation).
+            augment_prob: Probability that a sample (for mixup: a batch)
+                is augmented by each configured augmentation. Defaults to
+                ``0.5``.
+            precompute_saliency: Compute the maps of every saliency method
+                for every class when a repeat is evaluated. When ``False``,
+                evaluation stores labels and outputs only, and each map is
+                computed when a visualization first requests it (see
+                :class:`~.saliency.SaliencySource`). Defaults to ``False``.
 
         Raises:
             ValueError: If any option is invalid or not set.
@@ -125,6 +345,31 @@ class TrainingOption:
         self.checkpoint_epoch = checkpoint_epoch
         self.evaluation_option = evaluation_option
         self.repeat_num = repeat_num
+        self.cache_data = cache_data
+        self.cache_budget_mb = cache_budget_mb
+        self.num_workers = num_workers
+        self.prefetch_factor = prefetch_factor
+        self.pin_memory = pin_memory
+        self.persistent_workers = persistent_workers
+        self.parallel_jobs = parallel_jobs
+        self.threads_per_job = threads_per_job
+        self.vectorize_repeats = vectorize_repeats
+        self.precision = precision
+        self.eval_every = eval_every
+        self.per_epoch_test = per_epoch_test
+        self.early_stopping = early_stopping
+        self.patience = patience
+        self.lr_scheduler = lr_scheduler
+        self.scheduler_patience = scheduler_patience
+        self.scheduler_factor = scheduler_factor
+        self.schedule_epoch = schedule_epoch
+        self.checkpoint_keep_last = checkpoint_keep_last
+        self.checkpoint_keep_best = checkpoint_keep_best
+        self.epoch_snapshots = epoch_snapshots
+        self.profile = profile
+        self.augmentation = augmentation
+        self.augment_prob = augment_prob
+        self.precompute_saliency = precompute_saliency
         self.criterion = nn.CrossEntropyLoss()
         self.optimizer_name = "adam"  # Default
         self.validate()
@@ -171,6 +416,66 @@ class TrainingOption:
             errors.append("Invalid checkpoint epoch")
         if check_num(self.repeat_num) or int(self.repeat_num) <= 0:
             errors.append("Invalid repeat number")
+        if check_num(self.cache_budget_mb) or float(self.cache_budget_mb) < 0:
+            errors.append("Invalid cache budget (must be non-negative)")
+        if check_num(self.num_workers) or int(self.num_workers) < 0:
+            errors.append("Invalid number of workers (must be non-negative)")
+        if check_num(self.prefetch_factor) or int(self.prefetch_factor) <= 0:
+            errors.append("Invalid prefetch factor (must be a positive integer)")
+        if check_num(self.parallel_jobs) or int(self.parallel_jobs) <= 0:
+            errors.append("Invalid parallel jobs (must be a positive integer)")
+        if check_num(self.threads_per_job) or int(self.threads_per_job) < 0:
+            errors.append("Invalid threads per job (must be non-negative)")
+        try:
+            precision = TrainingPrecision(self.precision)
+        except ValueError:
+            errors.append("Invalid precision")
+        else:
+            if precision == TrainingPrecision.FP16 and self.use_cpu:
+                errors.append("fp16 precision requires a GPU device")
+        if check_num(self.eval_every) or int(self.eval_every) <= 0:
+            errors.append("Invalid evaluation interval (must be a positive integer)")
+        if not self.per_epoch_test and self.evaluation_option in (
+            TrainingEvaluation.TEST_ACC,
+            TrainingEvaluation.TEST_AUC,
+        ):
+            errors.append(
+                "Selecting the model by test performance requires per-epoch "
+                "test evaluation"
+            )
+        try:
+            TrainingEarlyStopping(self.early_stopping)
+        except ValueError:
+            errors.append("Invalid early stopping criterion")
+        if check_num(self.patience) or int(self.patience) <= 0:
+            errors.append("Invalid patience (must be a positive integer)")
+        try:
+            TrainingScheduler(self.lr_scheduler)
+        except ValueError:
+            errors.append("Invalid learning rate scheduler")
+        if check_num(self.scheduler_patience) or int(self.scheduler_patience) < 0:
+            errors.append("Invalid scheduler patience (must be non-negative)")
+        if check_num(self.scheduler_factor) or not 0 < float(self.scheduler_factor) < 1:
+            errors.append("Invalid scheduler factor (must be between 0 and 1)")
+        if self.schedule_epoch is not None and (
+            check_num(self.schedule_epoch) or int(self.schedule_epoch) <= 0
+        ):
+            errors.append("Invalid schedule epoch (must be a positive integer)")
+        if check_num(self.checkpoint_keep_last) or int(self.checkpoint_keep_last) < 0:
+            errors.append("Invalid checkpoint retention (must be non-negative)")
+        augmentation = {}
+        try:
+            for name, magnitude in (self.augmentation or {}).items():
+                augmentation[TrainingAugmentation(name)] = magnitude
+        except (AttributeError, ValueError):
+            errors.append("Invalid augmentation")
+        for name, magnitude in augmentation.items():
+            if check_num(magnitude) or float(magnitude) < 0:
+                errors.append(f"Invalid {name.value.lower()} (must be non-negative)")
+            elif name == TrainingAugmentation.CHANNEL_DROPOUT and float(magnitude) > 1:
+                errors.append("Invalid channel dropout (must be at most 1)")
+        if check_num(self.augment_prob) or not 0 <= float(self.augment_prob) <= 1:
+            errors.append("Invalid augmentation probability (must be between 0 and 1)")
 
         if errors:
             raise ValueError("; ".join(errors))
@@ -180,6 +485,36 @@ class TrainingOption:
         self.lr = float(self.lr)
         self.checkpoint_epoch = int(self.checkpoint_epoch)
         self.repeat_num = int(self.repeat_num)
+        self.cache_data = bool(self.cache_data)
+        self.cache_budget_mb = float(self.cache_budget_mb)
+        self.num_workers = int(self.num_workers)
+        self.prefetch_factor = int(self.prefetch_factor)
+        self.pin_memory = bool(self.pin_memory)
+        self.persistent_workers = bool(self.persistent_workers)
+        self.parallel_jobs = int(self.parallel_jobs)
+        self.threads_per_job = int(self.threads_per_job)
+        self.vectorize_repeats = bool(self.vectorize_repeats)
+        self.precision = TrainingPrecision(self.precision)
+        self.eval_every = int(self.eval_every)
+        self.per_epoch_test = bool(self.per_epoch_test)
+        self.early_stopping = TrainingEarlyStopping(self.early_stopping)
+        self.patience = int(self.patience)
+        self.lr_scheduler = TrainingScheduler(self.lr_scheduler)
+        self.scheduler_patience = int(self.scheduler_patience)
+        self.scheduler_factor = float(self.scheduler_factor)
+        if self.schedule_epoch is not None:
+            self.schedule_epoch = int(self.schedule_epoch)
+        self.checkpoint_keep_last = int(self.checkpoint_keep_last)
+        self.checkpoint_keep_best = bool(self.checkpoint_keep_best)
+        self.epoch_snapshots = bool(self.epoch_snapshots)
+        self.profile = bool(self.profile)
+        self.precompute_saliency = bool(self.precompute_saliency)
+        self.augmentation = {
+            name: float(magnitude)
+            for name, magnitude in augmentation.items()
+            if float(magnitude) > 0
+        }
+        self.augment_prob = float(self.augment_prob)
         if self.gpu_idx is not None:
             self.gpu_idx = int(self.gpu_idx)
 
@@ -200,6 +535,44 @@ class TrainingOption:
             raise ValueError("Optimizer not set")
         return self.optim(params=model.parameters(), lr=self.lr, **self.optim_params)
 
+    def get_scheduler(
+        self,
+        optimizer: torch.optim.Optimizer | None,
+    ) -> torch.optim.lr_scheduler.LRScheduler | None:
+        """Create the learning-rate scheduler for *optimizer*.
+
+        Args:
+            optimizer: Optimizer of a training repeat, or ``None``.
+
+        Returns:
+            A scheduler for :attr:`lr_scheduler`, or ``None`` if no
+            scheduler is configured or there is no optimizer.
+
+        """
+        if optimizer is None or self.lr_scheduler == TrainingScheduler.NONE:
+            return None
+        if self.lr_scheduler == TrainingScheduler.PLATEAU:
+            return torch.optim.lr_scheduler.ReduceLROnPlateau(
+                optimizer,
+                factor=self.scheduler_factor,
+                patience=self.scheduler_patience,
+            )
+        # Options pickled before schedule_epoch existed lack the attribute
+        t_max = getattr(self, "schedule_epoch", None) or self.epoch
+        return torch.optim.lr_scheduler.CosineAnnealingLR(optimizer, T_max=t_max)
+
+    def is_eval_epoch(self, epoch: int) -> bool:
+        """Return whether evaluation runs after the given epoch.
+
+        Args:
+            epoch: 1-based index of the epoch that just finished.
+
+        Returns:
+            ``True`` every :attr:`eval_every` epochs and after the last one.
+
+        """
+        return epoch % self.eval_every == 0 or epoch >= self.epoch
+
     def get_optimizer_name_repr(self) -> str:
         """Return the optimizer class name as a string.
 
@@ -265,6 +638,53 @@ class TrainingOption:
             return "cpu"
         return f"cuda:{self.gpu_idx}"
 
+    def get_loader_kwargs(self) -> dict:
+        """Return data-loader parallelism settings for :func:`to_holder`.
+
+        Worker-only settings are dropped when no workers are used, and
+        pinned memory is only requested for CUDA devices.
+
+        Returns:
+            A dictionary with ``num_workers``, ``prefetch_factor``,
+            ``pin_memory`` and ``persistent_workers``.
+
+        """
+        use_workers = self.num_workers > 0
+        return {
+            "num_workers": self.num_workers,
+            "prefetch_factor": self.prefetch_factor if use_workers else None,
+            "pin_memory": self.pin_memory and not self.use_cpu,
+            "persistent_workers": self.persistent_workers and use_workers,
+        }
+
+    def get_parallel_jobs(self) -> int:
+        """Return the number of repeats that may train concurrently.
+
+        Parallel jobs run in separate processes and are only used on CPU;
+        GPU training and vectorized repeats (which already train together)
+        run in the training thread.
+
+        Returns:
+            The configured :attr:`parallel_jobs` on CPU without
+            :attr:`vectorize_repeats`, otherwise ``1``.
+
+        """
+        if not self.use_cpu or self.vectorize_repeats:
+            return 1
+        return self.parallel_jobs
+
+    def get_threads_per_job(self) -> int:
+        """Return the intra-op thread budget of each parallel job.
+
+        Returns:
+            :attr:`threads_per_job` if set, otherwise the CPU count divided
+            evenly between :attr:`parallel_jobs` (at least ``1``).
+
+        """
+        if self.threads_per_job > 0:
+            return self.threads_per_job
+        return max(1, (os.cpu_count() or 1) // self.get_parallel_jobs())
+
     def get_evaluation_option_repr(self) -> str:
         """Return a string representation of the model selection option.
 
@@ -0,0 +1,270 @@
+"""Process-pool scheduler for training independent repeats concurrently.
+
+Every unfinished :class:`~XBrainLab.backend.training.record.TrainRecord` of
+the queued :class:`~XBrainLab.backend.training.training_plan.TrainingPlanHolder`
+objects is an independent job: it owns its model, optimizer and random
+state. :class:`ParallelScheduler` trains these jobs in spawned worker
+processes, each limited to its own ``torch.set_num_threads`` budget, and
+streams per-epoch progress back into the records owned by the main
+process. Records are sent to the workers released (see
+:meth:`TrainRecord.release`), so only state dicts are pickled and the main
+process never creates the models. Workers write checkpoints to the
+record's usual output directory, so the on-disk layout is the same as for
+sequential training.
+
+The epoch array of each plan is shared through a memory-mapped ``.npy``
+file (see :meth:`TrainingPlanHolder.get_shared_data_path`) instead of being
+pickled into every job.
+"""
+
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any
+
+import numpy as np
+import torch
+
+from ..utils.logger import logger
+from .record import TrainRecord
+from .training_plan import Status, TrainingPlanHolder
+
+_POLL_INTERVAL = 0.2
+
+_stop_event: Any = None
+_progress_queue: Any = None
+
+
+def _init_worker(stop_event: Any, progress_queue: Any) -> None:
+    """Store the shared stop event and progress queue in a worker process."""
+    global _stop_event, _progress_queue  # noqa: PLW0603
+    _stop_event = stop_event
+    _progress_queue = progress_queue
+
+
+def _run_job(
+    key: tuple[int, int],
+    holder: TrainingPlanHolder,
+    record: TrainRecord,
+    data_path: str,
+    num_threads: int,
+) -> dict[str, Any]:
+    """Train one repeat inside a worker process.
+
+    Args:
+        key: ``(plan index, repeat index)`` used to route progress updates.
+        holder: Lightweight copy of the plan without its record list.
+        record: Released copy of the record to train; its model, optimizer
+            and scheduler are created from the resume point in the worker.
+        data_path: Path of the memory-mapped epoch array.
+        num_threads: Intra-op thread budget of this job.
+
+    Returns:
+        A :meth:`TrainRecord.snapshot` including weights.
+
+    """
+    torch.set_num_threads(num_threads)
+    holder.dataset.get_epoch_data().data = np.load(data_path, mmap_mode="r")
+    holder._interrupt = _stop_event
+
+    def report(train_record: TrainRecord) -> None:
+        _progress_queue.put((key, train_record.snapshot()))
+
+    holder.epoch_callback = report
+    record.resume()
+    holder.train_one_repeat(record)
+    record.pause()
+    return record.snapshot(include_weights=True)
+
+
+def _make_job_args(
+    holder: TrainingPlanHolder,
+    record: TrainRecord,
+) -> tuple[TrainingPlanHolder, TrainRecord]:
+    """Return picklable copies of *holder* and *record* for a worker.
+
+    The copies share a dataset whose epoch array is detached (it is
+    re-attached from the memory-mapped file in the worker) and train with
+    in-process data loading. *record* is released first, so the copy
+    carries state dicts instead of a model; the parent's statistics are
+    left untouched.
+    """
+    epoch_data = copy.copy(holder.dataset.get_epoch_data())
+    epoch_data.data = None  # type: ignore[assignment]
+    dataset = copy.copy(holder.dataset)
+    dataset.epoch_data = epoch_data
+
+    option = copy.copy(holder.option)
+    option.num_workers = 0
+    option.persistent_workers = False
+    option.parallel_jobs = 1
+
+    worker_holder = copy.copy(holder)
+    worker_holder.dataset = dataset
+    worker_holder.option = option
+    worker_holder.train_record_list = []
+    worker_holder._tensor_cache = None
+    worker_holder._worker_data_path = None
+    worker_holder._eval_model = None
+    worker_holder._interrupt = None  # type: ignore[assignment]
+    worker_holder.epoch_callback = None
+
+    record.release()
+    worker_record = copy.copy(record)
+    worker_record.dataset = dataset
+    worker_record.option = option
+    return worker_holder, worker_record
+
+
+class ParallelScheduler:
+    """Train the unfinished repeats of several plans in a process pool.
+
+    Attributes:
+        plans: Plans whose unfinished repeats are scheduled, in queue order.
+        max_jobs: Maximum number of concurrently running repeats.
+        interrupt: Event that stops all jobs after their current batch.
+        on_status: Optional callback receiving a progress string whenever
+            the set of running repeats changes.
+
+    """
+
+    def __init__(
+        self,
+        plans: list[TrainingPlanHolder],
+        max_jobs: int,
+        interrupt: threading.Event,
+        on_status: Callable[[str], None] | None = None,
+    ):
+        self.plans = plans
+        self.max_jobs = max_jobs
+        self.interrupt = interrupt
+        self.on_status = on_status
+
+    def run(self) -> None:
+        """Train every unfinished repeat and wait for all jobs to end.
+
+        Errors of individual jobs are stored in :attr:`TrainingPlanHolder.error`
+        and cancel the remaining jobs of that plan; other plans continue.
+        """
+        jobs = [
+            (plan_idx, repeat)
+            for plan_idx, plan in enumerate(self.plans)
+            for repeat, record in enumerate(plan.get_plans())
+            if not record.is_finished()
+        ]
+        if not jobs or self.interrupt.is_set():
+            self._finish()
+            return
+
+        context = multiprocessing.get_context("spawn")
+        stop_event = context.Event()
+        progress_queue = context.Queue()
+        futures: dict[Future, tuple[int, int]] = {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_jobs, len(jobs)),
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(stop_event, progress_queue),
+            ) as executor:
+                for key in jobs:
+                    futures[self._submit(executor, key)] = key
+                self._wait(futures, stop_event, progress_queue)
+        finally:
+            self._drain(progress_queue)
+            self._finish()
+
+    def _submit(self, executor: ProcessPoolExecutor, key: tuple[int, int]) -> Future:
+        """Submit the repeat identified by *key* to *executor*."""
+        plan_idx, repeat = key
+        plan = self.plans[plan_idx]
+        record = plan.get_plans()[repeat]
+        worker_holder, worker_record = _make_job_args(plan, record)
+        return executor.submit(
+            _run_job,
+            key,
+            worker_holder,
+            worker_record,
+            plan.get_shared_data_path(),
+            plan.option.get_threads_per_job(),
+        )
+
+    def _wait(
+        self,
+        futures: dict[Future, tuple[int, int]],
+        stop_event: Any,
+        progress_queue: Any,
+    ) -> None:
+        """Poll progress, interrupts and results until all jobs are done."""
+        pending = set(futures)
+        while pending:
+            if self.interrupt.is_set() or any(p.interrupt for p in self.plans):
+                stop_event.set()
+            done, pending = wait(
+                pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED
+            )
+            self._drain(progress_queue)
+            for future in done:
+                self._collect(future, futures)
+            self._update_status(futures)
+
+    def _drain(self, progress_queue: Any) -> None:
+        """Apply all queued progress snapshots to the parent records."""
+        while True:
+            try:
+                (plan_idx, repeat), state = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            record = self.plans[plan_idx].get_plans()[repeat]
+            if state["epoch"] >= record.get_epoch():
+                record.restore_snapshot(state)
+
+    def _collect(self, future: Future, futures: dict[Future, tuple[int, int]]) -> None:
+        """Store the result (or error) of a finished job."""
+        plan_idx, repeat = futures[future]
+        plan = self.plans[plan_idx]
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            train_record = plan.get_plans()[repeat]
+            train_record.restore_snapshot(future.result())
+            plan.attach_saliency_source(train_record)
+            return
+        logger.error("Training plan execution failed: %s", error, exc_info=error)
+        plan.error = str(error)
+        for other, (other_idx, _) in futures.items():
+            if other_idx == plan_idx:
+                other.cancel()
+
+    def _update_status(self, futures: dict[Future, tuple[int, int]]) -> None:
+        """Refresh plan status strings and report the running repeats."""
+        running_keys = sorted(
+            key for future, key in futures.items() if future.running()
+        )
+        names: list[str] = []
+        for plan_idx, plan in enumerate(self.plans):
+            running = [
+                plan.get_plans()[repeat].get_name()
+                for idx, repeat in running_keys
+                if idx == plan_idx
+            ]
+            if running:
+                plan.status = Status.TRAIN.value.format(", ".join(running))
+                names.append(plan.get_name())
+        if names and self.on_status is not None:
+            self.on_status(", ".join(names))
+
+    def _finish(self) -> None:
+        """Set final plan status and release the shared data files."""
+        for plan in self.plans:
+            if plan.is_finished():
+                plan.status = Status.DONE.value
+            else:
+                plan.status = Status.PENDING.value
+            plan.release_shared_data()
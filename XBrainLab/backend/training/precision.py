@@ -0,0 +1,88 @@
+"""Mixed-precision helpers shared by training, evaluation and saliency."""
+
+from __future__ import annotations
+
+import contextlib
+
+import torch
+
+from .option import TrainingPrecision
+
+_AUTOCAST_DTYPES = {
+    TrainingPrecision.BF16: torch.bfloat16,
+    TrainingPrecision.FP16: torch.float16,
+}
+
+
+class MixedPrecision:
+    """Autocast context and loss scaling for one :class:`TrainingPrecision`.
+
+    ``fp32`` is a no-op. ``bf16`` autocasts on CPU or CUDA without loss
+    scaling (it has the exponent range of ``float32``). ``fp16`` autocasts
+    on CUDA and scales the loss with a :class:`torch.amp.GradScaler`; the
+    scaler state persists across calls, so one instance should be used per
+    training run.
+
+    Attributes:
+        precision: The configured precision.
+        device_type: ``'cpu'`` or ``'cuda'``.
+
+    """
+
+    def __init__(
+        self,
+        precision: TrainingPrecision | str = TrainingPrecision.FP32,
+        device: str = "cpu",
+    ):
+        """Initialize the autocast settings for *device*.
+
+        Args:
+            precision: Requested precision.
+            device: PyTorch device string (e.g. ``'cpu'`` or ``'cuda:0'``).
+
+        """
+        self.precision = TrainingPrecision(precision)
+        self.device_type = torch.device(device).type
+        self._scaler = (
+            torch.amp.GradScaler(self.device_type)
+            if self.precision == TrainingPrecision.FP16
+            else None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether autocast is active (any precision other than ``fp32``)."""
+        return self.precision != TrainingPrecision.FP32
+
+    def autocast(self) -> contextlib.AbstractContextManager:
+        """Return the autocast context for forward passes.
+
+        Returns:
+            A :func:`torch.autocast` context, or a null context for ``fp32``.
+
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return torch.autocast(
+            self.device_type,
+            dtype=_AUTOCAST_DTYPES[self.precision],
+        )
+
+    def backward(self, loss: torch.Tensor) -> None:
+        """Back-propagate *loss*, scaled when loss scaling is active."""
+        if self._scaler is None:
+            loss.backward()
+        else:
+            self._scaler.scale(loss).backward()
+
+    def step(self, optimizer: torch.optim.Optimizer) -> None:
+        """Step *optimizer*, unscaling gradients and skipping on overflow."""
+        if self._scaler is None:
+            optimizer.step()
+        else:
+            self._scaler.step(optimizer)
+
+    def update(self) -> None:
+        """Update the loss scale once all optimizers of a batch stepped."""
+        if self._scaler is not None:
+            self._scaler.update()
@@ -0,0 +1,212 @@
+"""Opt-in timing of the phases of a training epoch.
+
+With :attr:`TrainingOption.profile` enabled, the epoch runners time every
+batch's data fetch, forward pass, backward pass and optimizer step, the
+validation and test passes and the checkpoint export. Totals per epoch,
+the training throughput and the peak memory are stored as
+:class:`~.record.TrainRecordKey` statistics; the individual measurements
+are kept as Chrome trace events (see :meth:`TrainRecord.export_trace`).
+
+On CUDA the device is synchronized around every phase so that the
+measured time includes the queued kernels. This slows training down, so
+profiling is disabled by default.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+import psutil
+import torch
+
+from .record import TrainRecordKey
+
+if TYPE_CHECKING:
+    from .record.train import TrainRecord
+
+PHASE_KEYS = {
+    "data": TrainRecordKey.DATA_TIME,
+    "forward": TrainRecordKey.FORWARD_TIME,
+    "backward": TrainRecordKey.BACKWARD_TIME,
+    "optimizer": TrainRecordKey.OPTIM_TIME,
+    "val": TrainRecordKey.VAL_TIME,
+    "test": TrainRecordKey.TEST_TIME,
+    "checkpoint": TrainRecordKey.CHECKPOINT_TIME,
+}
+"""Statistic key of each profiled phase."""
+
+_RECORD_PHASES = ("checkpoint",)
+_NULL_CONTEXT = contextlib.nullcontext()
+# Common time origin of all trace events of this process (microseconds)
+_ORIGIN = time.perf_counter()
+
+
+class EpochProfiler:
+    """Collects phase timings of one epoch.
+
+    A disabled profiler hands out no-op contexts and leaves the loader
+    untouched, so the batch loop costs the same as without profiling.
+
+    Attributes:
+        enabled: Whether timings are collected.
+        epoch: 1-based epoch being profiled.
+        n_samples: Number of training samples seen.
+        events: Chrome trace events of the shared phases.
+
+    """
+
+    def __init__(self, device: str, epoch: int, enabled: bool = True):
+        """Start profiling an epoch.
+
+        Args:
+            device: Training device, synchronized around every phase.
+            epoch: 1-based epoch being profiled.
+            enabled: Collect timings. Defaults to ``True``.
+
+        """
+        self.enabled = enabled
+        self.epoch = epoch
+        self.n_samples = 0
+        self.events: list[dict[str, Any]] = []
+        self._device = torch.device(device)
+        self._cuda = self._device.type == "cuda" and torch.cuda.is_available()
+        self._totals = dict.fromkeys(PHASE_KEYS, 0.0)
+        self._train_time = 0.0
+        self._batch = 0
+        # Phases attributed to the next record passed to :meth:`finish`
+        self._record_events: list[dict[str, Any]] = []
+        self._peak_rss = 0
+        self._process: psutil.Process | None = None
+        if not enabled:
+            return
+        self._process = psutil.Process(os.getpid())
+        if self._cuda:
+            torch.cuda.reset_peak_memory_stats(self._device)
+        self._sample_memory()
+        self._start = time.perf_counter()
+
+    def iterate(self, loader: Iterable) -> Iterable:
+        """Return *loader*, timing the fetch of every batch when enabled."""
+        if not self.enabled:
+            return loader
+        return self._timed_batches(loader)
+
+    def phase(self, name: str) -> contextlib.AbstractContextManager:
+        """Return a context measuring the phase *name*.
+
+        Args:
+            name: One of the keys of :data:`PHASE_KEYS`.
+
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._timed_phase(name)
+
+    def finish(self, train_record: TrainRecord) -> None:
+        """Store the epoch statistics and trace events in *train_record*.
+
+        The shared phases are stored in every record passed here (the
+        repeats of a vectorized pass share their batches); the checkpoint
+        phase only in the record it was measured for.
+
+        Args:
+            train_record: Record of the profiled epoch.
+
+        """
+        if not self.enabled:
+            return
+        if self._cuda:
+            peak = torch.cuda.max_memory_allocated(self._device)
+        else:
+            self._sample_memory()
+            peak = self._peak_rss
+        statistic = {PHASE_KEYS[name]: total for name, total in self._totals.items()}
+        statistic[TrainRecordKey.THROUGHPUT] = (
+            self.n_samples / self._train_time if self._train_time > 0 else 0.0
+        )
+        statistic[TrainRecordKey.PEAK_MEMORY] = peak / 2**20
+        train_record.update_statistic(statistic)
+        train_record.add_trace_events([*self.events, *self._record_events])
+        for name in _RECORD_PHASES:
+            self._totals[name] = 0.0
+        self._record_events = []
+
+    def end_training(self, n_samples: int) -> None:
+        """Mark the end of the batch loop.
+
+        Args:
+            n_samples: Number of training samples processed.
+
+        """
+        if not self.enabled:
+            return
+        self._sync()
+        self._train_time = time.perf_counter() - self._start
+        self.n_samples = n_samples
+        self._add_event("train", self._start, time.perf_counter())
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _timed_batches(self, loader: Iterable) -> Iterator:
+        iterator = iter(loader)
+        while True:
+            start = time.perf_counter()
+            try:
+                batch = next(iterator)
+            except StopIteration:
+                return
+            self._sync()
+            self._record("data", start, time.perf_counter())
+            self._sample_memory()
+            yield batch
+            self._batch += 1
+
+    @contextlib.contextmanager
+    def _timed_phase(self, name: str) -> Iterator[None]:
+        self._sync()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._sync()
+            self._record(name, start, time.perf_counter())
+
+    def _record(self, name: str, start: float, end: float) -> None:
+        self._totals[name] += end - start
+        args = {"epoch": self.epoch}
+        if name in ("data", "forward", "backward", "optimizer"):
+            args["batch"] = self._batch
+        self._add_event(name, start, end, args, record=name in _RECORD_PHASES)
+
+    def _add_event(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+        record: bool = False,
+    ) -> None:
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start - _ORIGIN) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": 0,
+            "args": args or {"epoch": self.epoch},
+        }
+        (self._record_events if record else self.events).append(event)
+
+    def _sync(self) -> None:
+        if self._cuda:
+            torch.cuda.synchronize(self._device)
+
+    def _sample_memory(self) -> None:
+        if self._process is not None and not self._cuda:
+            self._peak_rss = max(self._peak_rss, self._process.memory_info().rss)
@@ -2,6 +2,7 @@
 
 from .eval import EvalRecord
 from .key import RecordKey, TrainRecordKey
+from .summary import RunSummary
 from .train import TrainRecord
 
-__all__ = ["EvalRecord", "RecordKey", "TrainRecord", "TrainRecordKey"]
+__all__ = ["EvalRecord", "RecordKey", "RunSummary", "TrainRecord", "TrainRecordKey"]
@@ -1,13 +1,41 @@
-"""Evaluation record module for storing and exporting model evaluation results."""
+"""Evaluation record module for storing and exporting model evaluation results.
 
+Records are stored in an ``eval_record`` directory of the repeat: the labels
+and outputs, one ``.npy`` file per saliency method and class, and a small
+``meta.json`` listing them. Loading reads the metadata, labels and outputs
+only; each saliency array is memory-mapped the first time it is requested,
+so plotting one class never reads the others. No file is unpickled.
+"""
+
+import json
 import os
+import time
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import Any
 
 import numpy as np
 import torch
-from sklearn.metrics import precision_recall_fscore_support, roc_auc_score
+from sklearn.metrics import roc_auc_score
 
 from XBrainLab.backend.utils.logger import logger
 
+from .statistics import EvaluationStatistics, compute_statistics
+
+# Saliency method name -> attribute holding its per-class maps
+SALIENCY_ATTRIBUTES = {
+    "Gradient": "gradient",
+    "Gradient * Input": "gradient_input",
+    "SmoothGrad": "smoothgrad",
+    "SmoothGrad_Squared": "smoothgrad_sq",
+    "VarGrad": "vargrad",
+}
+
+EVAL_DIR = "eval_record"
+EVAL_META_FILE = "meta.json"
+EVAL_FORMAT_VERSION = 1
+# Single pickled file written by earlier versions
+LEGACY_EVAL_FILE = "eval"
+
 
 def calculate_confusion(output: np.ndarray, label: np.ndarray) -> np.ndarray:
     """Calculate the confusion matrix from model outputs and ground truth labels.
@@ -23,21 +51,152 @@ def calculate_confusion(output: np.ndarray, label: np.ndarray) -> np.ndarray:
 
     """
     class_num = output.shape[1] if output.ndim > 1 else len(np.unique(label))
-    confusion = np.zeros((class_num, class_num), dtype=np.uint32)
-    output = output.argmax(axis=1)
-    for ground_truth in range(class_num):
-        for predict in range(class_num):
-            confusion[ground_truth][predict] = (
-                output[label == ground_truth] == predict
-            ).sum()
-    return confusion
+    label = np.asarray(label, dtype=np.int64)
+    predict = output.argmax(axis=1)
+    # Labels outside the model classes are not counted
+    valid = (label >= 0) & (label < class_num)
+    counts = np.bincount(
+        label[valid] * class_num + predict[valid], minlength=class_num * class_num
+    )
+    return counts.reshape(class_num, class_num).astype(np.uint32)
+
+
+class SaliencyStore(MutableMapping):
+    """Per-class saliency maps of one method, memory-mapped from disk.
+
+    Behaves like the ``dict`` of class index to maps held by an
+    :class:`EvalRecord`. Maps are opened with ``mmap_mode="r"`` on first
+    access; maps assigned afterwards replace the files in memory.
+
+    Attributes:
+        directory: Directory of the ``.npy`` files.
+        files: File name of the maps of each class index.
+
+    """
+
+    def __init__(self, directory: str, files: dict[int, str]):
+        self.directory = directory
+        self.files = dict(files)
+        self._arrays: dict[int, np.ndarray] = {}
+
+    def __getitem__(self, label_index: int) -> np.ndarray:
+        if label_index not in self._arrays:
+            if label_index not in self.files:
+                raise KeyError(label_index)
+            self._arrays[label_index] = np.load(
+                os.path.join(self.directory, self.files[label_index]), mmap_mode="r"
+            )
+        return self._arrays[label_index]
+
+    def __setitem__(self, label_index: int, saliency: np.ndarray) -> None:
+        self._arrays[label_index] = saliency
+        self.files.pop(label_index, None)
+
+    def __delitem__(self, label_index: int) -> None:
+        if label_index not in self._arrays and label_index not in self.files:
+            raise KeyError(label_index)
+        self._arrays.pop(label_index, None)
+        self.files.pop(label_index, None)
+
+    def __contains__(self, label_index: object) -> bool:
+        return label_index in self.files or label_index in self._arrays
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(sorted(self.files.keys() | self._arrays.keys()))
+
+    def __len__(self) -> int:
+        return len(self.files.keys() | self._arrays.keys())
+
+    def __getstate__(self) -> dict:
+        # Opened memory maps are reopened from their files
+        state = self.__dict__.copy()
+        state["_arrays"] = {
+            label_index: saliency
+            for label_index, saliency in self._arrays.items()
+            if label_index not in self.files
+        }
+        return state
+
+
+def _save_array(array: np.ndarray, path: str) -> None:
+    """Save *array* as ``.npy`` and atomically rename it to *path*.
+
+    Arrays memory-mapped from *path* itself are left as they are.
+    """
+    filename = getattr(array, "filename", None)
+    if filename is not None and os.path.abspath(filename) == os.path.abspath(path):
+        return
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, np.asarray(array))
+    os.replace(tmp_path, path)
+
+
+def write_eval_state(state: dict, target_path: str) -> str:
+    """Write the contents of an evaluation record to *target_path*.
+
+    Every array is written to its own file under a temporary name and
+    renamed into place, then ``meta.json`` is replaced, so readers always
+    see a complete record. Files no longer listed are deleted.
+
+    Args:
+        state: Dictionary returned by :meth:`EvalRecord.get_state`.
+        target_path: Directory of the repeat.
+
+    Returns:
+        The ``eval_record`` directory.
+
+    """
+    directory = os.path.join(target_path, EVAL_DIR)
+    os.makedirs(directory, exist_ok=True)
+    label = np.asarray(state["label"])
+    output = np.asarray(state["output"])
+    _save_array(label, os.path.join(directory, "label.npy"))
+    _save_array(output, os.path.join(directory, "output.npy"))
+    meta: dict = {
+        "version": EVAL_FORMAT_VERSION,
+        "n_samples": len(label),
+        "class_num": int(output.shape[-1]) if output.ndim > 1 else 0,
+        "saliency": {},
+    }
+    for attribute in SALIENCY_ATTRIBUTES.values():
+        entries = {}
+        for label_index, saliency in state[attribute].items():
+            name = f"{attribute}-{int(label_index)}.npy"
+            _save_array(saliency, os.path.join(directory, name))
+            entries[str(int(label_index))] = {
+                "file": name,
+                "shape": list(np.shape(saliency)),
+                "dtype": str(np.asarray(saliency).dtype),
+            }
+        meta["saliency"][attribute] = entries
+    tmp_path = os.path.join(directory, EVAL_META_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1)
+    os.replace(tmp_path, os.path.join(directory, EVAL_META_FILE))
+
+    listed = {"label.npy", "output.npy", EVAL_META_FILE} | {
+        entry["file"]
+        for entries in meta["saliency"].values()
+        for entry in entries.values()
+    }
+    for name in os.listdir(directory):
+        if name.endswith(".npy") and name not in listed:
+            os.remove(os.path.join(directory, name))
+    return directory
 
 
 class EvalRecord:
     """Record class for storing and exporting model evaluation results.
 
     Stores ground truth labels, model outputs, and saliency maps from
-    multiple attribution methods, organized by class index.
+    multiple attribution methods, organized by class index. Saliency maps
+    missing from the dictionaries are computed by :attr:`saliency_source`
+    when first requested (see :meth:`get_saliency`).
+
+    Probabilities, predictions, the confusion matrix and the metrics derived
+    from them are computed once and memoized until :attr:`label` or
+    :attr:`output` is replaced. Arrays must not be modified in place.
 
     Attributes:
         label: Ground truth label array of shape ``(n,)``.
@@ -47,6 +206,9 @@ class EvalRecord:
         smoothgrad: Dictionary mapping class indices to SmoothGrad arrays.
         smoothgrad_sq: Dictionary mapping class indices to SmoothGrad² arrays.
         vargrad: Dictionary mapping class indices to VarGrad arrays.
+        saliency_source: Callable returning the maps of a method and class
+            index that are not stored yet, or ``None``. Not pickled.
+        saliency_cost: Seconds spent obtaining the maps of each method.
 
     """
 
@@ -54,11 +216,11 @@ class EvalRecord:
         self,
         label: np.ndarray,
         output: np.ndarray,
-        gradient: dict,
-        gradient_input: dict,
-        smoothgrad: dict,
-        smoothgrad_sq: dict,
-        vargrad: dict,
+        gradient: MutableMapping[int, np.ndarray],
+        gradient_input: MutableMapping[int, np.ndarray],
+        smoothgrad: MutableMapping[int, np.ndarray],
+        smoothgrad_sq: MutableMapping[int, np.ndarray],
+        vargrad: MutableMapping[int, np.ndarray],
     ) -> None:
         """Initialize the evaluation record.
 
@@ -79,44 +241,162 @@ class EvalRecord:
         self.smoothgrad = smoothgrad
         self.smoothgrad_sq = smoothgrad_sq
         self.vargrad = vargrad
+        self.saliency_source: Callable[[str, int], np.ndarray] | None = None
+        self.saliency_cost: dict[str, float] = {}
+
+    @property
+    def label(self) -> np.ndarray:
+        """Ground truth label array of shape ``(n,)``."""
+        return self._label
+
+    @label.setter
+    def label(self, label: np.ndarray) -> None:
+        self._label = label
+        self._metrics: dict[str, Any] = {}
+
+    @property
+    def output(self) -> np.ndarray:
+        """Model output array of shape ``(n, num_classes)``."""
+        return self._output
+
+    @output.setter
+    def output(self, output: np.ndarray) -> None:
+        self._output = output
+        self._metrics = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["saliency_source"] = None
+        state["_metrics"] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state.setdefault("saliency_source", None)
+        state.setdefault("saliency_cost", {})
+        # Records pickled by earlier versions store plain attributes
+        if "label" in state:
+            state["_label"] = state.pop("label")
+        if "output" in state:
+            state["_output"] = state.pop("output")
+        state["_metrics"] = {}
+        self.__dict__.update(state)
+
+    def _memoize(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return the memoized value *name*, computing it on first use."""
+        if name not in self._metrics:
+            self._metrics[name] = compute()
+        return self._metrics[name]
+
+    def get_probabilities(self) -> np.ndarray:
+        """Return the softmax of :attr:`output`, shaped like it.
+
+        Returns:
+            Class probabilities of every sample.
+
+        """
+
+        def compute() -> np.ndarray:
+            output = np.asarray(self.output, dtype=np.float64)
+            exp = np.exp(output - output.max(axis=1, keepdims=True))
+            return exp / exp.sum(axis=1, keepdims=True)
+
+        return self._memoize("probabilities", compute)
+
+    def get_prediction(self) -> np.ndarray:
+        """Return the predicted class of every sample."""
+        return self._memoize("prediction", lambda: self.output.argmax(axis=1))
+
+    def get_confusion(self) -> np.ndarray:
+        """Return the confusion matrix (see :func:`calculate_confusion`)."""
+        return self._memoize(
+            "confusion", lambda: calculate_confusion(self.output, self.label)
+        )
+
+    def get_state(self) -> dict:
+        """Return a snapshot of the record to write with :func:`write_eval_state`.
+
+        The saliency dictionaries are copied, so maps computed later are not
+        part of the snapshot; the arrays themselves are shared.
+
+        Returns:
+            Dictionary of labels, outputs and saliency maps.
+
+        """
+        state: dict[str, Any] = {"label": self.label, "output": self.output}
+        for attribute in SALIENCY_ATTRIBUTES.values():
+            saliency = getattr(self, attribute)
+            state[attribute] = {
+                label_index: saliency[label_index] for label_index in saliency
+            }
+        return state
 
     def export(self, target_path: str) -> None:
-        """Export the evaluation record as a torch file.
+        """Export the evaluation record to the ``eval_record`` directory.
 
         Args:
-            target_path: Directory path where the ``'eval'`` file will be saved.
+            target_path: Directory of the repeat.
 
         """
-        record = {
-            "label": self.label,
-            "output": self.output,
-            "gradient": self.gradient,
-            "gradient_input": self.gradient_input,
-            "smoothgrad": self.smoothgrad,
-            "smoothgrad_sq": self.smoothgrad_sq,
-            "vargrad": self.vargrad,
-        }
-        torch.save(record, os.path.join(target_path, "eval"))
+        write_eval_state(self.get_state(), target_path)
 
     @classmethod
     def load(cls, target_path: str) -> "EvalRecord | None":
-        """Load an evaluation record from a torch file.
+        """Load an evaluation record written by :meth:`export`.
+
+        Only the metadata, labels and outputs are read; the saliency maps
+        are memory-mapped when requested. A record in the single-file
+        format of earlier versions is converted to the new layout.
 
         Args:
-            target_path: Directory path containing the ``'eval'`` file.
+            target_path: Directory of the repeat.
 
         Returns:
-            An :class:`EvalRecord` instance, or ``None`` if the file does not
-            exist or cannot be loaded.
+            An :class:`EvalRecord` instance, or ``None`` if there is no
+            record or it cannot be loaded.
 
         """
-        path = os.path.join(target_path, "eval")
-        if not os.path.exists(path):
-            return None
+        directory = os.path.join(target_path, EVAL_DIR)
+        if os.path.exists(os.path.join(directory, EVAL_META_FILE)):
+            try:
+                return cls._load_directory(directory)
+            except Exception as e:
+                logger.error("Failed to load EvalRecord: %s", e, exc_info=True)
+                return None
+        if os.path.exists(os.path.join(target_path, LEGACY_EVAL_FILE)):
+            return cls._load_legacy(target_path)
+        return None
 
+    @classmethod
+    def _load_directory(cls, directory: str) -> "EvalRecord":
+        with open(os.path.join(directory, EVAL_META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version", 0) > EVAL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported EvalRecord format {meta['version']}")
+        saliency = {
+            attribute: SaliencyStore(
+                directory,
+                {
+                    int(label_index): entry["file"]
+                    for label_index, entry in meta["saliency"]
+                    .get(attribute, {})
+                    .items()
+                },
+            )
+            for attribute in SALIENCY_ATTRIBUTES.values()
+        }
+        return cls(
+            np.load(os.path.join(directory, "label.npy")),
+            np.load(os.path.join(directory, "output.npy")),
+            **saliency,
+        )
+
+    @classmethod
+    def _load_legacy(cls, target_path: str) -> "EvalRecord | None":
+        """Load and convert the pickled ``eval`` file of earlier versions."""
+        path = os.path.join(target_path, LEGACY_EVAL_FILE)
         try:
             data = torch.load(path, weights_only=False)
-            return cls(
+            record = cls(
                 label=data["label"],
                 output=data["output"],
                 gradient=data.get("gradient", {}),
@@ -128,6 +408,13 @@ class EvalRecord:
         except Exception as e:
             logger.error("Failed to load EvalRecord: %s", e, exc_info=True)
             return None
+        try:
+            record.export(target_path)
+            os.remove(path)
+            logger.info("Converted %s to the %s format", path, EVAL_DIR)
+        except OSError as e:
+            logger.warning("Could not convert %s: %s", path, e)
+        return record
 
     def export_csv(self, target_path: str) -> None:
         """Export evaluation results as a CSV file.
@@ -161,25 +448,71 @@ class EvalRecord:
                 data is also saved via ``torch.save``.
 
         Returns:
-            The saliency dictionary for the requested method.
+            The saliency dictionary for the requested method, with the maps
+            of every class computed.
 
         """
-        if method == "Gradient":
-            saliency = self.gradient
-        elif method == "Gradient * Input":
-            saliency = self.gradient_input
-        elif method == "SmoothGrad":
-            saliency = self.smoothgrad
-        elif method == "SmoothGrad_Squared":
-            saliency = self.smoothgrad_sq
-        elif method == "VarGrad":
-            saliency = self.vargrad
-        else:
+        if method not in SALIENCY_ATTRIBUTES:
             raise ValueError(f"Unknown saliency method: {method}")
+        if self.saliency_source is not None:
+            for label_index in range(self.get_class_num()):
+                self.get_saliency(method, label_index)
+        saliency = getattr(self, SALIENCY_ATTRIBUTES[method])
         if target_path:
             torch.save(saliency, target_path)
         return saliency
 
+    def get_class_num(self) -> int:
+        """Return the number of classes of the model output."""
+        return self.output.shape[-1]
+
+    def get_saliency(self, method: str, label_index: int) -> np.ndarray:
+        """Return the saliency maps of *method* for the specified class.
+
+        Maps that are not stored yet are obtained from
+        :attr:`saliency_source` and kept; the time spent is added to
+        :attr:`saliency_cost`.
+
+        Args:
+            method: Saliency method name, a key of
+                :data:`SALIENCY_ATTRIBUTES`.
+            label_index: Class index to retrieve saliency maps for.
+
+        Returns:
+            Numpy array of saliency maps for the given class.
+
+        Raises:
+            ValueError: If *method* is unknown.
+            KeyError: If the maps are not stored and there is no source.
+
+        """
+        if method not in SALIENCY_ATTRIBUTES:
+            raise ValueError(f"Unknown saliency method: {method}")
+        saliency = getattr(self, SALIENCY_ATTRIBUTES[method])
+        if label_index not in saliency and self.saliency_source is not None:
+            start = time.perf_counter()
+            saliency[label_index] = self.saliency_source(method, label_index)
+            self.saliency_cost[method] = (
+                self.saliency_cost.get(method, 0.0) + time.perf_counter() - start
+            )
+        return saliency[label_index]
+
+    def has_saliency(self, method: str, label_index: int) -> bool:
+        """Return whether the maps of *method* for a class are stored."""
+        return label_index in getattr(self, SALIENCY_ATTRIBUTES[method])
+
+    def clear_saliency(self) -> None:
+        """Drop the stored saliency maps, e.g. after the parameters changed.
+
+        Only records with a :attr:`saliency_source` are cleared, since
+        others could not compute their maps again.
+        """
+        if self.saliency_source is None:
+            return
+        for attribute in SALIENCY_ATTRIBUTES.values():
+            setattr(self, attribute, {})
+        self.saliency_cost = {}
+
     def get_acc(self) -> float:
         """Compute the classification accuracy.
 
@@ -189,7 +522,9 @@ class EvalRecord:
         """
         if len(self.label) == 0:
             return 0.0
-        return sum(self.output.argmax(axis=1) == self.label) / len(self.label)
+        return self._memoize(
+            "acc", lambda: float(np.mean(self.get_prediction() == self.label))
+        )
 
     def get_auc(self) -> float:
         """Compute the AUC (Area Under the ROC Curve) score.
@@ -202,24 +537,14 @@ class EvalRecord:
         """
         if len(self.label) == 0 or len(self.output) == 0:
             return 0.0
-        if (
-            torch.nn.functional.softmax(torch.Tensor(self.output), dim=1)
-            .numpy()
-            .shape[-1]
-            <= 2
-        ):
-            return roc_auc_score(
-                self.label,
-                torch.nn.functional.softmax(torch.Tensor(self.output), dim=1).numpy()[
-                    :,
-                    -1,
-                ],
-            )
-        return roc_auc_score(
-            self.label,
-            torch.nn.functional.softmax(torch.Tensor(self.output), dim=1).numpy(),
-            multi_class="ovr",
-        )
+
+        def compute() -> float:
+            probabilities = self.get_probabilities()
+            if probabilities.shape[-1] <= 2:
+                return roc_auc_score(self.label, probabilities[:, -1])
+            return roc_auc_score(self.label, probabilities, multi_class="ovr")
+
+        return self._memoize("auc", compute)
 
     def get_kappa(self) -> float:
         """Compute Cohen's Kappa coefficient.
@@ -228,15 +553,53 @@ class EvalRecord:
             The Kappa statistic as a float.
 
         """
-        confusion = calculate_confusion(self.output, self.label)
-        class_num = len(confusion)
-        p0 = np.diagonal(confusion).sum() / confusion.sum()
-        pe = sum(
-            [confusion[:, i].sum() * confusion[i].sum() for i in range(class_num)],
-        ) / (confusion.sum() * confusion.sum())
-        if pe >= 1.0:
-            return 0.0
-        return (p0 - pe) / (1 - pe)
+
+        def compute() -> float:
+            confusion = self.get_confusion().astype(np.float64)
+            total = confusion.sum()
+            if total == 0:
+                return 0.0
+            p0 = np.trace(confusion) / total
+            pe = (confusion.sum(axis=0) * confusion.sum(axis=1)).sum() / total**2
+            if pe >= 1.0:
+                return 0.0
+            return float((p0 - pe) / (1 - pe))
+
+        return self._memoize("kappa", compute)
+
+    def get_statistics(
+        self,
+        n_bootstrap: int = 2000,
+        n_permutations: int = 2000,
+        confidence: float = 0.95,
+        seed: int | None = 0,
+    ) -> EvaluationStatistics:
+        """Return bootstrap intervals and permutation tests of the metrics.
+
+        Results are memoized per set of arguments (see
+        :func:`~.statistics.compute_statistics`).
+
+        Args:
+            n_bootstrap: Number of bootstrap resamples.
+            n_permutations: Number of label permutations.
+            confidence: Confidence level of the intervals.
+            seed: Seed of the resampling.
+
+        Returns:
+            Intervals and p-values of accuracy, AUC, kappa and per-class F1.
+
+        """
+        return self._memoize(
+            f"statistics-{n_bootstrap}-{n_permutations}-{confidence}-{seed}",
+            lambda: compute_statistics(
+                self.label,
+                self.get_probabilities(),
+                n_bootstrap=n_bootstrap,
+                n_permutations=n_permutations,
+                confidence=confidence,
+                seed=seed,
+            ),
+        )
 
     def get_per_class_metrics(self) -> dict:
         """Get per-class precision, recall, f1-score, and support.
@@ -246,21 +609,39 @@ class EvalRecord:
             'precision', 'recall', 'f1-score', 'support'
 
         """
-        y_true = self.label
-        y_pred = self.output.argmax(axis=1)
-        class_num = self.output.shape[1]
-        labels = np.arange(class_num)
-
-        precision, recall, f1, support = precision_recall_fscore_support(
-            y_true,
-            y_pred,
-            labels=labels,
-            zero_division=0,
+        return {
+            key: dict(values)
+            for key, values in self._memoize(
+                "per_class", self._compute_per_class_metrics
+            ).items()
+        }
+
+    def _compute_per_class_metrics(self) -> dict:
+        """Derive the per-class metrics from the confusion matrix.
+
+        Classes without predictions (or samples) get a precision (or
+        recall) of ``0``, like ``zero_division=0`` in scikit-learn.
+        """
+        confusion = self.get_confusion().astype(np.float64)
+        true_positive = np.diagonal(confusion)
+        support = confusion.sum(axis=1)
+        predicted = confusion.sum(axis=0)
+        zeros = np.zeros_like(true_positive)
+        precision = np.divide(
+            true_positive, predicted, out=zeros.copy(), where=predicted > 0
+        )
+        recall = np.divide(true_positive, support, out=zeros.copy(), where=support > 0)
+        denominator = precision + recall
+        f1 = np.divide(
+            2 * precision * recall,
+            denominator,
+            out=np.zeros_like(denominator),
+            where=denominator > 0,
         )
 
         metrics: dict[int | str, dict[str, float | int]] = {}
-        for i in labels:
-            metrics[int(i)] = {
+        for i in range(len(confusion)):
+            metrics[i] = {
                 "precision": precision[i],
                 "recall": recall[i],
                 "f1-score": f1[i],
@@ -287,7 +668,7 @@ class EvalRecord:
             Numpy array of gradient saliency maps for the given class.
 
         """
-        return self.gradient[label_index]
+        return self.get_saliency("Gradient", label_index)
 
     def get_gradient_input(self, label_index: int) -> np.ndarray:
         """Return gradient*input saliency maps for the specified class.
@@ -299,7 +680,7 @@ class EvalRecord:
             Numpy array of gradient*input saliency maps for the given class.
 
         """
-        return self.gradient_input[label_index]
+        return self.get_saliency("Gradient * Input", label_index)
 
     def get_smoothgrad(self, label_index: int) -> np.ndarray:
         """Return SmoothGrad saliency maps for the specified class.
@@ -311,7 +692,7 @@ class EvalRecord:
             Numpy array of SmoothGrad saliency maps for the given class.
 
         """
-        return self.smoothgrad[label_index]
+        return self.get_saliency("SmoothGrad", label_index)
 
     def get_smoothgrad_sq(self, label_index: int) -> np.ndarray:
         """Return SmoothGrad² saliency maps for the specified class.
@@ -323,7 +704,7 @@ class EvalRecord:
             Numpy array of SmoothGrad² saliency maps for the given class.
 
         """
-        return self.smoothgrad_sq[label_index]
+        return self.get_saliency("SmoothGrad_Squared", label_index)
 
     def get_vargrad(self, label_index: int) -> np.ndarray:
         """Return VarGrad saliency maps for the specified class.
@@ -335,4 +716,4 @@ class EvalRecord:
             Numpy array of VarGrad saliency maps for the given class.
 
         """
-        return self.vargrad[label_index]
+        return self.get_saliency("VarGrad", label_index)
@@ -31,13 +31,32 @@ class TrainRecordKey(RecordKey):
     """Extended key constants for training record statistics.
 
     Inherits loss, accuracy, and AUC keys from :class:`RecordKey` and adds
-    training-specific keys.
+    training-specific keys. The keys from :attr:`DATA_TIME` on are only
+    recorded when :attr:`TrainingOption.profile` is enabled.
 
     Attributes:
         TIME: Key for epoch duration values.
         LR: Key for learning rate values.
+        DATA_TIME: Key for the time spent fetching training batches.
+        FORWARD_TIME: Key for the time spent in forward passes.
+        BACKWARD_TIME: Key for the time spent in backward passes.
+        OPTIM_TIME: Key for the time spent in optimizer steps.
+        VAL_TIME: Key for the validation time.
+        TEST_TIME: Key for the test time.
+        CHECKPOINT_TIME: Key for the checkpoint export time.
+        THROUGHPUT: Key for the training throughput (samples per second).
+        PEAK_MEMORY: Key for the peak device (or process) memory in MB.
 
     """
 
     TIME = "time"
     LR = "lr"
+    DATA_TIME = "data_time"
+    FORWARD_TIME = "forward_time"
+    BACKWARD_TIME = "backward_time"
+    OPTIM_TIME = "optim_time"
+    VAL_TIME = "val_time"
+    TEST_TIME = "test_time"
+    CHECKPOINT_TIME = "checkpoint_time"
+    THROUGHPUT = "throughput"
+    PEAK_MEMORY = "peak_memory"
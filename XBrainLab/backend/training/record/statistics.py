@@ -0,0 +1,317 @@
+"""Bootstrap confidence intervals and permutation tests of evaluation metrics.
+
+:func:`compute_statistics` resamples the evaluated epochs with replacement
+to obtain percentile confidence intervals of accuracy, AUC, Cohen's kappa
+and per-class F1, and shuffles the labels against the outputs to test each
+metric against chance level. Resamples are processed in batches: one
+``np.bincount`` gives the confusion matrices of a whole batch, from which
+every metric except AUC follows; AUC is a weighted Mann-Whitney statistic
+over the epochs sorted once by score. Memory is bounded by
+:data:`CHUNK_ELEMENTS` whatever the number of resamples.
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+# Elements of the (resamples, epochs) arrays processed at once
+CHUNK_ELEMENTS = 2**22
+
+
+@dataclass
+class MetricInterval:
+    """Estimate, confidence interval and chance-level p-value of a metric.
+
+    Attributes:
+        estimate: Metric of the evaluated epochs.
+        low: Lower bound of the bootstrap percentile interval.
+        high: Upper bound of the bootstrap percentile interval.
+        p_value: One-sided permutation p-value of the metric being above
+            chance level, ``nan`` without permutations.
+
+    """
+
+    estimate: float
+    low: float
+    high: float
+    p_value: float
+
+
+@dataclass
+class EvaluationStatistics:
+    """Confidence intervals and permutation tests of one evaluation.
+
+    Attributes:
+        n_samples: Number of evaluated epochs.
+        n_bootstrap: Number of bootstrap resamples.
+        n_permutations: Number of label permutations.
+        confidence: Confidence level of the intervals.
+        metrics: Interval of each metric: ``"accuracy"``, ``"auc"``,
+            ``"kappa"`` and ``"f1-<class index>"``.
+
+    """
+
+    n_samples: int
+    n_bootstrap: int
+    n_permutations: int
+    confidence: float
+    metrics: dict[str, MetricInterval] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Return the statistics as plain (JSON serializable) types."""
+        return asdict(self)
+
+    def get_rows(self) -> list[dict]:
+        """Return one row per metric with its name and interval."""
+        return [
+            {"metric": name, **asdict(interval)}
+            for name, interval in self.metrics.items()
+        ]
+
+    def export_csv(self, path: str) -> None:
+        """Write one row per metric to the CSV file *path*."""
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=["metric", "estimate", "low", "high", "p_value"]
+            )
+            writer.writeheader()
+            writer.writerows(self.get_rows())
+            f.write(
+                f"# n_samples={self.n_samples}, n_bootstrap={self.n_bootstrap}, "
+                f"n_permutations={self.n_permutations}, "
+                f"confidence={self.confidence}\n"
+            )
+
+
+def _batched_confusion(
+    label: np.ndarray, predict: np.ndarray, class_num: int
+) -> np.ndarray:
+    """Return the confusion matrices of rows of labels and predictions.
+
+    Args:
+        label: Labels of shape ``(batch, n)``.
+        predict: Predictions of shape ``(batch, n)``.
+        class_num: Number of classes.
+
+    Returns:
+        Array of shape ``(batch, class_num, class_num)``.
+
+    """
+    batch = len(label)
+    offset = np.arange(batch)[:, None] * class_num * class_num
+    index = offset + label * class_num + predict
+    counts = np.bincount(index.ravel(), minlength=batch * class_num * class_num)
+    return counts.reshape(batch, class_num, class_num)
+
+
+def _confusion_metrics(confusion: np.ndarray) -> dict[str, np.ndarray]:
+    """Return accuracy, kappa and per-class F1 of a batch of confusion matrices."""
+    confusion = confusion.astype(np.float64)
+    total = confusion.sum(axis=(1, 2))
+    true_positive = np.diagonal(confusion, axis1=1, axis2=2)
+    support = confusion.sum(axis=2)
+    predicted = confusion.sum(axis=1)
+    accuracy = true_positive.sum(axis=1) / total
+    expected = (support * predicted).sum(axis=1) / total**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kappa = np.where(expected < 1, (accuracy - expected) / (1 - expected), 0.0)
+        denominator = support + predicted
+        f1 = np.where(denominator > 0, 2 * true_positive / denominator, 0.0)
+    metrics = {"accuracy": accuracy, "kappa": kappa}
+    for i in range(confusion.shape[1]):
+        metrics[f"f1-{i}"] = f1[:, i]
+    return metrics
+
+
+def _batched_auc(
+    scores: np.ndarray, weights: np.ndarray, positive: np.ndarray
+) -> np.ndarray:
+    """Return the ROC AUC of weighted rows of epochs.
+
+    AUC is the probability that a positive epoch scores higher than a
+    negative one, ties counting one half. Epochs are sorted and grouped
+    by score once for all rows.
+
+    Args:
+        scores: Score of each epoch, shape ``(n,)``.
+        weights: Multiplicity of each epoch in each row, ``(batch, n)``.
+        positive: Whether each epoch is positive in each row; *weights*
+            and *positive* may have a single row shared by all rows.
+
+    Returns:
+        AUC of each row, ``nan`` for rows without positive or negative
+        epochs.
+
+    """
+    order = np.argsort(scores, kind="stable")
+    sorted_scores = scores[order]
+    starts = np.flatnonzero(np.r_[True, sorted_scores[1:] != sorted_scores[:-1]])
+    shape = np.broadcast_shapes(weights.shape, positive.shape)
+    weights = np.broadcast_to(weights, shape)[:, order]
+    positive = np.broadcast_to(positive, shape)[:, order]
+    positive_weights = np.add.reduceat(np.where(positive, weights, 0), starts, axis=1)
+    negative_weights = np.add.reduceat(np.where(positive, 0, weights), starts, axis=1)
+    below = np.cumsum(negative_weights, axis=1) - negative_weights
+    pairs = positive_weights.sum(axis=1) * negative_weights.sum(axis=1)
+    wins = (positive_weights * (below + 0.5 * negative_weights)).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return wins / pairs
+
+
+def _auc(
+    probabilities: np.ndarray, label: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """Return the one-vs-rest macro AUC of rows of labels and weights.
+
+    Two-class outputs use the probability of the last class, like
+    :meth:`EvalRecord.get_auc`.
+    """
+    class_num = probabilities.shape[1]
+    if class_num <= 2:
+        return _batched_auc(probabilities[:, -1], weights, label == class_num - 1)
+    return np.mean(
+        [
+            _batched_auc(probabilities[:, c], weights, label == c)
+            for c in range(class_num)
+        ],
+        axis=0,
+    )
+
+
+def _bootstrap_metrics(
+    probabilities: np.ndarray,
+    predict: np.ndarray,
+    label: np.ndarray,
+    batch: int,
+    rng: np.random.Generator,
+) -> dict[str, np.ndarray]:
+    """Return the metrics of *batch* bootstrap resamples of the epochs."""
+    n, class_num = probabilities.shape
+    index = rng.integers(0, n, size=(batch, n))
+    metrics = _confusion_metrics(
+        _batched_confusion(label[index], predict[index], class_num)
+    )
+    # Multiplicity of each epoch in each resample
+    offset = np.arange(batch)[:, None] * n
+    weights = np.bincount((index + offset).ravel(), minlength=batch * n)
+    metrics["auc"] = _auc(probabilities, label[None], weights.reshape(batch, n))
+    return metrics
+
+
+def _permutation_metrics(
+    probabilities: np.ndarray,
+    predict: np.ndarray,
+    label: np.ndarray,
+    batch: int,
+    rng: np.random.Generator,
+) -> dict[str, np.ndarray]:
+    """Return the metrics of *batch* random permutations of the labels."""
+    class_num = probabilities.shape[1]
+    permuted = rng.permuted(np.tile(label, (batch, 1)), axis=1)
+    metrics = _confusion_metrics(
+        _batched_confusion(
+            permuted, np.broadcast_to(predict, permuted.shape), class_num
+        )
+    )
+    metrics["auc"] = _auc(probabilities, permuted, np.ones((1, len(label))))
+    return metrics
+
+
+def _run_batches(
+    compute: Callable[[int], dict[str, np.ndarray]],
+    total: int,
+    n: int,
+    chunk_elements: int,
+) -> dict[str, np.ndarray]:
+    """Concatenate the metrics of *total* rows computed in bounded batches."""
+    batch = max(1, chunk_elements // max(n, 1))
+    results: dict[str, list[np.ndarray]] = {}
+    for start in range(0, total, batch):
+        for name, values in compute(min(batch, total - start)).items():
+            results.setdefault(name, []).append(values)
+    return {name: np.concatenate(values) for name, values in results.items()}
+
+
+def compute_statistics(
+    label: np.ndarray,
+    probabilities: np.ndarray,
+    n_bootstrap: int = 2000,
+    n_permutations: int = 2000,
+    confidence: float = 0.95,
+    seed: int | None = 0,
+    chunk_elements: int = CHUNK_ELEMENTS,
+) -> EvaluationStatistics:
+    """Return confidence intervals and chance-level tests of the metrics.
+
+    Args:
+        label: Ground truth label of each epoch, shape ``(n,)``.
+        probabilities: Class probabilities (or any scores whose argmax is
+            the prediction) of each epoch, shape ``(n, class_num)``.
+        n_bootstrap: Number of bootstrap resamples; ``0`` gives intervals
+            of ``nan``.
+        n_permutations: Number of label permutations; ``0`` gives p-values
+            of ``nan``.
+        confidence: Confidence level of the percentile intervals.
+        seed: Seed of the random generator, for reproducible results.
+        chunk_elements: Bound on the elements of the per-batch arrays.
+
+    Returns:
+        The statistics of accuracy, AUC, kappa and per-class F1.
+
+    Raises:
+        ValueError: If there are no epochs or the arguments are invalid.
+
+    """
+    label = np.asarray(label, dtype=np.int64)
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    if len(label) == 0 or probabilities.ndim != 2:
+        raise ValueError("Statistics need at least one epoch with class scores")
+    if len(label) != len(probabilities):
+        raise ValueError("Labels and outputs differ in length")
+    if not 0 < confidence < 1:
+        raise ValueError("Invalid confidence (must be between 0 and 1)")
+    if n_bootstrap < 0 or n_permutations < 0:
+        raise ValueError("Invalid number of resamples (must not be negative)")
+    n, class_num = probabilities.shape
+    if label.min() < 0 or label.max() >= class_num:
+        raise ValueError("Labels must be class indices of the outputs")
+    predict = probabilities.argmax(axis=1)
+    rng = np.random.default_rng(seed)
+
+    observed = _confusion_metrics(
+        _batched_confusion(label[None], predict[None], class_num)
+    )
+    observed["auc"] = _auc(probabilities, label[None], np.ones((1, n)))
+
+    bootstrap = _run_batches(
+        lambda batch: _bootstrap_metrics(probabilities, predict, label, batch, rng),
+        n_bootstrap,
+        n,
+        chunk_elements,
+    )
+    permutation = _run_batches(
+        lambda batch: _permutation_metrics(probabilities, predict, label, batch, rng),
+        n_permutations,
+        n,
+        chunk_elements,
+    )
+
+    alpha = (1 - confidence) / 2
+    metrics = {}
+    for name in ["accuracy", "auc", "kappa"] + [f"f1-{i}" for i in range(class_num)]:
+        estimate = float(observed[name][0])
+        low = high = p_value = float("nan")
+        samples = bootstrap.get(name)
+        if samples is not None and not np.isnan(samples).all():
+            low, high = np.nanquantile(samples, [alpha, 1 - alpha])
+        chance = permutation.get(name)
+        if chance is not None:
+            p_value = (1 + np.count_nonzero(chance >= estimate)) / (1 + len(chance))
+        metrics[name] = MetricInterval(
+            estimate, float(low), float(high), float(p_value)
+        )
+    return EvaluationStatistics(n, n_bootstrap, n_permutations, confidence, metrics)
@@ -0,0 +1,204 @@
+"""Compact summaries of finished repeats for cross-plan comparison.
+
+A :class:`RunSummary` holds what comparing repeats needs: the final and
+best metrics, the confusion matrix, per-class metrics, training time and
+throughput, and the labels and predictions of the evaluated epochs for
+paired tests. :class:`~.train.TrainRecord` builds it when its evaluation
+record is set and writes it to :data:`SUMMARY_FILE` with the checkpoint,
+so leaderboards never touch the outputs or saliency maps of a repeat.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from XBrainLab.backend.utils.logger import logger
+
+from .key import RecordKey, TrainRecordKey
+
+if TYPE_CHECKING:
+    from .train import TrainRecord
+
+SUMMARY_FILE = "summary.json"
+SUMMARY_FORMAT_VERSION = 1
+
+
+@dataclass
+class RunSummary:
+    """Metrics of one finished repeat, independent of its raw outputs.
+
+    Attributes:
+        name: Display name of the repeat.
+        model_name: Class name of the model.
+        repeat: Index of the repeat.
+        epochs: Number of trained epochs.
+        early_stop_epoch: Epoch after which training stopped early.
+        metrics: Final evaluation ``"accuracy"``, ``"auc"`` and ``"kappa"``.
+        best: Best validation and test metrics with their epochs, e.g.
+            ``"best_val_accuracy"`` and ``"best_val_accuracy_epoch"``;
+            metrics that were never evaluated are left out.
+        confusion: Confusion matrix of the evaluated epochs.
+        per_class: Per-class metrics of
+            :meth:`EvalRecord.get_per_class_metrics`, keyed by class index
+            and ``"macro_avg"``.
+        training_time: Total training time of the epochs in seconds.
+        throughput: Training samples per second, ``None`` if unknown.
+        label: Label of each evaluated epoch.
+        prediction: Predicted class of each evaluated epoch.
+
+    """
+
+    name: str
+    model_name: str
+    repeat: int
+    epochs: int
+    early_stop_epoch: int | None
+    metrics: dict[str, float]
+    best: dict[str, Any] = field(default_factory=dict)
+    confusion: list[list[int]] = field(default_factory=list)
+    per_class: dict[int | str, dict[str, float]] = field(default_factory=dict)
+    training_time: float = 0.0
+    throughput: float | None = None
+    label: list[int] = field(default_factory=list)
+    prediction: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_record(cls, train_record: TrainRecord) -> RunSummary:
+        """Summarize the evaluated repeat *train_record*.
+
+        Raises:
+            ValueError: If the repeat has no evaluation record.
+
+        """
+        eval_record = train_record.get_eval_record()
+        if eval_record is None:
+            raise ValueError(f"{train_record.get_name()} has not been evaluated")
+        best = {}
+        for record_type in ["val", "test"]:
+            for key in RecordKey():
+                name = f"best_{record_type}_{key}"
+                epoch = train_record.best_record.get(name + "_epoch")
+                if epoch is not None:
+                    best[name] = float(train_record.best_record[name])
+                    best[name + "_epoch"] = int(epoch)
+
+        times = [t for t in train_record.train[TrainRecordKey.TIME] if t is not None]
+        training_time = float(sum(times))
+        throughputs = [
+            t for t in train_record.train[TrainRecordKey.THROUGHPUT] if t is not None
+        ]
+        throughput = None
+        if throughputs:
+            throughput = float(np.mean(throughputs))
+        elif training_time > 0:
+            samples = int(train_record.dataset.get_train_len()) * len(times)
+            throughput = samples / training_time
+
+        per_class = {
+            key: {name: float(value) for name, value in values.items()}
+            for key, values in eval_record.get_per_class_metrics().items()
+        }
+        return cls(
+            name=train_record.get_name(),
+            model_name=train_record.model_name,
+            repeat=train_record.repeat,
+            epochs=train_record.get_epoch(),
+            early_stop_epoch=train_record.early_stop_epoch,
+            metrics={
+                "accuracy": float(eval_record.get_acc()),
+                "auc": _safe_float(eval_record.get_auc),
+                "kappa": float(eval_record.get_kappa()),
+            },
+            best=best,
+            confusion=eval_record.get_confusion().astype(int).tolist(),
+            per_class=per_class,
+            training_time=training_time,
+            throughput=throughput,
+            label=np.asarray(eval_record.label).astype(int).tolist(),
+            prediction=eval_record.get_prediction().astype(int).tolist(),
+        )
+
+    def get_correct(self) -> np.ndarray:
+        """Return whether each evaluated epoch is classified correctly."""
+        return np.asarray(self.prediction) == np.asarray(self.label)
+
+    def get_row(self) -> dict[str, Any]:
+        """Return the scalar fields as one leaderboard row."""
+        return {
+            "name": self.name,
+            "model_name": self.model_name,
+            "repeat": self.repeat,
+            "epochs": self.epochs,
+            **self.metrics,
+            "macro_f1": self.per_class.get("macro_avg", {}).get("f1-score"),
+            **self.best,
+            "training_time": self.training_time,
+            "throughput": self.throughput,
+            "n_samples": len(self.label),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as plain (JSON serializable) types."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, state: dict[str, Any]) -> RunSummary:
+        """Create a summary from :meth:`to_dict` output or its JSON."""
+        state = dict(state)
+        # JSON object keys are strings
+        state["per_class"] = {
+            int(key) if str(key).isdigit() else key: values
+            for key, values in state.get("per_class", {}).items()
+        }
+        return cls(**state)
+
+    def save(self, target_path: str) -> None:
+        """Write the summary to :data:`SUMMARY_FILE` in *target_path*."""
+        write_summary(self.to_dict(), target_path)
+
+    @classmethod
+    def load(cls, target_path: str) -> RunSummary | None:
+        """Read the summary saved in *target_path*.
+
+        Returns:
+            The summary, or ``None`` if there is none or it is unreadable.
+
+        """
+        path = os.path.join(target_path, SUMMARY_FILE)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != SUMMARY_FORMAT_VERSION:
+                return None
+            return cls.from_dict(data["summary"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable run summary %s: %s", path, e)
+            return None
+
+
+def write_summary(state: dict[str, Any], target_path: str) -> None:
+    """Atomically write a :meth:`RunSummary.to_dict` state to *target_path*."""
+    path = os.path.join(target_path, SUMMARY_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": SUMMARY_FORMAT_VERSION, "summary": state}, f)
+    os.replace(tmp_path, path)
+
+
+def _safe_float(compute) -> float:
+    """Return ``compute()`` as a float, ``nan`` if it is undefined.
+
+    AUC is undefined when the evaluated epochs hold a single class.
+    """
+    try:
+        return float(compute())
+    except ValueError:
+        return math.nan
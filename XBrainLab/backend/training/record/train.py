@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import json
 import os
 import time
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 import torch
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
@@ -13,10 +18,77 @@ from matplotlib.figure import Figure
 from XBrainLab.backend.utils.logger import logger
 
 from ...dataset import Dataset
-from ...training import TrainingOption
+from ...training import TrainingEvaluation, TrainingOption
 from ...utils import get_random_state, set_random_state
-from .eval import EvalRecord, calculate_confusion
+from ..checkpoint import (
+    cpu_copy,
+    epoch_checkpoint_name,
+    flush_checkpoints,
+    get_checkpoint_writer,
+    prune_epoch_checkpoints,
+    save_atomic,
+)
+from .eval import EvalRecord, write_eval_state
 from .key import RecordKey, TrainRecordKey
+from .summary import SUMMARY_FILE, RunSummary, write_summary
+
+TRACE_FILE = "profile_trace.json"
+"""File name of the Chrome trace written next to the checkpoints."""
+
+MAX_TRACE_EVENTS = 100_000
+"""Number of most recent profiler trace events kept per record."""
+
+_PROFILE_PHASES = {
+    TrainRecordKey.DATA_TIME: "Data",
+    TrainRecordKey.FORWARD_TIME: "Forward",
+    TrainRecordKey.BACKWARD_TIME: "Backward",
+    TrainRecordKey.OPTIM_TIME: "Optimizer",
+    TrainRecordKey.VAL_TIME: "Validation",
+    TrainRecordKey.TEST_TIME: "Test",
+    TrainRecordKey.CHECKPOINT_TIME: "Checkpoint",
+}
+
+
+def _plot_series(values: list, *args: Any, **kwargs: Any) -> None:
+    """Plot the evaluated epochs of *values*, skipping ``None`` entries.
+
+    Validation and test statistics are ``None`` for epochs without
+    evaluation, so the remaining points are connected by epoch index.
+    """
+    points = [(i, v) for i, v in enumerate(values) if v is not None]
+    if not points:
+        return
+    epochs, series = zip(*points, strict=True)
+    plt.plot(epochs, series, *args, **kwargs)
+
+
+def _write_checkpoint(
+    target_path: str,
+    files: dict[str, Any],
+    keep_last: int,
+    keep: list[int],
+    trace_events: list[dict[str, Any]] | None = None,
+    eval_state: dict[str, Any] | None = None,
+    summary_state: dict[str, Any] | None = None,
+) -> None:
+    """Write checkpoint *files* atomically and prune old epoch checkpoints."""
+    for name, obj in files.items():
+        save_atomic(obj, os.path.join(target_path, name))
+    if eval_state is not None:
+        write_eval_state(eval_state, target_path)
+    if summary_state is not None:
+        write_summary(summary_state, target_path)
+    if trace_events:
+        _write_trace(trace_events, os.path.join(target_path, TRACE_FILE))
+    prune_epoch_checkpoints(target_path, keep_last, keep)
+
+
+def _write_trace(events: list[dict[str, Any]], path: str) -> None:
+    """Write *events* as a Chrome trace (``chrome://tracing``, Perfetto)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    os.replace(tmp_path, path)
 
 
 class TrainRecord:
@@ -28,7 +100,10 @@ class TrainRecord:
         dataset: :class:`XBrainLab.backend.dataset.Dataset`
             Dataset used for training
         model: :class:`torch.nn.Module`
-            Model used for training
+            Model used for training, created on first access for records
+            with a model factory (see :meth:`release`)
+        model_name: str
+            Class name of the model
         option: :class:`XBrainLab.backend.training.TrainingOption`
             Training option
         seed: int
@@ -39,6 +114,10 @@ class TrainRecord:
             Criterion used for training
         eval_record: :class:`EvalRecord` | None
             Evaluation record, set after training is finished
+        summary: :class:`RunSummary` | None
+            Compact metrics of the evaluation record (see
+            :meth:`get_summary`), built when the finished record is
+            exported and saved as :data:`~.summary.SUMMARY_FILE`
         best_val_loss_model: :class:`torch.nn.Module` | None
             Model with best validation loss, set during training
         best_val_accuracy_model: :class:`torch.nn.Module` | None
@@ -66,6 +145,16 @@ class TrainRecord:
             Path to save the record
         random_state: tuple
             Random state for reproducibility
+        compile_stats: dict
+            Compile cost and forward-pass speedup of a compiled model
+            (see :meth:`CompiledModel.get_stats`), empty for eager training
+        scheduler: :class:`torch.optim.lr_scheduler.LRScheduler` | None
+            Learning-rate scheduler of the optimizer, if configured
+        early_stop_epoch: int | None
+            Epoch after which training stopped early, ``None`` otherwise
+        trace_events: list[dict]
+            Chrome trace events of the profiled epochs (see
+            :attr:`TrainingOption.profile`), at most :data:`MAX_TRACE_EVENTS`
 
     """
 
@@ -73,35 +162,63 @@ class TrainRecord:
         self,
         repeat: int,
         dataset: Dataset,
-        model: torch.nn.Module,
+        model: torch.nn.Module | None,
         option: TrainingOption,
         seed: int,
         plan_id: str | None = None,
+        model_factory: Callable[[], torch.nn.Module] | None = None,
+        model_name: str | None = None,
     ):
         """Initialize a training record.
 
         Sets up the model, optimizer, criterion, record dictionaries, and
         output directory. Loads any existing data from disk if available.
 
+        With a *model_factory* instead of a *model*, the model, optimizer
+        and scheduler are only created when they are first used, from the
+        random state current at construction, and can be dropped again
+        with :meth:`release`.
+
         Args:
             repeat: Zero-based index of the training repetition.
             dataset: The dataset used for training.
-            model: The PyTorch model to train.
+            model: The PyTorch model to train, or ``None`` to create it
+                with *model_factory*.
             option: Training configuration options.
             seed: Random seed for reproducibility.
             plan_id: Optional unique identifier (timestamp) for the training plan,
                 used to construct the output path.
+            model_factory: Callable returning a new, untrained model.
+            model_name: Class name of the model, used in the output path.
+                Defaults to the class name of *model*.
+
+        Raises:
+            ValueError: If neither *model* nor *model_factory* is given.
 
         """
+        if model is None and model_factory is None:
+            raise ValueError("Either a model or a model factory is required")
         self.repeat = repeat
         self.dataset = dataset
         self.option = option
         self.seed = seed
         self.plan_id = plan_id
-        self.model = model
-        self.optim = self.option.get_optim(model)
+        if model_name is None:
+            model_name = model.__class__.__name__ if model is not None else "Model"
+        self.model_name = model_name
+        self._model_factory = model_factory
+        self._model: torch.nn.Module | None = None
+        self._optim: torch.optim.Optimizer | None = None
+        self._scheduler: Any = None
+        if model is not None:
+            self._model = model
+            self._optim = self.option.get_optim(model)
+            self._scheduler = self.option.get_scheduler(self._optim)
         self.criterion = self.option.criterion
         self.eval_record: EvalRecord | None = None
+        self.summary: RunSummary | None = None
+        # Evaluation record the summary was built from
+        self._summary_source: EvalRecord | None = None
         for key in RecordKey():
             setattr(self, "best_val_" + key + "_model", None)
             setattr(self, "best_test_" + key + "_model", None)
@@ -109,6 +226,7 @@ class TrainRecord:
         self.val: dict[str, list[float]] = {i: [] for i in RecordKey()}
         self.test: dict[str, list[float]] = {i: [] for i in RecordKey()}
         self.best_record: dict[str, Any] = {}
+        self.compile_stats: dict[str, Any] = {}
         for record_type in ["val", "test"]:
             for key in RecordKey():
                 self.best_record[f"best_{record_type}_{key}"] = -1
@@ -116,15 +234,117 @@ class TrainRecord:
             self.best_record[f"best_{record_type}_" + RecordKey.LOSS] = torch.inf
 
         self.epoch = 0
+        self.early_stop_epoch: int | None = None
+        self.trace_events: list[dict[str, Any]] = []
         self.target_path: str | None = None
         self.init_dir()
         self.random_state = get_random_state()
+        # Random state the model is initialized from (see _create_model)
+        self._init_random_state = self.random_state
         self.start_timestamp: float | None = None
         self.end_timestamp: float | None = None
+        # Objects already handed to the checkpoint writer, by file name
+        self._exported: dict[str, Any] = {}
+        # Training state at the end of the last completed epoch
+        self._resume_state: dict[str, Any] | None = None
 
         # Load existing data if available
         self.load()
 
+    @property
+    def model(self) -> torch.nn.Module:
+        """Model of this repeat, created on first access if released."""
+        if self._model is None:
+            self._create_model()
+        return self._model  # type: ignore[return-value]
+
+    @model.setter
+    def model(self, model: torch.nn.Module) -> None:
+        self._model = model
+
+    @property
+    def optim(self) -> torch.optim.Optimizer:
+        """Optimizer of :attr:`model`, created along with it."""
+        if self._model is None:
+            self._create_model()
+        return self._optim  # type: ignore[return-value]
+
+    @optim.setter
+    def optim(self, optim: torch.optim.Optimizer | None) -> None:
+        self._optim = optim
+
+    @property
+    def scheduler(self) -> Any:
+        """Learning-rate scheduler of :attr:`optim`, if configured."""
+        if self._model is None:
+            self._create_model()
+        return self._scheduler
+
+    @scheduler.setter
+    def scheduler(self, scheduler: Any) -> None:
+        self._scheduler = scheduler
+
+    def has_model(self) -> bool:
+        """Return whether the model and optimizer currently exist."""
+        return self._model is not None
+
+    def release(self) -> None:
+        """Drop the model, optimizer and scheduler, keeping their state.
+
+        Their current state is kept as the resume point (see
+        :meth:`save_resume_point`); the next access to :attr:`model`,
+        :attr:`optim` or :attr:`scheduler` creates them again from it.
+        Records created with a model instead of a model factory keep their
+        model.
+        """
+        if self._model is None or self._model_factory is None:
+            return
+        if not self.has_resume_point():
+            self.save_resume_point()
+        self._model = None
+        self._optim = None
+        self._scheduler = None
+
+    def get_model_state(self) -> dict[str, torch.Tensor] | None:
+        """Return the model state dict without creating a released model.
+
+        Returns:
+            The state dict of :attr:`model`, the one of the resume point if
+            the model is released, or ``None`` if it was never created.
+
+        """
+        if self._model is not None:
+            return self._model.state_dict()
+        if self._resume_state is not None:
+            return self._resume_state["model"]
+        return None
+
+    def _create_model(self) -> None:
+        """Create the model, optimizer and scheduler from the factory.
+
+        The model is initialized from the random state captured at
+        construction, without consuming the current random stream, so its
+        weights depend on the seed of the record only. An untrained record
+        then continues from the state after initialization, as if the model
+        had been created at construction; otherwise the resume point is
+        loaded.
+        """
+        if self._model_factory is None:
+            raise ValueError("The model of this record cannot be created again")
+        state = get_random_state()
+        set_random_state(self._init_random_state)
+        try:
+            model = self._model_factory()
+            if self._resume_state is None:
+                self.random_state = get_random_state()
+        finally:
+            set_random_state(state)
+        self._model = model
+        self._optim = self.option.get_optim(model)
+        self._scheduler = self.option.get_scheduler(self._optim)
+        if self._resume_state is not None:
+            self._load_training_state(self._resume_state)
+
     def init_dir(self) -> None:
         """Initialize the output directory for saving checkpoints and records.
 
@@ -135,7 +355,7 @@ class TrainRecord:
         repeat_name = self.get_name()
 
         # Construct unique path: output / dataset / model_timestamp / repeat
-        model_name = self.model.__class__.__name__
+        model_name = self.model_name
         unique_id = f"{model_name}_{self.plan_id}" if self.plan_id else model_name
 
         target_path = os.path.join(
@@ -152,16 +372,186 @@ class TrainRecord:
     def resume(self) -> None:
         """Resume training by restoring the saved random state.
 
-        Also sets the start timestamp if this is the first resume.
+        Also creates a released model and sets the start timestamp if this
+        is the first resume. With :attr:`TrainingOption.epoch_snapshots`,
+        the current state becomes the resume point (see :meth:`rollback`).
         """
+        if self._model is None:
+            self._create_model()
         set_random_state(self.random_state)
         if self.start_timestamp is None:
             self.start_timestamp = time.time()
+        if self.takes_epoch_snapshots() and not self.has_resume_point():
+            self.save_resume_point()
+
+    def takes_epoch_snapshots(self) -> bool:
+        """Return whether a resume point is saved after every epoch."""
+        # Options pickled before epoch_snapshots existed lack the attribute
+        return bool(getattr(self.option, "epoch_snapshots", False))
+
+    def has_resume_point(self) -> bool:
+        """Return whether the resume point is at the current epoch."""
+        return self._resume_state is not None and (
+            self._resume_state["epoch"] == self.epoch
+        )
+
+    def save_resume_point(self, model_state: dict | None = None) -> None:
+        """Record the current training state as the end of a complete epoch.
+
+        Copies the model, optimizer and scheduler state and the random
+        state. Resume points are taken when a checkpoint is exported, on
+        :meth:`pause` and :meth:`release`, and after every epoch with
+        :attr:`TrainingOption.epoch_snapshots`. The resume point is saved
+        with each checkpoint, so training can continue from it exactly
+        after a restart, and restored by :meth:`rollback` after an
+        interrupted epoch.
+
+        Args:
+            model_state: CPU copy of the model state dict to use instead of
+                copying it again.
+
+        """
+        if model_state is None:
+            model_state = cpu_copy(self.model.state_dict())
+        self._resume_state = {
+            "epoch": self.epoch,
+            "model": model_state,
+            "optim": cpu_copy(self.optim.state_dict()) if self.optim else None,
+            "scheduler": self.scheduler.state_dict() if self.scheduler else None,
+            "random_state": get_random_state(),
+        }
+
+    def rollback(self) -> None:
+        """Undo a partially trained epoch.
+
+        Restores the model, optimizer, scheduler and random state of the
+        resume point, so continuing training gives the same result as an
+        uninterrupted run. Does nothing unless the resume point is at the
+        current epoch, i.e. the last complete epoch was checkpointed or
+        :attr:`TrainingOption.epoch_snapshots` is set; the partially
+        trained state is then kept.
+        """
+        if self._resume_state is None:
+            return
+        if not self.has_resume_point():
+            logger.info(
+                "%s has no resume point at epoch %d, keeping the interrupted "
+                "epoch's weights",
+                self.get_name(),
+                self.epoch,
+            )
+            return
+        self._load_resume_state(self._resume_state)
+        set_random_state(self.random_state)
+
+    def _load_resume_state(self, state: dict[str, Any]) -> None:
+        """Apply a resume point created by :meth:`save_resume_point`.
+
+        The random state is stored in :attr:`random_state` and applied by
+        the next :meth:`resume`. A released model is not created; it is
+        loaded from the resume point when next used.
+        """
+        if self._model is not None:
+            self._load_training_state(state)
+        self.random_state = state["random_state"]
+        self._resume_state = state
+
+    def _load_training_state(self, state: dict[str, Any]) -> None:
+        """Load the model, optimizer and scheduler state of *state*."""
+        self.model.load_state_dict(state["model"])
+        if self.optim is not None and state["optim"] is not None:
+            self.optim.load_state_dict(state["optim"])
+        if self.scheduler is not None and state["scheduler"] is not None:
+            self.scheduler.load_state_dict(state["scheduler"])
 
     def pause(self) -> None:
-        """Pause training by saving the current random state and timestamp."""
+        """Pause training by saving the current random state and timestamp.
+
+        Also takes a resume point of a created model, if there is none at
+        the current epoch, and waits for pending checkpoints to be written.
+        """
         self.random_state = get_random_state()
         self.end_timestamp = time.time()
+        if self._model is not None and not self.has_resume_point():
+            self.save_resume_point()
+        flush_checkpoints()
+
+    def snapshot(self, include_weights: bool = False) -> dict[str, Any]:
+        """Return a picklable copy of the training progress.
+
+        Used to stream progress from a worker process back into the
+        record owned by the main process.
+
+        Args:
+            include_weights: Also include the model, optimizer and best-model
+                state dicts, the evaluation record, the random state and the
+                timestamps.
+
+        Returns:
+            A dictionary accepted by :meth:`restore_snapshot`.
+
+        """
+        state: dict[str, Any] = {
+            "epoch": self.epoch,
+            "early_stop_epoch": self.early_stop_epoch,
+            "train": self.train,
+            "val": self.val,
+            "test": self.test,
+            "best_record": self.best_record,
+            "compile_stats": self.compile_stats,
+        }
+        if not include_weights:
+            return state
+        state["model"] = cpu_copy(self.model.state_dict())
+        state["optim"] = self.optim.state_dict() if self.optim else None
+        state["scheduler"] = self.scheduler.state_dict() if self.scheduler else None
+        for best_type in ["val", "test"]:
+            for key in RecordKey():
+                full_key = "best_" + best_type + "_" + key + "_model"
+                state[full_key] = getattr(self, full_key)
+        state["eval_record"] = self.eval_record
+        state["trace_events"] = self.trace_events
+        state["random_state"] = self.random_state
+        state["start_timestamp"] = self.start_timestamp
+        state["end_timestamp"] = self.end_timestamp
+        return state
+
+    def restore_snapshot(self, state: dict[str, Any]) -> None:
+        """Apply a snapshot produced by :meth:`snapshot`.
+
+        Args:
+            state: Snapshot dictionary. Weight entries are only applied when
+                present; they become the resume point, so a released model
+                stays released.
+
+        """
+        self.epoch = state["epoch"]
+        self.early_stop_epoch = state["early_stop_epoch"]
+        self.train = state["train"]
+        self.val = state["val"]
+        self.test = state["test"]
+        self.best_record = state["best_record"]
+        self.compile_stats = state["compile_stats"]
+        if "model" not in state:
+            return
+        self._resume_state = {
+            "epoch": state["epoch"],
+            "model": state["model"],
+            "optim": state["optim"],
+            "scheduler": state["scheduler"],
+            "random_state": state["random_state"],
+        }
+        if self._model is not None:
+            self._load_training_state(self._resume_state)
+        for best_type in ["val", "test"]:
+            for key in RecordKey():
+                full_key = "best_" + best_type + "_" + key + "_model"
+                setattr(self, full_key, state[full_key])
+        self.eval_record = state["eval_record"]
+        self.trace_events = state["trace_events"]
+        self.random_state = state["random_state"]
+        self.start_timestamp = state["start_timestamp"]
+        self.end_timestamp = state["end_timestamp"]
 
     def get_name(self) -> str:
         """Return the display name of this record.
@@ -184,6 +574,8 @@ class TrainRecord:
     def get_training_model(self, device: str) -> torch.nn.Module:
         """Return the model moved to the specified device for training.
 
+        Optimizer state restored from a checkpoint is moved along with it.
+
         Args:
             device: PyTorch device string (e.g., ``'cpu'`` or ``'cuda:0'``).
 
@@ -191,17 +583,36 @@ class TrainRecord:
             The model on the target device.
 
         """
-        return self.model.to(device)
+        model = self.model.to(device)
+        if self.optim is not None:
+            for state in self.optim.state.values():
+                for key, value in state.items():
+                    # Adam-style step counters stay on the CPU
+                    if isinstance(value, torch.Tensor) and key != "step":
+                        state[key] = value.to(device)
+        return model
+
+    def is_trained(self) -> bool:
+        """Check whether no more epochs will be trained.
+
+        Returns:
+            ``True`` if the current epoch meets or exceeds the target or
+            training stopped early.
+
+        """
+        if self.early_stop_epoch is not None:
+            return True
+        return self.get_epoch() >= self.option.epoch
 
     def is_finished(self) -> bool:
         """Check whether training and evaluation are both complete.
 
         Returns:
-            ``True`` if the current epoch meets or exceeds the target and
-            an evaluation record exists.
+            ``True`` if training is done (see :meth:`is_trained`) and an
+            evaluation record exists.
 
         """
-        return self.get_epoch() >= self.option.epoch and self.eval_record is not None
+        return self.is_trained() and self.eval_record is not None
 
     def append_record(self, val: Any, arr: list) -> None:
         """Internal function for appending a value to a statistic array
@@ -290,10 +701,48 @@ class TrainRecord:
         for key, value in statistic.items():
             self.append_record(value, self.train[key])
 
+    def add_trace_events(self, events: list[dict[str, Any]]) -> None:
+        """Append profiler trace events, keeping the most recent ones.
+
+        Args:
+            events: Chrome trace events of one epoch.
+
+        """
+        self.trace_events.extend(events)
+        if len(self.trace_events) > MAX_TRACE_EVENTS:
+            del self.trace_events[:-MAX_TRACE_EVENTS]
+
+    def export_trace(self, path: str | None = None) -> str | None:
+        """Write the profiler trace events as a Chrome trace file.
+
+        The file can be opened in ``chrome://tracing`` or Perfetto. It is
+        also written with every checkpoint while profiling is enabled.
+
+        Args:
+            path: Destination file. Defaults to :data:`TRACE_FILE` in
+                :attr:`target_path`.
+
+        Returns:
+            The path written, or ``None`` if there is no trace or no path.
+
+        """
+        if not self.trace_events:
+            return None
+        if path is None:
+            if not self.target_path:
+                return None
+            path = os.path.join(self.target_path, TRACE_FILE)
+        _write_trace(self.trace_events, path)
+        return path
+
     def step(self) -> None:
         """Advance the epoch counter by one."""
         self.epoch += 1
 
+    def stop_early(self) -> None:
+        """Mark training as stopped after the current epoch."""
+        self.early_stop_epoch = self.epoch
+
     def set_eval_record(self, eval_record: EvalRecord) -> None:
         """Set the evaluation record after training completes.
 
@@ -303,46 +752,127 @@ class TrainRecord:
         """
         self.eval_record = eval_record
 
+    def get_summary(self) -> RunSummary | None:
+        """Return the summary of the evaluation record, building it if stale.
+
+        Returns:
+            The :class:`RunSummary`, or ``None`` if not yet evaluated.
+
+        """
+        if self.eval_record is None:
+            return None
+        if self.summary is None or self._summary_source is not self.eval_record:
+            self.summary = RunSummary.from_record(self)
+            self._summary_source = self.eval_record
+        return self.summary
+
     def export_checkpoint(self) -> None:
         """Save the current training state, best models, and evaluation record to disk.
 
-        Exports the model state dict, record statistics, best model state dicts,
-        and the evaluation record (if available) to :attr:`target_path`.
+        The model state dict, record statistics, changed best-model state
+        dicts and the evaluation record (if available) are copied in memory
+        and written to :attr:`target_path` by the background
+        :class:`~..checkpoint.CheckpointWriter`, which also applies the
+        :attr:`TrainingOption.checkpoint_keep_last` retention policy. Use
+        :func:`~..checkpoint.flush_checkpoints` to wait for the files.
         """
         epoch = len(self.train[RecordKey.LOSS])
 
         if not self.target_path:
             return
 
-        if self.eval_record:
-            self.eval_record.export(self.target_path)
-
+        files: dict[str, Any] = {}
+        eval_state = None
+        if self.eval_record and self._exported.get("eval") is not self.eval_record:
+            eval_state = self.eval_record.get_state()
+            self._exported["eval"] = self.eval_record
+        summary_state = None
+        try:
+            summary = self.get_summary()
+        except Exception as e:
+            # A missing summary must not cost the checkpoint
+            logger.error("Failed to summarize %s: %s", self.get_name(), e)
+            summary = None
+        if summary is not None and self._exported.get(SUMMARY_FILE) is not summary:
+            summary_state = summary.to_dict()
+            self._exported[SUMMARY_FILE] = summary
+
+        # Best models are replaced, never modified, so unchanged ones are
+        # not written again
         for best_type in ["val", "test"]:
             for key in RecordKey():
                 full_key = "best_" + best_type + "_" + key + "_model"
                 model = getattr(self, full_key)
-                if model:
-                    torch.save(model, os.path.join(self.target_path, full_key))
+                if model and self._exported.get(full_key) is not model:
+                    files[full_key] = model
+                    self._exported[full_key] = model
+
+        model_state = cpu_copy(self.model.state_dict())
+        files[epoch_checkpoint_name(epoch)] = model_state
+        if not self.has_resume_point():
+            # The epoch file and the resume point share one copy
+            self.save_resume_point(model_state)
+        record = copy.deepcopy(
+            {
+                "train": self.train,
+                "val": self.val,
+                "test": self.test,
+                "best_record": self.best_record,
+                "seed": self.seed,
+                "compile_stats": self.compile_stats,
+                "early_stop_epoch": self.early_stop_epoch,
+            }
+        )
+        # Resume points are replaced, never modified, so they are not copied
+        record["resume"] = self._resume_state
+        files["record"] = record
+
+        keep = []
+        best_epoch = self._get_best_epoch()
+        if self.option.checkpoint_keep_best and best_epoch is not None:
+            keep.append(best_epoch + 1)
+        trace = None
+        last_event = self.trace_events[-1] if self.trace_events else None
+        if last_event is not None and self._exported.get(TRACE_FILE) is not last_event:
+            # Events are never modified, so a shallow copy is a snapshot
+            trace = list(self.trace_events)
+            self._exported[TRACE_FILE] = last_event
+        get_checkpoint_writer().submit(
+            functools.partial(
+                _write_checkpoint,
+                self.target_path,
+                files,
+                self.option.checkpoint_keep_last,
+                keep,
+                trace,
+                eval_state,
+                summary_state,
+            )
+        )
 
-        fname = f"Epoch-{epoch}-model"
-        torch.save(self.model.state_dict(), os.path.join(self.target_path, fname))
-        record = {
-            "train": self.train,
-            "val": self.val,
-            "test": self.test,
-            "best_record": self.best_record,
-            "seed": self.seed,
-        }
-        torch.save(record, os.path.join(self.target_path, "record"))
+    def _get_best_epoch(self) -> int | None:
+        """Return the 0-based epoch of the model selected for evaluation."""
+        option = self.option.evaluation_option
+        if option == TrainingEvaluation.VAL_LOSS:
+            return self.best_record[f"best_val_{RecordKey.LOSS}_epoch"]
+        if option == TrainingEvaluation.TEST_ACC:
+            return self.best_record[f"best_test_{RecordKey.ACC}_epoch"]
+        if option == TrainingEvaluation.TEST_AUC:
+            return self.best_record[f"best_test_{RecordKey.AUC}_epoch"]
+        return None
 
     def load(self) -> None:
         """Load a previously saved training record from disk.
 
-        Restores training statistics, best records, seed, and evaluation record
-        from :attr:`target_path` if files exist.
+        Restores training statistics, best records, seed, best-model state
+        dicts and evaluation record from :attr:`target_path` if files exist.
+        Records saved with a resume point also restore the model, optimizer,
+        scheduler and random state, so :meth:`resume` continues training
+        exactly where the checkpoint was taken.
         """
         if not self.target_path or not os.path.exists(self.target_path):
             return
+        flush_checkpoints()
 
         # Load record dict
         record_path = os.path.join(self.target_path, "record")
@@ -353,17 +883,44 @@ class TrainRecord:
                 # files from trusted sources.
                 data = torch.load(record_path, weights_only=False)
                 self.train = data["train"]
+                # Records saved before a statistic existed lack its key
+                for key in TrainRecordKey():
+                    self.train.setdefault(key, [])
                 self.val = data["val"]
                 self.test = data["test"]
                 self.best_record = data["best_record"]
                 self.seed = data["seed"]
+                self.compile_stats = data.get("compile_stats", {})
+                self.early_stop_epoch = data.get("early_stop_epoch")
                 # Restore epoch from train loss length
                 self.epoch = len(self.train[RecordKey.LOSS])
+                if data.get("resume") is not None:
+                    self._load_resume_state(data["resume"])
             except Exception as e:
                 logger.error("Failed to load TrainRecord stats: %s", e, exc_info=True)
 
+        for best_type in ["val", "test"]:
+            for key in RecordKey():
+                full_key = "best_" + best_type + "_" + key + "_model"
+                path = os.path.join(self.target_path, full_key)
+                if not os.path.exists(path):
+                    continue
+                try:
+                    state = torch.load(path)
+                except Exception as e:
+                    logger.error("Failed to load %s: %s", full_key, e, exc_info=True)
+                    continue
+                setattr(self, full_key, state)
+                self._exported[full_key] = state
+
         # Load EvalRecord
         self.eval_record = EvalRecord.load(self.target_path)
+        if self.eval_record is not None:
+            summary = RunSummary.load(self.target_path)
+            if summary is not None:
+                self.summary = summary
+                self._summary_source = self.eval_record
+                self._exported[SUMMARY_FILE] = summary
 
     def get_model_output(self) -> str:
         """Return a formatted string summary of the training history.
@@ -376,6 +933,8 @@ class TrainRecord:
         lines = []
         lines.append(f"=== Training Summary for {self.get_name()} ===")
         lines.append(f"Total Epochs: {self.epoch}")
+        if self.early_stop_epoch is not None:
+            lines.append(f"Stopped early after epoch {self.early_stop_epoch}")
 
         # Best Performance
         lines.append("\n[Best Performance]")
@@ -392,7 +951,8 @@ class TrainRecord:
             idx = -1
 
             def get_val(d, k):
-                return d[k][idx] if len(d[k]) > 0 else "N/A"
+                values = [v for v in d[k] if v is not None]
+                return values[idx] if len(values) > 0 else "N/A"
 
             def fmt(val, p=4):
                 if isinstance(val, (int, float)):
@@ -406,6 +966,32 @@ class TrainRecord:
         else:
             lines.append("  No training data available.")
 
+        if self.train[TrainRecordKey.THROUGHPUT]:
+            lines.append("\n[Profile of Last Epoch]")
+            for key, label in _PROFILE_PHASES.items():
+                lines.append(f"  {label}: {self.train[key][-1]:.3f} s")
+            lines.append(
+                f"  Throughput: {self.train[TrainRecordKey.THROUGHPUT][-1]:.1f} "
+                "samples/s"
+            )
+            lines.append(
+                f"  Peak memory: {self.train[TrainRecordKey.PEAK_MEMORY][-1]:.1f} MB"
+            )
+
+        if self.compile_stats:
+            stats = self.compile_stats
+            source = "reused from cache" if stats["reused"] else "compiled"
+            lines.append("\n[Compilation]")
+            lines.append(
+                f"  Mode: {stats['mode']} "
+                f"({source}, {stats['compile_time']:.2f} s compile cost)"
+            )
+            lines.append(
+                f"  Forward: {stats['eager_time'] * 1000:.2f} ms eager, "
+                f"{stats['compiled_time'] * 1000:.2f} ms compiled "
+                f"({stats['speedup']:.2f}x)"
+            )
+
         return "\n".join(lines)
 
     # figure
@@ -444,9 +1030,9 @@ class TrainRecord:
         if len(training_loss_list) > 0:
             plt.plot(training_loss_list, "g", label="Training loss")
         if len(val_loss_list) > 0:
-            plt.plot(val_loss_list, "b", label="validation loss")
+            _plot_series(val_loss_list, "b", label="validation loss")
         if len(test_loss_list) > 0:
-            plt.plot(test_loss_list, "r", label="testing loss")
+            _plot_series(test_loss_list, "r", label="testing loss")
         plt.title("Training loss")
         plt.xlabel("Epochs")
         plt.ylabel("Loss")
@@ -489,9 +1075,9 @@ class TrainRecord:
         if len(training_acc_list) > 0:
             plt.plot(training_acc_list, "g", label="Training accuracy")
         if len(val_acc_list) > 0:
-            plt.plot(val_acc_list, "b", label="validation accuracy")
+            _plot_series(val_acc_list, "b", label="validation accuracy")
         if len(test_acc_list) > 0:
-            plt.plot(test_acc_list, "r", label="testing accuracy")
+            _plot_series(test_acc_list, "r", label="testing accuracy")
         plt.title("Training Accuracy")
         plt.xlabel("Epochs")
         plt.ylabel("Accuracy (%)")
@@ -534,9 +1120,9 @@ class TrainRecord:
         if len(training_auc_list) > 0:
             plt.plot(training_auc_list, "g", label="Training AUC")
         if len(val_auc_list) > 0:
-            plt.plot(val_auc_list, "b", label="validation AUC")
+            _plot_series(val_auc_list, "b", label="validation AUC")
         if len(test_auc_list) > 0:
-            plt.plot(test_auc_list, "r", label="testing AUC")
+            _plot_series(test_auc_list, "r", label="testing AUC")
         plt.title("Training AUC")
         plt.xlabel("Epochs")
         plt.ylabel("AUC")
@@ -576,6 +1162,52 @@ class TrainRecord:
         plt.ylabel("lr")
         return fig
 
+    def get_profile_figure(
+        self,
+        fig: Figure | None = None,
+        figsize: tuple = (6.4, 4.8),
+        dpi: int = 100,
+    ) -> Figure | None:
+        """Generate a stacked bar chart of the profiled phase times per epoch.
+
+        The training throughput is drawn as a line on a second axis.
+
+        Args:
+            fig: Existing figure to plot on. If ``None``, a new figure is created.
+            figsize: Width and height of the figure in inches.
+            dpi: Dots per inch for the figure.
+
+        Returns:
+            The matplotlib :class:`~matplotlib.figure.Figure`, or ``None``
+            if no epoch was profiled.
+
+        """
+        if fig is None:
+            fig = plt.figure(figsize=figsize, dpi=dpi)
+        plt.clf()
+
+        n_epochs = len(self.train[TrainRecordKey.THROUGHPUT])
+        if n_epochs == 0:
+            return None
+
+        epochs = np.arange(n_epochs)
+        bottom = np.zeros(n_epochs)
+        for key, label in _PROFILE_PHASES.items():
+            values = np.asarray(self.train[key][:n_epochs], dtype=float)
+            plt.bar(epochs, values, bottom=bottom, label=label)
+            bottom += values
+        plt.title("Epoch Profile")
+        plt.xlabel("Epochs")
+        plt.ylabel("Time (s)")
+        _ = plt.legend(loc="upper left", fontsize="small")
+
+        throughput_axis = plt.gca().twinx()
+        throughput_axis.plot(
+            epochs, self.train[TrainRecordKey.THROUGHPUT], "k.-", label="Throughput"
+        )
+        throughput_axis.set_ylabel("Samples / s")
+        return fig
+
     def get_confusion_figure(
         self,
         fig: Figure | None = None,
@@ -602,9 +1234,7 @@ class TrainRecord:
         plt.clf()
         if not self.eval_record:
             return None
-        output = self.eval_record.output
-        label = self.eval_record.label
-        confusion = calculate_confusion(output, label)
+        confusion = self.eval_record.get_confusion()
         class_num = confusion.shape[0]
 
         if show_percentage:
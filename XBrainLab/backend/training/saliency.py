@@ -0,0 +1,318 @@
+"""On-demand saliency maps of evaluated repeats.
+
+Final evaluation stores only the labels and outputs of a repeat. The
+saliency maps of one method and class are computed by
+:class:`SaliencySource` the first time a visualizer asks for them (see
+:meth:`EvalRecord.get_saliency`), from a model holding the evaluated
+weights that is created once per repeat, and cached as ``.npy`` files in
+the ``saliency`` directory of the repeat. Cache files are keyed by the
+parameters of the method, so changing the saliency parameters never
+returns stale maps.
+
+SmoothGrad, SmoothGrad² and VarGrad are the mean, the mean square and the
+variance of the absolute gradients of the same noisy copies of the input.
+:func:`compute_noise_tunnel` draws the copies once and obtains all three
+statistics from batched forward and backward passes, in chunks of
+``nt_samples_batch_size`` copies sized to a memory budget when it is not
+set (see :func:`get_noise_batch_size`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+import torch
+from captum.attr import Saliency
+
+from ..utils.logger import logger
+from .record.eval import SALIENCY_ATTRIBUTES
+
+if TYPE_CHECKING:
+    from .record import TrainRecord
+    from .training_plan import TrainingPlanHolder
+
+SALIENCY_DIR = "saliency"
+# Memory available to one chunk of noisy copies when
+# ``nt_samples_batch_size`` is not set
+NOISE_MEMORY_BUDGET_MB = 512.0
+# Bytes kept per input element besides the activations: the noisy copy,
+# its gradient and the running sums
+_INPUT_COPIES = 4
+
+# NoiseTunnel type of each smoothed method
+NOISE_TUNNEL_TYPES = {
+    "SmoothGrad": "smoothgrad",
+    "SmoothGrad_Squared": "smoothgrad_sq",
+    "VarGrad": "vargrad",
+}
+
+
+def get_noise_batch_size(
+    model: torch.nn.Module,
+    inputs: torch.Tensor,
+    nt_samples: int,
+    budget_mb: float = NOISE_MEMORY_BUDGET_MB,
+) -> int:
+    """Return how many noisy copies of *inputs* fit in *budget_mb* at once.
+
+    The memory of one epoch is estimated from the outputs of every module
+    in one forward pass of a single epoch (kept for the backward pass)
+    plus the copies of the input itself.
+
+    Args:
+        model: Model in evaluation mode.
+        inputs: Batch of epochs that is copied.
+        nt_samples: Number of noisy copies per epoch.
+        budget_mb: Memory budget in megabytes.
+
+    Returns:
+        Number of copies of the whole batch per pass, between ``1`` and
+        *nt_samples*.
+
+    """
+    activation_bytes = 0
+
+    def count(_module, _inputs, output) -> None:
+        nonlocal activation_bytes
+        if isinstance(output, torch.Tensor):
+            activation_bytes += output.numel() * output.element_size()
+
+    handles = [
+        module.register_forward_hook(count)
+        for module in model.modules()
+        if not list(module.children())
+    ]
+    try:
+        with torch.no_grad():
+            model(inputs[:1])
+    finally:
+        for handle in handles:
+            handle.remove()
+    epoch_bytes = (
+        activation_bytes + _INPUT_COPIES * inputs[:1].numel() * inputs.element_size()
+    )
+    copies = int(budget_mb * 2**20 // max(epoch_bytes * len(inputs), 1))
+    return min(max(copies, 1), nt_samples)
+
+
+def compute_noise_tunnel(
+    model: torch.nn.Module,
+    inputs: torch.Tensor,
+    target: int | list[int],
+    nt_samples: int = 5,
+    stdevs: float = 1.0,
+    nt_samples_batch_size: int | None = None,
+) -> dict[str, torch.Tensor]:
+    """Return SmoothGrad, SmoothGrad² and VarGrad of *inputs* in one pass.
+
+    Each epoch gets *nt_samples* copies with Gaussian noise of standard
+    deviation *stdevs*. The copies are attributed in chunks of
+    *nt_samples_batch_size* copies of the whole batch, with one forward
+    and one backward pass per chunk; the absolute gradients are summed and
+    squared-summed on the fly. The results match
+    :class:`captum.attr.NoiseTunnel` over :class:`captum.attr.Saliency`.
+
+    Args:
+        model: Model in evaluation mode.
+        inputs: Batch of epochs.
+        target: Class (or one class per epoch) the maps explain.
+        nt_samples: Number of noisy copies per epoch.
+        stdevs: Standard deviation of the noise.
+        nt_samples_batch_size: Copies per pass; ``None`` sizes the chunks
+            to :data:`NOISE_MEMORY_BUDGET_MB`.
+
+    Returns:
+        Mapping of ``"SmoothGrad"``, ``"SmoothGrad_Squared"`` and
+        ``"VarGrad"`` to tensors shaped like *inputs*.
+
+    """
+    inputs = inputs.detach()
+    batch = len(inputs)
+    targets = torch.as_tensor(target, device=inputs.device).expand(batch)
+    if nt_samples_batch_size is None:
+        nt_samples_batch_size = get_noise_batch_size(model, inputs, nt_samples)
+    total = torch.zeros_like(inputs, dtype=torch.float32)
+    total_sq = torch.zeros_like(inputs, dtype=torch.float32)
+    for start in range(0, nt_samples, nt_samples_batch_size):
+        copies = min(nt_samples_batch_size, nt_samples - start)
+        noisy = inputs.unsqueeze(0) + stdevs * torch.randn(
+            (copies, *inputs.shape), device=inputs.device, dtype=inputs.dtype
+        )
+        noisy = noisy.reshape(copies * batch, *inputs.shape[1:]).requires_grad_()
+        with torch.enable_grad():
+            outputs = model(noisy)
+            selected = outputs.gather(1, targets.repeat(copies)[:, None]).sum()
+            (gradient,) = torch.autograd.grad(selected, noisy)
+        attribution = gradient.abs().float().reshape(copies, *inputs.shape)
+        total += attribution.sum(dim=0)
+        total_sq += attribution.square().sum(dim=0)
+    mean = total / nt_samples
+    mean_sq = total_sq / nt_samples
+    return {
+        "SmoothGrad": mean,
+        "SmoothGrad_Squared": mean_sq,
+        "VarGrad": mean_sq - mean.square(),
+    }
+
+
+def get_shared_methods(method: str, saliency_params: dict) -> list[str]:
+    """Return the NoiseTunnel methods computed in the same pass as *method*.
+
+    Methods share a pass when their parameters are identical.
+    """
+    return [
+        other
+        for other in NOISE_TUNNEL_TYPES
+        if saliency_params.get(other) == saliency_params.get(method)
+    ]
+
+
+def compute_saliency(
+    model: torch.nn.Module,
+    inputs: torch.Tensor,
+    target: int | list[int],
+    method: str,
+    saliency_params: dict,
+) -> torch.Tensor:
+    """Return the saliency maps of *inputs* for one attribution method.
+
+    Args:
+        model: Model in evaluation mode.
+        inputs: Batch of epochs.
+        target: Class (or one class per epoch) the maps explain.
+        method: Key of :data:`~.record.eval.SALIENCY_ATTRIBUTES`.
+        saliency_params: Parameters of the NoiseTunnel methods, keyed by
+            method name.
+
+    Returns:
+        Tensor shaped like *inputs*.
+
+    Raises:
+        ValueError: If *method* is unknown.
+
+    """
+    if method in ("Gradient", "Gradient * Input"):
+        gradient = Saliency(model).attribute(inputs, target=target, abs=False)
+        if method == "Gradient * Input":
+            return gradient * inputs.detach()
+        return gradient
+    if method in NOISE_TUNNEL_TYPES:
+        return compute_noise_tunnel(model, inputs, target, **saliency_params[method])[
+            method
+        ]
+    raise ValueError(f"Unknown saliency method: {method}")
+
+
+class SaliencySource:
+    """Computes the saliency maps of one repeat when they are requested.
+
+    Instances are attached to :attr:`EvalRecord.saliency_source` by
+    :class:`~.training_plan.TrainingPlanHolder` and are not pickled with
+    the record.
+
+    Attributes:
+        plan: Plan providing the evaluated weights, data and parameters.
+        train_record: The repeat.
+
+    """
+
+    def __init__(self, plan: TrainingPlanHolder, train_record: TrainRecord):
+        self.plan = plan
+        self.train_record = train_record
+        # Model with the evaluated weights, reused by later requests
+        self._model: torch.nn.Module | None = None
+
+    def __call__(self, method: str, label_index: int) -> np.ndarray:
+        """Return the maps of *method* for the evaluation epochs of a class.
+
+        The NoiseTunnel methods sharing the parameters of *method* are
+        computed in the same pass and written to the cache as well.
+
+        Raises:
+            ValueError: If the method is unknown or the repeat has no
+                evaluated weights.
+
+        """
+        if method not in SALIENCY_ATTRIBUTES:
+            raise ValueError(f"Unknown saliency method: {method}")
+        path = self.get_cache_path(method, label_index)
+        if path is not None and os.path.exists(path):
+            try:
+                return np.load(path)
+            except (OSError, ValueError):
+                logger.warning("Ignoring unreadable saliency cache %s", path)
+        maps = self._compute(method, label_index)
+        for computed, saliency in maps.items():
+            self._save(self.get_cache_path(computed, label_index), saliency)
+        return maps[method]
+
+    def get_cache_path(self, method: str, label_index: int) -> str | None:
+        """Return the cache file of *method* and a class, or ``None``.
+
+        The file name contains a digest of the parameters of the method.
+        Records without an output directory are not cached.
+        """
+        if not self.train_record.target_path:
+            return None
+        params = self.plan.get_saliency_params().get(method) or {}
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode(),
+            usedforsecurity=False,
+        ).hexdigest()[:12]
+        return os.path.join(
+            self.train_record.target_path,
+            SALIENCY_DIR,
+            f"{SALIENCY_ATTRIBUTES[method]}-{label_index}-{digest}.npy",
+        )
+
+    @staticmethod
+    def _save(path: str | None, saliency: np.ndarray) -> None:
+        if path is None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, saliency)
+        os.replace(tmp_path, path)
+
+    def _compute(self, method: str, label_index: int) -> dict[str, np.ndarray]:
+        """Return the maps of *method* and of the methods sharing its pass."""
+        model, data_loader = self.plan.get_saliency_pair(self.train_record, self._model)
+        self._model = model
+        if model is None or data_loader is None:
+            raise ValueError(
+                f"{self.train_record.get_name()} has no evaluated weights or data"
+            )
+        precision = self.plan.get_mixed_precision()
+        saliency_params = self.plan.get_saliency_params()
+        if method in NOISE_TUNNEL_TYPES:
+            methods = get_shared_methods(method, saliency_params)
+        else:
+            methods = [method]
+        maps: dict[str, list[np.ndarray]] = {name: [] for name in methods}
+        for inputs, labels in data_loader:
+            mask = labels == label_index
+            if not bool(mask.any()):
+                continue
+            with precision.autocast():
+                if method in NOISE_TUNNEL_TYPES:
+                    batch_maps = compute_noise_tunnel(
+                        model, inputs[mask], label_index, **saliency_params[method]
+                    )
+                else:
+                    batch_maps = {
+                        method: compute_saliency(
+                            model, inputs[mask], label_index, method, saliency_params
+                        )
+                    }
+            for name in methods:
+                maps[name].append(batch_maps[name].detach().float().cpu().numpy())
+        if not maps[method]:
+            shape = self.plan.get_dataset().get_epoch_data().get_data().shape[1:]
+            empty = np.empty((0, *shape), dtype=np.float32)
+            return dict.fromkeys(methods, empty)
+        return {name: np.concatenate(batches) for name, batches in maps.items()}
@@ -0,0 +1,181 @@
+"""Running statistics of saliency maps across the repeats of a plan.
+
+:class:`SaliencyAggregator` keeps, for every requested saliency method and
+class, the element-wise mean and variance over the evaluated repeats of a
+:class:`~.training_plan.TrainingPlanHolder`. The maps of each repeat are
+folded in one at a time with Welford's algorithm and never stacked, so
+memory does not grow with the number of repeats. Repeats that finish later
+are added on the next request; the statistics are rebuilt only when an
+included repeat is evaluated again or the saliency parameters change.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .record import EvalRecord
+    from .training_plan import TrainingPlanHolder
+
+
+class RunningStatistics:
+    """Element-wise mean and variance of equally shaped arrays.
+
+    Attributes:
+        count: Number of arrays added.
+        mean: Running mean (``float64``), or ``None`` before the first array.
+        m2: Running sum of squared differences from the mean.
+        dtype: Data type of the first array, used for the results.
+
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean: np.ndarray | None = None
+        self.m2: np.ndarray | None = None
+        self.dtype: np.dtype | None = None
+
+    def update(self, array: np.ndarray) -> None:
+        """Add *array* to the statistics.
+
+        Raises:
+            ValueError: If the shape differs from the arrays added before.
+
+        """
+        values = np.asarray(array, dtype=np.float64)
+        if self.mean is None:
+            self.count = 1
+            self.mean = values.copy()
+            self.m2 = np.zeros_like(values)
+            self.dtype = np.asarray(array).dtype
+            return
+        if values.shape != self.mean.shape:
+            raise ValueError(
+                f"Cannot aggregate saliency of shape {values.shape} "
+                f"with {self.mean.shape}"
+            )
+        self.count += 1
+        delta = values - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (values - self.mean)
+
+    def get_mean(self) -> np.ndarray:
+        """Return the mean of the arrays added so far."""
+        if self.mean is None:
+            raise ValueError("No array has been added")
+        return self.mean.astype(self._result_dtype())
+
+    def get_std(self, ddof: int = 1) -> np.ndarray:
+        """Return the standard deviation of the arrays added so far.
+
+        Args:
+            ddof: Delta degrees of freedom; with ``count <= ddof`` the
+                deviation is zero.
+
+        """
+        if self.m2 is None:
+            raise ValueError("No array has been added")
+        if self.count <= ddof:
+            return np.zeros_like(self.m2, dtype=self._result_dtype())
+        return np.sqrt(self.m2 / (self.count - ddof)).astype(self._result_dtype())
+
+    def _result_dtype(self) -> np.dtype:
+        if self.dtype is not None and np.issubdtype(self.dtype, np.floating):
+            return self.dtype
+        return np.dtype(np.float64)
+
+
+class SaliencyAggregator:
+    """Mean and across-repeat variability of the saliency maps of a plan.
+
+    Statistics are computed per method and class when first requested,
+    from the evaluation records of the plan's repeats (see
+    :meth:`EvalRecord.get_saliency`). Methods are safe to call from
+    several threads.
+
+    Attributes:
+        plan: Weak reference to the plan.
+
+    """
+
+    def __init__(self, plan: TrainingPlanHolder):
+        self.plan = weakref.ref(plan)
+        self._stats: dict[tuple[str, int], RunningStatistics] = {}
+        # Evaluation records and saliency parameters behind each statistic
+        self._members: dict[tuple[str, int], list[EvalRecord]] = {}
+        self._params: dict[tuple[str, int], str] = {}
+        self._lock = threading.Lock()
+
+    def get_eval_records(self) -> list[EvalRecord]:
+        """Return the evaluation records of the evaluated repeats."""
+        plan = self.plan()
+        if plan is None:
+            return []
+        eval_records = []
+        for train_record in plan.get_plans():
+            eval_record = train_record.get_eval_record()
+            if eval_record is not None:
+                eval_records.append(eval_record)
+        return eval_records
+
+    def get_mean(self, method: str, label_index: int) -> np.ndarray:
+        """Return the mean maps of *method* for a class over the repeats."""
+        return self.update(method, label_index).get_mean()
+
+    def get_std(self, method: str, label_index: int) -> np.ndarray:
+        """Return the standard deviation of the maps across the repeats."""
+        return self.update(method, label_index).get_std()
+
+    def get_count(self, method: str, label_index: int) -> int:
+        """Return the number of repeats aggregated for *method* and a class."""
+        with self._lock:
+            stats = self._stats.get((method, label_index))
+            return 0 if stats is None else stats.count
+
+    def update(self, method: str, label_index: int) -> RunningStatistics:
+        """Add the repeats evaluated since the last request and return the stats.
+
+        Raises:
+            ValueError: If no repeat is evaluated or the maps of the repeats
+                differ in shape.
+
+        """
+        key = (method, label_index)
+        eval_records = self.get_eval_records()
+        if not eval_records:
+            raise ValueError("No evaluated repeat to aggregate")
+        params = self._get_params_key(method)
+        with self._lock:
+            members = self._members.get(key, [])
+            if self._params.get(key) != params or any(
+                not any(member is r for r in eval_records) for member in members
+            ):
+                self._stats.pop(key, None)
+                members = []
+            stats = self._stats.setdefault(key, RunningStatistics())
+            self._members[key] = members
+            self._params[key] = params
+            for eval_record in eval_records:
+                if not any(eval_record is member for member in members):
+                    stats.update(eval_record.get_saliency(method, label_index))
+                    members.append(eval_record)
+            return stats
+
+    def reset(self) -> None:
+        """Drop all statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._members.clear()
+            self._params.clear()
+
+    def _get_params_key(self, method: str) -> str:
+        plan = self.plan()
+        params = plan.get_saliency_params() if plan is not None else None
+        if isinstance(params, dict):
+            params = params.get(method)
+        return json.dumps(params, sort_keys=True, default=str)
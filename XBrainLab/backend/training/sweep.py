@@ -0,0 +1,654 @@
+"""Hyperparameter sweeps over training options and model arguments.
+
+A :class:`Sweep` turns a :class:`SearchSpace` into one
+:class:`~.training_plan.TrainingPlanHolder` per configuration (a
+:class:`SweepTrial`) and trains them with a :class:`~.trainer.Trainer`.
+Grid and random search train every trial for the full
+:attr:`TrainingOption.epoch` budget. Successive halving and Hyperband train
+all trials for a few epochs, keep the best ``1 / eta`` of them, and continue
+only those for ``eta`` times as many epochs, so weak trials are pruned
+after a small share of the budget. A continued trial resumes from the end
+of its previous rung instead of starting over.
+"""
+
+from __future__ import annotations
+
+import copy
+import csv
+import datetime
+import inspect
+import itertools
+import math
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import numpy as np
+
+from ..dataset import Dataset
+from ..utils import validate_type
+from .model_holder import ModelHolder
+from .option import TrainingOption
+from .record import RecordKey
+from .trainer import Trainer
+from .training_plan import TrainingPlanHolder
+
+MODEL_PREFIX = "model."
+"""Prefix of search-space keys that set a model argument."""
+
+
+class SweepStrategy(Enum):
+    """Enumeration of search strategies.
+
+    Attributes:
+        GRID: Train every combination of the choices for the full budget.
+        RANDOM: Train randomly sampled configurations for the full budget.
+        SUCCESSIVE_HALVING: Train sampled configurations (or the grid) on a
+            growing budget, keeping the best ``1 / eta`` after each rung.
+        HYPERBAND: Run successive halving in several brackets trading off
+            the number of configurations against their initial budget.
+
+    """
+
+    GRID = "Grid search"
+    RANDOM = "Random search"
+    SUCCESSIVE_HALVING = "Successive halving"
+    HYPERBAND = "Hyperband"
+
+
+class SweepObjective(Enum):
+    """Enumeration of metrics used to rank trials.
+
+    Each trial is scored by the mean over its repeats of the best
+    validation value. Without validation data the training value of the
+    last epoch is used instead.
+
+    Attributes:
+        VAL_LOSS: Lowest validation loss.
+        VAL_ACC: Highest validation accuracy.
+        VAL_AUC: Highest validation AUC.
+
+    """
+
+    VAL_LOSS = "Validation loss"
+    VAL_ACC = "Validation accuracy"
+    VAL_AUC = "Validation AUC"
+
+
+_OBJECTIVE_KEY = {
+    SweepObjective.VAL_LOSS: RecordKey.LOSS,
+    SweepObjective.VAL_ACC: RecordKey.ACC,
+    SweepObjective.VAL_AUC: RecordKey.AUC,
+}
+
+
+class TrialStatus(Enum):
+    """Enumeration of trial states.
+
+    Attributes:
+        PENDING: Not trained yet.
+        RUNNING: Trained in the current rung.
+        PRUNED: Stopped by successive halving.
+        COMPLETE: Trained for the full budget.
+        FAILED: Training raised an error.
+
+    """
+
+    PENDING = "Pending"
+    RUNNING = "Running"
+    PRUNED = "Pruned"
+    COMPLETE = "Complete"
+    FAILED = "Failed"
+
+
+@dataclass(frozen=True)
+class Uniform:
+    """Continuous parameter sampled uniformly from ``[low, high]``."""
+
+    low: float
+    high: float
+
+    def sample(self, rng: np.random.Generator) -> float:
+        """Draw one value."""
+        return float(rng.uniform(self.low, self.high))
+
+
+@dataclass(frozen=True)
+class LogUniform:
+    """Positive parameter sampled uniformly on a log scale (e.g. the lr)."""
+
+    low: float
+    high: float
+
+    def sample(self, rng: np.random.Generator) -> float:
+        """Draw one value."""
+        return float(np.exp(rng.uniform(np.log(self.low), np.log(self.high))))
+
+
+class SearchSpace:
+    """Values to explore for training options and model arguments.
+
+    Keys are :class:`TrainingOption` argument names (e.g. ``"lr"``,
+    ``"bs"``, ``"optim"``) or model arguments prefixed with
+    :data:`MODEL_PREFIX` (e.g. ``"model.F1"``). Values are a sequence of
+    choices, or a :class:`Uniform` / :class:`LogUniform` range that can
+    only be sampled.
+
+    Example::
+
+        SearchSpace({
+            "lr": LogUniform(1e-4, 1e-1),
+            "optim": [torch.optim.Adam, torch.optim.SGD],
+            "model.F1": [8, 16],
+        })
+
+    Attributes:
+        params: Mapping of parameter name to its choices or range.
+
+    """
+
+    def __init__(self, params: Mapping[str, Sequence[Any] | Uniform | LogUniform]):
+        """Validate the parameter names and values.
+
+        Args:
+            params: Mapping of parameter name to its choices or range.
+
+        Raises:
+            ValueError: If the space is empty, a name is not a training
+                option or model argument, or a choice list is empty.
+
+        """
+        if not params:
+            raise ValueError("Search space is empty")
+        option_args = set(inspect.signature(TrainingOption).parameters)
+        option_args.discard("output_dir")
+        self.params: dict[str, Sequence[Any] | Uniform | LogUniform] = {}
+        for name, values in params.items():
+            if not name.startswith(MODEL_PREFIX) and name not in option_args:
+                raise ValueError(f"Unknown sweep parameter: {name}")
+            if isinstance(values, Uniform | LogUniform):
+                self.params[name] = values
+                continue
+            if not values:
+                raise ValueError(f"No values given for sweep parameter {name}")
+            self.params[name] = list(values)
+
+    def is_discrete(self) -> bool:
+        """Return whether every parameter is a list of choices."""
+        return not any(
+            isinstance(v, Uniform | LogUniform) for v in self.params.values()
+        )
+
+    def grid(self) -> Iterator[dict[str, Any]]:
+        """Iterate over every combination of the choices.
+
+        Raises:
+            ValueError: If a parameter is a continuous range.
+
+        """
+        if not self.is_discrete():
+            raise ValueError("Grid search requires a list of values per parameter")
+        names = list(self.params)
+        choices = [self.params[name] for name in names]
+        for values in itertools.product(*choices):  # type: ignore[arg-type]
+            yield dict(zip(names, values, strict=True))
+
+    def sample(self, rng: np.random.Generator) -> dict[str, Any]:
+        """Draw one configuration.
+
+        Args:
+            rng: Random generator of the sweep.
+
+        """
+        config = {}
+        for name, values in self.params.items():
+            if isinstance(values, Uniform | LogUniform):
+                config[name] = values.sample(rng)
+            else:
+                config[name] = values[rng.integers(len(values))]
+        return config
+
+
+class SweepTrial:
+    """One configuration of a sweep and the plan training it.
+
+    Attributes:
+        trial_id: Index of the trial in the sweep.
+        params: The sampled configuration.
+        plan: Training plan of the configuration, created on first use.
+        status: :class:`TrialStatus` of the trial.
+        bracket: Hyperband bracket of the trial (``0`` otherwise).
+        score: Latest objective value, ``None`` before training.
+        error: Why the configuration could not be trained, if it failed.
+
+    """
+
+    def __init__(self, trial_id: int, params: dict[str, Any], bracket: int = 0):
+        self.trial_id = trial_id
+        self.params = params
+        self.bracket = bracket
+        self.plan: TrainingPlanHolder | None = None
+        self.status = TrialStatus.PENDING
+        self.score: float | None = None
+        self.error: str | None = None
+
+    def get_epoch(self) -> int:
+        """Return the number of epochs trained by each repeat."""
+        if self.plan is None:
+            return 0
+        return max(record.get_epoch() for record in self.plan.get_plans())
+
+    def get_budget(self) -> int:
+        """Return the number of epochs trained over all repeats."""
+        if self.plan is None:
+            return 0
+        return sum(record.get_epoch() for record in self.plan.get_plans())
+
+
+class Sweep:
+    """Hyperparameter search training one plan per configuration.
+
+    Attributes:
+        model_holder: Model of every trial; model arguments in the search
+            space override its :attr:`ModelHolder.model_params_map`.
+        dataset: Dataset shared by all trials.
+        option: Base training option. :attr:`TrainingOption.epoch` is the
+            full budget of one trial.
+        space: :class:`SearchSpace` to explore.
+        strategy: :class:`SweepStrategy` of the search.
+        objective: :class:`SweepObjective` ranking the trials.
+        n_trials: Number of sampled configurations (random search and
+            successive halving).
+        min_epoch: Budget of the first successive-halving rung.
+        eta: Fraction ``1 / eta`` of the trials kept after each rung.
+        trials: Trials created so far.
+        sweep_id: Prefix of the plan ids of the trials.
+
+    """
+
+    def __init__(
+        self,
+        model_holder: ModelHolder,
+        dataset: Dataset,
+        option: TrainingOption,
+        space: SearchSpace,
+        strategy: SweepStrategy | str = SweepStrategy.GRID,
+        objective: SweepObjective | str = SweepObjective.VAL_LOSS,
+        n_trials: int | None = None,
+        min_epoch: int = 1,
+        eta: int = 3,
+        seed: int | None = None,
+        saliency_params: dict | None = None,
+    ):
+        """Validate the sweep settings.
+
+        Args:
+            model_holder: Model of every trial.
+            dataset: Dataset shared by all trials.
+            option: Base training option; its ``epoch`` is the maximum
+                budget of a trial.
+            space: Parameters to explore.
+            strategy: Search strategy. Defaults to grid search.
+            objective: Metric ranking the trials. Defaults to the
+                validation loss.
+            n_trials: Number of configurations sampled by random search and
+                successive halving. Successive halving uses the grid when
+                ``None``. Ignored by grid search and Hyperband.
+            min_epoch: Smallest number of epochs a trial is trained before
+                it can be pruned. Defaults to ``1``.
+            eta: Pruning rate of successive halving and Hyperband.
+                Defaults to ``3``.
+            seed: Seed of the configuration sampler.
+            saliency_params: Saliency parameters of the trial plans.
+
+        Raises:
+            ValueError: If a setting is invalid, e.g. random search without
+                ``n_trials`` or a budget-based strategy searching ``epoch``.
+
+        """
+        validate_type(model_holder, ModelHolder, "model_holder")
+        validate_type(option, TrainingOption, "option")
+        validate_type(space, SearchSpace, "space")
+        self.model_holder = model_holder
+        self.dataset = dataset
+        self.option = option
+        self.space = space
+        self.strategy = SweepStrategy(strategy)
+        self.objective = SweepObjective(objective)
+        self.n_trials = n_trials
+        self.min_epoch = int(min_epoch)
+        self.eta = int(eta)
+        self.saliency_params = saliency_params
+        self.trials: list[SweepTrial] = []
+        self.sweep_id = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.trainer: Trainer | None = None
+        self._rng = np.random.default_rng(seed)
+        self._interrupt = threading.Event()
+
+        if n_trials is not None and n_trials <= 0:
+            raise ValueError("Invalid n_trials (must be a positive integer)")
+        if self.strategy == SweepStrategy.RANDOM and n_trials is None:
+            raise ValueError("Random search requires n_trials")
+        if self.strategy in (SweepStrategy.SUCCESSIVE_HALVING, SweepStrategy.HYPERBAND):
+            if "epoch" in space.params:
+                raise ValueError(f"{self.strategy.value} uses epoch as its budget")
+            if not 1 <= self.min_epoch <= option.epoch:
+                raise ValueError("Invalid min_epoch (must be between 1 and epoch)")
+            if self.eta < 2:
+                raise ValueError("Invalid eta (must be at least 2)")
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Train the trials of the sweep in the calling thread.
+
+        Stops after the current plan when :meth:`set_interrupt` is called.
+        """
+        self._interrupt.clear()
+        if self.strategy == SweepStrategy.GRID:
+            self._run_full(list(self.space.grid()))
+        elif self.strategy == SweepStrategy.RANDOM:
+            self._run_full([self._sample() for _ in range(self.n_trials or 0)])
+        elif self.strategy == SweepStrategy.SUCCESSIVE_HALVING:
+            if self.n_trials is None:
+                configs = list(self.space.grid())
+            else:
+                configs = [self._sample() for _ in range(self.n_trials)]
+            n_rungs = self._get_max_rungs()
+            self._run_bracket(self._add_trials(configs), self._rung_budgets(n_rungs))
+        else:
+            self._run_hyperband()
+
+    def _run_full(self, configs: list[dict[str, Any]]) -> None:
+        """Train every configuration for the full budget."""
+        self._run_bracket(self._add_trials(configs), [self.option.epoch])
+
+    def _run_hyperband(self) -> None:
+        """Run one successive-halving bracket per trade-off.
+
+        Bracket ``s`` starts ``ceil((s_max + 1) / (s + 1) * eta**s)``
+        configurations on ``epoch / eta**s`` epochs, so every bracket uses
+        a similar total budget.
+        """
+        s_max = self._get_max_rungs() - 1
+        for s in range(s_max, -1, -1):
+            if self._interrupt.is_set():
+                return
+            n = math.ceil((s_max + 1) / (s + 1) * self.eta**s)
+            configs = [self._sample() for _ in range(n)]
+            self._run_bracket(
+                self._add_trials(configs, bracket=s),
+                self._rung_budgets(s + 1),
+            )
+
+    def _run_bracket(self, trials: list[SweepTrial], budgets: list[int]) -> None:
+        """Train *trials* on growing budgets, pruning after every rung.
+
+        Args:
+            trials: Trials of the bracket.
+            budgets: Increasing number of epochs of each rung; the last one
+                is the full budget.
+
+        """
+        alive = trials
+        for rung, budget in enumerate(budgets):
+            if self._interrupt.is_set() or not alive:
+                return
+            plans = []
+            for trial in alive:
+                plan = self._get_plan(trial)
+                if plan is None:
+                    continue
+                plan.option.epoch = budget
+                trial.status = TrialStatus.RUNNING
+                plans.append(plan)
+            self.trainer = Trainer(plans)
+            self.trainer.run()
+
+            for trial in alive:
+                self._update_trial(trial)
+            if self._interrupt.is_set():
+                return
+            alive = [t for t in alive if t.status == TrialStatus.RUNNING]
+            if rung == len(budgets) - 1:
+                break
+            alive = self._prune(alive)
+        for trial in alive:
+            trial.status = TrialStatus.COMPLETE
+
+    def _prune(self, trials: list[SweepTrial]) -> list[SweepTrial]:
+        """Keep the best ``1 / eta`` of *trials* (at least one)."""
+        ranked = sorted(trials, key=self._rank_key)
+        keep = max(1, len(ranked) // self.eta)
+        for trial in ranked[keep:]:
+            trial.status = TrialStatus.PRUNED
+        return ranked[:keep]
+
+    def _rank_key(self, trial: SweepTrial) -> tuple[bool, float]:
+        """Sort key placing better scores first and unscored trials last."""
+        if trial.score is None:
+            return True, 0.0
+        if self.objective == SweepObjective.VAL_LOSS:
+            return False, trial.score
+        return False, -trial.score
+
+    def _get_max_rungs(self) -> int:
+        """Return the number of rungs from :attr:`min_epoch` to the full budget."""
+        n_rungs = 1
+        while self.min_epoch * self.eta**n_rungs <= self.option.epoch:
+            n_rungs += 1
+        return n_rungs
+
+    def _rung_budgets(self, n_rungs: int) -> list[int]:
+        """Return the epochs of *n_rungs* rungs ending at the full budget."""
+        budgets = [
+            max(1, round(self.option.epoch / self.eta ** (n_rungs - 1 - i)))
+            for i in range(n_rungs)
+        ]
+        return sorted(set(budgets))
+
+    # ------------------------------------------------------------------
+    # Trials
+    # ------------------------------------------------------------------
+
+    def _sample(self) -> dict[str, Any]:
+        return self.space.sample(self._rng)
+
+    def _add_trials(
+        self,
+        configs: list[dict[str, Any]],
+        bracket: int = 0,
+    ) -> list[SweepTrial]:
+        trials = [
+            SweepTrial(len(self.trials) + i, config, bracket)
+            for i, config in enumerate(configs)
+        ]
+        self.trials.extend(trials)
+        return trials
+
+    def _get_plan(self, trial: SweepTrial) -> TrainingPlanHolder | None:
+        """Return the plan of *trial*, creating it on first use.
+
+        Returns:
+            The plan, or ``None`` if the configuration is invalid, in which
+            case the trial is marked as failed.
+
+        """
+        if trial.plan is not None:
+            return trial.plan
+        option = copy.deepcopy(self.option)
+        # Rungs raise option.epoch; the LR schedule spans the full budget
+        option.schedule_epoch = self.option.epoch
+        model_params = dict(self.model_holder.model_params_map)
+        for name, value in trial.params.items():
+            if name.startswith(MODEL_PREFIX):
+                model_params[name[len(MODEL_PREFIX) :]] = value
+            else:
+                setattr(option, name, value)
+        model_holder = ModelHolder(
+            self.model_holder.target_model,
+            model_params,
+            self.model_holder.pretrained_weight_path,
+            self.model_holder.compile_mode,
+        )
+        try:
+            trial.plan = TrainingPlanHolder(
+                model_holder,
+                self.dataset,
+                option,
+                self.saliency_params,
+                plan_id=f"{self.sweep_id}-trial{trial.trial_id}",
+            )
+        except ValueError as e:
+            trial.status = TrialStatus.FAILED
+            trial.plan = None
+            trial.error = str(e)
+        return trial.plan
+
+    def _update_trial(self, trial: SweepTrial) -> None:
+        """Score *trial* and mark it as failed if its plan raised an error."""
+        if trial.plan is None:
+            return
+        if trial.plan.error:
+            trial.status = TrialStatus.FAILED
+            trial.error = trial.plan.error
+        trial.score = self.get_score(trial.plan)
+
+    def get_score(self, plan: TrainingPlanHolder) -> float | None:
+        """Return the :attr:`objective` of *plan*, averaged over its repeats.
+
+        Args:
+            plan: A trained plan.
+
+        Returns:
+            The score, or ``None`` if no repeat has trained an epoch.
+
+        """
+        key = _OBJECTIVE_KEY[self.objective]
+        values = []
+        for record in plan.get_plans():
+            if record.best_record[f"best_val_{key}_epoch"] is not None:
+                values.append(record.best_record[f"best_val_{key}"])
+                continue
+            train_values = [v for v in record.train[key] if v is not None]
+            if train_values:
+                values.append(train_values[-1])
+        if not values:
+            return None
+        return float(np.mean(values))
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def get_best_trial(self) -> SweepTrial | None:
+        """Return the best scored trial that was not pruned or failed."""
+        candidates = [
+            t
+            for t in self.trials
+            if t.score is not None
+            and t.status in (TrialStatus.COMPLETE, TrialStatus.RUNNING)
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=self._rank_key)
+
+    def get_table(self) -> list[dict[str, Any]]:
+        """Return one comparison row per trial, best first.
+
+        Each row holds the trial id, status, Hyperband bracket, epochs per
+        repeat, total epochs over repeats, the objective score, the mean
+        best validation loss, accuracy and AUC, and one column per search
+        parameter. Classes (e.g. optimizers) are shown by name.
+
+        Returns:
+            A list of rows; missing values are ``None``.
+
+        """
+        order = {
+            TrialStatus.COMPLETE: 0,
+            TrialStatus.RUNNING: 0,
+            TrialStatus.PRUNED: 1,
+            TrialStatus.PENDING: 2,
+            TrialStatus.FAILED: 3,
+        }
+        trials = sorted(
+            self.trials,
+            key=lambda t: (order[t.status], -t.get_epoch(), self._rank_key(t)),
+        )
+        rows = []
+        for trial in trials:
+            row: dict[str, Any] = {
+                "trial": trial.trial_id,
+                "status": trial.status.value,
+                "bracket": trial.bracket,
+                "epochs": trial.get_epoch(),
+                "budget": trial.get_budget(),
+                "score": trial.score,
+            }
+            for key in (RecordKey.LOSS, RecordKey.ACC, RecordKey.AUC):
+                row[f"val_{key}"] = self._get_best_val(trial, key)
+            for name in self.space.params:
+                row[name] = _format_value(trial.params[name])
+            rows.append(row)
+        return rows
+
+    def export_table(self, path: str) -> None:
+        """Write :meth:`get_table` to a CSV file.
+
+        Args:
+            path: Destination file path.
+
+        """
+        rows = self.get_table()
+        if not rows:
+            return
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    @staticmethod
+    def _get_best_val(trial: SweepTrial, key: str) -> float | None:
+        if trial.plan is None:
+            return None
+        values = [
+            record.best_record[f"best_val_{key}"]
+            for record in trial.plan.get_plans()
+            if record.best_record[f"best_val_{key}_epoch"] is not None
+        ]
+        if not values:
+            return None
+        return float(np.mean(values))
+
+    # ------------------------------------------------------------------
+    # Interrupt / progress
+    # ------------------------------------------------------------------
+
+    def set_interrupt(self) -> None:
+        """Stop the sweep; the running plan is interrupted as well."""
+        self._interrupt.set()
+        if self.trainer is not None:
+            self.trainer.set_interrupt()
+
+    def get_progress_text(self) -> str:
+        """Return the trial counts and the trainer's progress."""
+        counts = dict.fromkeys(TrialStatus, 0)
+        for trial in self.trials:
+            counts[trial.status] += 1
+        done = counts[TrialStatus.COMPLETE] + counts[TrialStatus.PRUNED]
+        text = f"{done} / {len(self.trials)} trials"
+        if self.trainer is not None:
+            text += f" - {self.trainer.get_progress_text()}"
+        return text
+
+
+def _format_value(value: Any) -> Any:
+    """Return a table-friendly representation of a parameter value."""
+    if isinstance(value, type):
+        return value.__name__
+    return value
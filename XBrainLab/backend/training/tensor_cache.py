@@ -0,0 +1,176 @@
+"""Device-resident tensor cache for dataset splits that fit in memory.
+
+Converts the train/val/test splits of the shared epoch array to torch
+tensors on the training device once per
+:class:`~XBrainLab.backend.training.training_plan.TrainingPlanHolder`,
+so every epoch of every repeat is served by indexing those tensors
+instead of re-converting NumPy slices.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TypeAlias
+
+import numpy as np
+import torch
+import torch.utils.data as torch_data
+
+_FLOAT_BYTES = 4
+_LABEL_BYTES = 8
+
+
+def estimate_cache_bytes(data: np.ndarray, n_samples: int) -> int:
+    """Estimate the memory needed to cache *n_samples* epochs as tensors.
+
+    Args:
+        data: Full epoch array of shape ``(N, ...)``.
+        n_samples: Number of samples that will be cached.
+
+    Returns:
+        Estimated size in bytes (``float32`` inputs plus ``int64`` labels).
+
+    """
+    sample_size = math.prod(data.shape[1:])
+    return n_samples * (sample_size * _FLOAT_BYTES + _LABEL_BYTES)
+
+
+class CachedTensorLoader:
+    """Batch iterator over tensors already resident on the target device.
+
+    Mirrors the parts of :class:`torch.utils.data.DataLoader` used by the
+    training loop (iteration, ``len`` and ``batch_size``). Shuffled epochs
+    are served by a fresh index permutation drawn from the global torch
+    RNG, so ordering follows the seed of the active :class:`TrainRecord`.
+
+    Attributes:
+        inputs: Input tensor of shape ``(n, ...)`` on the target device.
+        labels: Label tensor of shape ``(n,)`` on the target device.
+        batch_size: Number of samples per batch.
+        shuffle: Whether each epoch uses a new random permutation.
+
+    """
+
+    def __init__(
+        self,
+        inputs: torch.Tensor,
+        labels: torch.Tensor,
+        batch_size: int,
+        shuffle: bool = False,
+    ):
+        self.inputs = inputs
+        self.labels = labels
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+
+    def __len__(self) -> int:
+        """Return the number of batches per epoch."""
+        return math.ceil(len(self.labels) / self.batch_size)
+
+    def __iter__(self):
+        """Yield ``(inputs, labels)`` batches for one epoch."""
+        n = len(self.labels)
+        if not self.shuffle:
+            for start in range(0, n, self.batch_size):
+                end = start + self.batch_size
+                yield self.inputs[start:end], self.labels[start:end]
+            return
+
+        order = torch.randperm(n).to(self.labels.device)
+        for start in range(0, n, self.batch_size):
+            batch_idx = order[start : start + self.batch_size]
+            yield self.inputs[batch_idx], self.labels[batch_idx]
+
+
+BatchLoader: TypeAlias = "torch_data.DataLoader | CachedTensorLoader"
+"""Any loader yielding ``(inputs, labels)`` batches to the training loop."""
+
+
+class TensorCache:
+    """Split tensors converted once and shared by all loaders of a plan.
+
+    Attributes:
+        device: Device the tensors live on.
+        splits: Mapping of split name to ``(inputs, labels)`` tensors, or
+            ``None`` for empty splits.
+
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        labels: np.ndarray,
+        split_indices: dict[str, np.ndarray],
+        device: str,
+    ):
+        """Convert each split to tensors on *device*.
+
+        Args:
+            data: Full epoch array of shape ``(N, ...)``.
+            labels: Full label array of shape ``(N,)``.
+            split_indices: Mapping of split name to sample indices.
+            device: Target PyTorch device string.
+
+        """
+        self.device = device
+        self.splits: dict[str, tuple[torch.Tensor, torch.Tensor] | None] = {}
+        for name, indices in split_indices.items():
+            if len(indices) == 0:
+                self.splits[name] = None
+                continue
+            inputs = np.take(data, indices, axis=0).astype(np.float32, copy=False)
+            targets = np.take(labels, indices).astype(np.int64, copy=False)
+            self.splits[name] = (
+                torch.from_numpy(inputs).to(device),
+                torch.from_numpy(targets).to(device),
+            )
+
+    @classmethod
+    def build(
+        cls,
+        data: np.ndarray,
+        labels: np.ndarray,
+        split_indices: dict[str, np.ndarray],
+        device: str,
+        budget_mb: float,
+    ) -> TensorCache | None:
+        """Create a cache if the splits fit within *budget_mb*.
+
+        Args:
+            data: Full epoch array of shape ``(N, ...)``.
+            labels: Full label array of shape ``(N,)``.
+            split_indices: Mapping of split name to sample indices.
+            device: Target PyTorch device string.
+            budget_mb: Memory budget in megabytes.
+
+        Returns:
+            A :class:`TensorCache`, or ``None`` if the estimated size
+            exceeds the budget.
+
+        """
+        n_samples = sum(len(indices) for indices in split_indices.values())
+        if estimate_cache_bytes(data, n_samples) > budget_mb * 1024**2:
+            return None
+        return cls(data, labels, split_indices, device)
+
+    def get_loader(
+        self,
+        name: str,
+        batch_size: int,
+        shuffle: bool = False,
+    ) -> CachedTensorLoader | None:
+        """Return a loader over the cached split *name*.
+
+        Args:
+            name: Split name used at construction.
+            batch_size: Number of samples per batch.
+            shuffle: Whether to shuffle every epoch.
+
+        Returns:
+            A :class:`CachedTensorLoader`, or ``None`` if the split is empty.
+
+        """
+        split = self.splits.get(name)
+        if split is None:
+            return None
+        return CachedTensorLoader(split[0], split[1], batch_size, shuffle)
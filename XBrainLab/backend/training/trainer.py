@@ -5,6 +5,7 @@ from enum import Enum
 
 from ..utils import validate_list_type
 from ..utils.logger import logger
+from .parallel import ParallelScheduler
 from .training_plan import TrainingPlanHolder
 
 
@@ -97,8 +98,13 @@ class Trainer:
         """Execute the training job, iterating through all pending plan holders.
 
         Runs sequentially through :attr:`training_plan_holders` starting from
-        :attr:`current_idx`. Stops early if :attr:`interrupt` is set. On
-        exception, logs the error and updates :attr:`progress_text`.
+        :attr:`current_idx`. Consecutive plans that allow more than one
+        parallel job (CPU plans without vectorized repeats, see
+        :meth:`TrainingOption.get_parallel_jobs`) have their unfinished
+        repeats trained concurrently by a :class:`ParallelScheduler`; all
+        other plans train in this thread, in queue order. Stops early if
+        :attr:`interrupt` is set. On exception, logs the error and updates
+        :attr:`progress_text`.
         """
         try:
             while self.current_idx < len(self.training_plan_holders):
@@ -106,6 +112,10 @@ class Trainer:
                     break
 
                 plan_holder = self.training_plan_holders[self.current_idx]
+                if plan_holder.get_parallel_jobs() > 1:
+                    group = self._get_parallel_group()
+                    self._run_parallel(group, max(p.get_parallel_jobs() for p in group))
+                    continue
                 self.progress_text = Status.TRAIN.value.format(plan_holder.get_name())
 
                 plan_holder.train()
@@ -123,6 +133,37 @@ class Trainer:
                 self.progress_text = Status.PENDING
             self.job_thread = None
 
+    def _get_parallel_group(self) -> list[TrainingPlanHolder]:
+        """Return the consecutive parallel plans from :attr:`current_idx` on."""
+        group = []
+        for plan in self.training_plan_holders[self.current_idx :]:
+            if plan.get_parallel_jobs() <= 1:
+                break
+            group.append(plan)
+        return group
+
+    def _run_parallel(self, plans: list[TrainingPlanHolder], max_jobs: int) -> None:
+        """Train *plans* with a :class:`ParallelScheduler`.
+
+        Advances :attr:`current_idx` past every plan that was handled, or up
+        to the first unfinished plan if training was interrupted.
+
+        Args:
+            plans: Pending plan holders, in queue order.
+            max_jobs: Maximum number of concurrently running repeats.
+
+        """
+
+        def on_status(names: str) -> None:
+            if not self._interrupt.is_set():
+                self.progress_text = Status.TRAIN.value.format(names)
+
+        ParallelScheduler(plans, max_jobs, self._interrupt, on_status).run()
+        for plan in plans:
+            if self._interrupt.is_set() and not plan.is_finished():
+                break
+            self.current_idx += 1
+
     def run(self, interact: bool = False) -> None:
         """Start executing the training job.
 
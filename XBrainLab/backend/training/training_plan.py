@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import os
+import tempfile
 import threading
+from collections.abc import Callable
 from enum import Enum
 
 import numpy as np
@@ -17,17 +21,29 @@ from XBrainLab.backend.utils.logger import logger
 from ..dataset import Dataset
 from ..utils import set_seed, validate_type
 from ..visualization import supported_saliency_methods
+from .checkpoint import flush_checkpoints
+from .compiled import CompiledModel
 from .evaluator import Evaluator
-from .model_holder import ModelHolder
-from .option import TrainingEvaluation, TrainingOption
+from .model_holder import ModelCompileMode, ModelHolder
+from .option import TrainingEvaluation, TrainingOption, TrainingPrecision
+from .precision import MixedPrecision
 from .record import RecordKey, TrainRecord, TrainRecordKey
+from .saliency import SaliencySource
+from .tensor_cache import BatchLoader, TensorCache
 
 
 class SharedMemoryDataset(torch_data.Dataset):
     """A PyTorch Dataset that references shared numpy arrays to save RAM/VRAM.
 
-    Data is transferred to the target device only when accessed via
-    ``__getitem__``, avoiding upfront copies of the full dataset.
+    Data is transferred to the target device only when accessed, avoiding
+    upfront copies of the full dataset. Besides per-sample access through
+    ``__getitem__``, whole batches are gathered by ``__getitems__`` with a
+    single ``np.take`` followed by one dtype conversion and one device
+    transfer per batch.
+
+    When ``data`` is a memory-mapped ``.npy`` file, pickling the dataset
+    (e.g. for spawned loader workers) only transfers the file path, and
+    each worker re-opens the mapping instead of receiving a copy.
 
     Attributes:
         data: Full data array shared across all splits.
@@ -57,6 +73,25 @@ class SharedMemoryDataset(torch_data.Dataset):
         self.labels = labels
         self.indices = indices
         self.device = device
+        # Pinned staging buffer reused across batches (CUDA targets only)
+        self._pin = torch.device(device).type == "cuda" and torch.cuda.is_available()
+        self._buffer: torch.Tensor | None = None
+        self._copy_event: torch.cuda.Event | None = None
+
+    def __getstate__(self):
+        """Return picklable state, replacing a memory map by its file path."""
+        state = self.__dict__.copy()
+        state["_buffer"] = None
+        state["_copy_event"] = None
+        if isinstance(self.data, np.memmap) and self.data.filename:
+            state["data"] = os.fspath(self.data.filename)
+        return state
+
+    def __setstate__(self, state):
+        """Restore state, re-opening a memory-mapped data file if needed."""
+        self.__dict__.update(state)
+        if isinstance(self.data, str):
+            self.data = np.load(self.data, mmap_mode="r")
 
     def __len__(self):
         """Return the number of samples in this split.
@@ -79,10 +114,102 @@ class SharedMemoryDataset(torch_data.Dataset):
         """
         real_idx = self.indices[idx]
         # Data is transferred to device only when accessed (saves VRAM)
-        x = torch.from_numpy(self.data[real_idx]).float().to(self.device)
+        x = torch.tensor(self.data[real_idx], dtype=torch.float32).to(self.device)
         y = torch.tensor(self.labels[real_idx]).long().to(self.device)
         return x, y
 
+    def __getitems__(self, batch_idx: list[int]) -> tuple[torch.Tensor, torch.Tensor]:
+        """Gather a whole batch and transfer it to the target device.
+
+        Called by :class:`torch.utils.data.DataLoader` with the index list
+        produced by its batch sampler. The samples are gathered and cast to
+        ``float32`` in one pass, directly into a pinned staging buffer when
+        the target is a CUDA device.
+
+        Args:
+            batch_idx: Indices into :attr:`indices` forming one batch.
+
+        Returns:
+            A tuple of ``(input_batch, label_batch)`` on the target device.
+
+        """
+        real_idx = self.indices[np.asarray(batch_idx, dtype=np.int64)]
+        y = torch.from_numpy(np.take(self.labels, real_idx).astype(np.int64))
+        if not self._pin:
+            x_np = np.empty((len(real_idx), *self.data.shape[1:]), dtype=np.float32)
+            self._gather(real_idx, x_np)
+            return torch.from_numpy(x_np).to(self.device), y.to(self.device)
+
+        staging = self._get_staging_buffer(len(real_idx))
+        self._gather(real_idx, staging.numpy())
+        x = staging.to(self.device, non_blocking=True)
+        self._copy_event = torch.cuda.Event()
+        self._copy_event.record()
+        return x, y.to(self.device)
+
+    def _gather(self, real_idx: np.ndarray, out: np.ndarray) -> None:
+        """Gather ``data[real_idx]`` into *out*, casting in the same pass."""
+        # np.take only accepts ``out`` when it can be safely cast back to the
+        # source dtype (true for float32/float64 epoch data)
+        if np.can_cast(out.dtype, self.data.dtype):
+            np.take(self.data, real_idx, axis=0, out=out)
+        else:
+            out[...] = self.data[real_idx]
+
+    def _get_staging_buffer(self, size: int) -> torch.Tensor:
+        """Return a pinned ``float32`` view able to hold *size* samples.
+
+        Waits for the previous asynchronous host-to-device copy before the
+        buffer is handed out again, so a batch in flight is never
+        overwritten.
+        """
+        if self._copy_event is not None:
+            self._copy_event.synchronize()
+        if self._buffer is None or self._buffer.shape[0] < size:
+            self._buffer = torch.empty(
+                (size, *self.data.shape[1:]),
+                dtype=torch.float32,
+            ).pin_memory()
+        return self._buffer[:size]
+
+
+def collate_batch(batch):
+    """Pass through a batch already assembled by ``__getitems__``.
+
+    Args:
+        batch: The ``(inputs, labels)`` tuple returned by
+            :meth:`SharedMemoryDataset.__getitems__`.
+
+    Returns:
+        The batch unchanged.
+
+    """
+    return batch
+
+
+class DeviceDataLoader(torch_data.DataLoader):
+    """DataLoader that assembles batches on the host and moves them to a device.
+
+    Used when batches are produced by worker processes or pinned by the
+    loader, where the dataset itself must stay on the CPU.
+
+    Attributes:
+        device: Target PyTorch device string.
+
+    """
+
+    def __init__(self, *args, device: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.device = device
+
+    def __iter__(self):
+        """Yield ``(inputs, labels)`` batches on :attr:`device`."""
+        for inputs, labels in super().__iter__():
+            yield (
+                inputs.to(self.device, non_blocking=self.pin_memory),
+                labels.to(self.device, non_blocking=self.pin_memory),
+            )
+
 
 def to_holder(
     data: np.ndarray,
@@ -91,16 +218,34 @@ def to_holder(
     dev: str,
     bs: int,
     shuffle: bool = False,
+    num_workers: int = 0,
+    prefetch_factor: int | None = None,
+    pin_memory: bool = False,
+    persistent_workers: bool = False,
 ) -> torch_data.DataLoader | None:
     """Convert data arrays into a PyTorch DataLoader using shared memory.
 
+    The loader's batch sampler yields index batches which the dataset
+    gathers in one operation (see :meth:`SharedMemoryDataset.__getitems__`),
+    so shuffling and batch-size semantics match a default ``DataLoader``.
+
+    With worker processes or pinned memory the dataset produces CPU
+    batches and a :class:`DeviceDataLoader` moves them to ``dev`` in the
+    training thread.
+
     Args:
-        data: Full data array of shape ``(N, ...)``.
+        data: Full data array of shape ``(N, ...)``. Pass a memory-mapped
+            array when using workers so they share it instead of copying.
         labels: Full label array of shape ``(N,)``.
         indices: Integer array of sample indices for this split.
         dev: Target PyTorch device string.
         bs: Batch size.
         shuffle: Whether to shuffle the data. Defaults to ``False``.
+        num_workers: Number of loader worker processes. Defaults to ``0``.
+        prefetch_factor: Batches prefetched per worker, or ``None`` for
+            the PyTorch default.
+        pin_memory: Whether to pin host batches before the transfer.
+        persistent_workers: Whether to keep workers alive between epochs.
 
     Returns:
         A :class:`torch.utils.data.DataLoader` wrapping a
@@ -110,12 +255,30 @@ def to_holder(
     if len(indices) == 0:
         return None
 
-    # Use SharedMemoryDataset to avoid copying numpy arrays (saves RAM)
-    # and to load to GPU on-the-fly (saves VRAM).
-    dataset = SharedMemoryDataset(data, labels, indices, dev)
+    if num_workers == 0 and not pin_memory:
+        # Use SharedMemoryDataset to avoid copying numpy arrays (saves RAM)
+        # and to load to GPU on-the-fly (saves VRAM).
+        dataset = SharedMemoryDataset(data, labels, indices, dev)
+        return torch_data.DataLoader(
+            dataset,
+            batch_size=bs,
+            shuffle=shuffle,
+            collate_fn=collate_batch,
+        )
 
-    dataloader = torch_data.DataLoader(dataset, batch_size=bs, shuffle=shuffle)
-    return dataloader
+    # Workers must not touch the target device; transfer in the main thread
+    dataset = SharedMemoryDataset(data, labels, indices, "cpu")
+    return DeviceDataLoader(
+        dataset,
+        batch_size=bs,
+        shuffle=shuffle,
+        collate_fn=collate_batch,
+        num_workers=num_workers,
+        prefetch_factor=prefetch_factor if num_workers > 0 else None,
+        pin_memory=pin_memory,
+        persistent_workers=persistent_workers and num_workers > 0,
+        device=dev,
+    )
 
 
 class Status(Enum):
@@ -168,11 +331,16 @@ class TrainingPlanHolder:
         dataset: Dataset,
         option: TrainingOption,
         saliency_params: dict | None,
+        plan_id: str | None = None,
     ):
         """Initialize the training plan holder.
 
         Creates :class:`TrainRecord` instances for each repetition, each with
-        a fresh model and random seed.
+        its own random seed. Their models are created when the repetition
+        starts training and released when it finishes (see
+        :meth:`TrainRecord.release`), so memory grows with the repetitions
+        being trained rather than the ones queued; one model is built here
+        to validate the model parameters.
 
         Args:
             model_holder: Holder containing the model class and parameters.
@@ -180,6 +348,9 @@ class TrainingPlanHolder:
             option: Training configuration options.
             saliency_params: Parameters for saliency computation methods.
                 If ``None`` or empty, default parameters are used.
+            plan_id: Identifier used in the output directory of the
+                records. Pass the id of an earlier plan to resume training
+                from its checkpoints. Defaults to a new timestamp.
 
         Raises:
             ValueError: If the dataset, option, or model holder is invalid,
@@ -199,39 +370,50 @@ class TrainingPlanHolder:
         self.check_data()
 
         # Generate unique plan ID (timestamp) to avoid directory collision
-        self.plan_id = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.plan_id = plan_id or datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
 
         self.train_record_list = []
+        self._tensor_cache: TensorCache | None = None
+        self._worker_data_path: str | None = None
+        self.epoch_callback: Callable[[TrainRecord], None] | None = None
         self._interrupt = threading.Event()
+        # Evaluation model shared by the repetitions (see get_eval_pair)
+        self._eval_model: torch.nn.Module | None = None
         self.error: str | None = None
         self.status = Status.PENDING.value
+        model_factory = functools.partial(
+            self.model_holder.get_model,
+            self.dataset.get_epoch_data().get_model_args(),
+        )
+        model_name = self.model_holder.target_model.__name__
+        try:
+            model_factory()
+        except (RuntimeError, ValueError) as e:
+            # Catch both RuntimeError (from PyTorch) and ValueError (from our
+            # validation)
+            if "Output size is too small" in str(
+                e,
+            ) or "Epoch duration is too short" in str(e):
+                raise ValueError(
+                    f"Failed to create model '{model_name}': {e!s}",
+                ) from e
+            raise
         for i in range(self.option.repeat_num):
             seed = set_seed(seed=None)
-            try:
-                model = self.model_holder.get_model(
-                    self.dataset.get_epoch_data().get_model_args(),
-                )
-            except (RuntimeError, ValueError) as e:
-                # Catch both RuntimeError (from PyTorch) and ValueError (from our
-                # validation)
-                if "Output size is too small" in str(
-                    e,
-                ) or "Epoch duration is too short" in str(e):
-                    model_name = self.model_holder.target_model.__name__
-                    raise ValueError(
-                        f"Failed to create model '{model_name}': {e!s}",
-                    ) from e
-                raise
             self.train_record_list.append(
                 TrainRecord(
                     repeat=i,
                     dataset=self.dataset,
-                    model=model,
+                    model=None,
                     option=self.option,
                     seed=seed,
                     plan_id=self.plan_id,
+                    model_factory=model_factory,
+                    model_name=model_name,
                 ),
             )
+        for train_record in self.train_record_list:
+            self.attach_saliency_source(train_record)
 
     def check_data(self) -> None:
         """Validate that the training plan has valid dataset, option, and model.
@@ -255,23 +437,45 @@ class TrainingPlanHolder:
         validate_type(self.option, TrainingOption, "option")
         self.option.validate()
 
+        compile_mode = self.model_holder.compile_mode
+        if compile_mode != ModelCompileMode.NONE and self.option.vectorize_repeats:
+            raise ValueError("Compiled models cannot be trained as vectorized repeats")
+        if (
+            compile_mode == ModelCompileMode.TRACE
+            and self.option.precision != TrainingPrecision.FP32
+        ):
+            raise ValueError("TorchScript tracing requires fp32 precision")
+
     # interact
     def train(self) -> None:
         """Execute the full training process for all repetitions.
 
-        Iterates through each :class:`TrainRecord` and trains it. On completion,
-        updates the status to ``DONE`` or ``PENDING``. On exception, stores the
-        error message.
+        Iterates through each :class:`TrainRecord` and trains it, releasing
+        its model once it is done. On completion, updates the status to
+        ``DONE`` or ``PENDING``. On exception, stores the error message.
         """
         try:
-            for i in range(self.option.repeat_num):
+            if self.option.vectorize_repeats and self.option.repeat_num > 1:
                 self.status = Status.INIT.value.format(
-                    self.train_record_list[i].get_name(),
+                    ", ".join(r.get_name() for r in self.train_record_list),
                 )
-                train_record = self.train_record_list[i]
-                train_record.resume()
-                self.train_one_repeat(train_record)
-                train_record.pause()
+                # Repeats share one random stream, seeded by the first record
+                for train_record in reversed(self.train_record_list):
+                    train_record.resume()
+                self.train_repeats_vectorized(self.train_record_list)
+                for train_record in self.train_record_list:
+                    train_record.pause()
+                    train_record.release()
+            else:
+                for i in range(self.option.repeat_num):
+                    train_record = self.train_record_list[i]
+                    if train_record.is_finished():
+                        continue
+                    self.status = Status.INIT.value.format(train_record.get_name())
+                    train_record.resume()
+                    self.train_one_repeat(train_record)
+                    train_record.pause()
+                    train_record.release()
             if self.is_finished():
                 self.status = Status.DONE.value
             else:
@@ -281,29 +485,38 @@ class TrainingPlanHolder:
             self.error = str(e)
             self.status = Status.PENDING.value
         finally:
-            # Ensure GPU models are moved back to CPU to prevent VRAM leaks
+            # Drop the models to prevent VRAM leaks; their state is kept
             for tr in self.train_record_list:
-                self._safe_move_to_cpu(tr)
+                self._safe_release(tr)
+            self._eval_model = None
+            self._tensor_cache = None
+            self.release_shared_data()
+            flush_checkpoints()
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
 
     @staticmethod
-    def _safe_move_to_cpu(train_record):
-        """Move a training record's model to CPU, logging failures."""
+    def _safe_release(train_record: TrainRecord) -> None:
+        """Release a training record's model, logging failures."""
         try:
-            train_record.model.cpu()
+            train_record.release()
         except RuntimeError:
-            logger.debug("Failed to move model to CPU", exc_info=True)
+            logger.debug("Failed to release model", exc_info=True)
 
     def get_loader(
         self,
     ) -> tuple[
-        torch_data.DataLoader | None,
-        torch_data.DataLoader | None,
-        torch_data.DataLoader | None,
+        BatchLoader | None,
+        BatchLoader | None,
+        BatchLoader | None,
     ]:
         """Create data loaders for training, validation, and testing splits.
 
+        When :attr:`TrainingOption.cache_data` is set and the splits fit in
+        :attr:`TrainingOption.cache_budget_mb`, the loaders are served from
+        a :class:`TensorCache` built once per plan; otherwise they stream
+        from the shared NumPy array.
+
         Returns:
             A tuple of ``(train_loader, val_loader, test_loader)``. Any loader
             may be ``None`` if the corresponding split has no samples.
@@ -321,6 +534,31 @@ class TrainingPlanHolder:
         val_idx = np.where(self.dataset.val_mask)[0]
         test_idx = np.where(self.dataset.test_mask)[0]
 
+        if self.option.cache_data:
+            if self._tensor_cache is None:
+                self._tensor_cache = TensorCache.build(
+                    full_data,
+                    full_labels,
+                    {"train": train_idx, "val": val_idx, "test": test_idx},
+                    dev,
+                    self.option.cache_budget_mb,
+                )
+                if self._tensor_cache is None:
+                    logger.info(
+                        "Dataset exceeds cache budget (%.0f MB), streaming instead",
+                        self.option.cache_budget_mb,
+                    )
+            if self._tensor_cache is not None:
+                return (
+                    self._tensor_cache.get_loader("train", bs, shuffle=True),
+                    self._tensor_cache.get_loader("val", bs),
+                    self._tensor_cache.get_loader("test", bs),
+                )
+
+        loader_kwargs = self.option.get_loader_kwargs()
+        if loader_kwargs["num_workers"] > 0:
+            full_data = np.load(self.get_shared_data_path(), mmap_mode="r")
+
         train_holder: torch_data.DataLoader | None = to_holder(
             full_data,
             full_labels,
@@ -328,6 +566,7 @@ class TrainingPlanHolder:
             dev,
             bs,
             True,
+            **loader_kwargs,
         )
         val_holder: torch_data.DataLoader | None = to_holder(
             full_data,
@@ -335,6 +574,7 @@ class TrainingPlanHolder:
             val_idx,
             dev,
             bs,
+            **loader_kwargs,
         )
         test_holder: torch_data.DataLoader | None = to_holder(
             full_data,
@@ -342,19 +582,52 @@ class TrainingPlanHolder:
             test_idx,
             dev,
             bs,
+            **loader_kwargs,
         )
         return train_holder, val_holder, test_holder
 
+    def get_shared_data_path(self) -> str:
+        """Return the path of a ``.npy`` copy of the epoch array.
+
+        The array is written once per plan as ``float32`` to a temporary
+        file. Loader workers and parallel training jobs memory-map it
+        rather than receiving a pickled copy of the data. The file is
+        removed when :meth:`train` finishes.
+
+        Returns:
+            Path to the temporary ``.npy`` file.
+
+        """
+        if self._worker_data_path is None:
+            data = self.dataset.get_epoch_data().get_data()
+            fd, path = tempfile.mkstemp(prefix="xbrainlab-epochs-", suffix=".npy")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, data.astype(np.float32, copy=False))
+            self._worker_data_path = path
+        return self._worker_data_path
+
+    def release_shared_data(self) -> None:
+        """Delete the temporary file from :meth:`get_shared_data_path`, if any."""
+        if self._worker_data_path is None:
+            return
+        try:
+            os.remove(self._worker_data_path)
+        except OSError:
+            logger.debug("Failed to remove %s", self._worker_data_path, exc_info=True)
+        self._worker_data_path = None
+
     def get_eval_pair(
         self,
         train_record: TrainRecord,
-        val_loader: torch_data.DataLoader | None,
-        test_loader: torch_data.DataLoader | None,
-    ) -> tuple[torch.nn.Module | None, torch_data.DataLoader | None]:
+        val_loader: BatchLoader | None,
+        test_loader: BatchLoader | None,
+    ) -> tuple[torch.nn.Module | None, BatchLoader | None]:
         """Select the best model and data loader for final evaluation.
 
         The model selection depends on the configured
-        :attr:`option.evaluation_option` strategy.
+        :attr:`option.evaluation_option` strategy. The selected weights are
+        loaded into one evaluation model reused by all repetitions, which
+        is dropped when training ends.
 
         Args:
             train_record: The training record containing best model state dicts.
@@ -372,27 +645,41 @@ class TrainingPlanHolder:
         target_loader = test_loader or val_loader
 
         # Determine the state_dict to load before allocating the model on GPU
-        if self.option.evaluation_option == TrainingEvaluation.VAL_LOSS:
-            state = getattr(train_record, f"best_val_{RecordKey.LOSS}_model")
-        elif self.option.evaluation_option == TrainingEvaluation.TEST_ACC:
-            state = getattr(train_record, f"best_test_{RecordKey.ACC}_model")
-        elif self.option.evaluation_option == TrainingEvaluation.TEST_AUC:
-            state = getattr(train_record, f"best_test_{RecordKey.AUC}_model")
-        elif self.option.evaluation_option == TrainingEvaluation.LAST_EPOCH:
-            state = train_record.model.state_dict()
-        else:
-            raise NotImplementedError
-
+        state = self.get_eval_state(train_record)
         if not state:
             return None, target_loader
 
         # Only create the model on GPU once we know we have a valid state_dict
-        target_model = self.model_holder.get_model(
-            self.dataset.get_epoch_data().get_model_args(),
-        ).to(self.option.get_device())
-        target_model.load_state_dict(state)
-        target_model = target_model.eval()
-        return target_model, target_loader
+        if self._eval_model is None:
+            self._eval_model = self.model_holder.get_model(
+                self.dataset.get_epoch_data().get_model_args(),
+            ).to(self.option.get_device())
+        self._eval_model.load_state_dict(state)
+        return self._eval_model.eval(), target_loader
+
+    def get_eval_state(self, train_record: TrainRecord) -> dict | None:
+        """Return the weights of *train_record* selected for evaluation.
+
+        Args:
+            train_record: The training record containing best model state dicts.
+
+        Returns:
+            The state dict chosen by :attr:`option.evaluation_option`, or
+            ``None`` if the record has no such weights yet.
+
+        Raises:
+            NotImplementedError: If the evaluation option is not recognized.
+
+        """
+        if self.option.evaluation_option == TrainingEvaluation.VAL_LOSS:
+            return getattr(train_record, f"best_val_{RecordKey.LOSS}_model")
+        if self.option.evaluation_option == TrainingEvaluation.TEST_ACC:
+            return getattr(train_record, f"best_test_{RecordKey.ACC}_model")
+        if self.option.evaluation_option == TrainingEvaluation.TEST_AUC:
+            return getattr(train_record, f"best_test_{RecordKey.AUC}_model")
+        if self.option.evaluation_option == TrainingEvaluation.LAST_EPOCH:
+            return train_record.get_model_state()
+        raise NotImplementedError
 
     def train_one_repeat(self, train_record: TrainRecord) -> None:
         """Train one repetition of the training plan
@@ -405,14 +692,19 @@ class TrainingPlanHolder:
             return
         # init
         model = train_record.get_training_model(device=self.option.get_device())
+        model = self.model_holder.get_compiled_model(
+            model,
+            self.dataset.get_epoch_data().get_model_args(),
+        )
         train_loader, val_loader, test_loader = self.get_loader()
         if self.option.epoch > 0 and not train_loader:
             raise ValueError("No Training Data")
         optimizer = train_record.optim
         criterion = train_record.criterion
+        precision = self.get_mixed_precision()
         self.status = Status.TRAIN.value.format(train_record.get_name())
         # train one epoch
-        while train_record.epoch < self.option.epoch:
+        while not train_record.is_trained():
             if self._interrupt.is_set():
                 break
             if train_loader is None:
@@ -425,9 +717,97 @@ class TrainingPlanHolder:
                 optimizer,
                 criterion,
                 train_record,
+                precision=precision,
+            )
+        if self._interrupt.is_set() and not train_record.is_trained():
+            # Continue from the last complete epoch when resumed
+            train_record.rollback()
+
+        if isinstance(model, CompiledModel) and not train_record.compile_stats:
+            train_record.compile_stats = model.get_stats()
+        self._evaluate_repeat(train_record, train_loader, val_loader, test_loader)
+
+    def train_repeats_vectorized(self, train_records: list[TrainRecord]) -> None:
+        """Train several repetitions together, one vectorized pass per batch.
+
+        The models of all unfinished records are stacked with
+        :class:`~.vectorized.StackedModel` and trained over the same batches;
+        each record keeps its own optimizer and statistics. Records that
+        are behind (e.g. after an interrupted run) catch up first.
+
+        Args:
+            train_records: Training records to train.
+
+        """
+        from .vectorized import StackedModel, VectorizedEpochRunner
+
+        records = [r for r in train_records if not r.is_finished()]
+        if not records:
+            return
+        for train_record in records:
+            train_record.get_training_model(device=self.option.get_device())
+        train_loader, val_loader, test_loader = self.get_loader()
+        if self.option.epoch > 0 and not train_loader:
+            raise ValueError("No Training Data")
+
+        runner = VectorizedEpochRunner(
+            interrupt=self._interrupt,
+            checkpoint_epoch=self.option.checkpoint_epoch,
+            on_epoch_end=self.epoch_callback,
+            precision=self.get_mixed_precision(),
+            option=self.option,
+        )
+        group: list[TrainRecord] = []
+        stacked: StackedModel | None = None
+        while not self._interrupt.is_set():
+            pending = [r for r in records if not r.is_trained()]
+            if not pending:
+                break
+            if train_loader is None:
+                raise ValueError("train_loader cannot be None during training loop")
+            epoch = min(r.epoch for r in pending)
+            current = [r for r in pending if r.epoch == epoch]
+            if current != group or stacked is None:
+                group = current
+                stacked = StackedModel([r.model for r in group])
+            self.status = Status.TRAIN.value.format(
+                ", ".join(r.get_name() for r in group),
             )
+            runner.run_stacked(
+                stacked,
+                train_loader,
+                val_loader,
+                test_loader,
+                [r.optim for r in group],
+                group[0].criterion,
+                group,
+            )
+        if self._interrupt.is_set():
+            for train_record in records:
+                if not train_record.is_trained():
+                    train_record.rollback()
+
+        for train_record in records:
+            self._evaluate_repeat(train_record, train_loader, val_loader, test_loader)
 
-        if train_record.epoch == self.option.epoch:
+    def _evaluate_repeat(
+        self,
+        train_record: TrainRecord,
+        train_loader: BatchLoader | None,
+        val_loader: BatchLoader | None,
+        test_loader: BatchLoader | None,
+    ) -> None:
+        """Evaluate a fully trained repetition and export its checkpoint.
+
+        Args:
+            train_record: Training record to evaluate.
+            train_loader: Training data loader, used when no validation or
+                test data is available.
+            val_loader: Validation data loader, or ``None``.
+            test_loader: Test data loader, or ``None``.
+
+        """
+        if train_record.is_trained():
             self.status = Status.EVAL.value.format(train_record.get_name())
             target, target_loader = self.get_eval_pair(
                 train_record,
@@ -444,24 +824,96 @@ class TrainingPlanHolder:
                     target.eval()
 
             if target and target_loader:
-                eval_record = Evaluator.evaluate_with_saliency(
-                    target,
-                    target_loader,
-                    self.saliency_params,
-                )
+                if self.option.precompute_saliency:
+                    eval_record = Evaluator.evaluate_with_saliency(
+                        target,
+                        target_loader,
+                        self.saliency_params,
+                        self.get_mixed_precision(),
+                    )
+                else:
+                    eval_record = Evaluator.evaluate(
+                        target,
+                        target_loader,
+                        self.get_mixed_precision(),
+                    )
                 train_record.set_eval_record(eval_record)
+                self.attach_saliency_source(train_record)
 
         train_record.export_checkpoint()
 
+    def attach_saliency_source(self, train_record: TrainRecord) -> None:
+        """Let the evaluation record of *train_record* compute saliency maps.
+
+        Records computed with :attr:`TrainingOption.precompute_saliency`
+        only fill in maps they are missing. Records without an evaluation
+        record are left unchanged.
+        """
+        eval_record = train_record.get_eval_record()
+        if eval_record is not None and eval_record.saliency_source is None:
+            eval_record.saliency_source = SaliencySource(self, train_record)
+
+    def get_saliency_pair(
+        self,
+        train_record: TrainRecord,
+        model: torch.nn.Module | None = None,
+    ) -> tuple[torch.nn.Module | None, BatchLoader | None]:
+        """Return a model and data loader for computing saliency maps.
+
+        Unlike :meth:`get_eval_pair`, the model is not the training model,
+        so saliency can be computed while other repetitions are trained or
+        evaluated. Without validation or test data, the training data and
+        the last weights are used, as in final evaluation.
+
+        The loader streams the evaluated split from the epoch array in the
+        calling thread. It never builds the tensor cache, the shared data
+        file or loader workers, which are only released when :meth:`train`
+        finishes.
+
+        Args:
+            train_record: The evaluated training record.
+            model: Model returned by an earlier call for *train_record*,
+                reused instead of creating a new one.
+
+        Returns:
+            A tuple of ``(model, data_loader)``; the model is ``None`` if
+            the record has no suitable weights.
+
+        """
+        indices = np.where(self.dataset.test_mask)[0]
+        if len(indices) == 0:
+            indices = np.where(self.dataset.val_mask)[0]
+        state = self.get_eval_state(train_record)
+        if len(indices) == 0:
+            indices = np.where(self.dataset.train_mask)[0]
+            state = state or train_record.get_model_state()
+        epoch_data = self.dataset.get_epoch_data()
+        target_loader = to_holder(
+            epoch_data.get_data(),
+            epoch_data.get_label_list(),
+            indices,
+            self.option.get_device(),
+            self.option.bs,
+        )
+        if not state or target_loader is None:
+            return None, target_loader
+        if model is None:
+            model = self.model_holder.get_model(
+                epoch_data.get_model_args(),
+            ).to(self.option.get_device())
+            model.load_state_dict(state)
+        return model.eval(), target_loader
+
     def train_one_epoch(
         self,
         model: torch.nn.Module,
-        train_loader: torch_data.DataLoader,
-        val_loader: torch_data.DataLoader | None,
-        test_loader: torch_data.DataLoader | None,
+        train_loader: BatchLoader,
+        val_loader: BatchLoader | None,
+        test_loader: BatchLoader | None,
         optimizer: torch.optim.Optimizer,
         criterion: torch.nn.Module,
         train_record: TrainRecord,
+        precision: MixedPrecision | None = None,
     ) -> None:
         """Train one epoch of the training plan.
 
@@ -471,12 +923,15 @@ class TrainingPlanHolder:
 
         Args:
             model (torch.nn.Module): The model to train.
-            train_loader (torch_data.DataLoader): Data loader for training set.
-            val_loader (torch_data.DataLoader | None): Data loader for validation set.
-            test_loader (torch_data.DataLoader | None): Data loader for test set.
+            train_loader (BatchLoader): Data loader for training set.
+            val_loader (BatchLoader | None): Data loader for validation set.
+            test_loader (BatchLoader | None): Data loader for test set.
             optimizer (torch.optim.Optimizer): Optimizer for backpropagation.
             criterion (torch.nn.Module): Loss function.
             train_record (TrainRecord): Record to store training statistics.
+            precision (MixedPrecision | None): Autocast and loss-scaling
+                state shared by the epochs of one repeat. Defaults to a new
+                one from :meth:`get_mixed_precision`.
 
         """
         from .epoch_runner import EpochRunner
@@ -484,6 +939,9 @@ class TrainingPlanHolder:
         runner = EpochRunner(
             interrupt=self._interrupt,
             checkpoint_epoch=self.option.checkpoint_epoch,
+            on_epoch_end=self.epoch_callback,
+            precision=precision or self.get_mixed_precision(),
+            option=self.option,
         )
         runner.run(
             model,
@@ -495,6 +953,24 @@ class TrainingPlanHolder:
             train_record,
         )
 
+    def get_mixed_precision(self) -> MixedPrecision:
+        """Return autocast settings for :attr:`TrainingOption.precision`.
+
+        Returns:
+            A new :class:`MixedPrecision` for the training device.
+
+        """
+        return MixedPrecision(self.option.precision, self.option.get_device())
+
+    def get_parallel_jobs(self) -> int:
+        """Return how many repeats of this plan may train concurrently.
+
+        Returns:
+            The value of :meth:`TrainingOption.get_parallel_jobs`.
+
+        """
+        return self.option.get_parallel_jobs()
+
     @property
     def interrupt(self) -> bool:
         """Whether an interrupt has been requested (thread-safe)."""
@@ -548,13 +1024,25 @@ class TrainingPlanHolder:
 
     # setter
     def set_saliency_params(self, saliency_params: dict) -> None:
-        """Set new saliency parameters and re-evaluate all finished repeats.
+        """Set new saliency parameters for the finished repeats.
+
+        The stored saliency maps are dropped and computed again with the
+        new parameters when next requested. With
+        :attr:`TrainingOption.precompute_saliency`, all finished repeats
+        are re-evaluated instead. Released models are not created again;
+        the evaluation model is loaded from the stored state dicts.
 
         Args:
             saliency_params: New dictionary of saliency method parameters.
 
         """
         self.saliency_params = saliency_params
+        if not self.option.precompute_saliency:
+            for train_record in self.train_record_list:
+                eval_record = train_record.get_eval_record()
+                if eval_record is not None:
+                    eval_record.clear_saliency()
+            return
         _, val_loader, test_loader = self.get_loader()
         for i in range(self.option.repeat_num):
             train_record = self.train_record_list[i]
@@ -568,8 +1056,10 @@ class TrainingPlanHolder:
                     target,
                     target_loader,
                     self.saliency_params,
+                    self.get_mixed_precision(),
                 )
                 self.train_record_list[i].set_eval_record(eval_record)
+        self._eval_model = None
 
     # status
     def get_training_status(self) -> str:
@@ -629,12 +1119,16 @@ class TrainingPlanHolder:
             train_auc = record.train[TrainRecordKey.AUC][-1]
         if len(record.train[TrainRecordKey.ACC]) > 0:
             train_acc = record.train[TrainRecordKey.ACC][-1]
-        if len(record.val[RecordKey.LOSS]) > 0:
-            val_loss = record.val[RecordKey.LOSS][-1]
-        if len(record.val[RecordKey.ACC]) > 0:
-            val_acc = record.val[RecordKey.ACC][-1]
-        if len(record.val[RecordKey.AUC]) > 0:
-            val_auc = record.val[RecordKey.AUC][-1]
+        # Validation runs every ``eval_every`` epochs; show the latest one
+        val_values = {
+            key: [v for v in record.val[key] if v is not None] for key in RecordKey()
+        }
+        if len(val_values[RecordKey.LOSS]) > 0:
+            val_loss = val_values[RecordKey.LOSS][-1]
+        if len(val_values[RecordKey.ACC]) > 0:
+            val_acc = val_values[RecordKey.ACC][-1]
+        if len(val_values[RecordKey.AUC]) > 0:
+            val_auc = val_values[RecordKey.AUC][-1]
         return lr, train_loss, train_acc, train_auc, val_loss, val_acc, val_auc
 
     def is_finished(self) -> bool:
@@ -649,13 +1143,18 @@ class TrainingPlanHolder:
     def get_epoch_progress_text(self) -> str:
         """Return a progress string showing completed vs. total epochs.
 
+        Repeats that stopped early count as complete.
+
         Returns:
             A string formatted as ``'completed / total'``.
 
         """
         total = 0
         for train_record in self.train_record_list:
-            total += train_record.get_epoch()
+            if train_record.early_stop_epoch is not None:
+                total += self.option.epoch
+            else:
+                total += train_record.get_epoch()
         return f"{total} / {self.option.epoch * self.option.repeat_num}"
 
     def get_best_performance(self) -> float:
@@ -678,6 +1177,7 @@ class TrainingPlanHolder:
         if best_test_acc != -1:
             return best_test_acc
         # Fallback to current accuracy if no best recorded (e.g. early epoch)
-        if len(record.val[RecordKey.ACC]) > 0:
-            return record.val[RecordKey.ACC][-1]
+        val_acc = [v for v in record.val[RecordKey.ACC] if v is not None]
+        if len(val_acc) > 0:
+            return val_acc[-1]
         return 0.0
@@ -0,0 +1,266 @@
+"""Vectorized training of several repeats in one forward/backward pass.
+
+All repeats of a :class:`~XBrainLab.backend.training.training_plan.TrainingPlanHolder`
+share the model architecture and the data, so their parameters can be
+stacked along a leading "repeat" dimension and evaluated with a single
+``torch.func.vmap`` call per batch. Each repeat keeps its own model,
+optimizer, :class:`~XBrainLab.backend.training.record.TrainRecord` and
+metrics; only the batch order, the augmentation of the batches and the
+random stream used for dropout are shared.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+
+import torch
+from torch.func import functional_call, vmap
+
+from .augmentation import mixed_loss
+from .epoch_runner import EpochRunner
+from .metrics import MetricAccumulator
+from .precision import MixedPrecision
+from .record import RecordKey
+from .record.train import TrainRecord
+from .tensor_cache import BatchLoader
+
+
+class StackedModel:
+    """Evaluate several models of the same architecture with ``vmap``.
+
+    Parameters are stacked from the individual models on every call, so
+    gradients flow back into each model's own parameters and the models'
+    optimizers can be stepped independently. Buffers updated during the
+    forward pass (e.g. batch-norm running statistics) are copied back to
+    each model in training mode.
+
+    Attributes:
+        models: The stacked models, one per repeat.
+
+    """
+
+    def __init__(self, models: list[torch.nn.Module]):
+        """Create a stateless template of the shared architecture.
+
+        Args:
+            models: Models with identical parameter and buffer layout.
+
+        """
+        self.models = models
+        self._base = copy.deepcopy(models[0]).to("meta")
+        self._param_names = [name for name, _ in models[0].named_parameters()]
+        self._buffer_names = [name for name, _ in models[0].named_buffers()]
+        self._forward = vmap(
+            self._functional_forward,
+            in_dims=(0, 0, None),
+            randomness="different",
+        )
+
+    def _functional_forward(self, params: dict, buffers: dict, inputs):
+        return functional_call(self._base, (params, buffers), (inputs,))
+
+    def __len__(self) -> int:
+        """Return the number of stacked models."""
+        return len(self.models)
+
+    def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
+        """Run all models on the same batch.
+
+        Args:
+            inputs: Input batch of shape ``(B, ...)``.
+
+        Returns:
+            Outputs of shape ``(R, B, ...)`` where ``R`` is the number of
+            models.
+
+        """
+        named = [
+            (dict(m.named_parameters()), dict(m.named_buffers())) for m in self.models
+        ]
+        params = {
+            name: torch.stack([p[name] for p, _ in named]) for name in self._param_names
+        }
+        buffers = {
+            name: torch.stack([b[name] for _, b in named])
+            for name in self._buffer_names
+        }
+        outputs = self._forward(params, buffers, inputs)
+        if self._base.training:
+            with torch.no_grad():
+                for name, stacked in buffers.items():
+                    for i, (_, model_buffers) in enumerate(named):
+                        model_buffers[name].copy_(stacked[i])
+        return outputs
+
+    def train(self) -> None:
+        """Put all models in training mode."""
+        self._base.train()
+        for model in self.models:
+            model.train()
+
+    def eval(self) -> None:
+        """Put all models in evaluation mode."""
+        self._base.eval()
+        for model in self.models:
+            model.eval()
+
+
+class VectorizedEpochRunner(EpochRunner):
+    """Runs one epoch of several repeats over shared batches.
+
+    Uses the same record update, evaluation cadence, early stopping,
+    scheduler, checkpoint and callback sequence as :class:`EpochRunner`,
+    applied to every repeat.
+    """
+
+    def run_stacked(
+        self,
+        stacked: StackedModel,
+        train_loader: BatchLoader,
+        val_loader: BatchLoader | None,
+        test_loader: BatchLoader | None,
+        optimizers: list[torch.optim.Optimizer],
+        criterion: torch.nn.Module,
+        train_records: list[TrainRecord],
+    ) -> None:
+        """Execute one epoch for all repeats.
+
+        Args:
+            stacked: Models of the repeats, in the order of *train_records*.
+            train_loader: Training data loader shared by all repeats.
+            val_loader: Optional validation data loader.
+            test_loader: Optional test data loader.
+            optimizers: One optimizer per repeat.
+            criterion: Loss function.
+            train_records: Records for storing each repeat's statistics.
+        """
+        start_time = time.time()
+        stacked.train()
+        # Repeats of one group are at the same epoch
+        profiler = self._make_profiler(train_records[0])
+        # Batches are shared, so they are augmented with the first record's seed
+        augmenter = self._make_augmenter(train_records[0])
+
+        metrics = [MetricAccumulator() for _ in range(len(stacked))]
+        for batch_inputs, labels in profiler.iterate(train_loader):
+            if self._interrupt.is_set():
+                break
+            inputs, mixed = batch_inputs, None
+            if augmenter is not None:
+                with profiler.phase("data"):
+                    inputs, mixed = augmenter.augment(batch_inputs, labels)
+            for optimizer in optimizers:
+                optimizer.zero_grad()
+            with profiler.phase("forward"), self._precision.autocast():
+                outputs = stacked(inputs)
+                losses = torch.stack(
+                    [mixed_loss(criterion, output, labels, mixed) for output in outputs]
+                )
+            # Repeats share no parameters, so the gradient of the sum is
+            # each repeat's own gradient.
+            with profiler.phase("backward"):
+                self._precision.backward(losses.sum())
+            with profiler.phase("optimizer"):
+                for optimizer in optimizers:
+                    self._precision.step(optimizer)
+                self._precision.update()
+            for i, metric in enumerate(metrics):
+                metric.update(outputs[i], labels, losses[i])
+        profiler.end_training(metrics[0].n_samples)
+
+        if self._interrupt.is_set() or metrics[0].n_samples == 0:
+            return
+
+        duration = time.time() - start_time
+        for train_record, optimizer, metric in zip(
+            train_records, optimizers, metrics, strict=True
+        ):
+            result = metric.compute()
+            self._update_records(
+                train_record,
+                result[RecordKey.LOSS],
+                result[RecordKey.ACC],
+                result[RecordKey.AUC],
+                optimizer.param_groups[0]["lr"],
+                duration,
+            )
+
+        evaluate = self._is_eval_epoch(train_records[0])
+        val_results: list[dict[str, float] | None] = [None] * len(train_records)
+        if val_loader and evaluate:
+            with profiler.phase("val"):
+                results = self.test_stacked(
+                    stacked, val_loader, criterion, self._precision
+                )
+            for i, (train_record, result) in enumerate(
+                zip(train_records, results, strict=True)
+            ):
+                train_record.update_eval(result)
+                val_results[i] = result
+        stops = [
+            val_result is not None and self._should_stop(train_record)
+            for train_record, val_result in zip(train_records, val_results, strict=True)
+        ]
+
+        tested = [
+            self._is_test_epoch(train_record, evaluate, stop)
+            for train_record, stop in zip(train_records, stops, strict=True)
+        ]
+        if test_loader and any(tested):
+            with profiler.phase("test"):
+                results = self.test_stacked(
+                    stacked, test_loader, criterion, self._precision
+                )
+            for train_record, result, is_tested in zip(
+                train_records, results, tested, strict=True
+            ):
+                if is_tested:
+                    train_record.update_test(result)
+
+        for train_record, val_result, stop in zip(
+            train_records, val_results, stops, strict=True
+        ):
+            self._step_scheduler(
+                train_record,
+                val_result,
+                has_val=val_loader is not None,
+            )
+            self._finish_epoch(train_record, stop, profiler)
+
+        torch.cuda.empty_cache()
+
+    @staticmethod
+    def test_stacked(
+        stacked: StackedModel,
+        data_loader: BatchLoader,
+        criterion: torch.nn.Module,
+        precision: MixedPrecision | None = None,
+    ) -> list[dict[str, float]]:
+        """Evaluate all repeats on *data_loader* in one pass.
+
+        Args:
+            stacked: Models of the repeats.
+            data_loader: Loader providing input-label pairs.
+            criterion: Loss function used to compute evaluation loss.
+            precision: Autocast settings for the forward pass. Defaults to
+                ``fp32``.
+
+        Returns:
+            One metric dictionary per repeat, as returned by
+            :meth:`Evaluator.test_model`.
+
+        """
+        stacked.eval()
+        precision = precision or MixedPrecision()
+        metrics = [MetricAccumulator() for _ in range(len(stacked))]
+        with torch.no_grad():
+            for inputs, labels in data_loader:
+                with precision.autocast():
+                    outputs = stacked(inputs)
+                    losses = torch.stack(
+                        [criterion(output, labels) for output in outputs]
+                    )
+                for i, metric in enumerate(metrics):
+                    metric.update(outputs[i], labels, losses[i])
+        return [metric.compute() for metric in metrics]
@@ -18,6 +18,7 @@ class PlotType(Enum):
         ACCURACY: Accuracy curve figure.
         AUC: AUC curve figure.
         LR: Learning-rate schedule figure.
+        PROFILE: Profiled epoch phase times and throughput figure.
         CONFUSION: Confusion-matrix figure.
 
     """
@@ -26,6 +27,7 @@ class PlotType(Enum):
     ACCURACY = "get_acc_figure"
     AUC = "get_auc_figure"
     LR = "get_lr_figure"
+    PROFILE = "get_profile_figure"
     CONFUSION = "get_confusion_figure"
 
 
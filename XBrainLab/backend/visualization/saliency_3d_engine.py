@@ -245,7 +245,7 @@ class Saliency3DEngine(QObject):
         """
         # get saliency
         label_index = epoch_data.event_id[selected_event_name]
-        saliency_raw = eval_record.gradient[label_index]
+        saliency_raw = eval_record.get_gradient(label_index)
         self.saliency = saliency_raw.mean(axis=0)
         self.scalar_bar_range = [self.saliency.min(), self.saliency.max()]
 
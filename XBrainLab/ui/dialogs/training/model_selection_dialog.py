@@ -25,7 +25,7 @@ from PyQt6.QtWidgets import (
 )
 
 from XBrainLab.backend import model_base
-from XBrainLab.backend.training import ModelHolder
+from XBrainLab.backend.training import ModelCompileMode, ModelHolder
 from XBrainLab.ui.core.base_dialog import BaseDialog
 
 ARG_DICT_SKIP_SET = {"self", "n_classes", "channels", "samples", "sfreq"}
@@ -42,6 +42,7 @@ class ModelSelectionDialog(BaseDialog):
         pretrained_weight_path: Path to pretrained weight file, or None.
         model_holder: Configured ModelHolder after acceptance.
         model_combo: QComboBox for selecting the model architecture.
+        compile_combo: QComboBox for selecting the model execution mode.
         params_table: QTableWidget displaying model-specific parameters.
         model_map: Dictionary mapping model names to model classes.
         model_list: List of available model class names.
@@ -56,6 +57,7 @@ class ModelSelectionDialog(BaseDialog):
 
         # UI Elements
         self.model_combo = None
+        self.compile_combo = None
         self.params_table = None
         self.params_group = None
         self.weight_label = None
@@ -109,6 +111,18 @@ class ModelSelectionDialog(BaseDialog):
         weight_layout.addWidget(self.weight_btn)
         layout.addLayout(weight_layout)
 
+        # Execution mode
+        compile_layout = QHBoxLayout()
+        compile_layout.addWidget(QLabel("Execution:"))
+        self.compile_combo = QComboBox()
+        self.compile_combo.addItems([mode.value for mode in ModelCompileMode])
+        self.compile_combo.setToolTip(
+            "Compile the model with torch.compile or TorchScript tracing; "
+            "repeats reuse the compiled artifact",
+        )
+        compile_layout.addWidget(self.compile_combo)
+        layout.addLayout(compile_layout)
+
         # Buttons
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
@@ -212,10 +226,16 @@ class ModelSelectionDialog(BaseDialog):
                         value = value_text
                     model_params_map[param] = value
 
+            compile_mode = (
+                self.compile_combo.currentText()
+                if self.compile_combo
+                else ModelCompileMode.NONE
+            )
             self.model_holder = ModelHolder(
                 target_model,
                 model_params_map,
                 self.pretrained_weight_path,
+                compile_mode,
             )
             super().accept()
 
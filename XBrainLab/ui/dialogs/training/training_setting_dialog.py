@@ -1,16 +1,19 @@
 """Training settings dialog for configuring model training parameters.
 
 Aggregates settings for epochs, batch size, learning rate, optimizer,
-device, output directory, evaluation strategy, and repeat count.
+device, output directory, evaluation strategy, repeat count, evaluation
+schedule, data augmentation, and data loading.
 """
 
 from typing import Any
 
 from PyQt6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialogButtonBox,
     QFileDialog,
     QFormLayout,
+    QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
@@ -20,8 +23,12 @@ from PyQt6.QtWidgets import (
 )
 
 from XBrainLab.backend.training import (
+    TrainingAugmentation,
+    TrainingEarlyStopping,
     TrainingEvaluation,
     TrainingOption,
+    TrainingPrecision,
+    TrainingScheduler,
     parse_device_name,
     parse_optim_name,
 )
@@ -38,7 +45,8 @@ class TrainingSettingDialog(BaseDialog):
     """Main configuration dialog for training parameters.
 
     Aggregates settings for epochs, batch size, learning rate, optimizer,
-    device, output directory, evaluation strategy, and repeat count.
+    device, output directory, evaluation strategy, repeat count, evaluation
+    schedule, data augmentation, and data loading.
 
     Attributes:
         training_option: Configured TrainingOption after acceptance.
@@ -52,8 +60,33 @@ class TrainingSettingDialog(BaseDialog):
         bs_entry: QLineEdit for batch size.
         lr_entry: QLineEdit for learning rate.
         checkpoint_entry: QLineEdit for checkpoint save interval.
+        keep_last_entry: QLineEdit for the number of epoch checkpoints kept
+            (0 keeps all).
+        keep_best_check: QCheckBox for always keeping the best checkpoint.
         repeat_entry: QLineEdit for number of training repeats.
+        parallel_jobs_entry: QLineEdit for the number of repeats trained
+            concurrently (CPU only).
+        vectorize_check: QCheckBox for training all repeats in one
+            vectorized pass.
         evaluation_combo: QComboBox for evaluation strategy selection.
+        precision_combo: QComboBox for the training precision.
+        eval_every_entry: QLineEdit for the evaluation interval in epochs.
+        per_epoch_test_check: QCheckBox for testing at every evaluation.
+        early_stopping_combo: QComboBox for the early-stopping criterion.
+        patience_entry: QLineEdit for the early-stopping patience.
+        scheduler_combo: QComboBox for the learning-rate scheduler.
+        profile_check: QCheckBox for timing the phases of every epoch.
+        precompute_saliency_check: QCheckBox for computing all saliency
+            maps when a repeat is evaluated.
+        augmentation_entries: QLineEdit for the magnitude of each
+            :class:`TrainingAugmentation` (0 disables it).
+        augment_prob_entry: QLineEdit for the augmentation probability.
+        workers_entry: QLineEdit for the number of data-loading workers.
+        prefetch_entry: QLineEdit for the per-worker prefetch factor.
+        pin_memory_check: QCheckBox for pinned host memory.
+        persistent_workers_check: QCheckBox for persistent workers.
+        cache_check: QCheckBox for the device-resident tensor cache.
+        cache_budget_entry: QLineEdit for the tensor cache budget (MB).
 
     """
 
@@ -73,11 +106,31 @@ class TrainingSettingDialog(BaseDialog):
         self.bs_entry = None
         self.lr_entry = None
         self.checkpoint_entry = None
+        self.keep_last_entry = None
+        self.keep_best_check = None
         self.repeat_entry = None
+        self.parallel_jobs_entry = None
+        self.vectorize_check = None
         self.opt_label = None
         self.dev_label = None
         self.output_dir_label = None
         self.evaluation_combo = None
+        self.precision_combo = None
+        self.eval_every_entry = None
+        self.per_epoch_test_check = None
+        self.early_stopping_combo = None
+        self.patience_entry = None
+        self.scheduler_combo = None
+        self.profile_check = None
+        self.precompute_saliency_check = None
+        self.augmentation_entries: dict[TrainingAugmentation, QLineEdit] = {}
+        self.augment_prob_entry = None
+        self.workers_entry = None
+        self.prefetch_entry = None
+        self.pin_memory_check = None
+        self.persistent_workers_check = None
+        self.cache_check = None
+        self.cache_budget_entry = None
 
         super().__init__(parent, title="Training Setting", controller=controller)
         self.resize(500, 600)
@@ -106,6 +159,10 @@ class TrainingSettingDialog(BaseDialog):
                 self.lr_entry.setText(str(opt.lr))
             if self.checkpoint_entry:
                 self.checkpoint_entry.setText(str(opt.checkpoint_epoch))
+            if self.keep_last_entry:
+                self.keep_last_entry.setText(str(opt.checkpoint_keep_last))
+            if self.keep_best_check:
+                self.keep_best_check.setChecked(bool(opt.checkpoint_keep_best))
             if self.repeat_entry:
                 self.repeat_entry.setText(str(opt.repeat_num))
 
@@ -130,6 +187,56 @@ class TrainingSettingDialog(BaseDialog):
             if opt.evaluation_option and self.evaluation_combo:
                 self.evaluation_combo.setCurrentText(opt.evaluation_option.value)
 
+            if self.parallel_jobs_entry:
+                self.parallel_jobs_entry.setText(str(opt.parallel_jobs))
+            if self.vectorize_check:
+                self.vectorize_check.setChecked(bool(opt.vectorize_repeats))
+
+            if isinstance(opt.precision, TrainingPrecision) and self.precision_combo:
+                self.precision_combo.setCurrentText(opt.precision.value)
+
+            # Restore evaluation schedule
+            if self.eval_every_entry:
+                self.eval_every_entry.setText(str(opt.eval_every))
+            if self.per_epoch_test_check:
+                self.per_epoch_test_check.setChecked(bool(opt.per_epoch_test))
+            if (
+                isinstance(opt.early_stopping, TrainingEarlyStopping)
+                and self.early_stopping_combo
+            ):
+                self.early_stopping_combo.setCurrentText(opt.early_stopping.value)
+            if self.patience_entry:
+                self.patience_entry.setText(str(opt.patience))
+            if isinstance(opt.lr_scheduler, TrainingScheduler) and self.scheduler_combo:
+                self.scheduler_combo.setCurrentText(opt.lr_scheduler.value)
+            if self.profile_check:
+                self.profile_check.setChecked(bool(opt.profile))
+            if self.precompute_saliency_check:
+                self.precompute_saliency_check.setChecked(bool(opt.precompute_saliency))
+
+            # Restore augmentation
+            augmentation = (
+                opt.augmentation if isinstance(opt.augmentation, dict) else {}
+            )
+            for name, entry in self.augmentation_entries.items():
+                entry.setText(str(augmentation.get(name, 0)))
+            if self.augment_prob_entry:
+                self.augment_prob_entry.setText(str(opt.augment_prob))
+
+            # Restore data loading
+            if self.workers_entry:
+                self.workers_entry.setText(str(opt.num_workers))
+            if self.prefetch_entry:
+                self.prefetch_entry.setText(str(opt.prefetch_factor))
+            if self.pin_memory_check:
+                self.pin_memory_check.setChecked(bool(opt.pin_memory))
+            if self.persistent_workers_check:
+                self.persistent_workers_check.setChecked(bool(opt.persistent_workers))
+            if self.cache_check:
+                self.cache_check.setChecked(bool(opt.cache_data))
+            if self.cache_budget_entry:
+                self.cache_budget_entry.setText(str(opt.cache_budget_mb))
+
     def init_ui(self):
         """Initialize the dialog UI with training parameter controls."""
         layout = QVBoxLayout(self)
@@ -175,6 +282,16 @@ class TrainingSettingDialog(BaseDialog):
         self.checkpoint_entry = QLineEdit("1")
         form_layout.addRow("CheckPoint epoch", self.checkpoint_entry)
 
+        self.keep_last_entry = QLineEdit("0")
+        self.keep_last_entry.setToolTip(
+            "Number of most recent epoch checkpoints kept per repeat (0 keeps all)"
+        )
+        form_layout.addRow("Keep last checkpoints", self.keep_last_entry)
+
+        self.keep_best_check = QCheckBox("Always keep best checkpoint")
+        self.keep_best_check.setChecked(True)
+        form_layout.addRow(self.keep_best_check)
+
         # Evaluation
         self.evaluation_combo = QComboBox()
         self.evaluation_list = [i.value for i in TrainingEvaluation]
@@ -182,11 +299,130 @@ class TrainingSettingDialog(BaseDialog):
         self.evaluation_combo.setCurrentIndex(2)  # Default: Best testing performance
         form_layout.addRow("Evaluation", self.evaluation_combo)
 
+        self.precision_combo = QComboBox()
+        self.precision_combo.addItems([i.value for i in TrainingPrecision])
+        self.precision_combo.setToolTip(
+            "bf16 uses mixed precision on CPU or GPU; fp16 requires a GPU"
+        )
+        form_layout.addRow("Precision", self.precision_combo)
+
         self.repeat_entry = QLineEdit("1")
         form_layout.addRow("Repeat Number", self.repeat_entry)
 
+        self.parallel_jobs_entry = QLineEdit("1")
+        self.parallel_jobs_entry.setToolTip(
+            "Number of repeats trained at the same time in separate processes "
+            "(CPU only)"
+        )
+        form_layout.addRow("Parallel repeats", self.parallel_jobs_entry)
+
+        self.vectorize_check = QCheckBox("Train repeats together (vectorized)")
+        self.vectorize_check.setToolTip(
+            "Train all repeats in one batched pass over shared batches; "
+            "best suited to small models"
+        )
+        form_layout.addRow(self.vectorize_check)
+
         layout.addLayout(form_layout)
 
+        # Evaluation schedule
+        schedule_group = QGroupBox("Schedule")
+        schedule_layout = QFormLayout(schedule_group)
+
+        self.eval_every_entry = QLineEdit("1")
+        self.eval_every_entry.setToolTip(
+            "Validate every N epochs; the last epoch is always validated"
+        )
+        schedule_layout.addRow("Evaluate every", self.eval_every_entry)
+
+        self.per_epoch_test_check = QCheckBox("Test at every evaluation")
+        self.per_epoch_test_check.setChecked(True)
+        self.per_epoch_test_check.setToolTip(
+            "When unchecked, the test set is only evaluated after the last epoch"
+        )
+        schedule_layout.addRow(self.per_epoch_test_check)
+
+        self.early_stopping_combo = QComboBox()
+        self.early_stopping_combo.addItems([i.value for i in TrainingEarlyStopping])
+        schedule_layout.addRow("Early stopping", self.early_stopping_combo)
+
+        self.patience_entry = QLineEdit("10")
+        schedule_layout.addRow("Patience (epochs)", self.patience_entry)
+
+        self.scheduler_combo = QComboBox()
+        self.scheduler_combo.addItems([i.value for i in TrainingScheduler])
+        schedule_layout.addRow("LR scheduler", self.scheduler_combo)
+
+        self.profile_check = QCheckBox("Profile epochs")
+        self.profile_check.setToolTip(
+            "Record data, forward, backward, optimizer, evaluation and "
+            "checkpoint times, throughput and peak memory of every epoch; "
+            "slows down GPU training"
+        )
+        schedule_layout.addRow(self.profile_check)
+
+        self.precompute_saliency_check = QCheckBox("Compute saliency after training")
+        self.precompute_saliency_check.setToolTip(
+            "Compute every saliency method for every class when a repeat "
+            "finishes; otherwise each map is computed when first visualized"
+        )
+        schedule_layout.addRow(self.precompute_saliency_check)
+
+        layout.addWidget(schedule_group)
+
+        # Augmentation of training batches
+        augmentation_group = QGroupBox("Augmentation")
+        augmentation_layout = QFormLayout(augmentation_group)
+        augmentation_tips = {
+            TrainingAugmentation.TIME_SHIFT: "Maximum shift as a fraction of "
+            "the epoch length",
+            TrainingAugmentation.AMPLITUDE_SCALE: "Maximum relative change of "
+            "the amplitude",
+            TrainingAugmentation.GAUSSIAN_NOISE: "Noise level relative to the "
+            "standard deviation of each channel",
+            TrainingAugmentation.CHANNEL_DROPOUT: "Probability of zeroing each channel",
+            TrainingAugmentation.FREQUENCY_SHIFT: "Maximum frequency shift in Hz",
+            TrainingAugmentation.MIXUP: "Alpha of the mixing weight distribution",
+        }
+        for name in TrainingAugmentation:
+            entry = QLineEdit("0")
+            entry.setToolTip(f"{augmentation_tips[name]} (0 disables it)")
+            augmentation_layout.addRow(name.value, entry)
+            self.augmentation_entries[name] = entry
+
+        self.augment_prob_entry = QLineEdit("0.5")
+        self.augment_prob_entry.setToolTip(
+            "Probability of applying each augmentation to a sample "
+            "(to a batch for mixup); only training batches are augmented"
+        )
+        augmentation_layout.addRow("Probability", self.augment_prob_entry)
+
+        layout.addWidget(augmentation_group)
+
+        # Data loading
+        loading_group = QGroupBox("Data Loading")
+        loading_layout = QFormLayout(loading_group)
+
+        self.workers_entry = QLineEdit("0")
+        loading_layout.addRow("Workers", self.workers_entry)
+
+        self.prefetch_entry = QLineEdit("2")
+        loading_layout.addRow("Prefetch factor", self.prefetch_entry)
+
+        self.pin_memory_check = QCheckBox("Pin memory")
+        loading_layout.addRow(self.pin_memory_check)
+
+        self.persistent_workers_check = QCheckBox("Persistent workers")
+        loading_layout.addRow(self.persistent_workers_check)
+
+        self.cache_check = QCheckBox("Cache dataset on device")
+        loading_layout.addRow(self.cache_check)
+
+        self.cache_budget_entry = QLineEdit("1024")
+        loading_layout.addRow("Cache budget (MB)", self.cache_budget_entry)
+
+        layout.addWidget(loading_group)
+
         # Buttons
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
@@ -231,11 +467,30 @@ class TrainingSettingDialog(BaseDialog):
         """
         if (
             not self.evaluation_combo
+            or not self.precision_combo
             or not self.epoch_entry
             or not self.bs_entry
             or not self.lr_entry
             or not self.checkpoint_entry
+            or not self.keep_last_entry
+            or not self.keep_best_check
             or not self.repeat_entry
+            or not self.parallel_jobs_entry
+            or not self.vectorize_check
+            or not self.eval_every_entry
+            or not self.per_epoch_test_check
+            or not self.early_stopping_combo
+            or not self.patience_entry
+            or not self.scheduler_combo
+            or not self.profile_check
+            or not self.precompute_saliency_check
+            or not self.augment_prob_entry
+            or not self.workers_entry
+            or not self.prefetch_entry
+            or not self.pin_memory_check
+            or not self.persistent_workers_check
+            or not self.cache_check
+            or not self.cache_budget_entry
         ):
             return
 
@@ -250,12 +505,27 @@ class TrainingSettingDialog(BaseDialog):
                 epoch = int(self.epoch_entry.text())
                 bs = int(self.bs_entry.text())
                 ckpt = int(self.checkpoint_entry.text())
+                keep_last = int(self.keep_last_entry.text())
                 repeat = int(self.repeat_entry.text())
+                parallel_jobs = int(self.parallel_jobs_entry.text())
+                eval_every = int(self.eval_every_entry.text())
+                patience = int(self.patience_entry.text())
                 lr = float(self.lr_entry.text())
+                workers = int(self.workers_entry.text())
+                prefetch = int(self.prefetch_entry.text())
+                cache_budget = float(self.cache_budget_entry.text())
+                augmentation = {
+                    name: float(entry.text())
+                    for name, entry in self.augmentation_entries.items()
+                }
+                augment_prob = float(self.augment_prob_entry.text())
             except ValueError as e:
                 msg = (
-                    "Epoch, Batch Size, Checkpoint, Repeat must be Integers.\n"
-                    "Learning Rate must be Float."
+                    "Epoch, Batch Size, Checkpoint, Keep last checkpoints, "
+                    "Repeat, Parallel repeats, Evaluate every, Patience, "
+                    "Workers and Prefetch factor must be Integers.\n"
+                    "Learning Rate, Cache budget and augmentation settings "
+                    "must be Float."
                 )
                 raise ValueError(msg) from e
 
@@ -274,6 +544,26 @@ class TrainingSettingDialog(BaseDialog):
                 ckpt,
                 evaluation_option,
                 repeat,
+                cache_data=self.cache_check.isChecked(),
+                cache_budget_mb=cache_budget,
+                num_workers=workers,
+                prefetch_factor=prefetch,
+                pin_memory=self.pin_memory_check.isChecked(),
+                persistent_workers=self.persistent_workers_check.isChecked(),
+                parallel_jobs=parallel_jobs,
+                vectorize_repeats=self.vectorize_check.isChecked(),
+                precision=self.precision_combo.currentText(),
+                eval_every=eval_every,
+                per_epoch_test=self.per_epoch_test_check.isChecked(),
+                early_stopping=self.early_stopping_combo.currentText(),
+                patience=patience,
+                lr_scheduler=self.scheduler_combo.currentText(),
+                checkpoint_keep_last=keep_last,
+                checkpoint_keep_best=self.keep_best_check.isChecked(),
+                profile=self.profile_check.isChecked(),
+                precompute_saliency=self.precompute_saliency_check.isChecked(),
+                augmentation=augmentation,
+                augment_prob=augment_prob,
             )
             super().accept()
         except Exception as e:
@@ -0,0 +1,85 @@
+"""Leaderboard table widget comparing finished runs across training plans."""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QHeaderView, QTableWidget, QTableWidgetItem
+
+from XBrainLab.ui.styles.stylesheets import Stylesheets
+
+# (header, row key, decimals or None for text)
+_COLUMNS = [
+    ("Plan", "plan", None),
+    ("Run", "name", None),
+    ("Model", "model_name", None),
+    ("Accuracy", "accuracy", 4),
+    ("AUC", "auc", 4),
+    ("Kappa", "kappa", 4),
+    ("Macro F1", "macro_f1", 4),
+    ("Epochs", "epochs", 0),
+    ("Time (s)", "training_time", 1),
+    ("Samples/s", "throughput", 1),
+]
+_ACCURACY_COLUMN = 3
+
+
+class LeaderboardTableWidget(QTableWidget):
+    """Sortable table with one row per finished run of every plan.
+
+    Rows are the output of :meth:`Leaderboard.get_rows`, sorted by
+    accuracy until another header is clicked; numeric columns sort by
+    value.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize the leaderboard table widget.
+
+        Args:
+            parent: Optional parent widget.
+
+        """
+        super().__init__(parent)
+        self.init_ui()
+
+    def init_ui(self):
+        """Configure columns, headers, sorting, and styling for the table."""
+        self.setColumnCount(len(_COLUMNS))
+        self.setHorizontalHeaderLabels([header for header, _, _ in _COLUMNS])
+
+        header = self.horizontalHeader()
+        if header is not None:
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        v_header = self.verticalHeader()
+        if v_header is not None:
+            v_header.setVisible(False)
+        self.setAlternatingRowColors(True)
+        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setSortingEnabled(True)
+        self.sortByColumn(_ACCURACY_COLUMN, Qt.SortOrder.DescendingOrder)
+        self.setStyleSheet(Stylesheets.METRICS_TABLE)
+
+    def update_data(self, rows: list[dict]):
+        """Update table with leaderboard rows.
+
+        Args:
+            rows: Rows of :meth:`Leaderboard.get_rows`, re-sorted by the
+                current sort column.
+
+        """
+        # Sorting while inserting would move rows between setItem calls
+        self.setSortingEnabled(False)
+        self.setRowCount(0)
+        for row_data in rows:
+            row = self.rowCount()
+            self.insertRow(row)
+            for column, (_, key, decimals) in enumerate(_COLUMNS):
+                value = row_data.get(key)
+                item = QTableWidgetItem()
+                if decimals is None or value is None:
+                    item.setText("-" if value is None else str(value))
+                else:
+                    # Numeric data so that sorting compares values
+                    item.setData(Qt.ItemDataRole.DisplayRole, round(value, decimals))
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.setItem(row, column, item)
+        self.setSortingEnabled(True)
@@ -1,12 +1,17 @@
 """Evaluation panel for viewing confusion matrices, metrics, and model summaries."""
 
+import contextlib
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
+    QFileDialog,
     QGroupBox,
     QHBoxLayout,
     QLabel,
+    QMessageBox,
+    QPushButton,
     QStackedWidget,
     QTabWidget,
     QTextEdit,
@@ -18,8 +23,10 @@ from XBrainLab.backend.training.record.wrappers import PooledRecordWrapper
 from XBrainLab.ui.components.info_panel import AggregateInfoPanel
 from XBrainLab.ui.core.base_panel import BasePanel
 from XBrainLab.ui.panels.evaluation.confusion_matrix import ConfusionMatrixWidget
+from XBrainLab.ui.panels.evaluation.leaderboard_table import LeaderboardTableWidget
 from XBrainLab.ui.panels.evaluation.metrics_bar_chart import MetricsBarChartWidget
 from XBrainLab.ui.panels.evaluation.metrics_table import MetricsTableWidget
+from XBrainLab.ui.panels.evaluation.statistics_table import StatisticsTableWidget
 from XBrainLab.ui.styles.stylesheets import Stylesheets
 from XBrainLab.ui.styles.theme import Theme
 
@@ -41,6 +48,11 @@ class EvaluationPanel(BasePanel):
         matrix_widget: ``ConfusionMatrixWidget`` for the matrix plot.
         bar_chart: ``MetricsBarChartWidget`` for per-class bar chart.
         metrics_table: ``MetricsTableWidget`` for the metrics table.
+        statistics_table: ``StatisticsTableWidget`` with the confidence
+            intervals and chance-level p-values of the selection.
+        btn_export_stats: ``QPushButton`` exporting the statistics to CSV.
+        leaderboard_table: ``LeaderboardTableWidget`` ranking the finished
+            runs of all plans.
         summary_text: ``QTextEdit`` displaying the model summary string.
         info_panel: ``AggregateInfoPanel`` in the sidebar.
 
@@ -95,6 +107,9 @@ class EvaluationPanel(BasePanel):
         self.model_combo.clear()
 
         plans = self.controller.get_plans()
+        self.leaderboard_table.update_data(
+            self.controller.get_leaderboard().get_rows() if plans else []
+        )
         if plans:
             for i, plan in enumerate(plans):
                 self.model_combo.addItem(f"Fold {i + 1}: {plan.get_name()}", plan)
@@ -113,6 +128,7 @@ class EvaluationPanel(BasePanel):
             self.matrix_widget.update_plot(None)  # Clear plot
             self.bar_chart.update_plot({})  # Clear bar chart
             self.metrics_table.update_data({})
+            self.update_statistics(None)
             self.summary_text.clear()
             # Show No Data Label
             self.plot_stack.setCurrentIndex(1)
@@ -199,6 +215,7 @@ class EvaluationPanel(BasePanel):
 
             self.metrics_table.update_data(metrics)
             self.bar_chart.update_plot(metrics)
+            self.update_statistics(self.controller.get_pooled_eval_record(plan))
             return
 
         # Handle Single Record
@@ -216,11 +233,41 @@ class EvaluationPanel(BasePanel):
         else:
             self.metrics_table.update_data({})
             self.bar_chart.update_plot({})
+        self.update_statistics(record.eval_record)
 
         plan = self.model_combo.currentData()
         if plan:
             self.update_model_summary(plan, record=record)
 
+    def update_statistics(self, eval_record):
+        """Show the bootstrap intervals and permutation tests of a record.
+
+        Args:
+            eval_record: Evaluation record of the selection (the pooled
+                record for the average), or ``None`` to clear the table.
+
+        """
+        self.statistics = None
+        if eval_record is not None:
+            with contextlib.suppress(ValueError):
+                self.statistics = eval_record.get_statistics()
+        self.statistics_table.update_data(self.statistics)
+        self.btn_export_stats.setEnabled(self.statistics is not None)
+
+    def export_statistics(self):
+        """Save the statistics of the current selection to a CSV file."""
+        if self.statistics is None:
+            return
+        filepath, _ = QFileDialog.getSaveFileName(
+            self, "Export Statistics", "statistics.csv", "CSV Files (*.csv)"
+        )
+        if not filepath:
+            return
+        try:
+            self.statistics.export_csv(filepath)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to export statistics: {e}")
+
     def update_model_summary(self, plan, record=None):
         """Generate and display model summary."""
         summary_str = self.controller.get_model_summary_str(plan, record)
@@ -301,9 +348,14 @@ class EvaluationPanel(BasePanel):
         toolbar_layout.addWidget(self.chk_percentage)
 
         toolbar_layout.addStretch()
+
+        self.btn_export_stats = QPushButton("Export Statistics")
+        self.btn_export_stats.setEnabled(False)
+        self.btn_export_stats.clicked.connect(self.export_statistics)
+        toolbar_layout.addWidget(self.btn_export_stats)
         plots_layout.addLayout(toolbar_layout)
 
-        # 2. Bottom Section (Tabs: Metrics & Model Summary)
+        # 2. Bottom Section (Tabs: Metrics, Statistics, Leaderboard & Summary)
         self.bottom_tabs = QTabWidget()
 
         # Tab 1: Metrics
@@ -314,7 +366,24 @@ class EvaluationPanel(BasePanel):
         metrics_layout.addWidget(self.metrics_table)
         self.bottom_tabs.addTab(self.metrics_tab, "Metrics Summary")
 
-        # Tab 2: Model Summary
+        # Tab 2: Statistics
+        self.statistics_tab = QWidget()
+        statistics_layout = QVBoxLayout(self.statistics_tab)
+        statistics_layout.setContentsMargins(10, 10, 10, 10)
+        self.statistics = None
+        self.statistics_table = StatisticsTableWidget(self)
+        statistics_layout.addWidget(self.statistics_table)
+        self.bottom_tabs.addTab(self.statistics_tab, "Statistics")
+
+        # Tab 3: Leaderboard
+        self.leaderboard_tab = QWidget()
+        leaderboard_layout = QVBoxLayout(self.leaderboard_tab)
+        leaderboard_layout.setContentsMargins(10, 10, 10, 10)
+        self.leaderboard_table = LeaderboardTableWidget(self)
+        leaderboard_layout.addWidget(self.leaderboard_table)
+        self.bottom_tabs.addTab(self.leaderboard_tab, "Leaderboard")
+
+        # Tab 4: Model Summary
         self.summary_tab = QWidget()
         summary_layout = QVBoxLayout(self.summary_tab)
         summary_layout.setContentsMargins(10, 10, 10, 10)
@@ -0,0 +1,87 @@
+"""Statistics table widget for metric confidence intervals and p-values."""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QHeaderView, QTableWidget, QTableWidgetItem
+
+from XBrainLab.backend.training.record.statistics import EvaluationStatistics
+from XBrainLab.ui.styles.stylesheets import Stylesheets
+
+# Display name of the overall metrics
+_METRIC_NAMES = {"accuracy": "Accuracy", "auc": "AUC", "kappa": "Kappa"}
+
+
+class StatisticsTableWidget(QTableWidget):
+    """Table widget showing the bootstrap interval and p-value of each metric.
+
+    One row per metric of an :class:`EvaluationStatistics`: accuracy, AUC,
+    kappa and the F1-score of each class. Read-only, dark-theme styled.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize the statistics table widget.
+
+        Args:
+            parent: Optional parent widget.
+
+        """
+        super().__init__(parent)
+        self.init_ui()
+
+    def init_ui(self):
+        """Configure columns, headers, and styling for the table."""
+        columns = ["Metric", "Estimate", "CI Low", "CI High", "p (vs. chance)"]
+        self.setColumnCount(len(columns))
+        self.setHorizontalHeaderLabels(columns)
+
+        header = self.horizontalHeader()
+        if header is not None:
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        v_header = self.verticalHeader()
+        if v_header is not None:
+            v_header.setVisible(False)
+        self.setAlternatingRowColors(True)
+        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setStyleSheet(Stylesheets.METRICS_TABLE)
+
+    def update_data(self, statistics: EvaluationStatistics | None):
+        """Update table with statistics.
+
+        Args:
+            statistics: Result of :meth:`EvalRecord.get_statistics`, or
+                ``None`` to clear the table.
+
+        """
+        self.setRowCount(0)
+        if statistics is None:
+            return
+
+        confidence = f"{statistics.confidence:.0%}"
+        self.setHorizontalHeaderLabels(
+            [
+                "Metric",
+                "Estimate",
+                f"{confidence} CI Low",
+                f"{confidence} CI High",
+                "p (vs. chance)",
+            ]
+        )
+        for name, interval in statistics.metrics.items():
+            if name.startswith("f1-"):
+                label = f"F1 (Class {name[3:]})"
+            else:
+                label = _METRIC_NAMES.get(name, name)
+            row = self.rowCount()
+            self.insertRow(row)
+            values = [
+                label,
+                f"{interval.estimate:.4f}",
+                f"{interval.low:.4f}",
+                f"{interval.high:.4f}",
+                f"{interval.p_value:.4f}",
+            ]
+            for column, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.setItem(row, column, item)
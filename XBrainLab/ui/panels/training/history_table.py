@@ -165,8 +165,10 @@ class TrainingHistoryTable(QTableWidget):
 
             # Metrics
             def get_last(key, source):
-                if len(source[key]) > 0:
-                    val = source[key][-1]
+                # Skip epochs without evaluation (``eval_every`` > 1)
+                values = [v for v in source[key] if v is not None]
+                if len(values) > 0:
+                    val = values[-1]
                     try:
                         return float(val)
                     except (ValueError, TypeError):
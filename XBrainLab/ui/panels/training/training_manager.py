@@ -69,6 +69,7 @@ class TrainingManagerWindow(BaseDialog):
             plot_menu.addAction("Accuracy", self.plot_acc)
             plot_menu.addAction("AUC", self.plot_auc)
             plot_menu.addAction("Learning Rate", self.plot_lr)
+            plot_menu.addAction("Profile", self.plot_profile)
         layout.setMenuBar(menubar)
 
         # Table
@@ -153,6 +154,16 @@ class TrainingManagerWindow(BaseDialog):
         )
         win.exec()
 
+    def plot_profile(self):
+        """Open a plot dialog of the profiled epoch phases."""
+        win = PlotFigureWindow(
+            self,
+            self.training_plan_holders,
+            PlotType.PROFILE,
+            title="Profile Plot",
+        )
+        win.exec()
+
     def start_training(self):
         """Disable the start button and launch the trainer."""
         self.start_btn.setEnabled(False)
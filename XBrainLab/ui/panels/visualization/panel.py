@@ -13,10 +13,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from XBrainLab.backend.training.record import EvalRecord
 from XBrainLab.backend.utils.logger import logger
 from XBrainLab.backend.visualization import supported_saliency_methods
 from XBrainLab.ui.core.base_panel import BasePanel
 from XBrainLab.ui.styles.stylesheets import Stylesheets
+from XBrainLab.ui.styles.theme import Theme
 
 from .control_sidebar import ControlSidebar
 from .saliency_views.map_view import SaliencyMapWidget
@@ -126,6 +128,11 @@ class VisualizationPanel(BasePanel):
         ctrl_layout.addWidget(self.abs_check)
 
         ctrl_layout.addStretch()
+
+        # Time spent computing the saliency maps shown (computed on demand)
+        self.cost_label = QLabel("")
+        self.cost_label.setStyleSheet(f"color: {Theme.TEXT_MUTED};")
+        ctrl_layout.addWidget(self.cost_label)
         left_layout.addWidget(ctrl_bar)
 
         # 2. Plots Group
@@ -217,8 +224,9 @@ class VisualizationPanel(BasePanel):
             # Add runs
             for i in range(trainer.option.repeat_num):
                 self.run_combo.addItem(f"Run {i + 1}")
-            # Add Average
+            # Add Average and across-run variability
             self.run_combo.addItem("Average")
+            self.run_combo.addItem("Variability (Std)")
 
         self.run_combo.blockSignals(False)
 
@@ -255,8 +263,11 @@ class VisualizationPanel(BasePanel):
         target_plan = None
         eval_record = None
 
-        if run_name == "Average":
-            eval_record = self.controller.get_averaged_record(trainer)
+        if run_name in ("Average", "Variability (Std)"):
+            if run_name == "Average":
+                eval_record = self.controller.get_averaged_record(trainer)
+            else:
+                eval_record = self.controller.get_variability_record(trainer)
             if not eval_record:
                 if current_widget and hasattr(current_widget, "show_error"):
                     current_widget.show_error("No finished runs to average.")
@@ -299,10 +310,22 @@ class VisualizationPanel(BasePanel):
                 eval_record,
             )
 
+            self.update_cost_label(eval_record, method_name)
+
             # Force UI update to ensure plot appears immediately
             if current_widget:
                 current_widget.repaint()
 
+    def update_cost_label(self, eval_record, method_name):
+        """Show the time spent obtaining the saliency maps of the method."""
+        cost = None
+        if isinstance(eval_record, EvalRecord):
+            cost = eval_record.saliency_cost.get(method_name)
+        if cost is None:
+            self.cost_label.setText("")
+        else:
+            self.cost_label.setText(f"{method_name}: {cost:.2f} s")
+
     def update_info(self):
         """Update the Sidebar Info Panel and refresh combos."""
         if hasattr(self, "sidebar"):
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 from XBrainLab.backend.controller.evaluation_controller import EvaluationController
+from XBrainLab.backend.training.record import EvalRecord, RunSummary
 
 # Ensure torchinfo is mockable even when not installed
 _mock_torchinfo = MagicMock()
@@ -60,25 +61,67 @@ def test_get_pooled_eval_result_success(controller, mock_study):
     plan = MagicMock()
     plan.get_plans.return_value = [r1, r2]
 
-    # Needs to mock EvalRecord inside the controller logic
-    # The controller does: temp_record = EvalRecord(...)
-    with patch(
-        "XBrainLab.backend.controller.evaluation_controller.EvalRecord"
-    ) as MockRecord:
-        instance = MockRecord.return_value
-        instance.get_per_class_metrics.return_value = {"acc": 0.9}
+    labels, outputs, metrics = controller.get_pooled_eval_result(plan)
 
-        labels, outputs, metrics = controller.get_pooled_eval_result(plan)
+    # Check concatenation happened
+    assert np.array_equal(labels, np.array([0, 1, 1, 0]))
+    assert len(outputs) == 4
+    assert metrics["macro_avg"]["support"] == 4
+    assert metrics[0]["recall"] == 1.0
 
-        # Check concatenation happened
-        assert len(labels) == 4
-        assert len(outputs) == 4
-        assert metrics == {"acc": 0.9}
 
-        # Verify call to EvalRecord
-        # Should have concatenated arrays
-        args = MockRecord.call_args[0]
-        assert np.array_equal(args[0], np.array([0, 1, 1, 0]))
+def test_pooled_eval_record_cached(controller):
+    def finished(label):
+        record = MagicMock()
+        record.is_finished.return_value = True
+        record.eval_record = EvalRecord(
+            np.array(label), np.eye(2)[label], {}, {}, {}, {}, {}
+        )
+        return record
+
+    r1 = finished([0, 1])
+    r2 = finished([1, 1])
+    plan = MagicMock()
+    plan.get_plans.return_value = [r1]
+
+    pooled = controller.get_pooled_eval_record(plan)
+    assert controller.get_pooled_eval_record(plan) is pooled
+    compute = pooled._compute_per_class_metrics
+    with patch.object(EvalRecord, "_compute_per_class_metrics", wraps=compute) as mock:
+        controller.get_pooled_eval_result(plan)
+        controller.get_pooled_eval_result(plan)
+    assert mock.call_count == 1
+
+    # A newly finished run invalidates the pooled record
+    plan.get_plans.return_value = [r1, r2]
+    pooled = controller.get_pooled_eval_record(plan)
+    assert len(pooled.label) == 4
+    # So does a replaced evaluation record
+    r2.eval_record = EvalRecord(np.array([0]), np.eye(2)[[0]], {}, {}, {}, {}, {})
+    assert len(controller.get_pooled_eval_record(plan).label) == 3
+
+
+def test_pooled_statistics(controller, tmp_path):
+    plan = MagicMock()
+    plan.get_plans.return_value = []
+    assert controller.get_pooled_statistics(plan) is None
+    with pytest.raises(ValueError, match="No evaluation record"):
+        controller.export_pooled_statistics(plan, str(tmp_path / "stats.csv"))
+
+    record = MagicMock()
+    record.is_finished.return_value = True
+    label = np.array([0, 1, 1, 0, 1, 0])
+    record.eval_record = EvalRecord(label, np.eye(2)[label], {}, {}, {}, {}, {})
+    plan.get_plans.return_value = [record]
+    statistics = controller.get_pooled_statistics(plan, 50, 50)
+    assert statistics.n_samples == 6
+    assert statistics.metrics["accuracy"].estimate == 1.0
+    # Memoized with the pooled record
+    assert controller.get_pooled_statistics(plan, 50, 50) is statistics
+
+    filepath = tmp_path / "stats.csv"
+    controller.export_pooled_statistics(plan, str(filepath), 50, 50)
+    assert filepath.read_text().startswith("metric,estimate,low,high,p_value")
 
 
 def test_get_model_summary_str_from_record(controller):
@@ -123,3 +166,48 @@ def test_get_model_summary_error(controller):
         s = controller.get_model_summary_str(plan)
     assert "Error generating summary" in s
     assert "Shape error" in s
+
+
+def test_leaderboard_and_comparison(controller, mock_study):
+    def make_plan(name, predictions):
+        plan = MagicMock()
+        plan.get_name.return_value = name
+        records = []
+        for repeat, prediction in enumerate(predictions):
+            record = MagicMock()
+            record.is_finished.return_value = True
+            record.get_summary.return_value = RunSummary(
+                f"Repeat-{repeat}",
+                "EEGNet",
+                repeat,
+                5,
+                None,
+                {"accuracy": float(np.mean(np.array(prediction) == [0, 1, 1]))},
+                label=[0, 1, 1],
+                prediction=prediction,
+            )
+            records.append(record)
+        unfinished = MagicMock()
+        unfinished.is_finished.return_value = False
+        plan.get_plans.return_value = [*records, unfinished]
+        return plan
+
+    plan_a = make_plan("A", [[0, 1, 1], [0, 1, 0]])
+    plan_b = make_plan("B", [[0, 0, 0], [1, 0, 0]])
+    mock_study.trainer.get_training_plan_holders.return_value = [plan_a, plan_b]
+
+    assert len(controller.get_run_summaries(plan_a)) == 2
+    rows = controller.get_leaderboard().get_rows()
+    assert [(row["plan"], row["repeat"]) for row in rows] == [
+        ("A", 0),
+        ("A", 1),
+        ("B", 0),
+        ("B", 1),
+    ]
+    assert rows[0]["plan_index"] == 0
+
+    comparison = controller.compare_plans(plan_a, plan_b)
+    assert comparison.n_pairs == 2
+    assert comparison.n_samples == 6
+    assert comparison.only_a_correct == 4
+    assert comparison.only_b_correct == 0
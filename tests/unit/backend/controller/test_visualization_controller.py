@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
@@ -71,21 +71,19 @@ def test_get_averaged_record(controller):
     rec1 = MagicMock()
     rec1.label = np.array([0])
     rec1.output = np.array([[0.9]])
-    rec1.gradient = {"pool": np.array([1.0])}
-    rec1.gradient_input = {"pool": np.array([2.0])}
-    rec1.smoothgrad = {"pool": np.array([3.0])}
-    rec1.smoothgrad_sq = {"pool": np.array([4.0])}
-    rec1.vargrad = {"pool": np.array([5.0])}
+    rec1.get_saliency.side_effect = lambda method, label: {
+        "Gradient": np.array([1.0]),
+        "Gradient * Input": np.array([2.0]),
+    }[method]
     r1.get_eval_record.return_value = rec1
 
     # R2: Valid record
     r2 = MagicMock()
     rec2 = MagicMock()
-    rec2.gradient = {"pool": np.array([2.0])}  # Mean should be 1.5
-    rec2.gradient_input = {"pool": np.array([4.0])}  # Mean 3.0
-    rec2.smoothgrad = {"pool": np.array([3.0])}  # Mean 3.0
-    rec2.smoothgrad_sq = {"pool": np.array([4.0])}
-    rec2.vargrad = {"pool": np.array([5.0])}
+    rec2.get_saliency.side_effect = lambda method, label: {
+        "Gradient": np.array([2.0]),  # Mean should be 1.5
+        "Gradient * Input": np.array([4.0]),  # Mean 3.0
+    }[method]
     r2.get_eval_record.return_value = rec2
 
     # R3: Invalid record (None)
@@ -94,21 +92,43 @@ def test_get_averaged_record(controller):
 
     holder.get_plans.return_value = [r1, r2, r3]
 
-    # Patch EvalRecord to check constructor call
-    with patch(
-        "XBrainLab.backend.controller.visualization_controller.EvalRecord"
-    ) as MockRecord:
-        controller.get_averaged_record(holder)
-
-        args, kwargs = MockRecord.call_args
-        # Args order: label, output, gradient, gradient_input, smoothgrad,
-        # smoothgrad_sq, vargrad
-        # Check gradient
-        avg_grad = kwargs.get("gradient") or args[2]
-        assert avg_grad["pool"] == 1.5
-
-        avg_grad_input = kwargs.get("gradient_input") or args[3]
-        assert avg_grad_input["pool"] == 3.0
+    averaged = controller.get_averaged_record(holder)
+    # Nothing is computed until a map is requested
+    rec1.get_saliency.assert_not_called()
+
+    assert averaged.get_gradient(0) == 1.5
+    assert averaged.get_gradient_input(0) == 3.0
+    assert averaged.has_saliency("Gradient", 0)
+    assert not averaged.has_saliency("VarGrad", 0)
+    rec2.get_saliency.assert_any_call("Gradient", 0)
+
+
+def test_averages_cached_per_plan(controller):
+    holder = MagicMock()
+    records = []
+    for value in (1.0, 3.0):
+        rec = MagicMock()
+        rec.label = np.array([0])
+        rec.output = np.array([[0.9]])
+        rec.get_saliency.return_value = np.array([value])
+        records.append(rec)
+    holder.get_plans.return_value = [
+        MagicMock(get_eval_record=MagicMock(return_value=rec)) for rec in records
+    ]
+
+    assert controller.get_averaged_record(holder).get_gradient(0) == 2.0
+    assert np.isclose(controller.get_variability_record(holder).get_gradient(0), 2**0.5)
+    # A new averaged record reuses the statistics of the plan
+    assert controller.get_averaged_record(holder).get_gradient(0) == 2.0
+    assert records[0].get_saliency.call_count == 1
+    assert controller.get_saliency_aggregator(holder) is (
+        controller.get_saliency_aggregator(holder)
+    )
+
+    # New saliency parameters drop the statistics
+    controller.set_saliency_params({})
+    controller.get_averaged_record(holder).get_gradient(0)
+    assert records[0].get_saliency.call_count == 2
 
 
 def test_get_averaged_record_empty(controller):
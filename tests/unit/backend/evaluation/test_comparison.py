@@ -0,0 +1,95 @@
+import math
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from XBrainLab.backend.evaluation import Leaderboard, compare_runs
+from XBrainLab.backend.training.record import RunSummary
+
+
+def make_summary(repeat, label, prediction, training_time=1.0, **kwargs):
+    label = list(label)
+    prediction = list(prediction)
+    accuracy = float(np.mean(np.array(label) == np.array(prediction)))
+    return RunSummary(
+        name=f"Repeat-{repeat}",
+        model_name="EEGNet",
+        repeat=repeat,
+        epochs=10,
+        early_stop_epoch=None,
+        metrics={"accuracy": accuracy, "auc": 0.5, "kappa": 0.0},
+        training_time=training_time,
+        label=label,
+        prediction=prediction,
+        **kwargs,
+    )
+
+
+def test_leaderboard_sorting(tmp_path):
+    leaderboard = Leaderboard()
+    leaderboard.add(0, "A", make_summary(0, [0, 1], [0, 1], training_time=3.0))
+    leaderboard.add(1, "B", make_summary(0, [0, 1], [0, 0], training_time=1.0))
+    leaderboard.add(1, "B", make_summary(1, [0, 1], [1, 0], throughput=5.0))
+
+    rows = leaderboard.get_rows()
+    assert [row["accuracy"] for row in rows] == [1.0, 0.5, 0.0]
+    assert rows[0]["plan"] == "A"
+    rows = leaderboard.get_rows("training_time", descending=False)
+    assert [row["training_time"] for row in rows] == [1.0, 1.0, 3.0]
+    # Missing values come last
+    rows = leaderboard.get_rows("throughput")
+    assert [row["throughput"] for row in rows] == [5.0, None, None]
+    assert [row["plan"] for row in leaderboard.get_rows(None)] == ["A", "B", "B"]
+
+    path = tmp_path / "leaderboard.csv"
+    leaderboard.export_csv(str(path))
+    lines = path.read_text().splitlines()
+    assert lines[0].startswith("plan_index,plan,name,model_name,repeat,accuracy")
+    assert len(lines) == 4
+
+
+def test_compare_runs():
+    rng = np.random.default_rng(0)
+    label = rng.integers(0, 2, size=(3, 50))
+    good = [make_summary(i, label[i], label[i]) for i in range(3)]
+    flipped = [
+        make_summary(i, y, np.where(rng.random(50) < 0.3, 1 - y, y))
+        for i, y in enumerate(label)
+    ]
+
+    result = compare_runs(good, flipped)
+    assert result.n_pairs == 3
+    assert result.accuracy_a == 1.0
+    assert result.only_b_correct == 0
+    assert result.n_samples == 150
+    expected = stats.binomtest(0, result.only_a_correct).pvalue
+    assert result.mcnemar_p_value == pytest.approx(expected)
+    assert result.mcnemar_p_value < 0.001
+    t_test = stats.ttest_rel(
+        [s.metrics["accuracy"] for s in good],
+        [s.metrics["accuracy"] for s in flipped],
+    )
+    assert result.t_p_value == pytest.approx(t_test.pvalue)
+    assert result.mean_difference == pytest.approx(
+        result.accuracy_a - result.accuracy_b
+    )
+
+    # Identical models do not differ
+    same = compare_runs(good, good)
+    assert same.mcnemar_p_value == 1.0
+    assert same.mean_difference == 0
+
+
+def test_compare_runs_unpaired():
+    a = [make_summary(0, [0, 1], [0, 1])]
+    # Only repeat 0 is paired, evaluated on other epochs
+    b = [make_summary(0, [1, 1], [1, 0]), make_summary(1, [0], [0])]
+    result = compare_runs(a, b)
+    assert result.n_pairs == 1
+    assert math.isnan(result.t_p_value)
+    assert math.isnan(result.mcnemar_p_value)
+    assert result.n_samples == 0
+
+    with pytest.raises(ValueError, match="No paired repeats"):
+        compare_runs(a, [make_summary(2, [0], [0])])
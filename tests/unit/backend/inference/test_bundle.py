@@ -0,0 +1,85 @@
+"""Unit tests for :mod:`XBrainLab.backend.inference.bundle`."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+import torch
+
+from tests.unit.backend.training.test_training_plan import (
+    LinearModel,
+    dataset,  # noqa: F401
+    epochs,  # noqa: F401
+    preprocessed_data_list,  # noqa: F401
+    training_option,  # noqa: F401
+    y,  # noqa: F401
+)
+from XBrainLab.backend.inference import ModelBundle, register_model
+from XBrainLab.backend.preprocessor import PreprocessStep
+from XBrainLab.backend.training import ModelHolder, TrainingPlanHolder
+
+
+@pytest.fixture
+def plan(dataset, training_option, tmp_path):  # noqa: F811
+    training_option.output_dir = str(tmp_path)
+    training_option.epoch = 1
+    training_option.repeat_num = 1
+    return TrainingPlanHolder(
+        ModelHolder(LinearModel, {}), dataset, training_option, {}
+    )
+
+
+def test_bundle_requires_trained_weights(plan):
+    with pytest.raises(ValueError, match="no weights"):
+        ModelBundle.from_plan(plan)
+
+
+def test_bundle_from_plan_round_trip(plan, tmp_path):
+    plan.dataset.get_epoch_data().preprocess_steps = [
+        PreprocessStep("Filtering", (1.0, 40.0), {"notch_freqs": None}),
+    ]
+    plan.train()
+    bundle = ModelBundle.from_plan(plan)
+    assert bundle.model_class == f"{LinearModel.__module__}:LinearModel"
+    assert bundle.get_class_names() == ["C1", "C2", "C3", "C4"]
+    assert bundle.ch_names == ["C1"]
+
+    path = str(tmp_path / "model.pt")
+    bundle.save(path)
+    loaded = ModelBundle.load(path)
+    assert loaded.model_args == bundle.model_args
+    assert loaded.label_map == bundle.label_map
+    assert loaded.preprocess_steps == [
+        PreprocessStep("Filtering", (1.0, 40.0), {"notch_freqs": None}),
+    ]
+
+    model = loaded.get_model()
+    assert not model.training
+    state = plan.get_eval_state(plan.get_plans()[0])
+    for key, value in model.state_dict().items():
+        assert torch.equal(value, state[key].cpu())
+
+
+def test_bundle_unknown_model_class(plan):
+    plan.train()
+    bundle = ModelBundle.from_plan(plan)
+    bundle.model_class = "missing.module:Model"
+    with pytest.raises(ValueError, match="Unknown model"):
+        bundle.get_model()
+
+
+def test_bundle_tampered_model_class(plan, tmp_path):
+    plan.train()
+    bundle = ModelBundle.from_plan(plan)
+    # A crafted file naming any importable callable must not be run
+    bundle.model_class = "subprocess:run"
+    bundle.model_params = {"args": ["echo", "tampered"]}
+    bundle.model_args = {}
+    path = str(tmp_path / "model.pt")
+    bundle.save(path)
+    with patch("subprocess.run") as run, pytest.raises(ValueError, match="Unknown"):
+        ModelBundle.load(path).get_model()
+    run.assert_not_called()
+
+    with pytest.raises(ValueError, match="is not a torch"):
+        register_model(subprocess.run)
@@ -0,0 +1,122 @@
+"""Unit tests for :mod:`XBrainLab.backend.inference.predictor` and the CLI."""
+
+import csv
+
+import mne
+import numpy as np
+import pytest
+import torch
+
+from XBrainLab.backend.inference import BatchPredictor, ModelBundle, register_model
+from XBrainLab.backend.inference.cli import collect_files, main
+from XBrainLab.backend.preprocessor import PreprocessStep
+
+SFREQ = 50
+DURATION = 10
+
+
+class FlatModel(torch.nn.Module):
+    def __init__(self, n_classes, channels, samples, sfreq):
+        super().__init__()
+        self.fc = torch.nn.Linear(channels * samples, n_classes)
+
+    def forward(self, x):
+        return self.fc(x.flatten(1))
+
+
+register_model(FlatModel)
+
+
+@pytest.fixture
+def bundle():
+    torch.manual_seed(0)
+    model = FlatModel(2, 2, SFREQ, SFREQ)
+    return ModelBundle(
+        model_class=f"{__name__}:FlatModel",
+        model_params={},
+        model_args={"n_classes": 2, "channels": 2, "samples": SFREQ, "sfreq": SFREQ},
+        state_dict=model.state_dict(),
+        preprocess_steps=[
+            PreprocessStep("ChannelSelection", (["C4", "C3"],)),
+            PreprocessStep("WindowEpoch", (1.0, 0.0)),
+            # Label renaming is not replayed on new recordings
+            PreprocessStep("EditEventName", ({"left": "right"},)),
+        ],
+        label_map={0: "wake", 1: "sleep"},
+        ch_names=["C4", "C3"],
+    )
+
+
+@pytest.fixture
+def recording(tmp_path):
+    info = mne.create_info(["C3", "Pz", "C4"], SFREQ, "eeg")
+    data = np.random.default_rng(0).standard_normal((3, SFREQ * DURATION)) * 1e-5
+    path = tmp_path / "night" / "sub-01_raw.fif"
+    path.parent.mkdir()
+    mne.io.RawArray(data, info).save(path)
+    return str(path)
+
+
+def test_predictor_validation(bundle):
+    with pytest.raises(ValueError, match="batch size"):
+        BatchPredictor(bundle, batch_size=0)
+    with pytest.raises(ValueError, match="workers"):
+        BatchPredictor(bundle, workers=0)
+
+
+def test_predictor_prepare_and_predict(bundle, recording):
+    predictor = BatchPredictor(bundle, batch_size=3)
+    raw = predictor.prepare(recording)
+    assert not raw.is_raw()
+    assert raw.get_mne().ch_names == ["C4", "C3"]
+
+    data = predictor.get_epoch_data(raw)
+    assert data.shape == (DURATION, 2, SFREQ)
+    probabilities = predictor.predict(data)
+    expected = torch.softmax(
+        predictor.model(torch.as_tensor(data, dtype=torch.float32)), dim=-1
+    )
+    np.testing.assert_allclose(probabilities, expected.detach().numpy(), rtol=1e-5)
+    assert predictor.predict(data[:0]).shape == (0, 2)
+
+
+def test_predictor_rejects_mismatched_epochs(bundle, recording):
+    bundle.preprocess_steps[1] = PreprocessStep("WindowEpoch", (2.0, 0.0))
+    predictor = BatchPredictor(bundle)
+    result = predictor.predict_file(recording, "unused")
+    assert result.output_path is None
+    assert "do not match the model input" in result.error
+
+
+def test_predictor_predict_files(bundle, recording, tmp_path):
+    predictor = BatchPredictor(bundle, workers=2)
+    missing = str(tmp_path / "missing_raw.fif")
+    seen = []
+    results = predictor.predict_files(
+        [recording, missing, recording], str(tmp_path / "out"), seen.append
+    )
+
+    assert seen == results
+    assert [r.filepath for r in results] == [recording, missing, recording]
+    assert results[1].error is not None
+    assert results[0].n_epochs == DURATION
+    with open(results[0].output_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == DURATION
+    assert list(rows[0]) == ["epoch", "sample", "wake", "sleep", "predict"]
+    assert rows[1]["sample"] == str(SFREQ)
+    for row in rows:
+        assert float(row["wake"]) + float(row["sleep"]) == pytest.approx(1)
+        assert row["predict"] in ("wake", "sleep")
+
+
+def test_cli(bundle, recording, tmp_path):
+    model_path = str(tmp_path / "model.pt")
+    bundle.save(model_path)
+    night = str(tmp_path / "night")
+    assert collect_files([night]) == [recording]
+
+    out = tmp_path / "out"
+    assert main([model_path, night, "-o", str(out), "--workers", "1"]) == 0
+    assert (out / "sub-01_raw.csv").exists()
+    assert main([model_path, str(tmp_path / "missing.fif"), "-o", str(out)]) == 1
@@ -0,0 +1,114 @@
+"""Unit tests for :mod:`XBrainLab.backend.inference.quantization`."""
+
+import json
+
+import numpy as np
+import pytest
+import torch
+
+from tests.unit.backend.inference.test_predictor import (
+    SFREQ,
+    bundle,  # noqa: F401
+)
+from XBrainLab.backend.inference import (
+    BatchPredictor,
+    ModelExporter,
+    QuantizationMode,
+    load_cpu_runtime,
+    quantize_model,
+)
+from XBrainLab.backend.inference.quantization import (
+    BENCHMARK_FILE,
+    INT8_FILE,
+    get_available_runtimes,
+    load_runtime,
+)
+
+
+class ShapeBranchModel(torch.nn.Module):
+    """Branches on the input shape like the bundled EEG models."""
+
+    def __init__(self):
+        super().__init__()
+        self.fc = torch.nn.Linear(2 * SFREQ, 2)
+
+    def forward(self, x):
+        if len(x.shape) != 4:
+            x = x.unsqueeze(1)
+        return self.fc(x.flatten(1))
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).standard_normal((20, 2, SFREQ)).astype("float32")
+
+
+def test_quantize_static(bundle, data):  # noqa: F811
+    model = bundle.get_model()
+    quantized, mode = quantize_model(model, QuantizationMode.STATIC, data)
+    assert mode == QuantizationMode.STATIC
+    with torch.inference_mode():
+        expected = model(torch.as_tensor(data)).argmax(-1)
+        actual = quantized(torch.as_tensor(data)).argmax(-1)
+    assert (expected == actual).float().mean() >= 0.8
+
+    with pytest.raises(ValueError, match="calibration data"):
+        quantize_model(model, QuantizationMode.STATIC)
+
+
+def test_quantize_static_falls_back_to_dynamic(data):
+    model = ShapeBranchModel().eval()
+    quantized, mode = quantize_model(model, QuantizationMode.STATIC, data)
+    assert mode == QuantizationMode.DYNAMIC
+    assert isinstance(quantized.fc, torch.ao.nn.quantized.dynamic.Linear)
+    # the float model is left untouched
+    assert isinstance(model.fc, torch.nn.Linear)
+
+
+def test_export_and_benchmark(bundle, data, tmp_path):  # noqa: F811
+    labels = np.arange(len(data)) % 2
+    exporter = ModelExporter(
+        bundle, QuantizationMode.DYNAMIC, data, eval_data=data, eval_labels=labels
+    )
+    results = exporter.export(str(tmp_path))
+
+    assert (tmp_path / INT8_FILE).exists()
+    assert "torch-int8" in get_available_runtimes(str(tmp_path))
+    assert results[0].name == "torch"
+    assert results[0].agreement == 100
+    assert results[0].max_prob_error == 0
+    names = [result.name for result in results]
+    assert "torch-int8" in names
+    for result in results:
+        assert 0 <= result.accuracy <= 100
+        assert result.latency_ms > 0
+        assert result.size_bytes > 0
+    with open(tmp_path / BENCHMARK_FILE) as f:
+        assert [entry["name"] for entry in json.load(f)] == names
+
+
+def test_runtime_in_predictor(bundle, data, tmp_path):  # noqa: F811
+    ModelExporter(bundle, QuantizationMode.DYNAMIC).export(str(tmp_path))
+    runtime = load_runtime(str(tmp_path), "torch-int8")
+    predictor = BatchPredictor(bundle, batch_size=7, runtime=runtime)
+    assert predictor.model is None
+    probabilities = predictor.predict(data)
+    assert probabilities.shape == (len(data), 2)
+    np.testing.assert_allclose(probabilities.sum(axis=1), 1, rtol=1e-5)
+    assert load_cpu_runtime(str(tmp_path)).name in ("onnx-int8", "torch-int8")
+
+    with pytest.raises(ValueError, match="Unknown runtime"):
+        load_runtime(str(tmp_path), "tflite")
+    with pytest.raises(ValueError, match="no exported model"):
+        load_cpu_runtime(str(tmp_path / "empty"))
+
+
+def test_onnx_runtime(bundle, data, tmp_path):  # noqa: F811
+    pytest.importorskip("onnxruntime")
+    ModelExporter(bundle, QuantizationMode.STATIC, data).export(str(tmp_path))
+    float_model = bundle.get_model()
+    with torch.inference_mode():
+        expected = torch.softmax(float_model(torch.as_tensor(data)), -1).numpy()
+    onnx_runtime = load_runtime(str(tmp_path), "onnx")
+    np.testing.assert_allclose(onnx_runtime.predict(data), expected, atol=1e-5)
+    assert load_cpu_runtime(str(tmp_path)).name == "onnx-int8"
@@ -0,0 +1,194 @@
+"""Unit tests for :mod:`XBrainLab.backend.inference.streaming`."""
+
+import time
+
+import mne
+import numpy as np
+import pytest
+import torch
+
+from tests.unit.backend.inference.test_predictor import FlatModel
+from XBrainLab.backend.inference import (
+    FileReplaySource,
+    ModelBundle,
+    RingBuffer,
+    StreamingClassifier,
+)
+from XBrainLab.backend.inference.streaming import StreamPipeline
+from XBrainLab.backend.model_base import EEGNet, SCCNet, ShallowConvNet
+from XBrainLab.backend.preprocessor import PreprocessStep
+
+SFREQ = 100
+CH_NAMES = ["C3", "Pz", "C4"]
+
+
+def _chunks(data, size):
+    return [data[:, i : i + size] for i in range(0, data.shape[1], size)]
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).standard_normal((3, 4 * SFREQ))
+
+
+@pytest.fixture
+def bundle():
+    torch.manual_seed(0)
+    model = FlatModel(2, 2, 50, 50)
+    return ModelBundle(
+        model_class=f"{FlatModel.__module__}:FlatModel",
+        model_params={},
+        model_args={"n_classes": 2, "channels": 2, "samples": 50, "sfreq": 50},
+        state_dict=model.state_dict(),
+        preprocess_steps=[
+            PreprocessStep("ChannelSelection", (["C4", "C3"],)),
+            PreprocessStep("Resample", (50,)),
+            PreprocessStep("WindowEpoch", (1.0, 0.0)),
+            PreprocessStep("Normalize", ("z score",)),
+        ],
+        label_map={0: "rest", 1: "move"},
+        ch_names=["C4", "C3"],
+    )
+
+
+def test_ring_buffer():
+    buffer = RingBuffer(1, 5)
+    buffer.append(np.arange(3)[None])
+    np.testing.assert_array_equal(buffer.latest(3), [[0, 1, 2]])
+    with pytest.raises(ValueError, match="Only 3 samples"):
+        buffer.latest(4)
+    buffer.append(np.arange(3, 7)[None])
+    np.testing.assert_array_equal(buffer.latest(5), [[2, 3, 4, 5, 6]])
+    buffer.append(np.arange(7, 14)[None])
+    assert buffer.n_total == 14
+    np.testing.assert_array_equal(buffer.latest(5), [[9, 10, 11, 12, 13]])
+
+
+def test_stream_pipeline_is_chunk_invariant(data):
+    steps = [
+        PreprocessStep("ChannelSelection", (["C4", "C3"],)),
+        PreprocessStep("Rereference", ("average",)),
+        PreprocessStep("Filtering", (1.0, 30.0), {"notch_freqs": 50}),
+        PreprocessStep("Resample", (40,)),
+        PreprocessStep("EditEventName", ({"a": "b"},)),
+    ]
+    whole = StreamPipeline(steps, CH_NAMES, SFREQ)
+    assert whole.ch_names == ["C4", "C3"]
+    assert whole.sfreq == 40
+    expected = whole.process(data)
+    assert expected.shape == (2, 160)
+
+    chunked = StreamPipeline(steps, CH_NAMES, SFREQ)
+    result = np.concatenate([chunked.process(c) for c in _chunks(data, 7)], axis=1)
+    np.testing.assert_allclose(result, expected, atol=1e-10)
+
+
+def test_stream_pipeline_resample_and_normalize():
+    times = np.arange(SFREQ) / SFREQ
+    sine = np.sin(2 * np.pi * 2 * times)[None]
+    pipeline = StreamPipeline([PreprocessStep("Resample", (200,))], ["C3"], SFREQ)
+    upsampled = pipeline.process(sine)
+    new_times = np.arange(upsampled.shape[1]) / 200
+    np.testing.assert_allclose(
+        upsampled[0], np.sin(2 * np.pi * 2 * new_times), atol=0.01
+    )
+
+    pipeline = StreamPipeline(
+        [PreprocessStep("Normalize", ("z score",))], ["C3"], SFREQ
+    )
+    normalized = pipeline.process(5 + 2 * sine)
+    assert normalized.mean() == pytest.approx(0, abs=1e-9)
+    assert normalized.std() == pytest.approx(1)
+
+
+def test_stream_pipeline_rejects_steps():
+    with pytest.raises(ValueError, match="cannot be applied to a stream"):
+        StreamPipeline([PreprocessStep("Export", ("out",))], CH_NAMES, SFREQ)
+    with pytest.raises(ValueError, match="not in the stream"):
+        StreamPipeline([PreprocessStep("ChannelSelection", (["O1"],))], CH_NAMES, SFREQ)
+    with pytest.raises(ValueError, match="normalization"):
+        StreamPipeline([PreprocessStep("Normalize", ("l2",))], CH_NAMES, SFREQ)
+
+
+def test_streaming_classifier_validation(bundle):
+    with pytest.raises(ValueError, match="hop"):
+        StreamingClassifier(bundle, CH_NAMES, SFREQ, hop=0)
+    # Without channel selection and resampling
+    bundle.preprocess_steps = bundle.preprocess_steps[2:]
+    with pytest.raises(ValueError, match="expects 50"):
+        StreamingClassifier(bundle, CH_NAMES, SFREQ, hop=0.5)
+    with pytest.raises(ValueError, match="lacks channels"):
+        StreamingClassifier(bundle, ["O1", "O2"], 50, hop=0.5)
+
+
+def test_streaming_classifier_windows(bundle, data):
+    classifier = StreamingClassifier(bundle, CH_NAMES, SFREQ, hop=0.5)
+    assert (classifier.window, classifier.hop) == (50, 25)
+    predictions = list(classifier.stream(_chunks(data, 13)))
+
+    # 4 s at 50 Hz: first window after 1 s, then every 0.5 s
+    assert [p.end_sample for p in predictions] == list(range(50, 201, 25))
+    assert [p.index for p in predictions] == list(range(7))
+
+    # The windows match the offline preprocessing of the whole stream
+    preprocessed = StreamPipeline(bundle.preprocess_steps, CH_NAMES, SFREQ).process(
+        data
+    )
+    windows = np.stack(
+        [preprocessed[[0, 1], end - 50 : end] for end in range(50, 201, 25)]
+    )
+    windows = (windows - windows.mean(-1, keepdims=True)) / (
+        windows.std(-1, keepdims=True) + 1e-12
+    )
+    with torch.no_grad():
+        expected = torch.softmax(
+            classifier.model(torch.as_tensor(windows, dtype=torch.float32)), -1
+        )
+    np.testing.assert_allclose(
+        np.stack([p.probabilities for p in predictions]), expected.numpy(), atol=1e-5
+    )
+    assert all(p.label in ("rest", "move") for p in predictions)
+
+    assert all(p.latency > 0 for p in predictions)
+    summary = classifier.get_latency_summary()
+    assert summary["windows"] == 7
+    assert summary["max"] >= summary["median"] > 0
+
+
+def test_file_replay_source(data, tmp_path):
+    path = str(tmp_path / "pilot_raw.fif")
+    info = mne.create_info(CH_NAMES, SFREQ, "eeg")
+    mne.io.RawArray(data, info).save(path)
+
+    source = FileReplaySource(path, chunk_duration=0.1, speed=None)
+    assert source.ch_names == CH_NAMES
+    assert source.chunk_size == 10
+    replayed = np.concatenate(list(source), axis=1)
+    np.testing.assert_allclose(replayed, data, rtol=1e-6)
+
+    # 4 s of data replayed 20 times faster than real time
+    start = time.perf_counter()
+    list(FileReplaySource(path, chunk_duration=0.5, speed=20))
+    assert time.perf_counter() - start >= 0.2
+
+    with pytest.raises(ValueError, match="chunk duration"):
+        FileReplaySource(path, chunk_duration=0)
+
+
+@pytest.mark.parametrize("model_class", [EEGNet, SCCNet, ShallowConvNet])
+def test_streaming_classifier_builtin_models(model_class):
+    args = {"n_classes": 2, "channels": 3, "samples": 256, "sfreq": 128}
+    bundle = ModelBundle(
+        model_class=f"{model_class.__module__}:{model_class.__qualname__}",
+        model_params={},
+        model_args=args,
+        state_dict=model_class(**args).state_dict(),
+        preprocess_steps=[PreprocessStep("Filtering", (4.0, 40.0))],
+        label_map={0: "rest", 1: "move"},
+        ch_names=CH_NAMES,
+    )
+    classifier = StreamingClassifier(bundle, CH_NAMES, 128, hop=0.25)
+    data = np.random.default_rng(0).standard_normal((3, 4 * 128))
+    predictions = list(classifier.stream(_chunks(data, 16)))
+    assert len(predictions) == 9
+    assert predictions[0].probabilities.sum() == pytest.approx(1, abs=1e-5)
@@ -3,7 +3,8 @@ import numpy as np
 import pytest
 
 from XBrainLab.backend.load_data import Raw
-from XBrainLab.backend.preprocessor.base import PreprocessBase
+from XBrainLab.backend.preprocessor import ChannelSelection
+from XBrainLab.backend.preprocessor.base import PreprocessBase, PreprocessStep
 
 base_fs = 500
 base_duration = 10
@@ -51,3 +52,25 @@ def test_inherit(raw):
 
     assert result.get_subject_name() == "test_inherit"
     assert result.get_preprocess_history() == ["test desc 1"]
+
+
+def test_preprocess_step_record_and_replay(raw):
+    processed = ChannelSelection([raw]).data_preprocess(["Fp2", "F3"])[0]
+    assert processed.get_preprocess_steps() == [
+        PreprocessStep("ChannelSelection", (["Fp2", "F3"],), {}),
+    ]
+    # The original data is untouched; replaying modifies the given data
+    assert raw.get_preprocess_steps() == []
+    step = PreprocessStep.from_dict(processed.get_preprocess_steps()[0].to_dict())
+    result = step.apply([raw])
+    assert result[0] is raw
+    assert raw.get_mne().ch_names == ["Fp2", "F3"]
+    assert raw.get_preprocess_history() == processed.get_preprocess_history()
+
+    assert PreprocessStep("Filtering", (1.0, 40.0)).get_arguments() == {
+        "l_freq": 1.0,
+        "h_freq": 40.0,
+        "notch_freqs": None,
+    }
+    with pytest.raises(ValueError, match="Unknown preprocessor"):
+        PreprocessStep("Missing").apply([raw])
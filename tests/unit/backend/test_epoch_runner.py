@@ -8,7 +8,10 @@ from unittest.mock import MagicMock, patch
 import torch
 from torch.utils.data import DataLoader, TensorDataset
 
+from XBrainLab.backend.training import TrainingEvaluation, TrainingOption
 from XBrainLab.backend.training.epoch_runner import EpochRunner
+from XBrainLab.backend.training.precision import MixedPrecision
+from XBrainLab.backend.training.record import TrainRecordKey
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -28,6 +31,44 @@ def _make_simple_model(n_features: int = 4, n_classes: int = 2):
     return torch.nn.Linear(n_features, n_classes)
 
 
+def _make_option(**kwargs) -> TrainingOption:
+    """Return a CPU training option for 10 epochs."""
+    args = {
+        "output_dir": "ok",
+        "optim": torch.optim.SGD,
+        "optim_params": {},
+        "use_cpu": True,
+        "gpu_idx": None,
+        "epoch": 10,
+        "bs": 4,
+        "lr": 0.1,
+        "checkpoint_epoch": 0,
+        "evaluation_option": TrainingEvaluation.VAL_LOSS,
+        "repeat_num": 1,
+    }
+    args.update(kwargs)
+    return TrainingOption(**args)
+
+
+def _run_epoch(runner, record, val=True, test=True, optimizer=None):
+    """Run one epoch with patched evaluation; return the Evaluator mock."""
+    model = _make_simple_model()
+    loader = _make_loader()
+    optimizer = optimizer or torch.optim.SGD(model.parameters(), lr=0.1)
+    with patch("XBrainLab.backend.training.epoch_runner.Evaluator") as mock_eval:
+        mock_eval.test_model.return_value = {"loss": 0.5, "acc": 50.0, "auc": 0.5}
+        runner.run(
+            model,
+            loader,
+            loader if val else None,
+            loader if test else None,
+            optimizer,
+            torch.nn.CrossEntropyLoss(),
+            record,
+        )
+    return mock_eval
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -129,3 +170,187 @@ class TestEpochRunner:
             runner.run(model, loader, None, None, optimizer, criterion, record)
 
         record.export_checkpoint.assert_not_called()
+
+    def test_bf16_precision(self):
+        """bf16 autocast trains and reports float metrics on CPU."""
+        runner = EpochRunner(
+            interrupt=threading.Event(), precision=MixedPrecision("bf16", "cpu")
+        )
+
+        model = _make_simple_model()
+        loader = _make_loader()
+        optimizer = torch.optim.SGD(model.parameters(), lr=0.01)
+        criterion = torch.nn.CrossEntropyLoss()
+        record = MagicMock()
+        record.get_epoch.return_value = 1
+        weight = model.weight.detach().clone()
+
+        runner.run(model, loader, loader, None, optimizer, criterion, record)
+
+        assert model.weight.dtype == torch.float32
+        assert not torch.equal(model.weight, weight)
+        train_result = record.update_train.call_args[0][0]
+        assert all(isinstance(v, float) for v in train_result.values())
+        record.update_eval.assert_called_once()
+
+    def test_eval_every_skips_evaluation(self):
+        """Validation and test only run on every N-th and the last epoch."""
+        runner = EpochRunner(
+            interrupt=threading.Event(), option=_make_option(eval_every=3)
+        )
+        record = MagicMock()
+        record.scheduler = None
+
+        record.get_epoch.return_value = 0  # running epoch 1
+        mock_eval = _run_epoch(runner, record)
+        mock_eval.test_model.assert_not_called()
+        record.update_train.assert_called_once()
+        record.step.assert_called_once()
+
+        record.get_epoch.return_value = 2  # running epoch 3
+        mock_eval = _run_epoch(runner, record)
+        assert mock_eval.test_model.call_count == 2
+        record.update_eval.assert_called_once()
+        record.update_test.assert_called_once()
+
+    def test_test_only_after_last_epoch(self):
+        """Without per-epoch testing only the last epoch is tested."""
+        runner = EpochRunner(
+            interrupt=threading.Event(),
+            option=_make_option(per_epoch_test=False),
+        )
+        record = MagicMock()
+        record.scheduler = None
+
+        record.get_epoch.return_value = 4
+        _run_epoch(runner, record)
+        record.update_eval.assert_called_once()
+        record.update_test.assert_not_called()
+
+        record.get_epoch.return_value = 9
+        _run_epoch(runner, record)
+        record.update_test.assert_called_once()
+
+    def test_early_stopping_after_patience(self):
+        """Training stops once the validation loss stalls for *patience* epochs."""
+        runner = EpochRunner(
+            interrupt=threading.Event(),
+            option=_make_option(early_stopping="Validation loss", patience=2),
+        )
+        record = MagicMock()
+        record.scheduler = None
+        record.best_record = {"best_val_loss_epoch": 3}
+
+        record.get_epoch.return_value = 4
+        _run_epoch(runner, record)
+        record.stop_early.assert_not_called()
+
+        record.get_epoch.return_value = 5
+        _run_epoch(runner, record)
+        record.stop_early.assert_called_once()
+
+        # No validation data: never stops early
+        record.stop_early.reset_mock()
+        _run_epoch(runner, record, val=False)
+        record.stop_early.assert_not_called()
+
+    def test_plateau_scheduler_steps_on_val_loss(self):
+        """A plateau scheduler steps with the validation loss of evaluated epochs."""
+        runner = EpochRunner(
+            interrupt=threading.Event(), option=_make_option(eval_every=2)
+        )
+        record = MagicMock()
+        record.scheduler = MagicMock(spec=torch.optim.lr_scheduler.ReduceLROnPlateau)
+
+        record.get_epoch.return_value = 0
+        _run_epoch(runner, record)
+        record.scheduler.step.assert_not_called()
+
+        record.get_epoch.return_value = 1
+        _run_epoch(runner, record)
+        record.scheduler.step.assert_called_once_with(0.5)
+
+    def test_cosine_scheduler_steps_every_epoch(self):
+        """Epoch-based schedulers step after every epoch."""
+        option = _make_option(lr_scheduler="Cosine annealing", eval_every=5)
+        runner = EpochRunner(interrupt=threading.Event(), option=option)
+        model = _make_simple_model()
+        optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+        record = MagicMock()
+        record.scheduler = option.get_scheduler(optimizer)
+        record.get_epoch.return_value = 0
+
+        _run_epoch(runner, record, optimizer=optimizer)
+
+        assert optimizer.param_groups[0]["lr"] < 0.1
+        lr = record.update_statistic.call_args[0][0]["lr"]
+        assert lr == 0.1
+
+    def test_profile_records_phases(self):
+        """With profiling, phase times, throughput and a trace are recorded."""
+        runner = EpochRunner(
+            interrupt=threading.Event(),
+            checkpoint_epoch=1,
+            option=_make_option(profile=True),
+        )
+        record = MagicMock()
+        record.scheduler = None
+        record.get_epoch.return_value = 0
+
+        _run_epoch(runner, record)
+
+        statistic = record.update_statistic.call_args_list[-1][0][0]
+        phases = [
+            TrainRecordKey.DATA_TIME,
+            TrainRecordKey.FORWARD_TIME,
+            TrainRecordKey.BACKWARD_TIME,
+            TrainRecordKey.OPTIM_TIME,
+            TrainRecordKey.VAL_TIME,
+            TrainRecordKey.TEST_TIME,
+            TrainRecordKey.CHECKPOINT_TIME,
+        ]
+        assert all(statistic[key] >= 0 for key in phases)
+        assert statistic[TrainRecordKey.THROUGHPUT] > 0
+        assert statistic[TrainRecordKey.PEAK_MEMORY] > 0
+
+        events = record.add_trace_events.call_args[0][0]
+        names = [event["name"] for event in events]
+        assert names.count("forward") == 2  # 8 samples, batch size 4
+        assert {"data", "backward", "optimizer", "train"} <= set(names)
+        assert {"val", "test", "checkpoint"} <= set(names)
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+    def test_profile_disabled_by_default(self):
+        """Without profiling only the learning rate and time are recorded."""
+        runner = EpochRunner(interrupt=threading.Event(), option=_make_option())
+        record = MagicMock()
+        record.scheduler = None
+        record.get_epoch.return_value = 0
+
+        _run_epoch(runner, record)
+
+        record.update_statistic.assert_called_once()
+        record.add_trace_events.assert_not_called()
+
+    def test_augmentation_applies_to_training_batches(self):
+        """Only training batches are augmented, seeded by the record."""
+        runner = EpochRunner(
+            interrupt=threading.Event(),
+            option=_make_option(augmentation={"Mixup": 1.0}, augment_prob=1.0),
+        )
+        record = MagicMock()
+        record.scheduler = None
+        record.seed = 42
+        record.get_epoch.return_value = 0
+
+        with patch(
+            "XBrainLab.backend.training.epoch_runner.BatchAugmenter.augment",
+            autospec=True,
+            side_effect=lambda self, inputs, labels: (inputs, None),
+        ) as augment:
+            mock_eval = _run_epoch(runner, record)
+
+        assert augment.call_count == 2  # 8 samples, batch size 4
+        assert mock_eval.test_model.call_count == 2
+        assert augment.call_args[0][0].prob == 1.0
+        assert EpochRunner(threading.Event())._make_augmenter(record) is None
@@ -1,7 +1,8 @@
 """Extended tests for BackendFacade to cover uncovered paths.
 
 Covers: attach_labels, set_montage (fuzzy matching), generate_dataset
-(all split strategies), stop_training, is_training, get_latest_results.
+(all split strategies), stop_training, is_training, get_latest_results,
+export_model, get_evaluation_statistics, get_leaderboard, compare_plans.
 """
 
 import os
@@ -12,6 +13,7 @@ import pytest
 import torch
 
 from XBrainLab.backend.facade import BackendFacade
+from XBrainLab.backend.inference import QuantizationMode
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -395,6 +397,113 @@ class TestGetLatestResults:
         assert result["training_active"] is False
 
 
+# ---------------------------------------------------------------------------
+# export_model
+# ---------------------------------------------------------------------------
+
+
+class TestExportModel:
+    def test_no_plan(self):
+        facade, _ = _make_facade()
+        facade.evaluation.get_plans = MagicMock(return_value=[])
+        with pytest.raises(ValueError, match="No training plan"):
+            facade.export_model("model.pt")
+
+    def test_export(self):
+        facade, _ = _make_facade()
+        plan = MagicMock()
+        facade.evaluation.get_plans = MagicMock(return_value=[plan])
+        with patch("XBrainLab.backend.facade.ModelBundle") as MockBundle:
+            facade.export_model("model.pt", repeat=1)
+        MockBundle.from_plan.assert_called_once_with(plan, 1)
+        MockBundle.from_plan.return_value.save.assert_called_once_with("model.pt")
+
+    def test_export_quantized_no_plan(self):
+        facade, _ = _make_facade()
+        facade.evaluation.get_plans = MagicMock(return_value=[])
+        with pytest.raises(ValueError, match="No training plan"):
+            facade.export_quantized_model("out", plan_index=1)
+
+    def test_export_quantized(self):
+        facade, _ = _make_facade()
+        plan = MagicMock()
+        facade.evaluation.get_plans = MagicMock(return_value=[plan])
+        with patch("XBrainLab.backend.facade.ModelExporter") as MockExporter:
+            MockExporter.from_plan.return_value.export.return_value = []
+            assert facade.export_quantized_model("out", mode="dynamic") == []
+        MockExporter.from_plan.assert_called_once_with(
+            plan, 0, QuantizationMode.DYNAMIC
+        )
+        MockExporter.from_plan.return_value.export.assert_called_once_with("out")
+
+
+# ---------------------------------------------------------------------------
+# get_evaluation_statistics
+# ---------------------------------------------------------------------------
+
+
+class TestEvaluationStatistics:
+    def test_no_plan(self):
+        facade, _ = _make_facade()
+        facade.evaluation.get_plans = MagicMock(return_value=[])
+        with pytest.raises(ValueError, match="No training plan"):
+            facade.get_evaluation_statistics()
+
+    def test_no_finished_run(self):
+        facade, _ = _make_facade()
+        facade.evaluation.get_plans = MagicMock(return_value=[MagicMock()])
+        facade.evaluation.get_pooled_statistics = MagicMock(return_value=None)
+        with pytest.raises(ValueError, match="No evaluation record"):
+            facade.get_evaluation_statistics()
+
+    def test_statistics(self, tmp_path):
+        facade, _ = _make_facade()
+        plan = MagicMock()
+        facade.evaluation.get_plans = MagicMock(return_value=[plan])
+        statistics = MagicMock()
+        statistics.to_dict.return_value = {"n_samples": 10}
+        facade.evaluation.get_pooled_statistics = MagicMock(return_value=statistics)
+        filepath = str(tmp_path / "statistics.csv")
+        result = facade.get_evaluation_statistics(n_bootstrap=100, filepath=filepath)
+        assert result == {"n_samples": 10}
+        facade.evaluation.get_pooled_statistics.assert_called_once_with(
+            plan, 100, 2000, 0.95
+        )
+        statistics.export_csv.assert_called_once_with(filepath)
+
+
+# ---------------------------------------------------------------------------
+# get_leaderboard / compare_plans
+# ---------------------------------------------------------------------------
+
+
+class TestComparison:
+    def test_leaderboard(self):
+        facade, _ = _make_facade()
+        leaderboard = MagicMock()
+        leaderboard.get_rows.return_value = [{"plan": "A"}]
+        facade.evaluation.get_leaderboard = MagicMock(return_value=leaderboard)
+        assert facade.get_leaderboard("kappa", filepath="board.csv") == [{"plan": "A"}]
+        leaderboard.get_rows.assert_called_once_with("kappa", True)
+        leaderboard.export_csv.assert_called_once_with("board.csv", "kappa", True)
+
+    def test_compare_plans_no_plan(self):
+        facade, _ = _make_facade()
+        facade.evaluation.get_plans = MagicMock(return_value=[MagicMock()])
+        with pytest.raises(ValueError, match="No training plan at index 1"):
+            facade.compare_plans(0, 1)
+
+    def test_compare_plans(self):
+        facade, _ = _make_facade()
+        plans = [MagicMock(), MagicMock()]
+        facade.evaluation.get_plans = MagicMock(return_value=plans)
+        comparison = MagicMock()
+        comparison.to_dict.return_value = {"n_pairs": 2}
+        facade.evaluation.compare_plans = MagicMock(return_value=comparison)
+        assert facade.compare_plans(1, 0) == {"n_pairs": 2}
+        facade.evaluation.compare_plans.assert_called_once_with(plans[1], plans[0])
+
+
 # ---------------------------------------------------------------------------
 # Other delegation methods
 # ---------------------------------------------------------------------------
@@ -1,10 +1,20 @@
+import json
 import os
-from unittest.mock import patch
+import pickle
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+import torch
 
-from XBrainLab.backend.training.record.eval import EvalRecord, calculate_confusion
+from XBrainLab.backend.training.record.eval import (
+    EVAL_DIR,
+    EVAL_META_FILE,
+    LEGACY_EVAL_FILE,
+    EvalRecord,
+    SaliencyStore,
+    calculate_confusion,
+)
 
 
 @pytest.mark.parametrize(
@@ -93,25 +103,72 @@ def test_auc(label, output, expected):
     raise NotImplementedError
 
 
-def test_export():
-    with patch("torch.save") as torch_mock:
-        gradient = {"123": "test"}
-        label = [1, 2]
-        output = [1]
-        eval_record = EvalRecord(label, output, gradient, {}, {}, {}, {})
-        eval_record.export("target_path")
-        torch_mock.assert_called_once_with(
-            {
-                "label": label,
-                "output": output,
-                "gradient": gradient,
-                "gradient_input": {},
-                "smoothgrad": {},
-                "smoothgrad_sq": {},
-                "vargrad": {},
-            },
-            os.path.join("target_path", "eval"),
-        )
+def test_export(tmp_path):
+    label = np.array([0, 1, 1])
+    output = np.eye(2)[label]
+    gradient = {0: np.ones((1, 2, 3)), 1: np.zeros((2, 2, 3))}
+    eval_record = EvalRecord(label, output, gradient, {}, {}, {}, {1: gradient[1]})
+    eval_record.export(str(tmp_path))
+
+    directory = tmp_path / EVAL_DIR
+    with open(directory / EVAL_META_FILE) as f:
+        meta = json.load(f)
+    assert meta["class_num"] == 2
+    assert meta["saliency"]["gradient"]["1"]["shape"] == [2, 2, 3]
+    assert meta["saliency"]["smoothgrad"] == {}
+    assert sorted(os.listdir(directory)) == [
+        "gradient-0.npy",
+        "gradient-1.npy",
+        "label.npy",
+        EVAL_META_FILE,
+        "output.npy",
+        "vargrad-1.npy",
+    ]
+
+    with patch("torch.load") as torch_load:
+        loaded = EvalRecord.load(str(tmp_path))
+    torch_load.assert_not_called()
+    np.testing.assert_array_equal(loaded.label, label)
+    np.testing.assert_array_equal(loaded.output, output)
+    assert isinstance(loaded.gradient, SaliencyStore)
+    # Maps are memory-mapped when requested
+    assert loaded.gradient._arrays == {}
+    assert isinstance(loaded.get_gradient(1), np.memmap)
+    assert set(loaded.gradient._arrays) == {1}
+    np.testing.assert_array_equal(loaded.get_vargrad(1), gradient[1])
+    assert loaded.has_saliency("Gradient", 0)
+    assert not loaded.has_saliency("SmoothGrad", 0)
+
+
+def test_export_loaded_record(tmp_path):
+    label = np.array([0, 1])
+    gradient = {0: np.ones((1, 2)), 1: np.ones((1, 2))}
+    EvalRecord(label, np.eye(2), gradient, {}, {}, {}, {}).export(str(tmp_path))
+    loaded = EvalRecord.load(str(tmp_path))
+    loaded.get_gradient(0)
+    loaded.gradient[1] = np.full((1, 2), 2.0)
+    del loaded.gradient[0]
+    loaded.export(str(tmp_path))
+
+    files = os.listdir(tmp_path / EVAL_DIR)
+    assert "gradient-0.npy" not in files
+    assert not any(name.endswith(".tmp") for name in files)
+    # Trusted data: a pickle round trip of the record written above
+    reloaded = pickle.loads(pickle.dumps(EvalRecord.load(str(tmp_path))))  # noqa: S301
+    assert list(reloaded.gradient) == [1]
+    np.testing.assert_array_equal(reloaded.get_gradient(1), [[2.0, 2.0]])
+
+
+def test_load_legacy(tmp_path):
+    label = np.array([0, 1])
+    state = {"label": label, "output": np.eye(2), "gradient": {0: np.ones(2)}}
+    torch.save(state, tmp_path / LEGACY_EVAL_FILE)
+    record = EvalRecord.load(str(tmp_path))
+    np.testing.assert_array_equal(record.get_gradient(0), np.ones(2))
+    # The record is converted to the new layout
+    assert not (tmp_path / LEGACY_EVAL_FILE).exists()
+    assert (tmp_path / EVAL_DIR / EVAL_META_FILE).exists()
+    np.testing.assert_array_equal(EvalRecord.load(str(tmp_path)).label, label)
 
 
 def test_export_csv(tmp_path):
@@ -127,3 +184,74 @@ def test_export_csv(tmp_path):
         assert f.readline() == "0,1,ground_truth,predict\n"
         assert [float(i) for i in f.readline().split(",")] == [0, 1, 1, 1]
         assert [float(i) for i in f.readline().split(",")] == [1, 0, 2, 0]
+
+
+def test_saliency_source():
+    label = np.array([0, 1, 1])
+    record = EvalRecord(label, np.eye(2)[label], {0: np.zeros(1)}, {}, {}, {}, {})
+    record.saliency_source = MagicMock(return_value=np.ones((2, 1, 3)))
+
+    # Stored maps are returned without the source
+    assert np.array_equal(record.get_gradient(0), np.zeros(1))
+    record.saliency_source.assert_not_called()
+
+    assert not record.has_saliency("VarGrad", 1)
+    assert record.get_vargrad(1).shape == (2, 1, 3)
+    assert record.get_saliency("VarGrad", 1) is record.vargrad[1]
+    record.saliency_source.assert_called_once_with("VarGrad", 1)
+    assert record.saliency_cost["VarGrad"] >= 0
+
+    assert set(record.export_saliency("SmoothGrad")) == {0, 1}
+    with pytest.raises(ValueError, match="Unknown saliency method"):
+        record.get_saliency("Occlusion", 0)
+
+    # The source is not pickled
+    restored = pickle.loads(pickle.dumps(record))  # noqa: S301
+    assert restored.saliency_source is None
+    assert restored.has_saliency("VarGrad", 1)
+
+    record.clear_saliency()
+    assert not record.has_saliency("Gradient", 0)
+    assert record.saliency_cost == {}
+    # Records without a source keep their maps
+    restored.clear_saliency()
+    assert restored.has_saliency("Gradient", 0)
+
+
+def test_metrics_memoized():
+    label = np.array([0, 1, 2, 2])
+    output = np.array([[2.0, 0, 0], [0, 2.0, 0], [2.0, 0, 0], [0, 0, 2.0]])
+    record = EvalRecord(label, output, {}, {}, {}, {}, {})
+    np.testing.assert_allclose(record.get_probabilities().sum(axis=1), 1)
+    assert record.get_acc() == 0.75
+
+    with patch(
+        "XBrainLab.backend.training.record.eval.calculate_confusion",
+        wraps=calculate_confusion,
+    ) as confusion:
+        record.get_kappa()
+        record.get_per_class_metrics()
+        metrics = record.get_per_class_metrics()
+        assert confusion.call_count == 1
+        assert metrics[2]["recall"] == 0.5
+        # Returned metrics can be modified without affecting the record
+        metrics[2]["recall"] = 0
+        assert record.get_per_class_metrics()[2]["recall"] == 0.5
+
+        # Replacing the data clears the memoized metrics
+        record.output = np.eye(3)[label]
+        assert record.get_acc() == 1.0
+        assert record.get_per_class_metrics()[2]["recall"] == 1.0
+        assert confusion.call_count == 2
+
+    # Trusted data: the record built by this test
+    restored = pickle.loads(pickle.dumps(record))  # noqa: S301
+    assert restored._metrics == {}
+    assert restored.get_acc() == 1.0
+
+
+def test_confusion_ignores_unknown_labels():
+    output = np.eye(2)[[0, 1, 1]]
+    confusion = calculate_confusion(output, np.array([0, 1, 5]))
+    assert confusion.dtype == np.uint32
+    assert (confusion == np.array([[1, 0], [0, 1]])).all()
@@ -111,7 +111,7 @@ class TestLoadExport:
         label = np.array([0, 1, 0])
         output = np.array([[1.0, 0.0], [0.0, 1.0], [0.8, 0.2]])
         record = EvalRecord(
-            label, output, {"g": 1}, {"gi": 2}, {"s": 3}, {"ss": 4}, {"v": 5}
+            label, output, {0: np.ones((2, 3))}, {}, {}, {}, {1: np.zeros((1, 3))}
         )
         record.export(str(tmp_path))
 
@@ -119,7 +119,9 @@ class TestLoadExport:
         assert loaded is not None
         np.testing.assert_array_equal(loaded.label, label)
         np.testing.assert_array_equal(loaded.output, output)
-        assert loaded.gradient == {"g": 1}
+        assert list(loaded.gradient) == [0]
+        np.testing.assert_array_equal(loaded.get_gradient(0), np.ones((2, 3)))
+        np.testing.assert_array_equal(loaded.get_vargrad(1), np.zeros((1, 3)))
 
     def test_load_nonexistent(self, tmp_path):
         result = EvalRecord.load(str(tmp_path / "nonexistent"))
@@ -132,6 +134,13 @@ class TestLoadExport:
         result = EvalRecord.load(str(tmp_path))
         assert result is None
 
+    def test_load_corrupted_metadata(self, tmp_path):
+        EvalRecord(np.array([0]), np.array([[1.0, 0.0]]), {}, {}, {}, {}, {}).export(
+            str(tmp_path)
+        )
+        (tmp_path / "eval_record" / "meta.json").write_text("{")
+        assert EvalRecord.load(str(tmp_path)) is None
+
 
 # ---------------------------------------------------------------------------
 # Saliency
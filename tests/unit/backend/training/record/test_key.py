@@ -28,6 +28,9 @@ class TestTrainRecordKey:
     def test_extra_constants(self):
         assert TrainRecordKey.TIME == "time"
         assert TrainRecordKey.LR == "lr"
+        assert TrainRecordKey.DATA_TIME == "data_time"
+        assert TrainRecordKey.THROUGHPUT == "throughput"
+        assert TrainRecordKey.PEAK_MEMORY == "peak_memory"
 
     def test_iterable_includes_inherited(self):
         keys = list(TrainRecordKey())
@@ -36,4 +39,5 @@ class TestTrainRecordKey:
         assert "auc" in keys
         assert "time" in keys
         assert "lr" in keys
-        assert len(keys) == 5
+        assert "forward_time" in keys
+        assert len(keys) == 14
@@ -0,0 +1,104 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.record.statistics`."""
+
+import numpy as np
+import pytest
+from sklearn.metrics import roc_auc_score
+
+from XBrainLab.backend.training.record.eval import EvalRecord
+from XBrainLab.backend.training.record.statistics import (
+    _batched_auc,
+    compute_statistics,
+)
+
+
+def make_eval(n=200, class_num=3, noise=1.0, seed=0):
+    rng = np.random.default_rng(seed)
+    label = rng.integers(0, class_num, size=n)
+    output = np.eye(class_num)[label] * 2 + noise * rng.standard_normal((n, class_num))
+    return EvalRecord(label, output, {}, {}, {}, {}, {})
+
+
+@pytest.mark.parametrize("class_num", [2, 3])
+def test_estimates_match_eval_record(class_num):
+    record = make_eval(class_num=class_num)
+    statistics = compute_statistics(
+        record.label, record.get_probabilities(), n_bootstrap=200, n_permutations=200
+    )
+    metrics = statistics.metrics
+    assert metrics["accuracy"].estimate == pytest.approx(record.get_acc())
+    assert metrics["kappa"].estimate == pytest.approx(record.get_kappa())
+    assert metrics["auc"].estimate == pytest.approx(record.get_auc())
+    per_class = record.get_per_class_metrics()
+    for i in range(class_num):
+        assert metrics[f"f1-{i}"].estimate == pytest.approx(per_class[i]["f1-score"])
+    for interval in metrics.values():
+        assert interval.low <= interval.estimate <= interval.high
+        assert 0 < interval.p_value <= 1
+
+
+def test_bootstrap_auc_matches_sklearn():
+    rng = np.random.default_rng(1)
+    scores = rng.integers(0, 5, size=30).astype(float)  # many ties
+    positive = rng.random(30) < 0.5
+    weights = rng.integers(0, 3, size=(4, 30))
+    auc = _batched_auc(scores, weights, positive[None])
+    for row, expected in zip(weights, auc, strict=True):
+        assert expected == pytest.approx(
+            roc_auc_score(positive, scores, sample_weight=row)
+        )
+
+
+def test_p_values_against_chance():
+    good = make_eval(noise=0.1)
+    statistics = compute_statistics(
+        good.label, good.get_probabilities(), n_bootstrap=0, n_permutations=199
+    )
+    assert statistics.metrics["accuracy"].p_value == pytest.approx(1 / 200)
+    assert np.isnan(statistics.metrics["accuracy"].low)
+
+    rng = np.random.default_rng(0)
+    label = rng.integers(0, 2, size=200)
+    chance = compute_statistics(
+        label, rng.random((200, 2)), n_bootstrap=0, n_permutations=199
+    )
+    assert chance.metrics["accuracy"].p_value > 0.01
+
+
+def test_chunking_and_seed_reproducible():
+    record = make_eval()
+    args = (record.label, record.get_probabilities(), 100, 100)
+    whole = compute_statistics(*args)
+    assert compute_statistics(*args) == whole
+    # Smaller batches draw the same estimates, intervals of similar width
+    chunked = compute_statistics(*args, chunk_elements=1000)
+    for name, interval in chunked.metrics.items():
+        assert interval.estimate == whole.metrics[name].estimate
+        assert interval.high - interval.low < 0.3
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="at least one epoch"):
+        compute_statistics(np.array([]), np.empty((0, 2)))
+    with pytest.raises(ValueError, match="differ in length"):
+        compute_statistics(np.array([0, 1]), np.eye(2)[[0]])
+    with pytest.raises(ValueError, match="confidence"):
+        compute_statistics(np.array([0]), np.eye(2)[[0]], confidence=1)
+    with pytest.raises(ValueError, match="class indices"):
+        compute_statistics(np.array([2]), np.eye(2)[[0]])
+
+
+def test_memoized_and_exported(tmp_path):
+    record = make_eval()
+    statistics = record.get_statistics(50, 50)
+    assert record.get_statistics(50, 50) is statistics
+    assert record.get_statistics(60, 50) is not statistics
+
+    path = tmp_path / "statistics.csv"
+    statistics.export_csv(str(path))
+    lines = path.read_text().splitlines()
+    assert lines[0] == "metric,estimate,low,high,p_value"
+    assert [line.split(",")[0] for line in lines[1:4]] == ["accuracy", "auc", "kappa"]
+    assert lines[-1].startswith("# n_samples=200")
+    assert statistics.to_dict()["metrics"]["accuracy"]["estimate"] == pytest.approx(
+        record.get_acc()
+    )
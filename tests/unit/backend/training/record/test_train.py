@@ -1,5 +1,7 @@
+import json
 import os
 import shutil
+import threading
 from unittest.mock import patch
 
 import numpy as np
@@ -10,6 +12,7 @@ from matplotlib import pyplot as plt
 from tests.unit.backend.training.test_training_plan import (
     CLASS_NUM,
     FakeModel,
+    LinearModel,
     dataset,  # noqa: F401
     epochs,  # noqa: F401
     export_mocker,  # noqa: F401
@@ -18,12 +21,19 @@ from tests.unit.backend.training.test_training_plan import (
     training_option,  # noqa: F401
     y,  # noqa: F401
 )
+from XBrainLab.backend.training.checkpoint import (
+    cpu_copy,
+    flush_checkpoints,
+    save_atomic,
+)
 from XBrainLab.backend.training.record import (
     EvalRecord,
     RecordKey,
+    RunSummary,
     TrainRecord,
     TrainRecordKey,
 )
+from XBrainLab.backend.training.record.summary import SUMMARY_FILE
 from XBrainLab.backend.utils import set_seed
 
 
@@ -279,6 +289,30 @@ def test_train_record_test_lr_figure(train_record):
     plt.close("all")
 
 
+def _profile_statistic(value):
+    statistic = {
+        key: value
+        for key in TrainRecordKey()
+        if key.endswith("_time") or key in ("throughput", "peak_memory")
+    }
+    assert len(statistic) == 9
+    return statistic
+
+
+def test_train_record_test_profile_figure(train_record):
+    assert train_record.get_profile_figure() is None
+    assert "Profile" not in train_record.get_model_output()
+    train_record.update_statistic(_profile_statistic(1.0))
+    train_record.step()
+    train_record.update_statistic(_profile_statistic(2.0))
+
+    figure = train_record.get_profile_figure()
+    assert len(figure.axes[0].patches) == 2 * 7
+    assert len(figure.axes[1].lines) == 1
+    assert "Throughput: 2.0 samples/s" in train_record.get_model_output()
+    plt.close("all")
+
+
 @pytest.fixture()
 def eval_record():
     label = np.arange(CLASS_NUM).repeat(CLASS_NUM)
@@ -307,20 +341,248 @@ def test_train_record_eval_record_getter(train_record, eval_record, func_name):
     assert getattr(train_record, func_name)() is not None
 
 
+@pytest.fixture()
+def disk_record(tmp_path, dataset, training_option, model_holder):  # noqa: F811
+    model = model_holder.get_model({})
+    with patch.object(TrainRecord, "init_dir"):
+        record = TrainRecord(0, dataset, model, training_option, set_seed(0))
+    record.target_path = str(tmp_path)
+    return record
+
+
 @pytest.mark.parametrize("best_type", ["val", "test"])
 @pytest.mark.parametrize("key", list(RecordKey()))
-def test_export(train_record, best_type, key):
+def test_export(disk_record, tmp_path, best_type, key):
+    train_record = disk_record
     train_record.export_checkpoint()
+    flush_checkpoints()
 
-    args_list = torch.save.call_args_list
-    files = [os.path.basename(args[0][1]) for args in args_list]
+    files = os.listdir(tmp_path)
     assert "Epoch-0-model" in files
     assert "record" in files
+    assert not any(f.endswith(".tmp") for f in files)
 
     key = "best_" + best_type + "_" + key + "_model"
-    setattr(train_record, key, "test")
+    setattr(train_record, key, {"weight": torch.ones(1)})
+    with patch(
+        "XBrainLab.backend.training.record.train.save_atomic",
+        wraps=save_atomic,
+    ) as save_mock:
+        train_record.export_checkpoint()
+        flush_checkpoints()
+        train_record.export_checkpoint()
+        flush_checkpoints()
+
+    saved = [os.path.basename(args[0][1]) for args in save_mock.call_args_list]
+    # The unchanged best model is only written once
+    assert saved.count(key) == 1
+    assert torch.load(tmp_path / key)["weight"].item() == 1
+
+
+def test_summary_exported_and_loaded(disk_record, eval_record, tmp_path):
+    train_record = disk_record
+    assert train_record.get_summary() is None
+    for epoch in range(2):
+        train_record.update_train({RecordKey.LOSS: 1.0, TrainRecordKey.TIME: 2.0})
+        train_record.update_eval({RecordKey.LOSS: 1.0 - epoch, RecordKey.ACC: 50.0})
+        train_record.step()
+    train_record.set_eval_record(eval_record)
     train_record.export_checkpoint()
+    flush_checkpoints()
+
+    summary = train_record.get_summary()
+    assert train_record.get_summary() is summary
+    assert summary.metrics["accuracy"] == pytest.approx(eval_record.get_acc())
+    assert summary.metrics["kappa"] == pytest.approx(eval_record.get_kappa())
+    assert summary.confusion == eval_record.get_confusion().tolist()
+    assert summary.per_class[0]["support"] == CLASS_NUM
+    assert summary.training_time == 4.0
+    assert summary.throughput == pytest.approx(
+        2 * train_record.dataset.get_train_len() / 4.0
+    )
+    assert summary.best["best_val_loss"] == 0.0
+    assert summary.best["best_val_loss_epoch"] == 1
+    assert "best_test_loss" not in summary.best
+    assert summary.get_correct().sum() == len(eval_record.label) - 1
+    assert (tmp_path / SUMMARY_FILE).exists()
+
+    # Loaded records reuse the saved summary
+    with patch.object(RunSummary, "from_record") as from_record:
+        train_record.load()
+        loaded = train_record.get_summary()
+    from_record.assert_not_called()
+    assert loaded == summary
+
+    # A new evaluation record makes the summary stale
+    train_record.set_eval_record(
+        EvalRecord(np.array([0, 1]), np.eye(CLASS_NUM)[[0, 0]], {}, {}, {}, {}, {})
+    )
+    assert train_record.get_summary().metrics["accuracy"] == 0.5
+
+
+def test_export_does_not_block_on_disk(disk_record, tmp_path):
+    train_record = disk_record
+    release = threading.Event()
+
+    def slow_save(obj, path):
+        release.wait(5)
+        save_atomic(obj, path)
+
+    with patch(
+        "XBrainLab.backend.training.record.train.save_atomic",
+        side_effect=slow_save,
+    ):
+        train_record.export_checkpoint()
+        # Snapshot is taken before returning: later updates are not saved
+        train_record.update_train({RecordKey.LOSS: 1.0})
+        assert not os.path.exists(tmp_path / "record")
+        release.set()
+        train_record.pause()
+
+    assert (
+        torch.load(tmp_path / "record", weights_only=False)["train"][RecordKey.LOSS]
+        == []
+    )
+
+
+def test_export_retention(disk_record, tmp_path):
+    train_record = disk_record
+    train_record.option.checkpoint_keep_last = 2
+    for epoch in range(5):
+        train_record.update_train({RecordKey.LOSS: 1.0})
+        train_record.update_eval({RecordKey.LOSS: 1.0 if epoch == 1 else 2.0})
+        train_record.step()
+        train_record.export_checkpoint()
+    flush_checkpoints()
+
+    names = sorted(f for f in os.listdir(tmp_path) if f.startswith("Epoch-"))
+    # Last two epochs plus the best validation-loss epoch
+    assert names == ["Epoch-2-model", "Epoch-4-model", "Epoch-5-model"]
 
-    args_list = torch.save.call_args_list
-    arg = [args[0][0] for args in args_list]
-    assert "test" in arg
+    train_record.option.checkpoint_keep_best = False
+    train_record.export_checkpoint()
+    flush_checkpoints()
+    names = sorted(f for f in os.listdir(tmp_path) if f.startswith("Epoch-"))
+    assert names == ["Epoch-4-model", "Epoch-5-model"]
+
+
+def test_rollback_restores_resume_point(disk_record, tmp_path):
+    train_record = disk_record
+    # FakeModel does not load state dicts
+    train_record.model = LinearModel()
+    train_record.optim = train_record.option.get_optim(train_record.model)
+    train_record.option.epoch_snapshots = True
+    train_record.resume()
+    weights = {k: v.clone() for k, v in train_record.model.state_dict().items()}
+    expected_draw = torch.rand(1)
+    train_record.rollback()
+
+    # Partially trained epoch
+    with torch.no_grad():
+        for param in train_record.model.parameters():
+            param.add_(1.0)
+    torch.rand(3)
+    train_record.rollback()
+
+    for key, value in train_record.model.state_dict().items():
+        assert torch.equal(value, weights[key])
+    assert torch.equal(torch.rand(1), expected_draw)
+
+    # The resume point is saved with the record and restored on load
+    train_record.export_checkpoint()
+    flush_checkpoints()
+    with torch.no_grad():
+        for param in train_record.model.parameters():
+            param.zero_()
+    train_record.load()
+    for key, value in train_record.model.state_dict().items():
+        assert torch.equal(value, weights[key])
+
+
+def test_resume_point_taken_with_checkpoints(disk_record):
+    train_record = disk_record
+    train_record.model = LinearModel()
+    train_record.optim = train_record.option.get_optim(train_record.model)
+    with patch(
+        "XBrainLab.backend.training.record.train.cpu_copy", wraps=cpu_copy
+    ) as copy:
+        train_record.resume()
+        copy.assert_not_called()
+        train_record.step()
+        train_record.export_checkpoint()
+        # One copy of the model serves the epoch file and the resume point,
+        # one of the optimizer
+        assert copy.call_count == 2
+    flush_checkpoints()
+    assert train_record.has_resume_point()
+
+    # Without epoch snapshots, epochs after the checkpoint are not undone
+    train_record.step()
+    with torch.no_grad():
+        for param in train_record.model.parameters():
+            param.add_(1.0)
+    weights = {k: v.clone() for k, v in train_record.model.state_dict().items()}
+    train_record.rollback()
+    for key, value in train_record.model.state_dict().items():
+        assert torch.equal(value, weights[key])
+    assert not train_record.has_resume_point()
+    train_record.pause()
+    assert train_record.has_resume_point()
+
+
+def test_export_trace(disk_record, tmp_path):
+    train_record = disk_record
+    assert train_record.export_trace() is None
+    events = [{"name": "forward", "ph": "X", "ts": i, "dur": 1} for i in range(5)]
+    with patch("XBrainLab.backend.training.record.train.MAX_TRACE_EVENTS", 3):
+        train_record.add_trace_events(events)
+    assert [e["ts"] for e in train_record.trace_events] == [2, 3, 4]
+
+    # Written with the checkpoint and on request
+    train_record.export_checkpoint()
+    flush_checkpoints()
+    with open(tmp_path / "profile_trace.json") as f:
+        assert json.load(f)["traceEvents"] == train_record.trace_events
+    path = train_record.export_trace(str(tmp_path / "trace.json"))
+    with open(path) as f:
+        assert len(json.load(f)["traceEvents"]) == 3
+
+
+def test_train_record_lazy_model(tmp_path, dataset, training_option):  # noqa: F811
+    training_option.output_dir = str(tmp_path)
+    with pytest.raises(ValueError, match="model factory"):
+        TrainRecord(0, dataset, None, training_option, set_seed(0))
+
+    def make_record(seed):
+        return TrainRecord(
+            0,
+            dataset,
+            None,
+            training_option,
+            set_seed(seed),
+            model_factory=LinearModel,
+            model_name="LinearModel",
+        )
+
+    record = make_record(0)
+    assert not record.has_model()
+    assert record.get_model_state() is None
+    assert "LinearModel" in record.target_path
+
+    # The weights depend on the seed only, not on the random stream
+    torch.rand(5)
+    weight = record.model.fc.weight.clone()
+    assert record.has_model()
+    assert record.optim is not None
+    assert torch.equal(make_record(0).model.fc.weight, weight)
+
+    # Released after training, created again from the resume point
+    record.resume()
+    with torch.no_grad():
+        record.model.fc.weight.add_(1.0)
+    record.step()
+    record.release()
+    assert not record.has_model()
+    assert torch.equal(record.get_model_state()["fc.weight"], weight + 1)
+    assert torch.equal(record.model.fc.weight, weight + 1)
+    assert record.optim.param_groups[0]["params"][0] is record.model.fc.weight
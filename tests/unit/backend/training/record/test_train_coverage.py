@@ -21,6 +21,7 @@ from tests.unit.backend.training.test_training_plan import (
     training_option,  # noqa: F401
     y,  # noqa: F401
 )
+from XBrainLab.backend.training.checkpoint import flush_checkpoints
 from XBrainLab.backend.training.record import (
     EvalRecord,
     RecordKey,
@@ -185,6 +186,7 @@ class TestExportLoadRoundTrip:
         eval_rec = EvalRecord(label, output, {}, {}, {}, {}, {})
         record.set_eval_record(eval_rec)
         record.export_checkpoint()
+        flush_checkpoints()
 
         # Verify eval file exists
-        assert os.path.exists(os.path.join(str(tmp_path), "eval"))
+        assert os.path.exists(os.path.join(str(tmp_path), "eval_record", "meta.json"))
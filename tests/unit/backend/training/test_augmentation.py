@@ -0,0 +1,113 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.augmentation`."""
+
+import pytest
+import torch
+
+from XBrainLab.backend.training import TrainingAugmentation
+from XBrainLab.backend.training.augmentation import (
+    BatchAugmenter,
+    MixedTargets,
+    mixed_loss,
+)
+
+SFREQ = 100.0
+
+
+def _make_augmenter(augmentation, prob=1.0, seed=0, epoch=0):
+    augmenter = BatchAugmenter(augmentation, prob, SFREQ, "cpu")
+    augmenter.set_epoch(seed, epoch)
+    return augmenter
+
+
+@pytest.fixture
+def batch():
+    generator = torch.Generator().manual_seed(0)
+    inputs = torch.randn(8, 1, 3, 50, generator=generator)
+    labels = torch.arange(8) % 4
+    return inputs, labels
+
+
+def test_augmenter_requires_sfreq_for_frequency_shift():
+    with pytest.raises(ValueError, match="sampling frequency"):
+        BatchAugmenter({TrainingAugmentation.FREQUENCY_SHIFT: 1.0}, 0.5, None, "cpu")
+
+
+@pytest.mark.parametrize("name", list(TrainingAugmentation))
+def test_augmenter_is_seeded_and_out_of_place(batch, name):
+    inputs, labels = batch
+    original = inputs.clone()
+    magnitude = 0.5 if name == TrainingAugmentation.CHANNEL_DROPOUT else 2.0
+
+    first, _ = _make_augmenter({name: magnitude}).augment(inputs, labels)
+    second, _ = _make_augmenter({name: magnitude}).augment(inputs, labels)
+    other, _ = _make_augmenter({name: magnitude}, epoch=1).augment(inputs, labels)
+
+    assert torch.equal(inputs, original)
+    assert first.shape == inputs.shape
+    assert torch.equal(first, second)
+    assert not torch.equal(first, inputs)
+    assert not torch.equal(first, other)
+
+
+def test_augmenter_probability(batch):
+    inputs, labels = batch
+    augmenter = _make_augmenter({TrainingAugmentation.AMPLITUDE_SCALE: 0.5}, prob=0)
+    augmented, mixed = augmenter.augment(inputs, labels)
+    assert torch.equal(augmented, inputs)
+    assert mixed is None
+
+
+def test_augmenter_transforms(batch):
+    inputs, labels = batch
+
+    shifted, _ = _make_augmenter({TrainingAugmentation.TIME_SHIFT: 0.2}).augment(
+        inputs, labels
+    )
+    # Circular shifts keep the values of every channel
+    torch.testing.assert_close(shifted.sort(dim=-1).values, inputs.sort(dim=-1).values)
+
+    scaled, _ = _make_augmenter({TrainingAugmentation.AMPLITUDE_SCALE: 0.3}).augment(
+        inputs, labels
+    )
+    ratio = scaled / inputs
+    assert torch.allclose(ratio, ratio[:, :1, :1, :1])
+    assert ((ratio >= 0.7) & (ratio <= 1.3)).all()
+
+    dropped, _ = _make_augmenter({TrainingAugmentation.CHANNEL_DROPOUT: 0.5}).augment(
+        inputs, labels
+    )
+    zeroed = (dropped == 0).all(dim=-1)
+    kept = (dropped == inputs).all(dim=-1)
+    assert (zeroed | kept).all()
+    assert zeroed.any()
+
+    # A sinusoid is moved to another frequency
+    times = torch.arange(200) / SFREQ
+    sine = torch.sin(2 * torch.pi * 10 * times).expand(4, 1, 1, 200)
+    augmenter = _make_augmenter({TrainingAugmentation.FREQUENCY_SHIFT: 5.0})
+    moved, _ = augmenter.augment(sine, labels[:4])
+    peaks = torch.fft.rfft(moved, dim=-1).abs().argmax(dim=-1).flatten()
+    assert (peaks != 20).any()
+    assert ((peaks >= 10) & (peaks <= 30)).all()
+
+
+def test_augmenter_mixup(batch):
+    inputs, labels = batch
+    augmented, mixed = _make_augmenter({TrainingAugmentation.MIXUP: 0.4}).augment(
+        inputs, labels
+    )
+    assert isinstance(mixed, MixedTargets)
+    assert 0.5 <= mixed.weight <= 1
+    # The mixed-in labels are a permutation of the batch labels
+    assert sorted(mixed.labels.tolist()) == sorted(labels.tolist())
+
+    outputs = torch.randn(8, 4)
+    criterion = torch.nn.CrossEntropyLoss()
+    expected = mixed.weight * criterion(outputs, labels) + (
+        1 - mixed.weight
+    ) * criterion(outputs, mixed.labels)
+    torch.testing.assert_close(mixed_loss(criterion, outputs, labels, mixed), expected)
+    assert torch.equal(
+        mixed_loss(criterion, outputs, labels, None), criterion(outputs, labels)
+    )
+    assert augmented.shape == inputs.shape
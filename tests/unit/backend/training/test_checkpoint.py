@@ -0,0 +1,52 @@
+"""Tests for the background checkpoint writer."""
+
+import os
+
+import torch
+
+from XBrainLab.backend.training.checkpoint import (
+    CheckpointWriter,
+    prune_epoch_checkpoints,
+    save_atomic,
+)
+
+
+def test_save_atomic(tmp_path):
+    path = str(tmp_path / "record")
+    save_atomic({"a": 1}, path)
+    save_atomic({"a": 2}, path)
+
+    assert os.listdir(tmp_path) == ["record"]
+    assert torch.load(path) == {"a": 2}
+
+
+def test_writer_runs_jobs_in_order_after_failure():
+    writer = CheckpointWriter()
+    done = []
+
+    def failing():
+        raise OSError("disk full")
+
+    writer.submit(lambda: done.append(1))
+    writer.submit(failing)
+    writer.submit(lambda: done.append(2))
+    writer.flush()
+
+    assert done == [1, 2]
+
+
+def test_prune_epoch_checkpoints(tmp_path):
+    for epoch in range(1, 7):
+        (tmp_path / f"Epoch-{epoch}-model").touch()
+    (tmp_path / "record").touch()
+
+    assert prune_epoch_checkpoints(str(tmp_path), 0) == []
+    deleted = prune_epoch_checkpoints(str(tmp_path), 2, keep=[3])
+
+    assert sorted(deleted) == ["Epoch-1-model", "Epoch-2-model", "Epoch-4-model"]
+    assert sorted(os.listdir(tmp_path)) == [
+        "Epoch-3-model",
+        "Epoch-5-model",
+        "Epoch-6-model",
+        "record",
+    ]
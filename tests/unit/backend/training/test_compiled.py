@@ -0,0 +1,94 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.compiled`."""
+
+import copy
+
+import pytest
+import torch
+
+from XBrainLab.backend.training import compiled
+from XBrainLab.backend.training.compiled import CompiledModel, clear_compile_cache
+from XBrainLab.backend.training.model_holder import ModelCompileMode, ModelHolder
+
+
+class SmallNet(torch.nn.Module):
+    def __init__(self, hidden=4):
+        super().__init__()
+        self.fc = torch.nn.Linear(8, hidden)
+        self.bn = torch.nn.BatchNorm1d(hidden)
+
+    def forward(self, x):
+        return self.bn(self.fc(x))
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(monkeypatch):
+    # The default inductor backend takes tens of seconds per graph on CPU
+    monkeypatch.setattr(compiled, "_COMPILE_BACKEND", "eager")
+    clear_compile_cache()
+    yield
+    clear_compile_cache()
+
+
+@pytest.mark.parametrize("mode", [ModelCompileMode.TRACE, ModelCompileMode.COMPILE])
+def test_compiled_model_matches_eager(mode):
+    torch.manual_seed(0)
+    model = SmallNet()
+    reference = copy.deepcopy(model)
+    inputs = torch.randn(6, 8)
+
+    wrapper = CompiledModel(model, mode, {"hidden": 4})
+    wrapper.train()
+    reference.train()
+    outputs = wrapper(inputs)
+    expected = reference(inputs)
+
+    torch.testing.assert_close(outputs, expected)
+    # Benchmark calls on a cache miss leave the running statistics untouched
+    torch.testing.assert_close(model.bn.running_mean, reference.bn.running_mean)
+    outputs.sum().backward()
+    expected.sum().backward()
+    torch.testing.assert_close(model.fc.weight.grad, reference.fc.weight.grad)
+
+    wrapper.eval()
+    reference.eval()
+    with torch.no_grad():
+        torch.testing.assert_close(wrapper(inputs), reference(inputs))
+
+
+def test_compiled_model_reuses_cached_artifact():
+    inputs = torch.randn(6, 8)
+    first = CompiledModel(SmallNet(), ModelCompileMode.TRACE, {"hidden": 4})
+    first(inputs)
+    second = CompiledModel(SmallNet(), ModelCompileMode.TRACE, {"hidden": 4})
+    outputs = second(inputs)
+
+    torch.testing.assert_close(outputs, second.model(inputs))
+    assert first.get_stats()["reused"] is False
+    assert first.compile_time > 0
+    stats = second.get_stats()
+    assert stats["reused"] is True
+    assert stats["compile_time"] == 0
+    assert stats["speedup"] == first.get_stats()["speedup"]
+
+    # A different input shape or argument set compiles again
+    other = CompiledModel(SmallNet(hidden=2), ModelCompileMode.TRACE, {"hidden": 2})
+    other(inputs)
+    assert other.get_stats()["reused"] is False
+
+
+def test_compiled_model_stats_empty_before_call():
+    wrapper = CompiledModel(SmallNet(), ModelCompileMode.TRACE, {})
+    assert wrapper.get_stats() == {}
+    with pytest.raises(ValueError):
+        CompiledModel(SmallNet(), ModelCompileMode.NONE, {})
+
+
+def test_model_holder_get_compiled_model():
+    model = SmallNet()
+    assert ModelHolder(SmallNet, {}).get_compiled_model(model, {}) is model
+
+    holder = ModelHolder(SmallNet, {"hidden": 4}, compile_mode="trace")
+    wrapper = holder.get_compiled_model(model, {})
+    assert isinstance(wrapper, CompiledModel)
+    assert wrapper.model is model
+    assert wrapper.mode == ModelCompileMode.TRACE
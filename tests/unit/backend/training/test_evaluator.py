@@ -5,6 +5,7 @@ import pytest
 import torch
 
 from XBrainLab.backend.training.evaluator import Evaluator
+from XBrainLab.backend.training.precision import MixedPrecision
 from XBrainLab.backend.training.record.key import RecordKey
 
 
@@ -83,6 +84,18 @@ class TestTestModel:
         result = Evaluator.test_model(model, loader, criterion)
         assert result[RecordKey.LOSS] >= 0.0
 
+    def test_bf16_precision(self, simple_model_and_loader):
+        model, loader = simple_model_and_loader
+        criterion = torch.nn.CrossEntropyLoss()
+        expected = Evaluator.test_model(model, loader, criterion)
+        result = Evaluator.test_model(
+            model, loader, criterion, MixedPrecision("bf16", "cpu")
+        )
+        assert result[RecordKey.LOSS] == pytest.approx(
+            expected[RecordKey.LOSS], abs=0.05
+        )
+        assert 0.0 <= result[RecordKey.AUC] <= 1.0
+
     def test_empty_loader(self):
         model = torch.nn.Linear(4, 2)
         empty_dataset = torch.utils.data.TensorDataset(
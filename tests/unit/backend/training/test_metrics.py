@@ -0,0 +1,68 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.metrics`."""
+
+import numpy as np
+import pytest
+import torch
+from sklearn.metrics import confusion_matrix, roc_auc_score
+
+from XBrainLab.backend.training.metrics import MetricAccumulator, histogram_auc
+from XBrainLab.backend.training.record import RecordKey
+
+
+def _accumulate(outputs, labels, batch_size=16):
+    criterion = torch.nn.CrossEntropyLoss()
+    metrics = MetricAccumulator()
+    losses = []
+    for start in range(0, len(labels), batch_size):
+        out = outputs[start : start + batch_size]
+        lab = labels[start : start + batch_size]
+        loss = criterion(out, lab)
+        losses.append(loss.item())
+        metrics.update(out, lab, loss)
+    return metrics, float(np.mean(losses))
+
+
+@pytest.mark.parametrize("n_classes", [2, 4])
+def test_metric_accumulator_matches_reference(n_classes):
+    torch.manual_seed(0)
+    labels = torch.arange(200) % n_classes
+    outputs = torch.randn(200, n_classes) + 2 * torch.nn.functional.one_hot(labels)
+
+    metrics, loss = _accumulate(outputs, labels)
+    result = metrics.compute()
+
+    probs = torch.softmax(outputs, dim=1).numpy()
+    if n_classes == 2:
+        expected_auc = roc_auc_score(labels.numpy(), probs[:, 1])
+    else:
+        expected_auc = roc_auc_score(labels.numpy(), probs, multi_class="ovr")
+    predictions = outputs.argmax(dim=1)
+    assert metrics.n_samples == 200
+    assert result[RecordKey.LOSS] == pytest.approx(loss, rel=1e-5)
+    assert result[RecordKey.ACC] == pytest.approx(
+        (predictions == labels).float().mean().item() * 100
+    )
+    assert result[RecordKey.AUC] == pytest.approx(expected_auc, abs=2e-3)
+    np.testing.assert_array_equal(
+        metrics.confusion, confusion_matrix(labels.numpy(), predictions.numpy())
+    )
+
+
+def test_metric_accumulator_empty_and_single_class():
+    assert MetricAccumulator().compute() == {
+        RecordKey.ACC: 0,
+        RecordKey.AUC: 0,
+        RecordKey.LOSS: 0,
+    }
+
+    metrics, _ = _accumulate(torch.randn(8, 3), torch.zeros(8, dtype=torch.long))
+    result = metrics.compute()
+    assert result[RecordKey.AUC] == 0.0
+    assert 0 <= result[RecordKey.ACC] <= 100
+
+
+def test_histogram_auc_ties_count_half():
+    positive = np.array([[0, 1.0], [0, 1.0]])
+    negative = np.array([[0, 1.0], [0, 1.0]])
+    assert histogram_auc(positive, negative) == 0.5
+    assert histogram_auc(np.ones((1, 4)), np.ones((1, 4))) == 0.0
@@ -5,8 +5,11 @@ import torch
 
 from XBrainLab.backend.training import (
     TestOnlyOption,
+    TrainingAugmentation,
+    TrainingEarlyStopping,
     TrainingEvaluation,
     TrainingOption,
+    TrainingScheduler,
     parse_device_name,
     parse_optim_name,
 )
@@ -76,6 +79,42 @@ def test_parse_optim_name():
         ({"evaluation_option": None}, True),
         ({"repeat_num": None}, True),
         ({"repeat_num": "error"}, True),
+        ({"cache_data": True, "cache_budget_mb": 512}, False),
+        ({"cache_budget_mb": -1}, True),
+        ({"cache_budget_mb": "error"}, True),
+        ({"num_workers": 4, "prefetch_factor": 4, "pin_memory": True}, False),
+        ({"num_workers": -1}, True),
+        ({"prefetch_factor": 0}, True),
+        ({"parallel_jobs": 4, "threads_per_job": 2}, False),
+        ({"parallel_jobs": 0}, True),
+        ({"parallel_jobs": "error"}, True),
+        ({"threads_per_job": -1}, True),
+        ({"precision": "bf16"}, False),
+        ({"precision": "fp16"}, False),
+        ({"precision": "fp16", "use_cpu": True, "gpu_idx": None}, True),
+        ({"precision": "int8"}, True),
+        ({"eval_every": 5, "per_epoch_test": False}, False),
+        ({"eval_every": 0}, True),
+        ({"eval_every": "error"}, True),
+        (
+            {
+                "per_epoch_test": False,
+                "evaluation_option": TrainingEvaluation.TEST_ACC,
+            },
+            True,
+        ),
+        ({"early_stopping": "Validation AUC", "patience": 3}, False),
+        ({"early_stopping": "error"}, True),
+        ({"patience": 0}, True),
+        ({"lr_scheduler": "Reduce on plateau", "scheduler_factor": 0.5}, False),
+        ({"lr_scheduler": "error"}, True),
+        ({"scheduler_patience": -1}, True),
+        ({"scheduler_factor": 1.5}, True),
+        ({"schedule_epoch": 20}, False),
+        ({"schedule_epoch": 0}, True),
+        ({"epoch_snapshots": True}, False),
+        ({"checkpoint_keep_last": 3, "checkpoint_keep_best": False}, False),
+        ({"checkpoint_keep_last": -1}, True),
     ],
 )
 def test_option(kwargs, has_error):
@@ -109,7 +148,9 @@ def test_option(kwargs, has_error):
         option = TrainingOption(**args)
 
         assert option.get_output_dir() == "ok"
-        assert option.get_evaluation_option_repr() == "TrainingEvaluation.VAL_LOSS"
+        assert option.get_evaluation_option_repr() == (
+            f"TrainingEvaluation.{args['evaluation_option'].name}"
+        )
         if args["use_cpu"] or (not args["use_cpu"] and torch.cuda.is_available()):
             assert option.get_device_name() == parse_device_name(
                 args["use_cpu"], args["gpu_idx"]
@@ -191,3 +232,154 @@ def test_test_only_option(kwargs, has_error):
 
         assert option.get_optim(None) is None
         assert option.get_optim(10) is None
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        (
+            {},
+            {
+                "num_workers": 0,
+                "prefetch_factor": None,
+                "pin_memory": False,
+                "persistent_workers": False,
+            },
+        ),
+        (
+            {"num_workers": 2, "persistent_workers": True, "pin_memory": True},
+            {
+                "num_workers": 2,
+                "prefetch_factor": 2,
+                "pin_memory": False,
+                "persistent_workers": True,
+            },
+        ),
+        (
+            {"use_cpu": False, "gpu_idx": 0, "pin_memory": True},
+            {
+                "num_workers": 0,
+                "prefetch_factor": None,
+                "pin_memory": True,
+                "persistent_workers": False,
+            },
+        ),
+    ],
+)
+def test_option_loader_kwargs(kwargs, expected):
+    args = {
+        "output_dir": "ok",
+        "optim": FakeOptim,
+        "optim_params": {},
+        "use_cpu": True,
+        "gpu_idx": None,
+        "epoch": 10,
+        "bs": 20,
+        "lr": 0.01,
+        "checkpoint_epoch": 10,
+        "evaluation_option": TrainingEvaluation.VAL_LOSS,
+        "repeat_num": 5,
+    }
+    args.update(kwargs)
+    assert TrainingOption(**args).get_loader_kwargs() == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs, jobs, threads",
+    [
+        ({}, 1, 8),
+        ({"parallel_jobs": 4}, 4, 2),
+        ({"parallel_jobs": 16}, 16, 1),
+        ({"parallel_jobs": 4, "threads_per_job": 3}, 4, 3),
+        ({"parallel_jobs": 4, "use_cpu": False, "gpu_idx": 0}, 1, 8),
+        ({"parallel_jobs": 4, "vectorize_repeats": True}, 1, 8),
+    ],
+)
+def test_option_parallel_jobs(kwargs, jobs, threads):
+    args = {
+        "output_dir": "ok",
+        "optim": FakeOptim,
+        "optim_params": {},
+        "use_cpu": True,
+        "gpu_idx": None,
+        "epoch": 10,
+        "bs": 20,
+        "lr": 0.01,
+        "checkpoint_epoch": 10,
+        "evaluation_option": TrainingEvaluation.VAL_LOSS,
+        "repeat_num": 5,
+    }
+    args.update(kwargs)
+    option = TrainingOption(**args)
+    with patch("os.cpu_count", return_value=8):
+        assert option.get_parallel_jobs() == jobs
+        assert option.get_threads_per_job() == threads
+
+
+def test_option_schedule():
+    option = TrainingOption(
+        output_dir="ok",
+        optim=torch.optim.SGD,
+        optim_params={},
+        use_cpu=True,
+        gpu_idx=None,
+        epoch=10,
+        bs=20,
+        lr=0.1,
+        checkpoint_epoch=0,
+        evaluation_option=TrainingEvaluation.VAL_LOSS,
+        repeat_num=1,
+        eval_every=3,
+        lr_scheduler="Cosine annealing",
+    )
+    assert option.lr_scheduler == TrainingScheduler.COSINE
+    assert option.early_stopping == TrainingEarlyStopping.NONE
+    assert [e for e in range(1, 11) if option.is_eval_epoch(e)] == [3, 6, 9, 10]
+
+    optimizer = option.get_optim(FakeModel())
+    scheduler = option.get_scheduler(optimizer)
+    assert isinstance(scheduler, torch.optim.lr_scheduler.CosineAnnealingLR)
+    assert scheduler.T_max == 10
+    assert option.get_scheduler(None) is None
+    option.schedule_epoch = 30
+    assert option.get_scheduler(optimizer).T_max == 30
+
+    option.lr_scheduler = TrainingScheduler.PLATEAU
+    scheduler = option.get_scheduler(optimizer)
+    assert isinstance(scheduler, torch.optim.lr_scheduler.ReduceLROnPlateau)
+    option.lr_scheduler = TrainingScheduler.NONE
+    assert option.get_scheduler(optimizer) is None
+
+
+def test_option_augmentation():
+    args = {
+        "output_dir": "ok",
+        "optim": torch.optim.SGD,
+        "optim_params": {},
+        "use_cpu": True,
+        "gpu_idx": None,
+        "epoch": 10,
+        "bs": 20,
+        "lr": 0.1,
+        "checkpoint_epoch": 0,
+        "evaluation_option": TrainingEvaluation.VAL_LOSS,
+        "repeat_num": 1,
+    }
+    assert TrainingOption(**args).augmentation == {}
+
+    option = TrainingOption(
+        **args,
+        augmentation={"Time shift": "0.1", TrainingAugmentation.MIXUP: 0},
+        augment_prob=1,
+    )
+    assert option.augmentation == {TrainingAugmentation.TIME_SHIFT: 0.1}
+    assert option.augment_prob == 1.0
+
+    for augmentation, augment_prob, message in [
+        ({"Rotation": 1.0}, 0.5, "Invalid augmentation"),
+        ({"Gaussian noise": -1.0}, 0.5, "Invalid gaussian noise"),
+        ({"Channel dropout": 2.0}, 0.5, "Invalid channel dropout"),
+        (None, 1.5, "Invalid augmentation probability"),
+    ]:
+        with pytest.raises(ValueError, match=message):
+            TrainingOption(**args, augmentation=augmentation, augment_prob=augment_prob)
@@ -0,0 +1,153 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.parallel`."""
+
+import os
+import threading
+
+import mne
+import numpy as np
+import pytest
+import torch
+
+from XBrainLab.backend.dataset import (
+    DatasetGenerator,
+    DataSplitter,
+    DataSplittingConfig,
+    Epochs,
+    SplitByType,
+    SplitUnit,
+    TrainingType,
+    ValSplitByType,
+)
+from XBrainLab.backend.load_data import Raw
+from XBrainLab.backend.training import Trainer
+from XBrainLab.backend.training.option import TrainingEvaluation
+from XBrainLab.backend.training.parallel import ParallelScheduler, _make_job_args
+from XBrainLab.backend.training.training_plan import (
+    ModelHolder,
+    TrainingOption,
+    TrainingPlanHolder,
+)
+
+CLASS_NUM = 4
+REPEAT = 5
+
+
+class LinearModel(torch.nn.Module):
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.fc = torch.nn.Linear(CLASS_NUM, CLASS_NUM)
+
+    def forward(self, x):
+        return self.fc(x).squeeze(1)
+
+
+def _create_raw(subject):
+    y = np.arange(CLASS_NUM).repeat(REPEAT)
+    events = np.zeros((len(y), 3), dtype=int)
+    events[:, 0] = np.arange(len(y))
+    events[:, 2] = y
+    info = mne.create_info(ch_names=["C1"], sfreq=1, ch_types="eeg")
+    data = np.zeros((len(y), 1, CLASS_NUM))
+    for idx, gt in enumerate(y):
+        data[idx, 0, gt] = 1
+    event_id = {"C1": 0, "C2": 1, "C3": 2, "C4": 3}
+    epochs = mne.EpochsArray(data, info, events=events, tmin=0, event_id=event_id)
+    raw = Raw(f"test/sub-{subject}_ses-01.fif", epochs)
+    raw.set_subject_name(subject)
+    raw.set_session_name("01")
+    return raw
+
+
+@pytest.fixture
+def dataset():
+    epochs = Epochs([_create_raw(s) for s in ("01", "02", "03")])
+    test_split_list = [DataSplitter(SplitByType.SUBJECT, "1", SplitUnit.NUMBER, True)]
+    val_split_list = [DataSplitter(ValSplitByType.SUBJECT, "1", SplitUnit.NUMBER, True)]
+    config = DataSplittingConfig(
+        TrainingType.FULL, False, val_split_list, test_split_list
+    )
+    return DatasetGenerator(epochs, config).generate()[0]
+
+
+def _make_holder(dataset, output_dir, parallel_jobs=2):
+    option = TrainingOption(
+        output_dir=str(output_dir),
+        optim=torch.optim.Adam,
+        optim_params={},
+        use_cpu=True,
+        gpu_idx=None,
+        epoch=2,
+        bs=4,
+        lr=0.01,
+        checkpoint_epoch=1,
+        evaluation_option=TrainingEvaluation.LAST_EPOCH,
+        repeat_num=2,
+        parallel_jobs=parallel_jobs,
+        threads_per_job=1,
+    )
+    params = {
+        "nt_samples": 2,
+        "nt_samples_batch_size": None,
+        "stdevs": 1.0,
+    }
+    saliency_params = {
+        "SmoothGrad": params,
+        "SmoothGrad_Squared": params,
+        "VarGrad": params,
+    }
+    return TrainingPlanHolder(
+        ModelHolder(LinearModel, {}), dataset, option, saliency_params
+    )
+
+
+def test_make_job_args_detaches_data(dataset, tmp_path):
+    holder = _make_holder(dataset, tmp_path)
+    record = holder.get_plans()[0]
+
+    worker_holder, worker_record = _make_job_args(holder, record)
+
+    assert worker_holder.dataset.get_epoch_data().data is None
+    assert worker_record.dataset is worker_holder.dataset
+    # Records travel as state dicts; the worker creates the model
+    assert not worker_record.has_model()
+    assert worker_holder.train_record_list == []
+    assert worker_holder.option.num_workers == 0
+    # Parent objects are untouched
+    assert dataset.get_epoch_data().data is not None
+    assert not record.has_model()
+    assert isinstance(holder._interrupt, threading.Event)
+
+
+def test_trainer_runs_repeats_in_parallel(dataset, tmp_path):
+    holder = _make_holder(dataset, tmp_path)
+    trainer = Trainer([holder])
+
+    trainer.job()
+
+    assert holder.error is None
+    assert holder.is_finished()
+    assert holder.get_training_status() == "Finished"
+    assert trainer.current_idx == 1
+    assert trainer.get_progress_text() == "Pending"
+    assert holder._worker_data_path is None
+    for record in holder.get_plans():
+        assert record.get_epoch() == 2
+        assert len(record.train["loss"]) == 2
+        assert record.eval_record is not None
+        assert record.end_timestamp is not None
+        assert os.path.exists(os.path.join(record.target_path, "Epoch-2-model"))
+        assert os.path.exists(os.path.join(record.target_path, "record"))
+    first, second = (r.model.fc.weight for r in holder.get_plans())
+    assert not torch.equal(first, second)
+
+
+def test_scheduler_interrupted_before_start(dataset, tmp_path):
+    holder = _make_holder(dataset, tmp_path)
+    interrupt = threading.Event()
+    interrupt.set()
+
+    ParallelScheduler([holder], 2, interrupt).run()
+
+    assert not holder.is_finished()
+    assert holder.get_training_status() == "Pending"
+    assert holder._worker_data_path is None
@@ -0,0 +1,61 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.precision`."""
+
+import pytest
+import torch
+
+from XBrainLab.backend.training.option import TrainingPrecision
+from XBrainLab.backend.training.precision import MixedPrecision
+
+
+def _train_step(precision: MixedPrecision):
+    torch.manual_seed(0)
+    model = torch.nn.Linear(4, 2)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    before = model.weight.detach().clone()
+    with precision.autocast():
+        outputs = model(torch.randn(8, 4))
+        loss = torch.nn.functional.cross_entropy(outputs, torch.tensor([0, 1] * 4))
+    precision.backward(loss)
+    precision.step(optimizer)
+    precision.update()
+    return outputs, before, model.weight.detach()
+
+
+def test_fp32_is_noop():
+    precision = MixedPrecision()
+    assert precision.precision == TrainingPrecision.FP32
+    assert not precision.enabled
+    outputs, before, after = _train_step(precision)
+    assert outputs.dtype == torch.float32
+    assert not torch.equal(before, after)
+
+
+def test_bf16_cpu_autocast():
+    precision = MixedPrecision("bf16", "cpu")
+    assert precision.enabled
+    assert precision.device_type == "cpu"
+    outputs, before, after = _train_step(precision)
+    assert outputs.dtype == torch.bfloat16
+    # Parameters (and their updates) stay in float32
+    assert after.dtype == torch.float32
+    assert not torch.equal(before, after)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+def test_fp16_cuda_uses_grad_scaler():
+    precision = MixedPrecision(TrainingPrecision.FP16, "cuda:0")
+    assert precision._scaler is not None
+    model = torch.nn.Linear(4, 2).cuda()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    with precision.autocast():
+        outputs = model(torch.randn(8, 4, device="cuda"))
+        loss = outputs.float().sum()
+    precision.backward(loss)
+    precision.step(optimizer)
+    precision.update()
+    assert outputs.dtype == torch.float16
+
+
+def test_invalid_precision():
+    with pytest.raises(ValueError):
+        MixedPrecision("int4")
@@ -0,0 +1,176 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.saliency`."""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+from captum.attr import NoiseTunnel, Saliency
+
+from tests.unit.backend.training.test_training_plan import (
+    LinearModel,
+    dataset,  # noqa: F401
+    epochs,  # noqa: F401
+    preprocessed_data_list,  # noqa: F401
+    training_option,  # noqa: F401
+    y,  # noqa: F401
+)
+from XBrainLab.backend.training import ModelHolder, TrainingPlanHolder
+from XBrainLab.backend.training.evaluator import Evaluator
+from XBrainLab.backend.training.saliency import (
+    NOISE_TUNNEL_TYPES,
+    SALIENCY_DIR,
+    SaliencySource,
+    compute_noise_tunnel,
+    get_noise_batch_size,
+)
+
+PARAMS = {"nt_samples": 2, "nt_samples_batch_size": None, "stdevs": 0.1}
+
+
+@pytest.fixture
+def plan(dataset, training_option, tmp_path):  # noqa: F811
+    training_option.output_dir = str(tmp_path)
+    training_option.epoch = 1
+    training_option.repeat_num = 1
+    saliency_params = {method: dict(PARAMS) for method in NOISE_TUNNEL_TYPES}
+    return TrainingPlanHolder(
+        ModelHolder(LinearModel, {}), dataset, training_option, saliency_params
+    )
+
+
+def test_saliency_computed_on_demand(plan):
+    plan.train()
+    train_record = plan.get_plans()[0]
+    eval_record = train_record.get_eval_record()
+    # Evaluation stores labels and outputs only
+    assert eval_record.gradient == {}
+    assert eval_record.smoothgrad == {}
+    assert isinstance(eval_record.saliency_source, SaliencySource)
+
+    model, loader = plan.get_saliency_pair(train_record)
+    expected = Evaluator.evaluate_with_saliency(
+        model, loader, plan.get_saliency_params()
+    )
+    for label_index in range(4):
+        np.testing.assert_allclose(
+            eval_record.get_gradient(label_index), expected.gradient[label_index]
+        )
+        np.testing.assert_allclose(
+            eval_record.get_gradient_input(label_index),
+            expected.gradient_input[label_index],
+        )
+    assert eval_record.get_vargrad(0).shape == expected.vargrad[0].shape
+    assert set(eval_record.saliency_cost) == {"Gradient", "Gradient * Input", "VarGrad"}
+    assert not eval_record.has_saliency("SmoothGrad", 0)
+
+
+def test_saliency_cached_on_disk(plan):
+    plan.train()
+    train_record = plan.get_plans()[0]
+    source = train_record.get_eval_record().saliency_source
+    path = source.get_cache_path("SmoothGrad", 1)
+    assert os.path.dirname(path) == os.path.join(train_record.target_path, SALIENCY_DIR)
+
+    first = source("SmoothGrad", 1)
+    assert os.path.exists(path)
+    with patch.object(source, "_compute") as compute:
+        np.testing.assert_array_equal(source("SmoothGrad", 1), first)
+    compute.assert_not_called()
+
+    # New parameters use other cache files and drop the stored maps
+    train_record.get_eval_record().get_smoothgrad(1)
+    params = plan.get_saliency_params()
+    plan.set_saliency_params({**params, "SmoothGrad": {**PARAMS, "stdevs": 0.5}})
+    assert not train_record.get_eval_record().has_saliency("SmoothGrad", 1)
+    assert source.get_cache_path("SmoothGrad", 1) != path
+
+
+def test_saliency_loader_not_cached(plan):
+    plan.train()
+    train_record = plan.get_plans()[0]
+    source = train_record.get_eval_record().saliency_source
+    plan.option.cache_data = True
+    plan.option.num_workers = 2
+
+    with patch.object(
+        plan.model_holder, "get_model", wraps=plan.model_holder.get_model
+    ) as get_model:
+        source("Gradient", 0)
+        source("Gradient", 1)
+    # One model per repeat; no cache, shared file or workers are left behind
+    get_model.assert_called_once()
+    assert plan._tensor_cache is None
+    assert plan._worker_data_path is None
+    _, loader = plan.get_saliency_pair(train_record)
+    assert loader.num_workers == 0
+    assert len(loader.dataset) == plan.get_dataset().test_mask.sum()
+
+
+def test_precompute_saliency(plan):
+    plan.option.precompute_saliency = True
+    plan.train()
+    eval_record = plan.get_plans()[0].get_eval_record()
+    assert set(eval_record.gradient) == set(range(4))
+    assert set(eval_record.vargrad) == set(range(4))
+    with pytest.raises(ValueError, match="Unknown saliency method"):
+        eval_record.saliency_source("Occlusion", 0)
+
+
+class CountingModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.fc = torch.nn.Linear(6, 3)
+        self.calls = 0
+
+    def forward(self, x):
+        self.calls += 1
+        return torch.tanh(self.fc(x.flatten(1)))
+
+
+def test_noise_tunnel_matches_captum():
+    torch.manual_seed(0)
+    model = CountingModel().eval()
+    inputs = torch.randn(4, 2, 3)
+    target = [0, 1, 2, 1]
+    maps = compute_noise_tunnel(model, inputs, target, nt_samples=3, stdevs=0.0)
+    nt = NoiseTunnel(Saliency(model))
+    for method, nt_type in NOISE_TUNNEL_TYPES.items():
+        expected = nt.attribute(
+            inputs, nt_type=nt_type, nt_samples=3, stdevs=0.0, target=target
+        )
+        torch.testing.assert_close(maps[method], expected, atol=1e-6, rtol=1e-5)
+    torch.testing.assert_close(maps["VarGrad"], torch.zeros_like(inputs))
+
+
+def test_noise_tunnel_chunks():
+    model = CountingModel().eval()
+    inputs = torch.randn(4, 2, 3)
+    maps = compute_noise_tunnel(
+        model, inputs, 1, nt_samples=5, stdevs=0.5, nt_samples_batch_size=2
+    )
+    assert model.calls == 3
+    assert (maps["VarGrad"] >= -1e-6).all()
+    torch.testing.assert_close(
+        maps["VarGrad"], maps["SmoothGrad_Squared"] - maps["SmoothGrad"] ** 2
+    )
+
+
+def test_noise_batch_size():
+    model = CountingModel().eval()
+    inputs = torch.randn(4, 2, 3)
+    assert get_noise_batch_size(model, inputs, 50) == 50
+    assert get_noise_batch_size(model, inputs, 50, budget_mb=0) == 1
+    small = get_noise_batch_size(model, inputs, 10**9, budget_mb=0.01)
+    assert 1 < small < get_noise_batch_size(model, inputs, 10**9, budget_mb=0.1)
+
+
+def test_shared_noise_pass_cached(plan):
+    plan.train()
+    train_record = plan.get_plans()[0]
+    source = train_record.get_eval_record().saliency_source
+    source("VarGrad", 2)
+    for method in NOISE_TUNNEL_TYPES:
+        assert os.path.exists(source.get_cache_path(method, 2))
+    assert not os.path.exists(source.get_cache_path("Gradient", 2))
@@ -0,0 +1,87 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.saliency_stats`."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from XBrainLab.backend.training.saliency_stats import (
+    RunningStatistics,
+    SaliencyAggregator,
+)
+
+
+def test_running_statistics():
+    arrays = np.random.default_rng(0).standard_normal((5, 3, 4)).astype(np.float32)
+    stats = RunningStatistics()
+    for array in arrays:
+        stats.update(array)
+    assert stats.count == 5
+    np.testing.assert_allclose(stats.get_mean(), arrays.mean(axis=0), rtol=1e-5)
+    np.testing.assert_allclose(stats.get_std(), arrays.std(axis=0, ddof=1), rtol=1e-4)
+    assert stats.get_mean().dtype == np.float32
+
+    with pytest.raises(ValueError, match="shape"):
+        stats.update(np.zeros(2))
+    single = RunningStatistics()
+    single.update(np.ones(2))
+    np.testing.assert_array_equal(single.get_std(), [0, 0])
+    with pytest.raises(ValueError, match="No array"):
+        RunningStatistics().get_mean()
+
+
+def _train_record(value):
+    eval_record = MagicMock()
+    eval_record.get_saliency.side_effect = lambda method, label: np.full(2, value)
+    train_record = MagicMock()
+    train_record.get_eval_record.return_value = eval_record
+    return train_record
+
+
+@pytest.fixture
+def plan():
+    plan = MagicMock()
+    plan.get_saliency_params.return_value = {"SmoothGrad": {"stdevs": 1.0}}
+    return plan
+
+
+def test_aggregator_incremental(plan):
+    r1, r2, r3 = _train_record(1.0), _train_record(3.0), _train_record(8.0)
+    unfinished = MagicMock()
+    unfinished.get_eval_record.return_value = None
+    plan.get_plans.return_value = [r1, r2, unfinished]
+    aggregator = SaliencyAggregator(plan)
+
+    np.testing.assert_array_equal(aggregator.get_mean("Gradient", 0), [2.0, 2.0])
+    np.testing.assert_allclose(aggregator.get_std("Gradient", 0), [2**0.5] * 2)
+    assert aggregator.get_count("Gradient", 0) == 2
+
+    # Runs already aggregated are not read again
+    plan.get_plans.return_value = [r1, r2, r3]
+    np.testing.assert_array_equal(aggregator.get_mean("Gradient", 0), [4.0, 4.0])
+    assert r1.get_eval_record().get_saliency.call_count == 1
+    assert r3.get_eval_record().get_saliency.call_count == 1
+
+    # A run evaluated again rebuilds the statistics
+    r1.get_eval_record.return_value = _train_record(4.0).get_eval_record()
+    np.testing.assert_array_equal(aggregator.get_mean("Gradient", 0), [5.0, 5.0])
+    assert aggregator.get_count("Gradient", 0) == 3
+
+
+def test_aggregator_params_change(plan):
+    record = _train_record(1.0)
+    plan.get_plans.return_value = [record]
+    aggregator = SaliencyAggregator(plan)
+    aggregator.get_mean("SmoothGrad", 1)
+    aggregator.get_mean("SmoothGrad", 1)
+    assert record.get_eval_record().get_saliency.call_count == 1
+
+    plan.get_saliency_params.return_value = {"SmoothGrad": {"stdevs": 2.0}}
+    aggregator.get_mean("SmoothGrad", 1)
+    assert record.get_eval_record().get_saliency.call_count == 2
+
+    aggregator.reset()
+    assert aggregator.get_count("SmoothGrad", 1) == 0
+    plan.get_plans.return_value = []
+    with pytest.raises(ValueError, match="No evaluated repeat"):
+        aggregator.get_mean("SmoothGrad", 1)
@@ -0,0 +1,207 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.sweep`."""
+
+import csv
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+from tests.unit.backend.training.test_training_plan import (
+    LinearModel,
+    dataset,  # noqa: F401
+    epochs,  # noqa: F401
+    preprocessed_data_list,  # noqa: F401
+    y,  # noqa: F401
+)
+from XBrainLab.backend.training import (
+    LogUniform,
+    ModelHolder,
+    SearchSpace,
+    Sweep,
+    SweepStrategy,
+    TrainingEvaluation,
+    TrainingOption,
+    TrainingScheduler,
+    TrialStatus,
+    Uniform,
+)
+
+
+@pytest.fixture
+def option(tmp_path):
+    return TrainingOption(
+        output_dir=str(tmp_path),
+        optim=torch.optim.Adam,
+        optim_params={},
+        use_cpu=True,
+        gpu_idx=None,
+        epoch=9,
+        bs=4,
+        lr=0.01,
+        checkpoint_epoch=0,
+        evaluation_option=TrainingEvaluation.VAL_LOSS,
+        repeat_num=1,
+    )
+
+
+@pytest.fixture
+def model_holder():
+    return ModelHolder(LinearModel, {})
+
+
+def _score_by_lr(self, plan):
+    return plan.option.lr
+
+
+def test_search_space_validation():
+    with pytest.raises(ValueError, match="empty"):
+        SearchSpace({})
+    with pytest.raises(ValueError, match="Unknown"):
+        SearchSpace({"learning_rate": [0.1]})
+    with pytest.raises(ValueError, match="No values"):
+        SearchSpace({"lr": []})
+    with pytest.raises(ValueError, match="Grid search"):
+        list(SearchSpace({"lr": Uniform(0.1, 0.2)}).grid())
+
+
+def test_search_space_grid_and_sample():
+    space = SearchSpace({"bs": [2, 4], "model.hidden": [8, 16, 32]})
+    grid = list(space.grid())
+    assert len(grid) == 6
+    assert grid[0] == {"bs": 2, "model.hidden": 8}
+
+    space = SearchSpace({"lr": LogUniform(1e-4, 1e-1), "bs": [2, 4]})
+    first = [space.sample(np.random.default_rng(0)) for _ in range(2)]
+    assert first[0] == first[1]
+    assert 1e-4 <= first[0]["lr"] <= 1e-1
+    assert first[0]["bs"] in (2, 4)
+
+
+def test_sweep_validation(model_holder, dataset, option):  # noqa: F811
+    space = SearchSpace({"lr": [0.1]})
+    with pytest.raises(ValueError, match="n_trials"):
+        Sweep(model_holder, dataset, option, space, SweepStrategy.RANDOM)
+    with pytest.raises(ValueError, match="budget"):
+        Sweep(
+            model_holder,
+            dataset,
+            option,
+            SearchSpace({"epoch": [1, 2]}),
+            SweepStrategy.HYPERBAND,
+        )
+    with pytest.raises(ValueError, match="eta"):
+        Sweep(model_holder, dataset, option, space, "Successive halving", eta=1)
+
+
+def test_sweep_rung_budgets(model_holder, dataset, option):  # noqa: F811
+    space = SearchSpace({"lr": [0.1]})
+    sweep = Sweep(model_holder, dataset, option, space, SweepStrategy.HYPERBAND)
+    assert sweep._get_max_rungs() == 3
+    assert sweep._rung_budgets(3) == [1, 3, 9]
+    assert sweep._rung_budgets(1) == [9]
+
+    sweep.min_epoch = 2
+    assert sweep._get_max_rungs() == 2
+
+
+def test_sweep_grid(model_holder, dataset, option, tmp_path):  # noqa: F811
+    option.epoch = 2
+    space = SearchSpace(
+        {"lr": [0.01, 0.1], "optim": [torch.optim.Adam, torch.optim.SGD]},
+    )
+    sweep = Sweep(model_holder, dataset, option, space)
+    sweep.run()
+
+    assert len(sweep.trials) == 4
+    assert all(t.status == TrialStatus.COMPLETE for t in sweep.trials)
+    assert all(t.get_epoch() == 2 for t in sweep.trials)
+    # Every trial trains its own plan with its own configuration
+    assert sweep.trials[1].plan.option.optim is torch.optim.SGD
+    assert sweep.trials[2].plan.option.lr == 0.1
+    assert option.lr == 0.01
+
+    table = sweep.get_table()
+    scores = [row["score"] for row in table]
+    assert scores == sorted(scores)
+    assert table[0]["trial"] == sweep.get_best_trial().trial_id
+    assert {row["optim"] for row in table} == {"Adam", "SGD"}
+    assert table[0]["val_loss"] == table[0]["score"]
+
+    path = tmp_path / "sweep.csv"
+    sweep.export_table(str(path))
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 4
+    assert rows[0]["status"] == TrialStatus.COMPLETE.value
+
+
+def test_sweep_successive_halving(model_holder, dataset, option):  # noqa: F811
+    space = SearchSpace({"lr": [0.03, 0.01, 0.02]})
+    sweep = Sweep(
+        model_holder, dataset, option, space, SweepStrategy.SUCCESSIVE_HALVING
+    )
+    with patch.object(Sweep, "get_score", _score_by_lr):
+        sweep.run()
+
+    best, pruned = sweep.trials[1], [sweep.trials[0], sweep.trials[2]]
+    assert best.status == TrialStatus.COMPLETE
+    assert best.get_epoch() == 9
+    # The surviving trial continued its first rung instead of restarting
+    assert len(best.plan.get_plans()[0].train["loss"]) == 9
+    for trial in pruned:
+        assert trial.status == TrialStatus.PRUNED
+        assert trial.get_epoch() == 1
+    assert sweep.get_best_trial() is best
+    assert sum(t.get_budget() for t in sweep.trials) == 11
+    assert [row["trial"] for row in sweep.get_table()] == [1, 2, 0]
+
+
+def test_sweep_cosine_schedule_spans_budget(
+    model_holder,
+    dataset,  # noqa: F811
+    option,
+):
+    option.lr_scheduler = TrainingScheduler.COSINE
+    space = SearchSpace({"lr": [0.03, 0.01, 0.02]})
+    sweep = Sweep(
+        model_holder, dataset, option, space, SweepStrategy.SUCCESSIVE_HALVING
+    )
+    with patch.object(Sweep, "get_score", _score_by_lr):
+        sweep.run()
+
+    record = sweep.trials[1].plan.get_plans()[0]
+    # Annealed over the full budget, not restarted at every rung
+    assert record.scheduler.T_max == 9
+    lrs = record.train["lr"]
+    assert len(lrs) == 9
+    assert np.all(np.diff(lrs) < 0)
+    assert option.schedule_epoch is None
+
+
+def test_sweep_hyperband(model_holder, dataset, option):  # noqa: F811
+    option.epoch = 3
+    space = SearchSpace({"lr": LogUniform(1e-3, 1e-1)})
+    sweep = Sweep(model_holder, dataset, option, space, SweepStrategy.HYPERBAND, seed=0)
+    with patch.object(Sweep, "get_score", _score_by_lr):
+        sweep.run()
+
+    brackets = [[t for t in sweep.trials if t.bracket == s] for s in (1, 0)]
+    assert [len(b) for b in brackets] == [3, 2]
+    statuses = sorted(t.status.value for t in brackets[0])
+    assert statuses == ["Complete", "Pruned", "Pruned"]
+    assert all(t.status == TrialStatus.COMPLETE for t in brackets[1])
+    assert all(t.get_epoch() == 3 for t in brackets[1])
+    assert "5 / 5 trials" in sweep.get_progress_text()
+
+
+def test_sweep_failed_trial(model_holder, dataset, option):  # noqa: F811
+    option.epoch = 1
+    space = SearchSpace({"bs": [4, 0]})
+    sweep = Sweep(model_holder, dataset, option, space)
+    sweep.run()
+
+    assert sweep.trials[0].status == TrialStatus.COMPLETE
+    assert sweep.trials[1].status == TrialStatus.FAILED
+    assert "Invalid batch size" in sweep.trials[1].error
+    assert sweep.get_table()[-1]["score"] is None
@@ -0,0 +1,65 @@
+import numpy as np
+import torch
+
+from XBrainLab.backend.training.tensor_cache import (
+    CachedTensorLoader,
+    TensorCache,
+    estimate_cache_bytes,
+)
+
+
+def _make_data(n=20):
+    X = np.arange(n * 6, dtype=np.float64).reshape(n, 2, 3)
+    y = np.arange(n) % 4
+    return X, y
+
+
+def test_estimate_cache_bytes():
+    X, _ = _make_data()
+    assert estimate_cache_bytes(X, 10) == 10 * (6 * 4 + 8)
+
+
+def test_tensor_cache_splits():
+    X, y = _make_data()
+    splits = {"train": np.arange(10), "val": np.array([], dtype=int), "test": [15]}
+    cache = TensorCache(X, y, splits, "cpu")
+
+    train_x, train_y = cache.splits["train"]
+    assert train_x.dtype == torch.float32
+    assert train_y.dtype == torch.int64
+    np.testing.assert_allclose(train_x.numpy(), X[:10])
+    assert cache.splits["val"] is None
+    assert cache.get_loader("val", 4) is None
+    assert isinstance(cache.get_loader("test", 4), CachedTensorLoader)
+
+
+def test_tensor_cache_build_respects_budget():
+    X, y = _make_data()
+    splits = {"train": np.arange(20)}
+    assert TensorCache.build(X, y, splits, "cpu", budget_mb=0) is None
+    assert isinstance(TensorCache.build(X, y, splits, "cpu", budget_mb=1), TensorCache)
+
+
+def test_cached_loader_sequential():
+    X, y = _make_data(10)
+    loader = CachedTensorLoader(torch.from_numpy(X), torch.from_numpy(y), 4)
+    batches = list(loader)
+    assert len(loader) == len(batches) == 3
+    assert [len(b[1]) for b in batches] == [4, 4, 2]
+    torch.testing.assert_close(torch.cat([b[1] for b in batches]), torch.from_numpy(y))
+
+
+def test_cached_loader_shuffle_is_seeded_permutation():
+    X, _ = _make_data(10)
+    loader = CachedTensorLoader(torch.from_numpy(X), torch.arange(10), 3, shuffle=True)
+    torch.manual_seed(0)
+    first = torch.cat([b[1] for b in loader])
+    torch.manual_seed(0)
+    again = torch.cat([b[1] for b in loader])
+    second = torch.cat([b[1] for b in loader])
+
+    assert sorted(first.tolist()) == list(range(10))
+    torch.testing.assert_close(first, again)
+    assert not torch.equal(first, second)
+    for inputs, labels in loader:
+        torch.testing.assert_close(inputs, torch.from_numpy(X)[labels])
@@ -15,12 +15,16 @@ class FakePlan:
 
 
 class FakeTrainingPlanHolder(TrainingPlanHolder):
-    def __init__(self, i):
+    def __init__(self, i, parallel_jobs=1):
         self.i = i
+        self.parallel_jobs = parallel_jobs
         self.train_record_list = [FakePlan("test")]
         self._interrupt = threading.Event()
         self.error = None
 
+    def get_parallel_jobs(self):
+        return self.parallel_jobs
+
     def get_name(self):
         return "Fake" + str(self.i)
 
@@ -122,6 +126,46 @@ def test_trainer_job(training_plan_holders):
             p.stop()
 
 
+def test_trainer_job_mixed_queue():
+    # CPU plans allowing parallel jobs, and GPU or vectorized plans (1 job)
+    holders = [
+        FakeTrainingPlanHolder(0, parallel_jobs=2),
+        FakeTrainingPlanHolder(1, parallel_jobs=3),
+        FakeTrainingPlanHolder(2),
+        FakeTrainingPlanHolder(3, parallel_jobs=2),
+        FakeTrainingPlanHolder(4),
+    ]
+    trainer = Trainer(holders)
+    order = []
+
+    class FakeScheduler:
+        def __init__(self, plans, max_jobs, interrupt, on_status):
+            self.plans = plans
+            self.max_jobs = max_jobs
+
+        def run(self):
+            order.append(([p.i for p in self.plans], self.max_jobs))
+
+    patches = [
+        patch.object(holder, "train", side_effect=lambda i=holder.i: order.append(i))
+        for holder in holders
+    ]
+    for p in patches:
+        p.start()
+    try:
+        with patch(
+            "XBrainLab.backend.training.trainer.ParallelScheduler", FakeScheduler
+        ):
+            trainer.job()
+    finally:
+        for p in patches:
+            p.stop()
+
+    # Only parallel plans go to the pool; the others train in queue order
+    assert order == [([0, 1], 3), 2, ([3], 2), 4]
+    assert trainer.current_idx == len(holders)
+
+
 def test_trainer_interrupt(training_plan_holders):
     trainer = Trainer(training_plan_holders)
     holder = training_plan_holders[0]
@@ -23,6 +23,9 @@ class FakeTrainingPlanHolder(TrainingPlanHolder):
         self._interrupt = threading.Event()
         self.error = None
 
+    def get_parallel_jobs(self):
+        return 1
+
     def get_name(self):
         return self._name
 
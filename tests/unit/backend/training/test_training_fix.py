@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 import torch
 
 from XBrainLab.backend.dataset import Dataset, Epochs
-from XBrainLab.backend.training import ModelHolder, TrainingOption
+from XBrainLab.backend.training import ModelCompileMode, ModelHolder, TrainingOption
 from XBrainLab.backend.training.training_plan import TrainingPlanHolder
 
 
@@ -53,6 +53,7 @@ class TestTrainingFix(unittest.TestCase):
         self.mock_model_holder = MagicMock(spec=ModelHolder)
         self.mock_model_holder.target_model = MagicMock()
         self.mock_model_holder.target_model.__name__ = "TestModel"
+        self.mock_model_holder.compile_mode = ModelCompileMode.NONE
         self.mock_model_holder.get_model.return_value = self.mock_model
 
         self.saliency_params = {}
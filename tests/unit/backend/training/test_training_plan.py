@@ -1,3 +1,4 @@
+import os
 import time
 from unittest.mock import Mock, patch
 
@@ -17,9 +18,17 @@ from XBrainLab.backend.dataset import (
     ValSplitByType,
 )
 from XBrainLab.backend.load_data import Raw
+from XBrainLab.backend.training.checkpoint import flush_checkpoints
 from XBrainLab.backend.training.evaluator import Evaluator
-from XBrainLab.backend.training.option import TrainingEvaluation
-from XBrainLab.backend.training.record import RecordKey
+from XBrainLab.backend.training.model_holder import ModelCompileMode
+from XBrainLab.backend.training.option import (
+    TrainingEarlyStopping,
+    TrainingEvaluation,
+    TrainingPrecision,
+    TrainingScheduler,
+)
+from XBrainLab.backend.training.record import RecordKey, TrainRecordKey
+from XBrainLab.backend.training.tensor_cache import CachedTensorLoader
 from XBrainLab.backend.training.training_plan import (
     ModelHolder,
     TrainingOption,
@@ -140,6 +149,7 @@ def training_option():
 def export_mocker():
     with patch("torch.save") as mock_save, patch("os.makedirs") as mock_makedirs:
         yield mock_save, mock_makedirs
+        flush_checkpoints()
 
 
 @pytest.fixture
@@ -204,6 +214,49 @@ def test_training_plan_holder_get_loader(base_holder):
         torch.testing.assert_close(test_data[1], train_data[1])
 
 
+def test_training_plan_holder_get_loader_cached(base_holder):
+    base_holder.option.cache_data = True
+    train_loader, val_loader, test_loader = base_holder.get_loader()
+    assert isinstance(train_loader, CachedTensorLoader)
+    assert isinstance(val_loader, CachedTensorLoader)
+    cache = base_holder._tensor_cache
+    assert cache is not None
+
+    # The cache is built once per plan and shared by subsequent loaders
+    train_again, _, _ = base_holder.get_loader()
+    assert base_holder._tensor_cache is cache
+    assert train_again.inputs is train_loader.inputs
+
+    val_data = next(iter(val_loader))
+    test_data = next(iter(test_loader))
+    assert val_data[0].shape == (BS, 1, CLASS_NUM)
+    torch.testing.assert_close(test_data[0], val_data[0])
+
+
+def test_training_plan_holder_get_loader_cache_over_budget(base_holder):
+    base_holder.option.cache_data = True
+    base_holder.option.cache_budget_mb = 0
+    train_loader, _, _ = base_holder.get_loader()
+    assert isinstance(train_loader, torch.utils.data.DataLoader)
+    assert base_holder._tensor_cache is None
+
+
+def test_training_plan_holder_get_loader_workers(base_holder):
+    base_holder.option.num_workers = 1
+    train_loader, val_loader, _ = base_holder.get_loader()
+    path = base_holder._worker_data_path
+    assert path is not None
+    assert isinstance(train_loader.dataset.data, np.memmap)
+
+    val_data = next(iter(val_loader))
+    assert val_data[0].shape == (BS, 1, CLASS_NUM)
+    assert val_data[0].dtype == torch.float32
+
+    base_holder.release_shared_data()
+    assert base_holder._worker_data_path is None
+    assert not os.path.exists(path)
+
+
 @pytest.mark.parametrize(
     "val_loader, test_loader, expected_loader",
     [
@@ -679,3 +732,253 @@ def test_training_plan_holder_init_error(
         pytest.raises(RuntimeError, match="Other error"),
     ):
         TrainingPlanHolder(**args)
+
+
+class LinearModel(torch.nn.Module):
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.fc = torch.nn.Linear(CLASS_NUM, CLASS_NUM)
+
+    def forward(self, x):
+        return self.fc(x).squeeze(1)
+
+
+def test_training_plan_holder_train_vectorized(dataset, training_option, tmp_path):
+    training_option.output_dir = str(tmp_path)
+    training_option.epoch = 2
+    training_option.vectorize_repeats = True
+    holder = TrainingPlanHolder(
+        ModelHolder(LinearModel, {}), dataset, training_option, {}
+    )
+    initial = [r.model.fc.weight.clone() for r in holder.get_plans()]
+
+    with patch.object(
+        holder, "train_one_repeat", side_effect=AssertionError
+    ) as sequential:
+        holder.train()
+    sequential.assert_not_called()
+
+    assert holder.error is None
+    assert holder.is_finished()
+    for record, weight in zip(holder.get_plans(), initial, strict=True):
+        assert record.get_epoch() == 2
+        assert len(record.train[RecordKey.LOSS]) == 2
+        assert len(record.val[RecordKey.LOSS]) == 2
+        assert record.eval_record is not None
+        assert not torch.equal(record.model.fc.weight, weight)
+    first, second = (r.model.fc.weight for r in holder.get_plans()[:2])
+    assert not torch.equal(first, second)
+
+
+def test_training_plan_holder_train_early_stopping(dataset, training_option, tmp_path):
+    training_option.output_dir = str(tmp_path)
+    training_option.repeat_num = 2
+    training_option.early_stopping = TrainingEarlyStopping.VAL_LOSS
+    training_option.patience = 2
+    training_option.lr_scheduler = TrainingScheduler.COSINE
+    holder = TrainingPlanHolder(
+        ModelHolder(LinearModel, {}), dataset, training_option, {}
+    )
+    losses = iter(range(1000))
+
+    def worsening_loss(*args, **kwargs):
+        return {RecordKey.LOSS: float(next(losses)), RecordKey.ACC: 0, RecordKey.AUC: 0}
+
+    with patch.object(Evaluator, "test_model", side_effect=worsening_loss):
+        holder.train()
+
+    assert holder.error is None
+    assert holder.is_finished()
+    for record in holder.get_plans():
+        assert record.get_epoch() == 3
+        assert record.early_stop_epoch == 3
+        assert record.best_record[f"best_val_{RecordKey.LOSS}_epoch"] == 0
+        assert record.eval_record is not None
+        assert record.train[TrainRecordKey.LR][-1] < training_option.lr
+        assert "Stopped early after epoch 3" in record.get_model_output()
+    assert holder.get_epoch_progress_text() == "20 / 20"
+
+
+class CountingModel(LinearModel):
+    instances = 0
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        CountingModel.instances += 1
+
+
+def test_training_plan_holder_lazy_models(dataset, training_option, tmp_path):
+    training_option.output_dir = str(tmp_path)
+    training_option.epoch = 1
+    training_option.repeat_num = 3
+    CountingModel.instances = 0
+    holder = TrainingPlanHolder(
+        ModelHolder(CountingModel, {}), dataset, training_option, {}
+    )
+    # Only the model validating the parameters is created up front
+    assert CountingModel.instances == 1
+    assert not any(r.has_model() for r in holder.get_plans())
+
+    live = []
+    original_train_one_repeat = holder.train_one_repeat
+
+    def train_one_repeat(train_record):
+        live.append(sum(r.has_model() for r in holder.get_plans()))
+        original_train_one_repeat(train_record)
+
+    with patch.object(holder, "train_one_repeat", side_effect=train_one_repeat):
+        holder.train()
+
+    assert holder.is_finished()
+    assert live == [1, 1, 1]
+    assert not any(r.has_model() for r in holder.get_plans())
+    # One model per repeat plus one evaluation model shared by all repeats
+    assert CountingModel.instances == 1 + 3 + 1
+    assert holder._eval_model is None
+
+    # New saliency parameters only drop the stored maps
+    holder.set_saliency_params(holder.get_saliency_params())
+    assert CountingModel.instances == 1 + 3 + 1
+
+    # Computing saliency does not create the training models again
+    holder.get_plans()[0].get_eval_record().get_gradient(0)
+    assert not any(r.has_model() for r in holder.get_plans())
+    assert CountingModel.instances == 1 + 3 + 2
+
+
+@pytest.mark.parametrize("epoch_snapshots", [False, True])
+def test_training_plan_holder_resume_point_copies(base_holder, epoch_snapshots):
+    option = base_holder.option
+    option.epoch = 3
+    option.repeat_num = 1
+    option.checkpoint_epoch = 0
+    option.epoch_snapshots = epoch_snapshots
+    with patch.object(
+        TrainRecord,
+        "save_resume_point",
+        autospec=True,
+        side_effect=TrainRecord.save_resume_point,
+    ) as save:
+        base_holder.train()
+    assert base_holder.is_finished()
+    # Only the final checkpoint copies the state, unless every epoch does
+    assert save.call_count == (1 + 3 if epoch_snapshots else 1)
+
+
+class DropoutModel(LinearModel):
+    def forward(self, x):
+        return torch.nn.functional.dropout(super().forward(x), 0.5, self.training)
+
+
+@pytest.mark.parametrize("interrupt_mid_epoch", [False, True])
+def test_training_plan_holder_resume_exact(
+    dataset, training_option, tmp_path, interrupt_mid_epoch
+):
+    training_option.output_dir = str(tmp_path)
+    training_option.epoch = 4
+    training_option.repeat_num = 1
+    training_option.checkpoint_epoch = 1
+    training_option.lr_scheduler = TrainingScheduler.COSINE
+    model_holder = ModelHolder(DropoutModel, {})
+
+    def make_holder(plan_id, initial=None):
+        holder = TrainingPlanHolder(
+            model_holder, dataset, training_option, {}, plan_id=plan_id
+        )
+        record = holder.get_plans()[0]
+        if initial is not None:
+            record.model.load_state_dict(initial[0])
+            record.random_state = initial[1]
+        return holder, record
+
+    full, full_record = make_holder("full")
+    initial = (
+        {k: v.clone() for k, v in full_record.model.state_dict().items()},
+        full_record.random_state,
+    )
+    full.train()
+
+    # Stop after two epochs (optionally half-way through the third)
+    partial, partial_record = make_holder("resumed", initial)
+    calls = {"n": 0}
+    original_run = partial.train_one_epoch
+
+    def interrupting_epoch(*args, **kwargs):
+        if partial_record.get_epoch() == 2:
+            if not interrupt_mid_epoch:
+                partial.set_interrupt()
+                return
+            # Train a few batches of the third epoch, then interrupt
+            original_step = partial_record.optim.step
+
+            def step(*a, **kw):
+                calls["n"] += 1
+                if calls["n"] == 2:
+                    partial.set_interrupt()
+                return original_step(*a, **kw)
+
+            partial_record.optim.step = step
+        original_run(*args, **kwargs)
+
+    with patch.object(partial, "train_one_epoch", side_effect=interrupting_epoch):
+        partial.train()
+    assert partial_record.get_epoch() == 2
+    assert not partial.is_finished()
+
+    # A new plan on the same output directory continues from the checkpoint
+    resumed, resumed_record = make_holder("resumed")
+    assert resumed_record.get_epoch() == 2
+    resumed.train()
+
+    assert resumed.is_finished()
+    for key, value in full_record.model.state_dict().items():
+        torch.testing.assert_close(resumed_record.model.state_dict()[key], value)
+    assert resumed_record.train[RecordKey.LOSS] == full_record.train[RecordKey.LOSS]
+    assert (
+        resumed_record.optim.param_groups[0]["lr"]
+        == full_record.optim.param_groups[0]["lr"]
+    )
+
+    # Continuing the interrupted plan in memory gives the same result
+    vars(partial_record.optim).pop("step", None)
+    partial.clear_interrupt()
+    partial.train()
+    for key, value in full_record.model.state_dict().items():
+        torch.testing.assert_close(partial_record.model.state_dict()[key], value)
+
+
+def test_training_plan_holder_train_compiled(dataset, training_option, tmp_path):
+    training_option.output_dir = str(tmp_path)
+    training_option.epoch = 2
+    training_option.repeat_num = 2
+    model_holder = ModelHolder(LinearModel, {}, compile_mode=ModelCompileMode.TRACE)
+    holder = TrainingPlanHolder(model_holder, dataset, training_option, {})
+
+    holder.train()
+
+    assert holder.error is None
+    assert holder.is_finished()
+    first, second = (r.compile_stats for r in holder.get_plans())
+    assert first["mode"] == "trace"
+    assert first["speedup"] > 0
+    assert second["reused"] is True
+    assert second["compile_time"] == 0
+    assert "[Compilation]" in holder.get_plans()[0].get_model_output()
+
+
+@pytest.mark.parametrize(
+    ("compile_mode", "option_args"),
+    [
+        (ModelCompileMode.COMPILE, {"vectorize_repeats": True}),
+        (ModelCompileMode.TRACE, {"precision": TrainingPrecision.BF16}),
+    ],
+)
+def test_training_plan_holder_compile_mode_invalid(
+    export_mocker, dataset, training_option, compile_mode, option_args
+):
+    for key, value in option_args.items():
+        setattr(training_option, key, value)
+    model_holder = ModelHolder(LinearModel, {}, compile_mode=compile_mode)
+
+    with pytest.raises(ValueError):
+        TrainingPlanHolder(model_holder, dataset, training_option, {})
@@ -1,13 +1,19 @@
+import pickle
 from unittest.mock import patch
 
 import numpy as np
 import pytest
 import torch
-from torch.utils.data import DataLoader
+from torch.utils.data import DataLoader, TensorDataset
 
 from XBrainLab.backend.training.evaluator import Evaluator
+from XBrainLab.backend.training.precision import MixedPrecision
 from XBrainLab.backend.training.record import EvalRecord
-from XBrainLab.backend.training.training_plan import to_holder
+from XBrainLab.backend.training.training_plan import (
+    DeviceDataLoader,
+    SharedMemoryDataset,
+    to_holder,
+)
 
 
 @pytest.mark.parametrize("shuffle", [True, False])
@@ -46,6 +52,72 @@ def test_to_holder_empty():
     assert to_holder(X, y, indices, device, bs, shuffle) is None
 
 
+def test_shared_memory_dataset_getitems_matches_getitem():
+    X = np.random.rand(20, 2, 5)
+    y = np.arange(20) % 3
+    indices = np.arange(5, 15)
+    dataset = SharedMemoryDataset(X, y, indices, "cpu")
+
+    batch_x, batch_y = dataset.__getitems__([3, 0, 7])
+    assert batch_x.dtype == torch.float32
+    assert batch_y.dtype == torch.int64
+    for row, idx in enumerate([3, 0, 7]):
+        x, label = dataset[idx]
+        torch.testing.assert_close(batch_x[row], x)
+        assert batch_y[row] == label
+
+
+def test_to_holder_shuffle_matches_default_loader():
+    length = 50
+    X = np.arange(length, dtype=np.float64).reshape(-1, 1)
+    y = np.arange(length)
+    indices = np.arange(length)
+    reference = DataLoader(TensorDataset(torch.from_numpy(y)), 8, shuffle=True)
+
+    torch.manual_seed(0)
+    expected = [batch_y for (batch_y,) in reference]
+    torch.manual_seed(0)
+    actual = [batch_y for _, batch_y in to_holder(X, y, indices, "cpu", 8, True)]
+
+    assert len(actual) == len(expected) == 7
+    for a, e in zip(actual, expected, strict=True):
+        torch.testing.assert_close(a, e)
+
+
+def test_shared_memory_dataset_pickles_memmap_by_path(tmp_path):
+    path = tmp_path / "data.npy"
+    np.save(path, np.random.rand(100, 8, 64).astype(np.float32))
+    data = np.load(path, mmap_mode="r")
+    dataset = SharedMemoryDataset(data, np.arange(100), np.arange(10), "cpu")
+
+    payload = pickle.dumps(dataset)
+    assert len(payload) < data[0].nbytes
+
+    restored = pickle.loads(payload)  # noqa: S301
+    assert isinstance(restored.data, np.memmap)
+    torch.testing.assert_close(restored[3][0], dataset[3][0])
+
+
+def test_to_holder_with_workers(tmp_path):
+    length = 64
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(length, dtype=np.float32).reshape(-1, 1))
+    X = np.load(path, mmap_mode="r")
+    y = np.arange(length)
+    indices = np.arange(length)
+
+    dataloader = to_holder(X, y, indices, "cpu", 16, num_workers=1, prefetch_factor=2)
+    assert isinstance(dataloader, DeviceDataLoader)
+    assert dataloader.batch_size == 16
+
+    batches = list(dataloader)
+    assert len(batches) == 4
+    inputs = torch.cat([b[0] for b in batches])
+    labels = torch.cat([b[1] for b in batches])
+    torch.testing.assert_close(inputs.squeeze(1), labels.float())
+    torch.testing.assert_close(labels, torch.arange(length))
+
+
 CLASS_NUM = 4
 ERROR_NUM = 3
 SAMPLE_NUM = CLASS_NUM
@@ -127,6 +199,27 @@ def test_test_model(dataloader, loss_avg):
     assert np.isclose(test_dict["loss"], loss_avg)
 
 
+def test_eval_model_bf16(dataloader, y):
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(
+        torch.nn.Flatten(), torch.nn.Linear(CLASS_NUM, CLASS_NUM)
+    )
+    saliency_params = {
+        "SmoothGrad": {"nt_samples": 1, "stdevs": 0.1},
+        "SmoothGrad_Squared": {"nt_samples": 1, "stdevs": 0.1},
+        "VarGrad": {"nt_samples": 1, "stdevs": 0.1},
+    }
+
+    result = Evaluator.evaluate_with_saliency(
+        model, dataloader, saliency_params, MixedPrecision("bf16", "cpu")
+    )
+
+    assert np.array_equal(result.label, y)
+    assert result.output.dtype == np.float32
+    assert result.gradient[0].dtype == np.float32
+    assert result.smoothgrad[0].shape == result.gradient[0].shape
+
+
 def test_eval_model(dataloader, y, full_y):
     model = FakeModel()
     model.eval()
@@ -167,3 +260,12 @@ def test_eval_model(dataloader, y, full_y):
         ]
         for g, expected_shape in zip(called_gradient, expected_list, strict=False):
             assert called_gradient[g].shape == expected_shape
+
+
+def test_evaluate_without_saliency(dataloader, y, full_y):
+    result = Evaluator.evaluate(FakeModel(), dataloader)
+
+    assert np.array_equal(result.label, y)
+    assert np.array_equal(result.output.argmax(axis=-1), full_y)
+    assert result.gradient == {}
+    assert result.vargrad == {}
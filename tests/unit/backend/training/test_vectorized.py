@@ -0,0 +1,124 @@
+"""Unit tests for :mod:`XBrainLab.backend.training.vectorized`."""
+
+import copy
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from XBrainLab.backend.training.record import RecordKey
+from XBrainLab.backend.training.vectorized import StackedModel, VectorizedEpochRunner
+
+REPEAT = 3
+
+
+class SmallNet(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.fc = torch.nn.Linear(8, 4)
+        self.bn = torch.nn.BatchNorm1d(4)
+
+    def forward(self, x):
+        return self.bn(self.fc(x))
+
+
+@pytest.fixture
+def models():
+    torch.manual_seed(0)
+    return [SmallNet() for _ in range(REPEAT)]
+
+
+def test_stacked_model_matches_individual_models(models):
+    inputs = torch.randn(6, 8)
+    reference = [copy.deepcopy(model) for model in models]
+
+    stacked = StackedModel(models)
+    stacked.train()
+    outputs = stacked(inputs)
+    assert outputs.shape == (REPEAT, 6, 4)
+
+    for i, ref in enumerate(reference):
+        ref.train()
+        expected = ref(inputs)
+        torch.testing.assert_close(outputs[i], expected)
+        # Running statistics were written back to each model
+        torch.testing.assert_close(models[i].bn.running_mean, ref.bn.running_mean)
+
+
+def test_stacked_model_gradients_are_per_model(models):
+    inputs = torch.randn(6, 8)
+    stacked = StackedModel(models)
+    stacked.train()
+    stacked(inputs)[1].sum().backward()
+
+    assert models[0].fc.weight.grad is None or not models[0].fc.weight.grad.any()
+    assert models[1].fc.weight.grad.abs().sum() > 0
+    assert models[2].fc.weight.grad is None or not models[2].fc.weight.grad.any()
+
+
+def test_stacked_model_eval_keeps_buffers(models):
+    stacked = StackedModel(models)
+    stacked.eval()
+    before = models[0].bn.running_mean.clone()
+    with torch.no_grad():
+        stacked(torch.randn(6, 8))
+    torch.testing.assert_close(models[0].bn.running_mean, before)
+
+
+def test_vectorized_epoch_runner_updates_every_record(models):
+    data = TensorDataset(torch.randn(12, 8), torch.arange(12) % 4)
+    loader = DataLoader(data, batch_size=4)
+    optimizers = [torch.optim.SGD(m.parameters(), lr=0.1) for m in models]
+    records = [MagicMock() for _ in models]
+    for record in records:
+        record.get_epoch.return_value = 1
+    weights = [m.fc.weight.clone() for m in models]
+    callback = MagicMock()
+
+    runner = VectorizedEpochRunner(
+        interrupt=threading.Event(), checkpoint_epoch=1, on_epoch_end=callback
+    )
+    runner.run_stacked(
+        StackedModel(models),
+        loader,
+        loader,
+        None,
+        optimizers,
+        torch.nn.CrossEntropyLoss(),
+        records,
+    )
+
+    for model, weight in zip(models, weights, strict=True):
+        assert not torch.equal(model.fc.weight, weight)
+    for record in records:
+        record.update_train.assert_called_once()
+        record.update_statistic.assert_called_once()
+        record.update_eval.assert_called_once()
+        record.update_test.assert_not_called()
+        record.step.assert_called_once()
+        record.export_checkpoint.assert_called_once()
+        result = record.update_eval.call_args[0][0]
+        assert set(result) == {RecordKey.ACC, RecordKey.AUC, RecordKey.LOSS}
+    assert callback.call_count == REPEAT
+
+
+def test_vectorized_epoch_runner_interrupted(models):
+    data = TensorDataset(torch.randn(12, 8), torch.arange(12) % 4)
+    interrupt = threading.Event()
+    interrupt.set()
+    records = [MagicMock() for _ in models]
+
+    VectorizedEpochRunner(interrupt=interrupt).run_stacked(
+        StackedModel(models),
+        DataLoader(data, batch_size=4),
+        None,
+        None,
+        [torch.optim.SGD(m.parameters(), lr=0.1) for m in models],
+        torch.nn.CrossEntropyLoss(),
+        records,
+    )
+
+    for record in records:
+        record.step.assert_not_called()
@@ -21,12 +21,15 @@ class TestPlotType:
     def test_lr(self):
         assert PlotType.LR.value == "get_lr_figure"
 
+    def test_profile(self):
+        assert PlotType.PROFILE.value == "get_profile_figure"
+
     def test_confusion(self):
         assert PlotType.CONFUSION.value == "get_confusion_figure"
 
     def test_all_members(self):
         members = list(PlotType)
-        assert len(members) == 5
+        assert len(members) == 6
 
 
 class TestVisualizerType:
@@ -9,10 +9,16 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from XBrainLab.backend.training.record.statistics import (
+    EvaluationStatistics,
+    MetricInterval,
+)
 from XBrainLab.ui.panels.evaluation.confusion_matrix import ConfusionMatrixWidget
+from XBrainLab.ui.panels.evaluation.leaderboard_table import LeaderboardTableWidget
 from XBrainLab.ui.panels.evaluation.metrics_bar_chart import MetricsBarChartWidget
 from XBrainLab.ui.panels.evaluation.metrics_table import MetricsTableWidget
 from XBrainLab.ui.panels.evaluation.panel import EvaluationPanel
+from XBrainLab.ui.panels.evaluation.statistics_table import StatisticsTableWidget
 
 
 # Mock classes
@@ -43,6 +49,18 @@ class MockEvalRecord:
             },
         }
 
+    def get_statistics(self):
+        return EvaluationStatistics(
+            20,
+            100,
+            100,
+            0.95,
+            {
+                "accuracy": MetricInterval(0.75, 0.6, 0.9, 0.01),
+                "auc": MetricInterval(0.8, 0.65, 0.95, 0.01),
+            },
+        )
+
 
 class MockTrainRecord:
     def __init__(self, finished=True):
@@ -133,6 +151,11 @@ def test_evaluation_panel_layout(qtbot):
     metrics_table = panel.findChild(MetricsTableWidget)
     assert metrics_table is not None
 
+    # Check Statistics Table
+    statistics_table = panel.findChild(StatisticsTableWidget)
+    assert statistics_table is not None
+    assert not panel.btn_export_stats.isEnabled()
+
     # Check Actions Group (Should be Removed)
     action_group = next((g for g in groups if g.title() == "ACTIONS"), None)
     assert action_group is None
@@ -172,6 +195,9 @@ def test_evaluation_panel_logic(qtbot):
 
     rc = panel.metrics_table.rowCount()
     assert rc == 3, f"Row count mismatch. Expected 3, got {rc}"
+    assert panel.statistics_table.rowCount() == 2
+    assert panel.statistics_table.item(0, 0).text() == "Accuracy"
+    assert panel.btn_export_stats.isEnabled()
 
     # Mock update_plot for bar chart to verify call
     panel.bar_chart.update_plot = MagicMock()
@@ -180,6 +206,8 @@ def test_evaluation_panel_logic(qtbot):
     panel.run_combo.setCurrentIndex(1)
     assert panel.metrics_table.rowCount() == 0  # Should be empty
     panel.bar_chart.update_plot.assert_called_with({})  # Should be cleared
+    assert panel.statistics_table.rowCount() == 0
+    assert not panel.btn_export_stats.isEnabled()
 
     # Change Model to Plan B
     panel.model_combo.setCurrentIndex(1)
@@ -190,3 +218,43 @@ def test_evaluation_panel_logic(qtbot):
     # Test Show Percentage Toggle
     panel.chk_percentage.setChecked(True)
     panel.chk_percentage.setChecked(False)
+
+
+def test_evaluation_panel_export_statistics(qtbot, tmp_path, monkeypatch):
+    """Statistics of the selected run are exported to CSV."""
+    main_window = MockMainWindow()
+    controller = main_window.study.get_controller("evaluation")
+    panel = EvaluationPanel(controller=controller, parent=main_window)
+    qtbot.addWidget(panel)
+    panel.update_panel()
+
+    filepath = str(tmp_path / "statistics.csv")
+    monkeypatch.setattr(
+        "XBrainLab.ui.panels.evaluation.panel.QFileDialog.getSaveFileName",
+        lambda *args, **kwargs: (filepath, ""),
+    )
+    panel.export_statistics()
+    with open(filepath) as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "metric,estimate,low,high,p_value"
+    assert lines[1].startswith("accuracy,0.75")
+
+
+def test_evaluation_panel_leaderboard(qtbot):
+    """Finished runs of all plans are ranked in the leaderboard tab."""
+    main_window = MockMainWindow()
+    controller = main_window.study.get_controller("evaluation")
+    controller.get_leaderboard.return_value.get_rows.return_value = [
+        {"plan": "Plan A", "name": "Repeat-0", "accuracy": 0.5, "epochs": 10},
+        {"plan": "Plan B", "name": "Repeat-0", "accuracy": 0.9, "epochs": 10},
+    ]
+    panel = EvaluationPanel(controller=controller, parent=main_window)
+    qtbot.addWidget(panel)
+    panel.update_panel()
+
+    table = panel.findChild(LeaderboardTableWidget)
+    assert table is panel.leaderboard_table
+    assert table.rowCount() == 2
+    # Sorted by accuracy, missing values shown as "-"
+    assert table.item(0, 0).text() == "Plan B"
+    assert table.item(0, 4).text() == "-"
@@ -6,7 +6,11 @@ import numpy as np
 from XBrainLab.backend.controller.visualization_controller import (
     VisualizationController,
 )
-from XBrainLab.backend.training.record.eval import EvalRecord
+from XBrainLab.backend.training.record.eval import SALIENCY_ATTRIBUTES, EvalRecord
+
+
+def _stored_saliency(record):
+    return lambda method, label: getattr(record, SALIENCY_ATTRIBUTES[method])[label]
 
 
 class TestAveraging(unittest.TestCase):
@@ -20,6 +24,7 @@ class TestAveraging(unittest.TestCase):
         rec1.smoothgrad = {0: np.array([[1.0]]), 1: np.array([[2.0]])}
         rec1.smoothgrad_sq = {0: np.array([[1.0]]), 1: np.array([[2.0]])}
         rec1.vargrad = {0: np.array([[1.0]]), 1: np.array([[2.0]])}
+        rec1.get_saliency.side_effect = _stored_saliency(rec1)
 
         rec2 = MagicMock(spec=EvalRecord)
         rec2.label = np.array([0, 1])
@@ -29,6 +34,7 @@ class TestAveraging(unittest.TestCase):
         rec2.smoothgrad = {0: np.array([[3.0]]), 1: np.array([[4.0]])}
         rec2.smoothgrad_sq = {0: np.array([[3.0]]), 1: np.array([[4.0]])}
         rec2.vargrad = {0: np.array([[3.0]]), 1: np.array([[4.0]])}
+        rec2.get_saliency.side_effect = _stored_saliency(rec2)
 
         # Mock plans
         plan1 = MagicMock()
@@ -51,5 +57,6 @@ class TestAveraging(unittest.TestCase):
         self.assertIsNotNone(avg_rec)
 
         # Check gradient average: (1+3)/2 = 2, (2+4)/2 = 3
-        np.testing.assert_array_equal(avg_rec.gradient[0], np.array([[2.0, 2.0]]))
-        np.testing.assert_array_equal(avg_rec.gradient[1], np.array([[3.0, 3.0]]))
+        np.testing.assert_array_equal(avg_rec.get_gradient(0), np.array([[2.0, 2.0]]))
+        np.testing.assert_array_equal(avg_rec.get_gradient(1), np.array([[3.0, 3.0]]))
+        np.testing.assert_array_equal(avg_rec.get_vargrad(1), np.array([[3.0]]))
@@ -101,9 +101,10 @@ class TestOnPlanChanged:
         panel.friendly_map["Fold 1 (EEGNet)"] = trainer
 
         panel.on_plan_changed("Fold 1 (EEGNet)")
-        # Run combo should have "Run 1", "Run 2", "Average"
-        assert panel.run_combo.count() == 3
+        # Run combo should have "Run 1", "Run 2", "Average", "Variability (Std)"
+        assert panel.run_combo.count() == 4
         assert panel.run_combo.itemText(2) == "Average"
+        assert panel.run_combo.itemText(3) == "Variability (Std)"
 
     def test_unknown_plan(self, panel_and_ctrl):
         panel, _ = panel_and_ctrl
@@ -156,6 +157,25 @@ class TestOnUpdate:
         panel.on_update()
         current_widget.update_plot.assert_called_once()
 
+    def test_variability_run(self, panel_and_ctrl):
+        panel, ctrl = panel_and_ctrl
+        trainer = MagicMock()
+        trainer.get_plans.return_value = [MagicMock()]
+        self._setup_plan(panel, trainer)
+        panel.run_combo.addItem("Variability (Std)")
+        panel.run_combo.setCurrentText("Variability (Std)")
+
+        std_record = MagicMock()
+        ctrl.get_variability_record.return_value = std_record
+
+        current_widget = panel.tabs.currentWidget()
+        current_widget.update_plot = MagicMock()
+        current_widget.repaint = MagicMock()
+
+        panel.on_update()
+        ctrl.get_averaged_record.assert_not_called()
+        assert current_widget.update_plot.call_args[0][-1] is std_record
+
     def test_average_no_record(self, panel_and_ctrl):
         panel, ctrl = panel_and_ctrl
         trainer = MagicMock()
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from PyQt6.QtWidgets import QTableWidgetItem
 
+from XBrainLab.backend.training import ModelCompileMode
 from XBrainLab.ui.dialogs.training import ModelSelectionDialog
 
 
@@ -47,6 +48,7 @@ class TestModelSelection:
     def test_confirm(self, dialog):
         # Modify a parameter
         dialog.params_table.setItem(0, 1, QTableWidgetItem("20"))
+        dialog.compile_combo.setCurrentText("trace")
 
         # Click OK
         with patch("PyQt6.QtWidgets.QDialog.accept") as mock_accept:
@@ -60,6 +62,7 @@ class TestModelSelection:
         assert holder.model_params_map["param1"] == 20
         assert holder.model_params_map["param2"] == 0.5
         assert holder.model_params_map["param3"] == "test"
+        assert holder.compile_mode == ModelCompileMode.TRACE
 
     def test_load_weight(self, dialog):
         with patch("PyQt6.QtWidgets.QFileDialog.getOpenFileName") as mock_open:
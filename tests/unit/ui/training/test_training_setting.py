@@ -3,6 +3,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 import torch
 
+from XBrainLab.backend.training import (
+    TrainingAugmentation,
+    TrainingEarlyStopping,
+    TrainingEvaluation,
+    TrainingPrecision,
+    TrainingScheduler,
+)
 from XBrainLab.ui.dialogs.training import (
     DeviceSettingDialog,
     OptimizerSettingDialog,
@@ -70,6 +77,98 @@ class TestTrainingSetting:
         assert option.output_dir == "/mock/output"
         assert option.use_cpu is True
 
+    def test_data_loading_settings(self, window):
+        window.optim = torch.optim.Adam
+        window.optim_params = {}
+        window.workers_entry.setText("4")
+        window.prefetch_entry.setText("3")
+        window.pin_memory_check.setChecked(True)
+        window.persistent_workers_check.setChecked(True)
+        window.cache_check.setChecked(True)
+        window.cache_budget_entry.setText("256")
+        window.parallel_jobs_entry.setText("2")
+        window.vectorize_check.setChecked(True)
+        window.precision_combo.setCurrentText("bf16")
+
+        with patch("PyQt6.QtWidgets.QDialog.accept") as mock_accept:
+            window.accept()
+            mock_accept.assert_called_once()
+
+        option = window.get_result()
+        assert option.num_workers == 4
+        assert option.prefetch_factor == 3
+        assert option.pin_memory is True
+        assert option.persistent_workers is True
+        assert option.cache_data is True
+        assert option.cache_budget_mb == 256.0
+        assert option.parallel_jobs == 2
+        assert option.vectorize_repeats is True
+        assert option.precision == TrainingPrecision.BF16
+
+    def test_schedule_settings(self, window):
+        window.optim = torch.optim.Adam
+        window.optim_params = {}
+        window.evaluation_combo.setCurrentText(TrainingEvaluation.VAL_LOSS.value)
+        window.eval_every_entry.setText("5")
+        window.per_epoch_test_check.setChecked(False)
+        window.early_stopping_combo.setCurrentText("Validation AUC")
+        window.patience_entry.setText("3")
+        window.scheduler_combo.setCurrentText("Reduce on plateau")
+        window.keep_last_entry.setText("3")
+        window.keep_best_check.setChecked(False)
+
+        with patch("PyQt6.QtWidgets.QDialog.accept") as mock_accept:
+            window.accept()
+            mock_accept.assert_called_once()
+
+        option = window.get_result()
+        assert option.eval_every == 5
+        assert option.per_epoch_test is False
+        assert option.early_stopping == TrainingEarlyStopping.VAL_AUC
+        assert option.patience == 3
+        assert option.lr_scheduler == TrainingScheduler.PLATEAU
+        assert option.checkpoint_keep_last == 3
+        assert option.checkpoint_keep_best is False
+
+    def test_augmentation_settings(self, window):
+        window.optim = torch.optim.Adam
+        window.optim_params = {}
+        window.augmentation_entries[TrainingAugmentation.TIME_SHIFT].setText("0.1")
+        window.augmentation_entries[TrainingAugmentation.MIXUP].setText("0.4")
+        window.augment_prob_entry.setText("0.8")
+
+        with patch("PyQt6.QtWidgets.QDialog.accept") as mock_accept:
+            window.accept()
+            mock_accept.assert_called_once()
+
+        option = window.get_result()
+        assert option.augmentation == {
+            TrainingAugmentation.TIME_SHIFT: 0.1,
+            TrainingAugmentation.MIXUP: 0.4,
+        }
+        assert option.augment_prob == 0.8
+
+    def test_test_selection_requires_per_epoch_test(self, window):
+        window.optim = torch.optim.Adam
+        window.optim_params = {}
+        window.evaluation_combo.setCurrentText(TrainingEvaluation.TEST_ACC.value)
+        window.per_epoch_test_check.setChecked(False)
+        with patch(
+            "XBrainLab.ui.dialogs.training.training_setting_dialog.QMessageBox.warning"
+        ) as mock_warning:
+            window.accept()
+            mock_warning.assert_called_once()
+        assert window.get_result() is None
+
+    def test_invalid_workers_rejected(self, window):
+        window.workers_entry.setText("many")
+        with patch(
+            "XBrainLab.ui.dialogs.training.training_setting_dialog.QMessageBox.warning"
+        ) as mock_warning:
+            window.accept()
+            mock_warning.assert_called_once()
+        assert window.get_result() is None
+
     def test_set_output_dir(self, window):
         with patch(
             "PyQt6.QtWidgets.QFileDialog.getExistingDirectory",